@@ -32,6 +32,9 @@ Sessions:
   - `api_snapshot`: Public API snapshot test (per Python).
   - `property_test`: Long-running property tests (opt-in).
   - `perf_baseline`: Local pipeline memory/allocation baseline benchmarks (opt-in).
+  - `perf_import_time`: CLI import-time budgets per subcommand (opt-in).
+  - `perf_compare`: Compare two preserved pipeline baseline runs against regression budgets.
+  - `perf_throughput`: Repository-scale throughput on synthetic monorepos (opt-in).
   - `package_check`: Build sdist/wheel and validate metadata (twine).
   - `release_check`: Deterministic pre-release gate (single Python, offline-friendly).
   - `release_full`: Full release gate (serial QA + links + packaging + matrix).
@@ -707,6 +710,67 @@ def perf_baseline(session: nox.Session) -> None:
     )
 
 
+@nox.session(python=CANONICAL_PYTHON)
+def perf_compare(session: nox.Session) -> None:
+    """Compare preserved pipeline baseline runs and enforce regression budgets.
+
+    Runs `tools/perf/pipeline_perf_compare.py --enforce`, which fails when a
+    scenario/mode pair regresses beyond its elapsed, traced-peak, or RSS budget.
+    Pass the runs to compare after `--`, e.g.
+    `nox -s perf_compare -- --baseline main-run --candidate pr-run`.
+    """
+    if not session.posargs:
+        session.error(
+            "perf_compare needs runs to compare: "
+            "nox -s perf_compare -- --baseline RUN --candidate RUN"
+        )
+    session.install(".")
+
+    session.run(
+        "python",
+        "tools/perf/pipeline_perf_compare.py",
+        "--enforce",
+        *session.posargs,
+    )
+
+
+@nox.session(python=CANONICAL_PYTHON)
+def perf_import_time(session: nox.Session) -> None:
+    """Check CLI import-time budgets for every subcommand.
+
+    Runs `tools/perf/cli_import_time_benchmark.py --enforce`, which fails when a
+    subcommand exceeds its import-time budget or imports a module it must not.
+    Pass arguments after `--` to select command paths or override budgets;
+    `--enforce` is always passed.
+    """
+    session.install(".")
+
+    session.run(
+        "python",
+        "tools/perf/cli_import_time_benchmark.py",
+        "--enforce",
+        *session.posargs,
+    )
+
+
+@nox.session(python=CANONICAL_PYTHON)
+def perf_throughput(session: nox.Session) -> None:
+    """Measure repository-scale throughput on synthetic monorepos.
+
+    Runs `tools/perf/repository_throughput_benchmark.py`, which generates
+    deterministic monorepos and reports files/s and MB/s for discovery, check,
+    check --diff, and check --apply. Pass arguments after `--` to select tree
+    sizes (`--files`), worker counts (`--jobs`), or phases.
+    """
+    session.install(".")
+
+    session.run(
+        "python",
+        "tools/perf/repository_throughput_benchmark.py",
+        *session.posargs,
+    )
+
+
 @nox.session(python=CANONICAL_PYTHON)
 def release_check(session: nox.Session) -> None:
     """Release gate: quality + docs + packaging checks (single Python, offline-friendly).
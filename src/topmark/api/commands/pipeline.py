@@ -44,6 +44,8 @@ from topmark.api.types import RunCompletedEvent
 from topmark.api.types import RunStartedEvent
 from topmark.api.view import finalize_probe_result
 from topmark.api.view import finalize_run_result
+from topmark.config.types import OutputTarget
+from topmark.core.errors import InvalidContentInputError
 from topmark.core.errors import InvalidReportScopeError
 from topmark.pipeline.events import StreamEventKind
 from topmark.pipeline.pipelines import select_pipeline
@@ -154,6 +156,58 @@ def _resolve_public_report_scope(
         ) from exc
 
 
+def _build_run_options(
+    pipeline: PipelineSelection,
+    paths: Iterable[Path | str],
+    *,
+    content: str | None,
+    prune_views: bool,
+) -> tuple[list[Path | str], RunOptions]:
+    """Return the input paths and execution-only run options for an API call.
+
+    When `content` is given, the single input path becomes the logical name of
+    an in-memory buffer: it is processed exactly like content read from STDIN by
+    the CLI (`--stdin-filename`), so the path need not exist on disk and apply
+    runs emit the updated content to standard output instead of writing a file.
+
+    Args:
+        pipeline: Selected concrete pipeline for the call.
+        paths: Files and/or directories supplied by the caller.
+        content: Optional in-memory file content for a single logical path.
+        prune_views: If True, release consumed volatile views between pipeline steps.
+
+    Returns:
+        The materialized input paths and the run options for the call.
+
+    Raises:
+        InvalidContentInputError: If `content` is given together with zero or
+            several paths.
+    """
+    path_inputs: list[Path | str] = list(paths)
+    if content is None:
+        return path_inputs, RunOptions.from_pipeline_selection(
+            pipeline,
+            prune_views=prune_views,
+        )
+
+    if len(path_inputs) != 1:
+        raise InvalidContentInputError(
+            message=(
+                "content requires exactly one path naming the buffer, "
+                f"got {len(path_inputs)} path(s)"
+            ),
+            path_count=len(path_inputs),
+        )
+    return path_inputs, RunOptions.from_pipeline_selection(
+        pipeline,
+        output_target=OutputTarget.STDOUT if pipeline.apply else None,
+        stdin_mode=True,
+        stdin_filename=str(path_inputs[0]),
+        stdin_content=content.encode("utf-8"),
+        prune_views=prune_views,
+    )
+
+
 def _iter_content_events(
     *,
     command: Literal["check", "strip"],
@@ -237,6 +291,7 @@ def _run_probe_pipeline(
     include_file_types: Sequence[str] | None,
     exclude_file_types: Sequence[str] | None,
     prune_views: bool,
+    content: str | None,
 ) -> _ProbePipelineRun:
     """Run the probe pipeline and assemble the public result DTO.
 
@@ -249,6 +304,7 @@ def _run_probe_pipeline(
         include_file_types: Optional whitelist of file type identifiers.
         exclude_file_types: Optional blacklist of file type identifiers.
         prune_views: If True, release consumed volatile views between pipeline steps.
+        content: Optional in-memory content for a single logical path.
 
     Returns:
         Finalized public probe result and the ordered selected real file paths.
@@ -262,14 +318,16 @@ def _run_probe_pipeline(
         diff=False,
     )
 
-    run_options: RunOptions = RunOptions.from_pipeline_selection(
-        selection=pipeline,
+    path_inputs, run_options = _build_run_options(
+        pipeline,
+        paths,
+        content=content,
         prune_views=prune_views,
     )
 
     api_run: ApiPipelineResultRun = run_probe_pipeline_results(
         pipeline=pipeline,
-        paths=paths,
+        paths=path_inputs,
         run_options=run_options,
         base_config=config,
         include_file_types=include_file_types,
@@ -303,6 +361,7 @@ def _run_content_pipeline(
     would_change: Callable[[ProcessingResult], bool],
     prune_views: bool,
     update_statuses: frozenset[PlanStatus],
+    content: str | None,
 ) -> _ContentPipelineRun:
     """Run a content-processing pipeline and assemble the public result DTO.
 
@@ -326,6 +385,7 @@ def _run_content_pipeline(
         prune_views: If True, release consumed volatile views between pipeline steps.
         update_statuses: Plan statuses counted as write/update candidates by the
             public result finalizer.
+        content: Optional in-memory content for a single logical path.
 
     Returns:
         Filtered per-file outcomes, counts, diagnostics, write stats, and the
@@ -341,14 +401,16 @@ def _run_content_pipeline(
     # Run the pipeline; runtime helpers handle config discovery, policy overlays,
     # file-list resolution, per-path config, and pipeline execution.
 
-    run_options: RunOptions = RunOptions.from_pipeline_selection(
+    path_inputs, run_options = _build_run_options(
         pipeline,
+        paths,
+        content=content,
         prune_views=prune_views,
     )
 
     api_run: ApiPipelineResultRun = run_pipeline_results(
         pipeline=pipeline,
-        paths=paths,
+        paths=path_inputs,
         run_options=run_options,
         base_config=config,  # None preserves discovery; mapping/Config is honored.
         include_file_types=include_file_types,
@@ -385,6 +447,7 @@ def check(
     exclude_file_types: Sequence[str] | None = None,
     report: PublicReportScopeLiteral = "actionable",
     prune_views: bool = False,
+    content: str | None = None,
 ) -> RunResult:
     """Validate or apply TopMark headers for the given paths.
 
@@ -409,10 +472,17 @@ def check(
         report: Reporting scope for the returned API view (`actionable`,
             `noncompliant`, or `all`).
         prune_views: If True, release consumed volatile views between pipeline steps.
+        content: Optional in-memory content of a single file. `paths` must then
+            name exactly one logical path, used for file-type resolution and
+            header fields; it need not exist. With `apply=True` the updated
+            content is written to standard output instead of to a file.
 
     Returns:
         Filtered per-file outcomes, counts, diagnostics, and write stats.
 
+    Raises:
+        InvalidContentInputError: If `content` is given with zero or several paths.
+
     Notes:
         Reporting/view filtering is handled by the public view layer. It does not
         change which files are eligible to be written when `apply=True`.
@@ -431,6 +501,7 @@ def check(
         would_change=would_add_or_update_result,
         prune_views=prune_views,
         update_statuses=_CHECK_UPDATE_STATUSES,
+        content=content,
     )
     events: tuple[ContentStreamEvent, ...] = tuple(
         _iter_content_events(
@@ -461,6 +532,7 @@ def stream_check(
     exclude_file_types: Sequence[str] | None = None,
     report: PublicReportScopeLiteral = "actionable",
     prune_views: bool = False,
+    content: str | None = None,
 ) -> Iterator[ContentStreamEvent]:
     """Stream public events for a `check()` invocation.
 
@@ -483,6 +555,7 @@ def stream_check(
         would_change=would_add_or_update_result,
         prune_views=prune_views,
         update_statuses=_CHECK_UPDATE_STATUSES,
+        content=content,
     )
     yield from _iter_content_events(
         command="check",
@@ -502,6 +575,7 @@ def strip(
     exclude_file_types: Sequence[str] | None = None,
     report: PublicReportScopeLiteral = "actionable",
     prune_views: bool = False,
+    content: str | None = None,
 ) -> RunResult:
     """Remove TopMark headers from files (dry-run or apply).
 
@@ -525,10 +599,17 @@ def strip(
         report: Reporting scope for the returned API view (`actionable`,
             `noncompliant`, or `all`).
         prune_views: If True, release consumed volatile views between pipeline steps.
+        content: Optional in-memory content of a single file. `paths` must then
+            name exactly one logical path, used for file-type resolution and
+            header fields; it need not exist. With `apply=True` the updated
+            content is written to standard output instead of to a file.
 
     Returns:
         Filtered per-file outcomes, counts, diagnostics, and write stats.
 
+    Raises:
+        InvalidContentInputError: If `content` is given with zero or several paths.
+
     Notes:
         Reporting/view filtering is handled by the public view layer and does not
         modify pipeline write decisions.
@@ -547,6 +628,7 @@ def strip(
         would_change=would_strip_result,
         prune_views=prune_views,
         update_statuses=_STRIP_UPDATE_STATUSES,
+        content=content,
     )
     events: tuple[ContentStreamEvent, ...] = tuple(
         _iter_content_events(
@@ -577,6 +659,7 @@ def stream_strip(
     exclude_file_types: Sequence[str] | None = None,
     report: PublicReportScopeLiteral = "actionable",
     prune_views: bool = False,
+    content: str | None = None,
 ) -> Iterator[ContentStreamEvent]:
     """Stream public events for a `strip()` invocation.
 
@@ -599,6 +682,7 @@ def stream_strip(
         would_change=would_strip_result,
         prune_views=prune_views,
         update_statuses=_STRIP_UPDATE_STATUSES,
+        content=content,
     )
     yield from _iter_content_events(
         command="strip",
@@ -615,6 +699,7 @@ def probe(
     include_file_types: Sequence[str] | None = None,
     exclude_file_types: Sequence[str] | None = None,
     prune_views: bool = False,
+    content: str | None = None,
 ) -> ProbeRunResult:
     """Explain how paths resolve to TopMark file types and processors.
 
@@ -639,11 +724,16 @@ def probe(
         exclude_file_types: Optional blacklist of file type identifiers to exclude from discovery.
         prune_views: If True, release consumed volatile views between pipeline steps.
             Probe results are built from resolution data, not presentation views.
+        content: Optional in-memory content of a single file. `paths` must then
+            name exactly one logical path, which need not exist.
 
     Returns:
         Stable probe results, summary counts, diagnostics, and any fatal
         pipeline-level exit code.
 
+    Raises:
+        InvalidContentInputError: If `content` is given with zero or several paths.
+
     Notes:
         `probe()` is always read-only. It has no `apply` or `diff` mode because it
         explains resolution rather than planning or applying header mutations.
@@ -656,6 +746,7 @@ def probe(
         include_file_types=include_file_types,
         exclude_file_types=exclude_file_types,
         prune_views=prune_views,
+        content=content,
     )
     events: tuple[ProbeStreamEvent, ...] = tuple(_iter_probe_events(run=result))
     collected: CollectedProbeRun = collect_probe_stream(
@@ -676,6 +767,7 @@ def stream_probe(
     include_file_types: Sequence[str] | None = None,
     exclude_file_types: Sequence[str] | None = None,
     prune_views: bool = False,
+    content: str | None = None,
 ) -> Iterator[ProbeStreamEvent]:
     """Stream public events for a `probe()` invocation.
 
@@ -692,5 +784,6 @@ def stream_probe(
         include_file_types=include_file_types,
         exclude_file_types=exclude_file_types,
         prune_views=prune_views,
+        content=content,
     )
     yield from _iter_probe_events(run=result)
@@ -47,17 +47,18 @@ from topmark.config.policy import HeaderMutationMode
 from topmark.config.policy import MixedLineEndingsMode
 from topmark.config.resolution.bridge import resolve_toml_sources_and_build_mutable_config
 from topmark.config.resolution.layers import build_config_layers_from_resolved_toml_sources
-from topmark.config.resolution.merge import build_effective_config_for_path
+from topmark.config.resolution.merge import EffectiveConfigInterner
 from topmark.config.resolution.synthetic import SyntheticConfigSource
 from topmark.core.constants import TOPMARK_VERSION
 from topmark.core.errors import InvalidPolicyError
 from topmark.core.logging import get_logger
 from topmark.pipeline.engine import PipelineExecutionState
 from topmark.pipeline.engine import exit_code_from_pipeline_results
-from topmark.pipeline.engine import iter_steps_for_files
+from topmark.pipeline.engine import iter_results_for_files
 from topmark.pipeline.reduction import iter_processing_results
 from topmark.pipeline.synthetic import build_filtered_probe_contexts
 from topmark.pipeline.synthetic import build_missing_file_contexts
+from topmark.resolution.files import FileListResolution
 from topmark.resolution.files import probe_explicit_file_selection
 from topmark.resolution.files import resolve_file_list_with_diagnostics
 from topmark.runtime.writer_options import WriterOptions
@@ -74,11 +75,9 @@ if TYPE_CHECKING:
     from topmark.config.resolution.layers import ConfigLayer
     from topmark.core.exit_codes import ExitCode
     from topmark.core.logging import TopmarkLogger
-    from topmark.pipeline.context.model import ProcessingContext
     from topmark.pipeline.pipelines import PipelineSelection
     from topmark.pipeline.result import ProcessingResult
     from topmark.resolution.discovery import FileSelectionProbeResult
-    from topmark.resolution.files import FileListResolution
     from topmark.runtime.model import RunOptions
     from topmark.toml.resolution import ResolvedTopmarkTomlSources
 
@@ -406,7 +405,9 @@ def _build_path_configs(
     When provenance layers are available, each file path receives a config built from the subset of
     layers whose scope applies to that path. Config-like runtime policy overlays are copied onto the
     per-path effective config so pipeline steps see the same invocation policy regardless of where
-    the file-specific fields came from.
+    the file-specific fields came from. Each distinct applicable layer set is merged and frozen
+    once (see [`EffectiveConfigInterner`][topmark.config.resolution.merge.EffectiveConfigInterner])
+    and the resulting config object is shared by every path with that layer set.
 
     When no layers are available, this helper falls back to using the single run-level config for
     every path.
@@ -423,15 +424,30 @@ def _build_path_configs(
     if layers is None:
         return dict.fromkeys(file_list, effective_cfg)
 
+    # Paths sharing the same applicable layers share one effective config object;
+    # the engine relies on that identity to build one policy registry per config.
+    interner: EffectiveConfigInterner = EffectiveConfigInterner(layers=layers)
+    runtime_cfgs: dict[int, FrozenConfig] = {}
     path_configs: dict[Path, FrozenConfig] = {}
     for path in file_list:
-        per_path_cfg: FrozenConfig = build_effective_config_for_path(layers, path).freeze()
-        path_configs[path] = replace(
-            per_path_cfg,
-            policy=effective_cfg.policy,
-            policy_by_type=effective_cfg.policy_by_type,
-        )
-
+        per_path_cfg: FrozenConfig = interner.config_for_path(path)
+        runtime_cfg: FrozenConfig | None = runtime_cfgs.get(id(per_path_cfg))
+        if runtime_cfg is None:
+            runtime_cfg = replace(
+                per_path_cfg,
+                policy=effective_cfg.policy,
+                policy_by_type=effective_cfg.policy_by_type,
+            )
+            runtime_cfgs[id(per_path_cfg)] = runtime_cfg
+        path_configs[path] = runtime_cfg
+
+    logger.debug(
+        "Per-path configs: %d path(s), %d director(y/ies), %d distinct config(s), %d cache hit(s)",
+        interner.stats.lookups,
+        interner.stats.directories,
+        interner.stats.distinct_configs,
+        interner.stats.hits,
+    )
     return path_configs
 
 
@@ -670,8 +686,19 @@ def _prepare_api_pipeline_run(
     )
     logger.debug("(3) Run options for invocation: %s", effective_run_options)
 
-    # (4) Resolve the selected file list after policy overlays.
-    file_resolution: FileListResolution = resolve_file_list_with_diagnostics(effective_cfg)
+    # (4) Resolve the selected file list after policy overlays. In-memory
+    # content runs process exactly one logical path that need not exist on disk.
+    file_resolution: FileListResolution
+    if effective_run_options.stdin_mode:
+        if effective_run_options.stdin_filename is None:
+            raise RuntimeError("stdin_filename should not be undefined in stdin_mode")
+        file_resolution = FileListResolution(
+            selected=(Path(effective_run_options.stdin_filename),),
+            missing_literals=(),
+            unmatched_patterns=(),
+        )
+    else:
+        file_resolution = resolve_file_list_with_diagnostics(effective_cfg)
     file_list: list[Path] = list(file_resolution.selected)
     logger.debug("(4) Files found: %s", len(file_list))
 
@@ -693,7 +720,8 @@ def _iter_pipeline_results_for_file_list(
     """Yield durable pipeline results for the selected files in a prepared API run.
 
     This helper is the API/runtime streaming-capable seam for normal content
-    processing runs. It executes each selected file, reduces the yielded
+    processing runs. It executes each selected file (in worker processes when
+    `run_options.jobs` allows it), reduces each
     [`ProcessingContext`][topmark.pipeline.context.model.ProcessingContext]
     into a durable [`ProcessingResult`][topmark.pipeline.result.ProcessingResult],
     and releases context-owned volatile views immediately after snapshotting.
@@ -710,13 +738,19 @@ def _iter_pipeline_results_for_file_list(
     if not prepared.file_list:
         return
 
-    path_configs: dict[Path, FrozenConfig] = _build_path_configs(
-        layers=prepared.discovered_layers,
-        file_list=prepared.file_list,
-        effective_cfg=prepared.effective_cfg,
+    # In-memory content has no on-disk directory to scope layers against; like
+    # the CLI, it is processed with the run-level config.
+    path_configs: dict[Path, FrozenConfig] | None = (
+        None
+        if prepared.run_options.stdin_mode
+        else _build_path_configs(
+            layers=prepared.discovered_layers,
+            file_list=prepared.file_list,
+            effective_cfg=prepared.effective_cfg,
+        )
     )
 
-    contexts: Iterator[ProcessingContext] = iter_steps_for_files(
+    yield from iter_results_for_files(
         run_options=prepared.run_options,
         config=prepared.effective_cfg,
         path_configs=path_configs,
@@ -724,7 +758,6 @@ def _iter_pipeline_results_for_file_list(
         file_list=prepared.file_list,
         state=state,
     )
-    yield from iter_processing_results(contexts, release_views=True)
 
 
 def run_pipeline_results(
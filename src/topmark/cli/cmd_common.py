@@ -14,9 +14,9 @@ This module holds small, focused helpers used by multiple CLI commands.
 They intentionally avoid policy (exit code rules, messages) and only
 encapsulate plumbing such as running pipelines, filtering, and error exits.
 
-It also contains a small initializer (`init_common_state`) that prepares the
-shared typed CLI state (`TopmarkCliState`) for commands that own verbosity,
-color, and related human-output controls rather than the root command group.
+The lightweight per-command state initializer lives in
+[`topmark.cli.common_state`][topmark.cli.common_state] so that commands which
+do not run pipelines avoid importing this module.
 """
 
 from __future__ import annotations
@@ -31,16 +31,14 @@ import click
 
 from topmark.cli.cli_types import CliWriteMode
 from topmark.cli.console.click_console import Console
-from topmark.cli.console.color import resolve_color_mode
 from topmark.cli.emitters.machine import emit_config_diagnostics_machine
-from topmark.cli.options import ColorMode
-from topmark.cli.options import normalize_verbosity
+from topmark.cli.errors import TopmarkCliUsageError
+from topmark.cli.keys import CliOpt
 from topmark.cli.presentation import TextStyler
 from topmark.cli.presentation import style_for_role
 from topmark.cli.state import TopmarkCliState
 from topmark.cli.state import bootstrap_cli_state
 from topmark.cli.state import get_cli_state
-from topmark.cli.validators import validate_output_verbosity_policy
 from topmark.config.overrides import ConfigOverrides
 from topmark.config.overrides import PolicyOverrides
 from topmark.config.overrides import apply_config_overrides
@@ -48,21 +46,29 @@ from topmark.config.resolution.bridge import resolve_toml_sources_and_build_muta
 from topmark.config.types import FileWriteStrategy
 from topmark.config.types import OutputTarget
 from topmark.core.constants import CLI_OVERRIDE_STR
+from topmark.core.errors import GitSelectionError
 from topmark.core.exit_codes import ExitCode
 from topmark.core.formats import OutputFormat
-from topmark.core.logging import resolve_env_log_level
-from topmark.core.logging import setup_logging
 from topmark.core.presentation import StyleRole
+from topmark.pipeline.result_cache import DEFAULT_RESULT_CACHE_DIR
+from topmark.pipeline.result_cache import clear_result_cache
 from topmark.presentation.markdown.diagnostic import render_diagnostics_markdown
+from topmark.presentation.markdown.pipeline import render_pipeline_profile_markdown
+from topmark.presentation.markdown.pipeline import render_result_cache_summary_markdown
 from topmark.presentation.text.diagnostic import render_diagnostics_text
+from topmark.presentation.text.pipeline import render_pipeline_profile_text
+from topmark.presentation.text.pipeline import render_result_cache_summary_text
 from topmark.resolution.files import FileListResolution
 from topmark.resolution.files import resolve_file_list_with_diagnostics
+from topmark.resolution.git import git_changed_files
 from topmark.runtime.model import RunOptions
 from topmark.runtime.writer_options import WriterOptions
 from topmark.runtime.writer_options import apply_resolved_writer_options
 from topmark.utils.merge import none_if_empty
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from topmark.cli.console.protocols import ConsoleProtocol
     from topmark.cli.io import InputPlan
     from topmark.config.model import FrozenConfig
@@ -73,109 +79,72 @@ if TYPE_CHECKING:
     from topmark.core.machine.schemas import MetaPayload
     from topmark.diagnostic.model import FrozenDiagnosticLog
     from topmark.pipeline.pipelines import PipelineSelection
+    from topmark.pipeline.profiling import StepProfile
+    from topmark.pipeline.result_cache import ResultCacheStats
     from topmark.toml.resolution import ResolvedTopmarkTomlSources
 
 
-def init_common_state(
-    ctx: click.Context,
-    *,
-    verbosity: int,
-    quiet: bool,
-    color_mode: ColorMode | None,
-    no_color: bool,
-) -> None:
-    """Initialize shared UI/runtime state on the Click context.
-
-    It initializes the shared `TopmarkCliState` stored on `ctx.obj`.
-
-    Args:
-        ctx: Current Click context; will have ``obj`` and ``color`` set.
-        verbosity: Count of ``--verbose/-v`` flags (0..2).
-        quiet: Whether ``--quiet/-q`` was provided.
-        color_mode: Explicit color mode from ``--color`` (or ``None``).
-        no_color: Whether ``--no-color`` was passed; forces color off.
-    """
-    state: TopmarkCliState = bootstrap_cli_state(ctx)
-
-    # 1. Color policy for the effective command output format.
-    effective_color_mode: ColorMode = (
-        ColorMode.NEVER if no_color else (color_mode or ColorMode.AUTO)
-    )
-    # Store the resolved color mode in the Click context:
-    state.color_mode = effective_color_mode
-    enable_color: bool = resolve_color_mode(
-        color_mode_override=effective_color_mode,
-        output_format=state.output_format,
-    )
-    # Store whether color is enabled for this invocation.
-    state.color_enabled = enable_color
-    ctx.color = enable_color
-
-    # 2. Initialize the console.
-    # Respect the resolved color policy (may differ from the raw `--no-color`` flag).
-    console = Console(enable_color=enable_color)
-    # Store the console in the Click context:
-    state.console = console
-
-    # 3. Initialize internal logging (env-driven).
-    level_env: int | None = resolve_env_log_level()
-    setup_logging(level=level_env)
-    # Store the resolved internal runtime log level in the Click context:
-    state.log_level = level_env
-
-    # 4. Validate output verbosity for human formats.
-    fmt: OutputFormat = state.output_format
-
-    # Store raw human-output controls so validators can normalize ignored flags.
-    state.verbosity = verbosity
-    state.quiet = quiet
-
-    # Program-output verbosity / quiet policy (stored for downstream gating).
-    validate_output_verbosity_policy(
-        ctx,
-        verbosity=verbosity,
-        quiet=quiet,
-        fmt=fmt,
-    )
-
-    # Store normalized effective human-output state for downstream consumers.
-    state.verbosity = normalize_verbosity(state.verbosity)
-
-
 def build_file_resolution(
     *,
     run_options: RunOptions,
     config: FrozenConfig,
-    temp_path: Path | None,
+    changed_since: str | None = None,
+    staged: bool = False,
 ) -> FileListResolution:
     """Return file-list resolution diagnostics for the current invocation.
 
     - In content-on-STDIN mode, return a synthetic resolution containing the
-      single temp path created for staged input content.
+      single logical path (`--stdin-filename`) of the in-memory content.
+    - With `changed_since` or `staged`, take candidates from the local git
+      repository and let the unified resolver restrict and filter them.
     - Otherwise, delegate to the unified resolver that uses `config.files`,
       `files_from`, include/exclude patterns, and file types.
 
     Args:
         run_options: Invocation-wide runtime options for the current run.
         config: Effective run config used for file discovery.
-        temp_path: Temporary file path created for content-on-STDIN mode, if any.
+        changed_since: Git revision from `--changed-since`, if any.
+        staged: Whether `--staged` was given.
 
     Returns:
         A [FileListResolution][topmark.resolution.files.FileListResolution]
         containing selected files and any discovery diagnostics.
 
     Raises:
-        RuntimeError: If `temp_path` is undefined in `stdin_mode`.
+        RuntimeError: If `stdin_filename` is undefined in `stdin_mode`.
+        TopmarkCliUsageError: If git-based selection is combined with
+            content-on-STDIN mode or git cannot report the changed files.
     """
+    git_selection: bool = changed_since is not None or staged
     if run_options.stdin_mode:
-        if temp_path is None:
-            raise RuntimeError("temp_path should not be undefined in stdin_mode")
+        if git_selection:
+            raise TopmarkCliUsageError(
+                f"{CliOpt.CHANGED_SINCE} and {CliOpt.STAGED} cannot be used when reading "
+                "file content from STDIN."
+            )
+        if run_options.stdin_filename is None:
+            raise RuntimeError("stdin_filename should not be undefined in stdin_mode")
         return FileListResolution(
-            selected=(temp_path,),
+            selected=(Path(run_options.stdin_filename),),
             missing_literals=(),
             unmatched_patterns=(),
         )
-    resolution: FileListResolution = resolve_file_list_with_diagnostics(config)
+
+    changed_files: tuple[Path, ...] | None = None
+    if git_selection:
+        try:
+            changed_files = git_changed_files(
+                cwd=Path.cwd(),
+                since=changed_since,
+                staged=staged,
+            )
+        except GitSelectionError as exc:
+            raise TopmarkCliUsageError(str(exc)) from exc
+
+    resolution: FileListResolution = resolve_file_list_with_diagnostics(
+        config,
+        changed_files=changed_files,
+    )
     return resolution
 
 
@@ -188,7 +157,11 @@ def build_run_options(
     write_mode: CliWriteMode | None,
     stdin_mode: bool,
     stdin_filename: str | None,
+    stdin_content: bytes | None = None,
     prune_views: bool = True,
+    jobs: int = 1,
+    result_cache: bool = False,
+    profile: bool = False,
 ) -> RunOptions:
     """Build invocation-wide runtime options for a pipeline CLI command.
 
@@ -196,8 +169,9 @@ def build_run_options(
     options. Pipeline-derived fields such as pipeline kind, mutation mode, and
     diff-view preservation are copied from `pipeline` via
     [`RunOptions.from_pipeline_selection`][topmark.runtime.model.RunOptions.from_pipeline_selection].
-    CLI-only choices such as STDIN mode, synthetic STDIN filename, write mode,
-    and view pruning remain explicit parameters here.
+    CLI-only choices such as STDIN mode, synthetic STDIN filename and content, write mode,
+    view pruning, the worker-process count, result caching, and profiling remain explicit
+    parameters here.
 
     Args:
         pipeline: The selected pipeline, including the command family and
@@ -205,7 +179,12 @@ def build_run_options(
         write_mode: Effective CLI write mode (`stdout`, `atomic`, or `inplace`).
         stdin_mode: Whether the command is operating in content-on-STDIN mode.
         stdin_filename: Synthetic file name associated with STDIN content, if any.
+        stdin_content: File content read from STDIN, processed in memory, if any.
         prune_views: If True, release consumed volatile views between pipeline steps.
+        jobs: Number of worker processes used to run the pipeline (`0` = one per CPU).
+        result_cache: Whether to reuse cached results stored under the result-cache
+            directory of the current working directory.
+        profile: Whether to record per-step timings for each processed file.
 
     Returns:
         The execution-only runtime options for the current CLI invocation.
@@ -234,7 +213,11 @@ def build_run_options(
         file_write_strategy=file_write_strategy,
         stdin_mode=stdin_mode,
         stdin_filename=stdin_filename,
+        stdin_content=stdin_content,
         prune_views=prune_views,
+        jobs=jobs,
+        result_cache_dir=resolve_result_cache_dir() if result_cache else None,
+        profile=profile,
     )
 
     ctx: click.Context | None = click.get_current_context(silent=True)
@@ -248,6 +231,96 @@ def build_run_options(
     return apply_resolved_writer_options(run_options, writer_options)
 
 
+def resolve_result_cache_dir() -> Path:
+    """Return the persistent result-cache directory for CLI runs.
+
+    Returns:
+        The `.topmark_cache` directory under the current working directory.
+    """
+    return Path.cwd() / DEFAULT_RESULT_CACHE_DIR
+
+
+def reset_result_cache() -> None:
+    """Delete the CLI result-cache directory (`--clear-cache`)."""
+    clear_result_cache(resolve_result_cache_dir())
+
+
+def emit_result_cache_summary(
+    *,
+    console: ConsoleProtocol,
+    stats: ResultCacheStats | None,
+    fmt: OutputFormat,
+    quiet: bool,
+    command_path: str,
+    styled: bool,
+) -> None:
+    """Emit the result-cache statistics line for human output formats.
+
+    Args:
+        console: Human report console.
+        stats: Result-cache counters for the run, or `None` when caching is disabled.
+        fmt: Selected output format. Machine formats never receive this line.
+        quiet: Whether TEXT output is suppressed.
+        command_path: Command path, such as `topmark check`.
+        styled: Whether ANSI-capable styling is enabled.
+    """
+    if stats is None:
+        return
+    if fmt == OutputFormat.TEXT and not quiet:
+        console.print(
+            render_result_cache_summary_text(
+                command_path=command_path,
+                stats=stats,
+                styled=styled,
+            )
+        )
+    elif fmt == OutputFormat.MARKDOWN:
+        console.print(
+            render_result_cache_summary_markdown(
+                command_path=command_path,
+                stats=stats,
+            )
+        )
+
+
+def emit_pipeline_profile_summary(
+    *,
+    console: ConsoleProtocol,
+    profiles: Sequence[StepProfile],
+    fmt: OutputFormat,
+    quiet: bool,
+    command_path: str,
+    styled: bool,
+) -> None:
+    """Emit the per-step profiling report for human output formats.
+
+    Machine formats carry the same statistics in their envelope instead.
+
+    Args:
+        console: Human report console.
+        profiles: Aggregated step profiles for the run.
+        fmt: Selected output format.
+        quiet: Whether TEXT output is suppressed.
+        command_path: Command path, such as `topmark check`.
+        styled: Whether ANSI-capable styling is enabled.
+    """
+    if fmt == OutputFormat.TEXT and not quiet:
+        console.print(
+            render_pipeline_profile_text(
+                command_path=command_path,
+                profiles=profiles,
+                styled=styled,
+            )
+        )
+    elif fmt == OutputFormat.MARKDOWN:
+        console.print(
+            render_pipeline_profile_markdown(
+                command_path=command_path,
+                profiles=profiles,
+            )
+        )
+
+
 def exit_if_no_files(file_list: list[Path], *, console: ConsoleProtocol, styled: bool) -> bool:
     """Echo a friendly message and return True if there is nothing to process."""
     if not file_list:
@@ -307,12 +380,9 @@ def resolve_human_console(
     return console
 
 
-def maybe_exit_on_error(*, code: ExitCode | None, temp_path: Path | None) -> None:
-    """If an error code was encountered, cleanup and exit with it."""
+def maybe_exit_on_error(*, code: ExitCode | None) -> None:
+    """If an error code was encountered, exit with it."""
     if code is not None:
-        from topmark.utils.file import safe_unlink
-
-        safe_unlink(temp_path)
         click.get_current_context().exit(code)
 
 
@@ -58,11 +58,14 @@ from topmark.api.runtime import ensure_config_valid
 from topmark.cli.cmd_common import build_file_resolution
 from topmark.cli.cmd_common import build_resolved_toml_sources_and_config_for_plan
 from topmark.cli.cmd_common import build_run_options
+from topmark.cli.cmd_common import emit_pipeline_profile_summary
+from topmark.cli.cmd_common import emit_result_cache_summary
 from topmark.cli.cmd_common import exit_for_config_validation_error
 from topmark.cli.cmd_common import exit_if_no_files
-from topmark.cli.cmd_common import init_common_state
 from topmark.cli.cmd_common import maybe_exit_on_error
+from topmark.cli.cmd_common import reset_result_cache
 from topmark.cli.cmd_common import resolve_human_console
+from topmark.cli.common_state import init_common_state
 from topmark.cli.emitters.machine import emit_processing_stream_json_machine
 from topmark.cli.emitters.machine import emit_processing_stream_machine
 from topmark.cli.help import HelpExample
@@ -85,16 +88,22 @@ from topmark.cli.options import common_stdin_content_mode_options
 from topmark.cli.options import common_text_output_quiet_options
 from topmark.cli.options import common_text_output_verbosity_options
 from topmark.cli.options import config_strict_options
+from topmark.cli.options import git_changed_files_options
+from topmark.cli.options import pipeline_execution_options
 from topmark.cli.options import pipeline_reporting_options
 from topmark.cli.options import remediation_policy_options
 from topmark.cli.options import render_diff_options
+from topmark.cli.options import result_cache_options
 from topmark.cli.options import shared_policy_options
 from topmark.cli.state import TopmarkCliState
 from topmark.cli.state import bootstrap_cli_state
+from topmark.cli.streaming import ProcessingProgressLine
 from topmark.cli.streaming import ProcessingStreamStats
-from topmark.cli.streaming import emit_stdout_payload
+from topmark.cli.streaming import emit_human_stream_output
 from topmark.cli.streaming import iter_cli_processing_stream
 from topmark.cli.streaming import observe_processing_stream
+from topmark.cli.streaming import stderr_supports_progress
+from topmark.cli.streaming import track_processing_progress
 from topmark.cli.validators import apply_color_policy_for_output_format
 from topmark.cli.validators import validate_diff_apply_mutual_exclusion
 from topmark.cli.validators import validate_stdin_dash_requires_piped_input
@@ -111,20 +120,20 @@ from topmark.core.logging import get_logger
 from topmark.core.machine.payloads import build_meta_payload
 from topmark.pipeline.context.model import ProcessingContext
 from topmark.pipeline.engine import PipelineExecutionState
-from topmark.pipeline.engine import iter_steps_for_files
+from topmark.pipeline.engine import iter_results_for_files
 from topmark.pipeline.pipelines import select_pipeline
+from topmark.pipeline.profiling import PipelineProfiler
+from topmark.pipeline.reduction import iter_processing_results
 from topmark.pipeline.reporting import ReportScope
 from topmark.pipeline.reporting import would_add_or_update_result
 from topmark.pipeline.synthetic import build_missing_file_contexts
 from topmark.presentation.markdown.diagnostic import render_diagnostics_markdown
 from topmark.presentation.markdown.pipeline import render_pipeline_apply_summary_markdown
 from topmark.presentation.markdown.version import render_version_footer_markdown
-from topmark.presentation.output.pipeline import render_pipeline_command_human_stream_output
-from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
+from topmark.presentation.output.pipeline import iter_pipeline_command_human_stream_output
 from topmark.presentation.shared.pipeline import PipelineHumanPresentationOptions
 from topmark.presentation.text.diagnostic import render_diagnostics_text
 from topmark.presentation.text.pipeline import render_pipeline_apply_summary_text
-from topmark.utils.file import safe_unlink
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -144,6 +153,7 @@ if TYPE_CHECKING:
     from topmark.pipeline.kinds import PipelineKindLiteral
     from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
     from topmark.pipeline.pipelines import PipelineSelection
+    from topmark.pipeline.result import ProcessingResult
     from topmark.resolution.files import FileListResolution
     from topmark.runtime.model import RunOptions
 
@@ -182,6 +192,7 @@ logger: TopmarkLogger = get_logger(__name__)
 @common_config_resolution_options
 @common_stdin_content_mode_options
 @common_files_from_options
+@git_changed_files_options
 @common_include_exclude_from_options
 @common_file_filtering_options
 @common_file_type_filtering_options
@@ -191,6 +202,8 @@ logger: TopmarkLogger = get_logger(__name__)
 @common_apply_and_write_options
 @render_diff_options
 @pipeline_reporting_options
+@pipeline_execution_options
+@result_cache_options
 @common_header_formatting_options
 @common_output_format_options
 def check_command(
@@ -210,6 +223,9 @@ def check_command(
     stdin_filename: str | None,
     # common_files_from_options:
     files_from: list[str],
+    # git_changed_files_options:
+    changed_since: str | None,
+    staged: bool,
     # common_include_exclude_from_options:
     include_from: list[str],
     exclude_from: list[str],
@@ -236,7 +252,14 @@ def check_command(
     diff: bool,
     # pipeline_reporting_options
     summary_mode: bool,
+    show_progress: bool,
+    profile: bool,
     report_scope: ReportScope,
+    # pipeline_execution_options
+    jobs: int,
+    # result_cache_options
+    result_cache: bool,
+    clear_result_cache: bool,
     # common_header_formatting_options:
     align_fields: bool,
     relative_to: str | None,
@@ -265,6 +288,9 @@ def check_command(
         stdin_filename: Assumed filename when reading content from STDIN).
         files_from: Files that contain newline-delimited *paths* to add to the
             candidate set before filtering. Use ``-`` to read from STDIN.
+        changed_since: Git revision whose changes (up to the working tree) form
+            the candidate set, or `None`.
+        staged: If True, files staged in the git index form the candidate set.
         include_from: Files that contain include glob patterns (one per line).
             Use ``-`` to read patterns from STDIN.
         exclude_from: Files that contain exclude glob patterns (one per line).
@@ -295,8 +321,13 @@ def check_command(
             or writing to STDOUT (default: atomic writer).
         diff: Show unified diffs of header changes (human output only).
         summary_mode: Show outcome counts instead of per-file details.
+        show_progress: Show a progress line on STDERR when it is a terminal.
+        profile: Record per-step timings and report them after the run.
         report_scope: Reporting scope for human per-file output (`actionable`, `noncompliant`,
             `all`). Ignored for summary mode and machine-readable formats.
+        jobs: Number of worker processes used to process files (`0` = one per CPU).
+        result_cache: Reuse cached results for unchanged files (`.topmark_cache/`).
+        clear_result_cache: Delete the result cache before running.
         align_fields: Whether to align header fields when rendering (captured in config).
         relative_to: Base path used only for resolving header metadata (e.g., `file_relpath`).
         output_format: Output format to use (``text``, ``markdown``, ``json``, or ``ndjson``).
@@ -394,6 +425,9 @@ def check_command(
         include_patterns=include_patterns,
         exclude_patterns=exclude_patterns,
         stdin_filename=stdin_filename,
+        # Git selection supplies its own candidates; without PATHS it covers the
+        # whole repository.
+        allow_empty_paths=changed_since is not None or staged,
     )
 
     prepared_cli_config: PreparedCliConfig = build_resolved_toml_sources_and_config_for_plan(
@@ -415,12 +449,19 @@ def check_command(
         diff=diff,
     )
 
+    if clear_result_cache:
+        reset_result_cache()
+
     run_options: RunOptions = build_run_options(
         pipeline=pipeline,
         write_mode=write_mode,
         stdin_mode=plan.stdin_mode,
         stdin_filename=plan.stdin_filename,
+        stdin_content=plan.stdin_content,
         prune_views=prune_views,
+        jobs=jobs,
+        result_cache=result_cache,
+        profile=profile,
     )
 
     logger.debug("run options: %s", run_options)
@@ -483,12 +524,11 @@ def check_command(
             )
         )
 
-    temp_path: Path | None = plan.temp_path  # for cleanup/STDIN-apply branch
-
     file_resolution: FileListResolution = build_file_resolution(
         run_options=run_options,
         config=config,
-        temp_path=temp_path,
+        changed_since=changed_since,
+        staged=staged,
     )
     file_list: list[Path] = list(file_resolution.selected)
 
@@ -518,8 +558,8 @@ def check_command(
         *file_list,
         *file_resolution.missing_literals,
     )
-    context_results: chain[ProcessingContext] = chain(
-        iter_steps_for_files(
+    processing_results: chain[ProcessingResult] = chain(
+        iter_results_for_files(
             run_options=run_options,
             config=config,
             path_configs=None,
@@ -527,16 +567,17 @@ def check_command(
             file_list=file_list,
             state=execution_state,
         ),
-        missing_results,
+        iter_processing_results(missing_results, release_views=True),
+    )
+    stats: ProcessingStreamStats = ProcessingStreamStats(
+        profiler=PipelineProfiler() if profile else None,
     )
-    stats: ProcessingStreamStats = ProcessingStreamStats()
 
     events: Iterator[MachineProcessingStreamEvent] = observe_processing_stream(
         iter_cli_processing_stream(
-            context_results,
+            processing_results,
             command=PIPELINE_KIND,
             paths=stream_paths,
-            release_views=True,
         ),
         stats=stats,
         would_change=would_add_or_update_result,
@@ -551,6 +592,7 @@ def check_command(
                 resolved_toml=prepared_cli_config.resolved_toml,
                 events=events,
                 summary_mode=summary_mode,
+                profile=profile,
             )
 
         case OutputFormat.NDJSON:
@@ -561,6 +603,7 @@ def check_command(
                 resolved_toml=prepared_cli_config.resolved_toml,
                 events=events,
                 summary_mode=summary_mode,
+                profile=profile,
             )
 
         case OutputFormat.TEXT | OutputFormat.MARKDOWN:  # pragma: no branch
@@ -582,19 +625,46 @@ def check_command(
                 apply_changes=apply_changes,
                 styled=enable_color,
             )
-            output: PipelineCommandHumanOutput = render_pipeline_command_human_stream_output(
-                options=options,
-                events=events,
-                fmt=fmt,
-                would_change=would_add_or_update_result,
+            # Per-file sections and diffs are written as soon as each durable
+            # result arrives; the progress line (if any) is cleared around them.
+            progress: ProcessingProgressLine | None = (
+                ProcessingProgressLine()
+                if show_progress and not state.quiet and stderr_supports_progress()
+                else None
+            )
+            if progress is not None:
+                events = track_processing_progress(events, progress=progress)
+            emit_human_stream_output(
+                iter_pipeline_command_human_stream_output(
+                    options=options,
+                    events=events,
+                    fmt=fmt,
+                    would_change=would_add_or_update_result,
+                ),
+                console=console,
+                # TEXT honors --quiet; Markdown remains document-oriented.
+                show_report=fmt == OutputFormat.MARKDOWN or not state.quiet,
+                progress=progress,
             )
 
-            emit_stdout_payload(output.stdout)
+    emit_result_cache_summary(
+        console=console,
+        stats=execution_state.result_cache,
+        fmt=fmt,
+        quiet=state.quiet,
+        command_path=ctx.command_path,
+        styled=enable_color,
+    )
 
-            if (fmt == OutputFormat.TEXT and not state.quiet and output.stderr) or (
-                fmt == OutputFormat.MARKDOWN and output.stderr
-            ):
-                console.print(output.stderr)
+    if stats.profiler is not None:
+        emit_pipeline_profile_summary(
+            console=console,
+            profiles=stats.profiler.profiles(),
+            fmt=fmt,
+            quiet=state.quiet,
+            command_path=ctx.command_path,
+            styled=enable_color,
+        )
 
     # Combine engine-derived failures with stream-observed failures.
     #
@@ -611,9 +681,6 @@ def check_command(
         if run_options.stdin_mode:
             # For STDIN content mode, the modified file content is emitted to stdout in WriterStep.
             # So we do not have to output it here.
-            #
-            # Cleanup the temp file.
-            safe_unlink(temp_path)
             return
         else:
             # Count outcomes observed from durable-result stream events.
@@ -659,14 +726,9 @@ def check_command(
     # a successful diff-only result.
     maybe_exit_on_error(
         code=encountered_exit_code,
-        temp_path=temp_path,
     )
 
     if not apply_changes and stats.would_change:
         ctx.exit(ExitCode.WOULD_CHANGE)
 
-    # Cleanup temp file if any (shouldn't be needed except on errors)
-    if temp_path and temp_path.exists():
-        safe_unlink(temp_path)
-
     # No explicit return is needed for Click commands.
@@ -21,20 +21,28 @@ configuration:
 
 from __future__ import annotations
 
+from typing import Final
+
 import rich_click
 
-from topmark.cli.commands.config_check import config_check_command
-from topmark.cli.commands.config_defaults import config_defaults_command
-from topmark.cli.commands.config_dump import config_dump_command
-from topmark.cli.commands.config_init import config_init_command
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
 from topmark.cli.keys import CliCmd
+from topmark.cli.lazy_group import LazyRichGroup
 from topmark.cli.options import GROUP_CONTEXT_SETTINGS
 
+#: Subcommands of `topmark config`, imported only when Click resolves them.
+CONFIG_LAZY_SUBCOMMANDS: Final[dict[str, str]] = {
+    CliCmd.CONFIG_CHECK: "topmark.cli.commands.config_check:config_check_command",
+    CliCmd.CONFIG_DUMP: "topmark.cli.commands.config_dump:config_dump_command",
+    CliCmd.CONFIG_DEFAULTS: "topmark.cli.commands.config_defaults:config_defaults_command",
+    CliCmd.CONFIG_INIT: "topmark.cli.commands.config_init:config_init_command",
+}
+
 
 @rich_click.group(
-    cls=rich_click.RichGroup,
+    cls=LazyRichGroup,
+    lazy_subcommands=CONFIG_LAZY_SUBCOMMANDS,
     name=CliCmd.CONFIG,
     context_settings=GROUP_CONTEXT_SETTINGS,
     help="Validate, inspect, and scaffold TopMark configuration.",
@@ -70,22 +78,3 @@ def config_command() -> None:
       * ``init``: print a starter configuration file for projects.
     """
     # No-op: behavior is provided by subcommands only.
-
-
-# Attach existing commands as subcommands of `topmark config`
-config_command.add_command(
-    config_check_command,
-    name=CliCmd.CONFIG_CHECK,
-)
-config_command.add_command(
-    config_dump_command,
-    name=CliCmd.CONFIG_DUMP,
-)
-config_command.add_command(
-    config_defaults_command,
-    name=CliCmd.CONFIG_DEFAULTS,
-)
-config_command.add_command(
-    config_init_command,
-    name=CliCmd.CONFIG_INIT,
-)
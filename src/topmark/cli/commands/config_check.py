@@ -33,7 +33,7 @@ import click
 import rich_click
 
 from topmark.api.runtime import is_config_valid
-from topmark.cli.cmd_common import init_common_state
+from topmark.cli.common_state import init_common_state
 from topmark.cli.emitters.machine import emit_config_check_machine
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
@@ -32,8 +32,8 @@ import click
 import rich_click
 
 from topmark.cli.cmd_common import build_resolved_toml_sources_and_config_for_plan
-from topmark.cli.cmd_common import init_common_state
 from topmark.cli.cmd_common import resolve_human_console
+from topmark.cli.common_state import init_common_state
 from topmark.cli.emitters.machine import emit_config_machine
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
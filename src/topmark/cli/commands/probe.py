@@ -56,9 +56,9 @@ from topmark.cli.cmd_common import build_resolved_toml_sources_and_config_for_pl
 from topmark.cli.cmd_common import build_run_options
 from topmark.cli.cmd_common import exit_for_config_validation_error
 from topmark.cli.cmd_common import exit_if_no_files
-from topmark.cli.cmd_common import init_common_state
 from topmark.cli.cmd_common import maybe_exit_on_error
 from topmark.cli.cmd_common import resolve_human_console
+from topmark.cli.common_state import init_common_state
 from topmark.cli.emitters.machine import emit_probe_stream_json_machine
 from topmark.cli.emitters.machine import emit_probe_stream_machine
 from topmark.cli.help import HelpExample
@@ -77,6 +77,7 @@ from topmark.cli.options import common_stdin_content_mode_options
 from topmark.cli.options import common_text_output_quiet_options
 from topmark.cli.options import common_text_output_verbosity_options
 from topmark.cli.options import config_strict_options
+from topmark.cli.options import pipeline_execution_options
 from topmark.cli.options import shared_policy_options
 from topmark.cli.state import bootstrap_cli_state
 from topmark.cli.streaming import ProbeStreamStats
@@ -91,8 +92,9 @@ from topmark.core.formats import OutputFormat
 from topmark.core.logging import get_logger
 from topmark.core.machine.payloads import build_meta_payload
 from topmark.pipeline.engine import PipelineExecutionState
-from topmark.pipeline.engine import iter_steps_for_files
+from topmark.pipeline.engine import iter_results_for_files
 from topmark.pipeline.pipelines import select_pipeline
+from topmark.pipeline.reduction import iter_processing_results
 from topmark.pipeline.synthetic import build_filtered_probe_contexts
 from topmark.pipeline.synthetic import build_missing_file_contexts
 from topmark.presentation.markdown.diagnostic import render_diagnostics_markdown
@@ -100,7 +102,6 @@ from topmark.presentation.markdown.version import render_version_footer_markdown
 from topmark.presentation.output.pipeline import render_probe_command_human_stream_output
 from topmark.presentation.text.diagnostic import render_diagnostics_text
 from topmark.resolution.files import probe_explicit_file_selection
-from topmark.utils.file import safe_unlink
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -118,6 +119,7 @@ if TYPE_CHECKING:
     from topmark.pipeline.kinds import PipelineKindLiteral
     from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
     from topmark.pipeline.pipelines import PipelineSelection
+    from topmark.pipeline.result import ProcessingResult
     from topmark.resolution.discovery import FileSelectionProbeResult
     from topmark.resolution.files import FileListResolution
     from topmark.runtime.model import RunOptions
@@ -155,6 +157,7 @@ logger: TopmarkLogger = get_logger(__name__)
 @common_file_filtering_options
 @common_file_type_filtering_options
 @shared_policy_options
+@pipeline_execution_options
 @common_output_format_options
 def probe_command(
     paths: tuple[str, ...],
@@ -184,6 +187,8 @@ def probe_command(
     exclude_file_types: list[str],
     # policy_options (shared):
     allow_content_probe: bool | None,
+    # pipeline_execution_options
+    jobs: int,
     # common_output_format_options:
     output_format: OutputFormat | None,
 ) -> None:
@@ -219,6 +224,7 @@ def probe_command(
         exclude_file_types: Exclude processing for the given file type identifiers.
         allow_content_probe: Shared policy override controlling whether
             file-type resolution may consult file contents when needed.
+        jobs: Number of worker processes used to process files (`0` = one per CPU).
         output_format: Output format to use (``text``, ``markdown``, ``json``, or ``ndjson``).
             Verbosity and quiet controls apply only to TEXT output.
 
@@ -318,7 +324,9 @@ def probe_command(
         write_mode=None,  # Not relevant for `topmark probe`
         stdin_mode=plan.stdin_mode,
         stdin_filename=plan.stdin_filename,
+        stdin_content=plan.stdin_content,
         prune_views=prune_views,
+        jobs=jobs,
     )
 
     logger.debug("run options: %s", run_options)
@@ -376,12 +384,9 @@ def probe_command(
             )
         )
 
-    temp_path: Path | None = plan.temp_path  # for cleanup/STDIN-apply branch
-
     file_resolution: FileListResolution = build_file_resolution(
         run_options=run_options,
         config=config,
-        temp_path=temp_path,
     )
     file_list: list[Path] = list(file_resolution.selected)
 
@@ -432,8 +437,8 @@ def probe_command(
         *file_resolution.missing_literals,
         *(result.path for result in filtered_selection_results),
     )
-    context_results: chain[ProcessingContext] = chain(
-        iter_steps_for_files(
+    processing_results: chain[ProcessingResult] = chain(
+        iter_results_for_files(
             run_options=run_options,
             config=config,
             path_configs=None,
@@ -441,17 +446,16 @@ def probe_command(
             file_list=file_list,
             state=execution_state,
         ),
-        missing_results,
-        filtered_results,
+        iter_processing_results(missing_results, release_views=True),
+        iter_processing_results(filtered_results, release_views=True),
     )
     stats: ProbeStreamStats = ProbeStreamStats()
 
     events: Iterator[MachineProcessingStreamEvent] = observe_probe_stream(
         iter_cli_processing_stream(
-            context_results,
+            processing_results,
             command=PIPELINE_KIND,
             paths=stream_paths,
-            release_views=True,
         ),
         stats=stats,
     )
@@ -508,7 +512,6 @@ def probe_command(
 
     maybe_exit_on_error(
         code=encountered_exit_code,
-        temp_path=temp_path,
     )
 
     # Probe-specific semantic exit status. Filtered explicit inputs are reported
@@ -519,8 +522,4 @@ def probe_command(
     if stats.unresolved_probe:
         ctx.exit(ExitCode.UNSUPPORTED_FILE_TYPE)
 
-    # Cleanup temp file if any (shouldn't be needed except on errors)
-    if temp_path and temp_path.exists():
-        safe_unlink(temp_path)
-
     # No explicit return is needed for Click commands.
@@ -20,15 +20,14 @@ Provides subcommands for inspecting TopMark registry metadata:
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import Final
 
 import rich_click
 
-from topmark.cli.commands.registry_bindings import registry_bindings_command
-from topmark.cli.commands.registry_filetypes import registry_filetypes_command
-from topmark.cli.commands.registry_processors import registry_processors_command
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
 from topmark.cli.keys import CliCmd
+from topmark.cli.lazy_group import LazyRichGroup
 from topmark.cli.options import GROUP_CONTEXT_SETTINGS
 from topmark.core.logging import get_logger
 
@@ -38,9 +37,19 @@ if TYPE_CHECKING:
 
 logger: TopmarkLogger = get_logger(__name__)
 
+#: Subcommands of `topmark registry`, imported only when Click resolves them.
+REGISTRY_LAZY_SUBCOMMANDS: Final[dict[str, str]] = {
+    CliCmd.REGISTRY_FILETYPES: "topmark.cli.commands.registry_filetypes:registry_filetypes_command",
+    CliCmd.REGISTRY_PROCESSORS: (
+        "topmark.cli.commands.registry_processors:registry_processors_command"
+    ),
+    CliCmd.REGISTRY_BINDINGS: "topmark.cli.commands.registry_bindings:registry_bindings_command",
+}
+
 
 @rich_click.group(
-    cls=rich_click.RichGroup,
+    cls=LazyRichGroup,
+    lazy_subcommands=REGISTRY_LAZY_SUBCOMMANDS,
     name=CliCmd.REGISTRY,
     context_settings=GROUP_CONTEXT_SETTINGS,
     help="Inspect TopMark registry metadata.",
@@ -71,18 +80,3 @@ def registry_command() -> None:
       * ``bindings``: inspect file-type-to-processor bindings.
     """
     # No-op: behavior is provided by subcommands only.
-
-
-# Attach existing commands as subcommands of `topmark registry`
-registry_command.add_command(
-    registry_filetypes_command,
-    name=CliCmd.REGISTRY_FILETYPES,
-)
-registry_command.add_command(
-    registry_processors_command,
-    name=CliCmd.REGISTRY_PROCESSORS,
-)
-registry_command.add_command(
-    registry_bindings_command,
-    name=CliCmd.REGISTRY_BINDINGS,
-)
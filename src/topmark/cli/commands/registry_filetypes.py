@@ -20,7 +20,7 @@ from typing import TYPE_CHECKING
 import click
 import rich_click
 
-from topmark.cli.cmd_common import init_common_state
+from topmark.cli.common_state import init_common_state
 from topmark.cli.emitters.machine import emit_filetypes_machine
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
@@ -0,0 +1,150 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : serve.py
+#   file_relpath : src/topmark/cli/commands/serve.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""TopMark `serve` command.
+
+Runs a long-lived TopMark server that answers `check`, `strip`, and `probe`
+requests (newline-delimited JSON-RPC 2.0) on a Unix socket or on STDIN/STDOUT,
+keeping the registries and parsed config files warm between requests. See
+[`topmark.server`][topmark.server].
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import click
+import rich_click
+
+from topmark.cli.common_state import init_common_state
+from topmark.cli.errors import TopmarkCliIOError
+from topmark.cli.errors import TopmarkCliUsageError
+from topmark.cli.help import HelpExample
+from topmark.cli.help import render_examples_epilog
+from topmark.cli.keys import CliCmd
+from topmark.cli.keys import CliOpt
+from topmark.cli.options import GROUP_CONTEXT_SETTINGS
+from topmark.cli.options import common_color_options
+from topmark.cli.options import common_text_output_verbosity_options
+from topmark.cli.options import serve_transport_options
+from topmark.cli.state import TopmarkCliState
+from topmark.cli.state import bootstrap_cli_state
+from topmark.cli.validators import apply_ignore_positional_paths_policy
+from topmark.core.formats import OutputFormat
+from topmark.server.protocol import default_socket_path
+from topmark.server.service import TopmarkService
+from topmark.server.transport import serve_stdio
+from topmark.server.transport import serve_unix_socket
+from topmark.server.transport import unix_sockets_supported
+
+if TYPE_CHECKING:
+    from topmark.cli.console.color import ColorMode
+    from topmark.cli.console.protocols import ConsoleProtocol
+
+
+@rich_click.command(
+    name=CliCmd.SERVE,
+    context_settings=GROUP_CONTEXT_SETTINGS,
+    help=(
+        "Run a long-lived TopMark server answering check/strip/probe requests "
+        "(JSON-RPC 2.0, one message per line) with warm registries and config caches."
+    ),
+    epilog=render_examples_epilog(
+        examples=(
+            HelpExample(
+                summary="Serve on the default per-user Unix socket",
+                command_line=f"topmark {CliCmd.SERVE}",
+            ),
+            HelpExample(
+                summary="Serve on an explicit socket path",
+                command_line=f"topmark {CliCmd.SERVE} {CliOpt.SERVE_SOCKET} /tmp/topmark.sock",
+            ),
+            HelpExample(
+                summary="Serve requests on STDIN/STDOUT (editor integrations)",
+                command_line=f"topmark {CliCmd.SERVE} {CliOpt.SERVE_STDIO}",
+            ),
+        ),
+        notes=(
+            "Methods: check, strip, probe (params mirror the topmark.api functions; "
+            "pass 'content' to process an in-memory buffer), ping, and shutdown.",
+            "Config files are re-parsed only when their modification time, size, or inode changes.",
+            "Clients can use topmark.server.client.TopmarkClient, which falls back to "
+            "in-process execution when no server is running.",
+        ),
+    ),
+)
+@common_color_options
+@common_text_output_verbosity_options
+@serve_transport_options
+def serve_command(
+    *,
+    # common_ui_options (verbosity, color):
+    verbosity: int,
+    color_mode: ColorMode | None,
+    no_color: bool,
+    # serve_transport_options:
+    socket_path: str | None,
+    stdio: bool,
+) -> None:
+    """Run a TopMark server until it receives a `shutdown` request.
+
+    Args:
+        verbosity: Increase TEXT output detail.
+        color_mode: Set the color mode (default: auto).
+        no_color: bool: If set, disable color mode.
+        socket_path: Unix socket to listen on (default: per-user socket path).
+        stdio: Serve on STDIN/STDOUT instead of a Unix socket.
+
+    Raises:
+        TopmarkCliUsageError: If both transports are requested, or Unix sockets
+            are unavailable on this platform.
+        TopmarkCliIOError: If the socket cannot be created.
+    """
+    ctx: click.Context = click.get_current_context()
+    state: TopmarkCliState = bootstrap_cli_state(ctx)
+    state.output_format = OutputFormat.TEXT
+
+    init_common_state(
+        ctx,
+        verbosity=verbosity,
+        quiet=False,  # No ``--quiet`` option is registered for `serve`.
+        color_mode=color_mode,
+        no_color=no_color,
+    )
+    console: ConsoleProtocol = state.console
+
+    # `serve` takes its inputs from requests: ignore positional PATHS
+    apply_ignore_positional_paths_policy(ctx, warn_stdin_dash=True)
+
+    if stdio and socket_path is not None:
+        raise TopmarkCliUsageError(
+            f"{CliOpt.SERVE_SOCKET} and {CliOpt.SERVE_STDIO} are mutually exclusive."
+        )
+
+    service: TopmarkService = TopmarkService()
+    service.warm()
+
+    if stdio:
+        # STDOUT carries the protocol: nothing else may be printed there.
+        serve_stdio(service)
+        return
+
+    if not unix_sockets_supported():
+        raise TopmarkCliUsageError(
+            f"Unix sockets are not available on this platform; use {CliOpt.SERVE_STDIO}."
+        )
+
+    path: Path = Path(socket_path) if socket_path is not None else default_socket_path()
+    console.print(f"TopMark server listening on {path}")
+    try:
+        serve_unix_socket(service, path)
+    except OSError as exc:
+        raise TopmarkCliIOError(f"Cannot serve on {path}: {exc}") from exc
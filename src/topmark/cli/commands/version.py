@@ -11,6 +11,9 @@
 """TopMark `version` command.
 
 Prints the current TopMark version as installed in the active Python environment.
+
+The machine-output layer (payloads, serializers, emitters) is imported inside
+the JSON/NDJSON branch, so plain `topmark version` does not load it.
 """
 
 from __future__ import annotations
@@ -20,8 +23,7 @@ from typing import TYPE_CHECKING
 import click
 import rich_click
 
-from topmark.cli.cmd_common import init_common_state
-from topmark.cli.emitters.machine import emit_machine
+from topmark.cli.common_state import init_common_state
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
 from topmark.cli.keys import CliCmd
@@ -37,12 +39,10 @@ from topmark.cli.validators import apply_color_policy_for_output_format
 from topmark.cli.validators import apply_ignore_positional_paths_policy
 from topmark.core.formats import OutputFormat
 from topmark.core.machine.errors import unsupported_machine_readable_format
-from topmark.core.machine.payloads import build_meta_payload
 from topmark.presentation.markdown.version import render_version_markdown
 from topmark.presentation.shared.version import VersionHumanReport
 from topmark.presentation.shared.version import make_version_human_report
 from topmark.presentation.text.version import render_version_text
-from topmark.version.machine.serializers import serialize_version
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -128,9 +128,6 @@ def version_command(
     # Select the console
     console: ConsoleProtocol = state.console
 
-    # Machine metadata
-    meta: MetaPayload = build_meta_payload()
-
     # Output format
     fmt: OutputFormat = state.output_format
 
@@ -142,6 +139,12 @@ def version_command(
 
     # Machine-readable formats
     if fmt in (OutputFormat.JSON, OutputFormat.NDJSON):
+        from topmark.cli.emitters.machine import emit_machine
+        from topmark.core.machine.payloads import build_meta_payload
+        from topmark.version.machine.serializers import serialize_version
+
+        # Machine metadata
+        meta: MetaPayload = build_meta_payload()
         serialized: str | Iterable[str] = serialize_version(
             meta=meta,
             fmt=fmt,
@@ -0,0 +1,105 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : common_state.py
+#   file_relpath : src/topmark/cli/common_state.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Per-command initialization of the shared typed CLI state.
+
+[`init_common_state`][topmark.cli.common_state.init_common_state] prepares the
+shared typed CLI state (`TopmarkCliState`) for commands that own verbosity,
+color, and related human-output controls rather than the root command group.
+
+It is kept apart from [`topmark.cli.cmd_common`][topmark.cli.cmd_common]
+because every command needs it, while only pipeline commands need the
+configuration, resolution, and machine-output layers that `cmd_common` imports.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from topmark.cli.console.click_console import Console
+from topmark.cli.console.color import ColorMode
+from topmark.cli.console.color import resolve_color_mode
+from topmark.cli.options import normalize_verbosity
+from topmark.cli.state import bootstrap_cli_state
+from topmark.cli.validators import validate_output_verbosity_policy
+from topmark.core.logging import resolve_env_log_level
+from topmark.core.logging import setup_logging
+
+if TYPE_CHECKING:
+    import click
+
+    from topmark.cli.state import TopmarkCliState
+    from topmark.core.formats import OutputFormat
+
+
+def init_common_state(
+    ctx: click.Context,
+    *,
+    verbosity: int,
+    quiet: bool,
+    color_mode: ColorMode | None,
+    no_color: bool,
+) -> None:
+    """Initialize shared UI/runtime state on the Click context.
+
+    It initializes the shared `TopmarkCliState` stored on `ctx.obj`.
+
+    Args:
+        ctx: Current Click context; will have ``obj`` and ``color`` set.
+        verbosity: Count of ``--verbose/-v`` flags (0..2).
+        quiet: Whether ``--quiet/-q`` was provided.
+        color_mode: Explicit color mode from ``--color`` (or ``None``).
+        no_color: Whether ``--no-color`` was passed; forces color off.
+    """
+    state: TopmarkCliState = bootstrap_cli_state(ctx)
+
+    # 1. Color policy for the effective command output format.
+    effective_color_mode: ColorMode = (
+        ColorMode.NEVER if no_color else (color_mode or ColorMode.AUTO)
+    )
+    # Store the resolved color mode in the Click context:
+    state.color_mode = effective_color_mode
+    enable_color: bool = resolve_color_mode(
+        color_mode_override=effective_color_mode,
+        output_format=state.output_format,
+    )
+    # Store whether color is enabled for this invocation.
+    state.color_enabled = enable_color
+    ctx.color = enable_color
+
+    # 2. Initialize the console.
+    # Respect the resolved color policy (may differ from the raw `--no-color`` flag).
+    console = Console(enable_color=enable_color)
+    # Store the console in the Click context:
+    state.console = console
+
+    # 3. Initialize internal logging (env-driven).
+    level_env: int | None = resolve_env_log_level()
+    setup_logging(level=level_env)
+    # Store the resolved internal runtime log level in the Click context:
+    state.log_level = level_env
+
+    # 4. Validate output verbosity for human formats.
+    fmt: OutputFormat = state.output_format
+
+    # Store raw human-output controls so validators can normalize ignored flags.
+    state.verbosity = verbosity
+    state.quiet = quiet
+
+    # Program-output verbosity / quiet policy (stored for downstream gating).
+    validate_output_verbosity_policy(
+        ctx,
+        verbosity=verbosity,
+        quiet=quiet,
+        fmt=fmt,
+    )
+
+    # Store normalized effective human-output state for downstream consumers.
+    state.verbosity = normalize_verbosity(state.verbosity)
@@ -129,6 +129,7 @@ def emit_processing_stream_json_machine(
     resolved_toml: ResolvedTopmarkTomlSources,
     events: Iterable[MachineProcessingStreamEvent],
     summary_mode: bool,
+    profile: bool = False,
 ) -> None:
     """Emit processing JSON from an internal durable-result stream.
 
@@ -139,6 +140,7 @@ def emit_processing_stream_json_machine(
         resolved_toml: ResolvedTopmarkTomlSources.
         events: Internal machine processing stream events in deterministic order.
         summary_mode: If True, emit aggregated counts instead of per-file entries.
+        profile: If True, include per-step profiling statistics.
     """
     envelope: dict[str, object] = build_processing_results_stream_json_envelope(
         meta=meta,
@@ -146,6 +148,7 @@ def emit_processing_stream_json_machine(
         resolved_toml=resolved_toml,
         events=events,
         summary_mode=summary_mode,
+        profile=profile,
     )
     emit_machine(serialize_json_object(envelope), console=console, nl=False)
 
@@ -158,6 +161,7 @@ def emit_processing_stream_machine(
     resolved_toml: ResolvedTopmarkTomlSources,
     events: Iterable[MachineProcessingStreamEvent],
     summary_mode: bool,
+    profile: bool = False,
 ) -> None:
     """Emit processing NDJSON from an internal durable-result stream.
 
@@ -168,6 +172,7 @@ def emit_processing_stream_machine(
         resolved_toml: ResolvedTopmarkTomlSources.
         events: Internal machine processing stream events in deterministic order.
         summary_mode: If True, emit aggregated counts instead of per-file entries.
+        profile: If True, include per-step profiling statistics.
     """
     records: Iterator[dict[str, object]] = iter_processing_results_stream_ndjson_records(
         meta=meta,
@@ -175,6 +180,7 @@ def emit_processing_stream_machine(
         resolved_toml=resolved_toml,
         events=events,
         summary_mode=summary_mode,
+        profile=profile,
     )
     emit_machine(iter_ndjson_strings(records), console=console)
 
@@ -12,7 +12,7 @@
 
 This module intentionally focuses only on normalizing STDIN usage for the CLI:
 - List mode: consume newline-delimited paths from STDIN.
-- Content mode: materialize STDIN bytes as a temporary file path.
+- Content mode: keep STDIN bytes in memory under a logical file path.
 
 Higher-level concerns like config building or file discovery are handled elsewhere.
 """
@@ -20,7 +20,6 @@ Higher-level concerns like config building or file discovery are handled elsewhe
 from __future__ import annotations
 
 import sys
-import tempfile
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -45,13 +44,15 @@ if TYPE_CHECKING:
 
 # Keep this module narrowly scoped to STDIN handling only.
 
+_DEFAULT_STDIN_FILENAME: str = "stdin"
+
 
 class StdinMode(str, Enum):
     """How STDIN was interpreted by consume_stdin()."""
 
     NONE = "none"  # No STDIN was consumed (TTY or empty)
     LIST = "list"  # STDIN contained a list of paths (one per line)
-    CONTENT = "content"  # STDIN contained file content (written to a temp file)
+    CONTENT = "content"  # STDIN contained file content (kept in memory)
 
 
 class StdinResult(NamedTuple):
@@ -61,15 +62,16 @@ class StdinResult(NamedTuple):
         mode: How STDIN was interpreted:
               - "none": no STDIN was consumed (stdin is a TTY or empty)
               - "list": STDIN contained a list of paths (one per line)
-              - "content": STDIN contained file content (written to a temp file)
-        paths: In "list" mode, the parsed paths. In "content", a single temp path.
-        temp_path: The temp file created for "content" mode; otherwise None.
+              - "content": STDIN contained file content (kept in memory)
+        paths: In "list" mode, the parsed paths. In "content", the single logical path
+            of the content (never created on disk).
+        content: The encoded file content in "content" mode; otherwise None.
         errors: Non-fatal errors/warnings (strings) collected during processing.
     """
 
     mode: StdinMode
     paths: list[Path]
-    temp_path: Path | None
+    content: bytes | None
     errors: list[str]
 
 
@@ -82,8 +84,9 @@ def consume_stdin(
     """Consume STDIN if present and return a normalized result.
 
     If `stdin_filename` is provided (or `expect="content"`), STDIN is treated
-    as the contents of a single file which is written to a temporary path.
-    The returned `paths` will contain exactly that temp path and `mode == "content"`.
+    as the contents of a single file, which is returned as `content` without
+    writing it anywhere. The returned `paths` will contain exactly the logical
+    path of that file (`stdin_filename`) and `mode == "content"`.
 
     Otherwise (default), STDIN is treated as a list of paths, one per line.
     Empty lines and lines starting with '#' are ignored. `mode == "list"`.
@@ -94,58 +97,35 @@ def consume_stdin(
         expect: Force interpretation of STDIN ("list" or "content"), or "auto".
         stdin_filename: Target filename to use when interpreting STDIN as file content. If omitted
             in content mode, a default name is used.
-        encoding: Text encoding for reading and writing.
+        encoding: Text encoding used to encode the content.
 
     Returns:
         A struct describing what (if anything) was consumed.
     """
     # If no data is piped, do nothing.
     if not sys.stdin or sys.stdin.isatty():
-        return StdinResult(mode=StdinMode.NONE, paths=[], temp_path=None, errors=[])
+        return StdinResult(mode=StdinMode.NONE, paths=[], content=None, errors=[])
 
     data: str = sys.stdin.read()
     if data == "":
-        return StdinResult(mode=StdinMode.NONE, paths=[], temp_path=None, errors=[])
+        return StdinResult(mode=StdinMode.NONE, paths=[], content=None, errors=[])
 
     # Decide interpretation
     force_content: bool = expect == "content" or stdin_filename is not None
     if force_content:
-        # Treat as a single file's content written to a temp file.
-        # We use NamedTemporaryFile(delete=False) to hand back a stable path.
-        # We do not delete it here; caller cleans up if needed.
-        try:
-            # Create temp file with a sensible suffix/name if provided
-            suffix: str = ""
-            if stdin_filename and "." in stdin_filename:
-                suffix = "." + stdin_filename.rsplit(".", 1)[-1]
-
-            with tempfile.NamedTemporaryFile(
-                prefix="topmark-stdin-",
-                suffix=suffix,
-                delete=False,
-            ) as tmp:
-                temp_path = Path(tmp.name)
-                tmp.write(data.encode(encoding))
-
-            return StdinResult(
-                mode=StdinMode.CONTENT,
-                paths=[temp_path],
-                temp_path=temp_path,
-                errors=[],
-            )
-
-        except OSError as exc:
-            return StdinResult(
-                mode=StdinMode.NONE,
-                paths=[],
-                temp_path=None,
-                errors=[f"#ERROR: failed to create temp file for STDIN content: {exc}"],
-            )
+        # Treat as a single file's content. The pipeline reads it from memory
+        # (see `RunOptions.stdin_content`), so no temporary file is created.
+        return StdinResult(
+            mode=StdinMode.CONTENT,
+            paths=[Path(stdin_filename or _DEFAULT_STDIN_FILENAME)],
+            content=data.encode(encoding),
+            errors=[],
+        )
 
     # Default/forced list mode: parse as list of paths (one per line)
     lines: list[str] = [ln.strip() for ln in data.splitlines()]
     paths: list[Path] = [Path(ln) for ln in lines if ln and not ln.startswith("#")]
-    return StdinResult(mode=StdinMode.LIST, paths=paths, temp_path=None, errors=[])
+    return StdinResult(mode=StdinMode.LIST, paths=paths, content=None, errors=[])
 
 
 def merge_cli_paths_with_stdin(
@@ -157,7 +137,7 @@ def merge_cli_paths_with_stdin(
     Rules:
       - mode == "none": just return CLI paths.
       - mode == "list": return CLI paths + list from STDIN (in that order).
-      - mode == "content": ignore CLI paths and return the single temp file path.
+      - mode == "content": ignore CLI paths and return the single logical path.
 
     This keeps command bodies small and avoids subtle drift across subcommands.
 
@@ -192,7 +172,7 @@ class InputPlan:
     Attributes:
         stdin_mode: True when reading a single file's *content* from STDIN via "-".
         stdin_filename: The filename to use when in STDIN mode.
-        temp_path: Temporary file path used in content-on-STDIN mode; None otherwise.
+        stdin_content: File content read from STDIN in content mode; None otherwise.
         paths: Positional PATH arguments after normalization
             (and/or from --files-from -).
         include_patterns: Include glob patterns after merging CLI and include-from.
@@ -206,7 +186,7 @@ class InputPlan:
     stdin_mode: bool  # True if reading a single file's content from STDIN ("-")
     stdin_filename: str | None
 
-    temp_path: Path | None  # Temp file path for STDIN content mode, or None
+    stdin_content: bytes | None  # File content for STDIN content mode, or None
     paths: list[str]  # Positional PATH arguments (normalized)
     include_patterns: list[str]  # Include glob patterns (after merging CLI/include-from)
     exclude_patterns: list[str]  # Exclude glob patterns (after merging CLI/exclude-from)
@@ -237,7 +217,8 @@ def plan_cli_inputs(
         exclude_patterns: Iterable of exclude glob patterns.
         stdin_filename: Optional assumed filename when reading content from STDIN.
         allow_empty_paths: If True, do not raise an error if no paths are provided.
-            (Used for commands like dump-config that are file-agnostic.)
+            (Used for commands like dump-config that are file-agnostic, and for
+            `--changed-since`/`--staged`, whose candidates come from git.)
 
     Raises:
         TopmarkCliUsageError: If
@@ -275,7 +256,7 @@ def plan_cli_inputs(
     paths: list[str] = []
     inc: list[str] = list(include_patterns)
     exc: list[str] = list(exclude_patterns)
-    temp_path: Path | None = None
+    stdin_content: bytes | None = None
 
     if stdin_mode:
         if not stdin_filename:
@@ -283,10 +264,10 @@ def plan_cli_inputs(
                 f"{CliOpt.STDIN_FILENAME} is required when using '-' to read from STDIN."
             )
         res: StdinResult = consume_stdin(expect="content", stdin_filename=stdin_filename)
-        if res.mode != "content" or not res.paths:
+        if res.mode != "content" or res.content is None:
             raise TopmarkCliUsageError("No data received on STDIN while '-' was specified.")
-        temp_path = res.paths[0]
-        paths = [str(temp_path)]
+        stdin_content = res.content
+        paths = [str(res.paths[0])]
     else:
         # ...-from routing (list mode)
         if files_from_text is not None:
@@ -323,7 +304,7 @@ def plan_cli_inputs(
     return InputPlan(
         stdin_mode=stdin_mode,
         stdin_filename=stdin_filename,
-        temp_path=temp_path,
+        stdin_content=stdin_content,
         paths=paths,
         include_patterns=inc,
         exclude_patterns=exc,
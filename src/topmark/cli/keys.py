@@ -45,6 +45,7 @@ class CliCmd:
     REGISTRY_BINDINGS: Final = "bindings"
     REGISTRY_FILETYPES: Final = "filetypes"
     REGISTRY_PROCESSORS: Final = "processors"
+    SERVE: Final = "serve"
     VERSION: Final = "version"
 
 
@@ -67,6 +68,8 @@ class CliOpt:
     INCLUDE_PATTERNS: Final = "--include"
     EXCLUDE_PATTERNS: Final = "--exclude"
     FILES_FROM: Final = "--files-from"
+    CHANGED_SINCE: Final = "--changed-since"
+    STAGED: Final = "--staged"
 
     # Config discovery
     CONFIG_FILES: Final = "--config"
@@ -101,11 +104,19 @@ class CliOpt:
     # Pipeline result reporting
     REPORT: Final = "--report"
 
+    # Pipeline execution
+    JOBS: Final = "--jobs"
+    RESULT_CACHE: Final = "--cache"
+    NO_RESULT_CACHE: Final = "--no-cache"
+    CLEAR_RESULT_CACHE: Final = "--clear-cache"
+
     # Output / write behavior
     WRITE_MODE: Final = "--write-mode"
     APPLY_CHANGES: Final = "--apply"
     RENDER_DIFF: Final = "--diff"
     RESULTS_SUMMARY_MODE: Final = "--summary"
+    PROGRESS: Final = "--progress"
+    PROFILE: Final = "--profile"
     OUTPUT_FORMAT: Final = "--output-format"
     SHOW_DETAILS: Final = "--long"
 
@@ -128,6 +139,10 @@ class CliOpt:
     # Config root
     CONFIG_ROOT: Final = "--root"
 
+    # Server
+    SERVE_SOCKET: Final = "--socket"
+    SERVE_STDIO: Final = "--stdio"
+
 
 class CliShortOpt:
     """User-facing short option spellings for the TopMark CLI.
@@ -147,3 +162,4 @@ class CliShortOpt:
     INCLUDE_PATTERNS: Final = "-i"
     EXCLUDE_PATTERNS: Final = "-e"
     SHOW_DETAILS: Final = "-l"
+    JOBS: Final = "-j"
@@ -0,0 +1,123 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : lazy_group.py
+#   file_relpath : src/topmark/cli/lazy_group.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Lazily loaded Rich Click command groups.
+
+TopMark command modules import most of the pipeline, configuration, and
+presentation layers at module level. Registering them eagerly on the root group
+means that `topmark version` pays for the whole import graph before argv is
+even parsed.
+
+[`LazyRichGroup`][topmark.cli.lazy_group.LazyRichGroup] registers subcommands
+by *import path* instead. A subcommand module is imported only when Click
+resolves that subcommand, i.e. when it is dispatched, when its help is
+rendered, or when the group help lists its short help.
+
+Import paths use the ``"package.module:attribute"`` form, as in
+`[project.scripts]` entry points.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+import click
+import rich_click
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+def load_lazy_command(import_path: str) -> click.Command:
+    """Import and return the Click command referenced by ``import_path``.
+
+    Args:
+        import_path: Reference in ``"package.module:attribute"`` form.
+
+    Returns:
+        The Click command object bound to ``attribute``.
+
+    Raises:
+        ValueError: If ``import_path`` is not in ``"module:attribute"`` form.
+        TypeError: If the referenced attribute is not a Click command.
+    """
+    module_name, sep, attr_name = import_path.partition(":")
+    if not sep or not module_name or not attr_name:
+        raise ValueError(f"Invalid lazy command import path: {import_path!r}")
+
+    module = importlib.import_module(module_name)
+    command: object = getattr(module, attr_name)
+    if not isinstance(command, click.Command):
+        raise TypeError(
+            f"Lazy command {import_path!r} resolved to {type(command).__name__}, "
+            "expected a click.Command"
+        )
+    return command
+
+
+class LazyRichGroup(rich_click.RichGroup):
+    """Rich Click group whose subcommands are imported on first use.
+
+    Eagerly registered commands (via `add_command`) keep working; lazy entries
+    are merged into `list_commands` and resolved by `get_command`. A resolved
+    lazy command is cached in `commands`, so each module is imported at most
+    once per process.
+
+    Attributes:
+        lazy_subcommands: Mapping of subcommand name to
+            ``"package.module:attribute"`` import path.
+    """
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401 - forwarded verbatim to rich_click.RichGroup
+        lazy_subcommands: Mapping[str, str] | None = None,
+        **kwargs: Any,  # noqa: ANN401 - forwarded verbatim to rich_click.RichGroup
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return eager and lazy subcommand names without importing anything.
+
+        Args:
+            ctx: Current Click context.
+
+        Returns:
+            Sorted subcommand names.
+        """
+        names: set[str] = set(super().list_commands(ctx))
+        names.update(self.lazy_subcommands)
+        return sorted(names)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return the named subcommand, importing its module if needed.
+
+        Args:
+            ctx: Current Click context.
+            cmd_name: Subcommand name as typed on the command line.
+
+        Returns:
+            The resolved subcommand, or `None` if the name is unknown.
+        """
+        command: click.Command | None = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+
+        import_path: str | None = self.lazy_subcommands.get(cmd_name)
+        if import_path is None:
+            return None
+
+        command = load_lazy_command(import_path)
+        # Register under the lazy name (command.name may differ, e.g. `config check`).
+        self.add_command(command, name=cmd_name)
+        return command
@@ -16,36 +16,47 @@ Key ideas:
 - The root Click group bootstraps a shared typed CLI state.
 - Subcommands own verbosity/color options and initialize shared human-output state.
 - The root command ensures help output has a console available.
+- Subcommands are registered by import path and only imported when dispatched
+  (see [`LazyRichGroup`][topmark.cli.lazy_group.LazyRichGroup]).
 
 This module intentionally stays compact to keep CLI wiring explicit and predictable.
 """
 
 from __future__ import annotations
 
+from typing import Final
+
 import click
 import rich_click
 
-from topmark.cli.cmd_common import init_common_state
-from topmark.cli.commands.check import check_command
-from topmark.cli.commands.config import config_command
-from topmark.cli.commands.probe import probe_command
-from topmark.cli.commands.registry import registry_command
-from topmark.cli.commands.strip import strip_command
-from topmark.cli.commands.version import version_command
+from topmark.cli.common_state import init_common_state
 from topmark.cli.console.color import ColorMode
 from topmark.cli.help import HelpExample
 from topmark.cli.help import render_examples_epilog
 from topmark.cli.keys import CliCmd
 from topmark.cli.keys import CliOpt
+from topmark.cli.lazy_group import LazyRichGroup
 from topmark.cli.options import GROUP_CONTEXT_SETTINGS
 from topmark.cli.state import TopmarkCliState
 from topmark.cli.state import bootstrap_cli_state
 from topmark.core.formats import OutputFormat
 from topmark.utils.version import check_python_version
 
+#: Top-level subcommands, imported only when Click resolves them.
+ROOT_LAZY_SUBCOMMANDS: Final[dict[str, str]] = {
+    CliCmd.CHECK: "topmark.cli.commands.check:check_command",
+    CliCmd.CONFIG: "topmark.cli.commands.config:config_command",
+    CliCmd.PROBE: "topmark.cli.commands.probe:probe_command",
+    CliCmd.REGISTRY: "topmark.cli.commands.registry:registry_command",
+    CliCmd.SERVE: "topmark.cli.commands.serve:serve_command",
+    CliCmd.STRIP: "topmark.cli.commands.strip:strip_command",
+    CliCmd.VERSION: "topmark.cli.commands.version:version_command",
+}
+
 
 @rich_click.group(
-    cls=rich_click.RichGroup,
+    cls=LazyRichGroup,
+    lazy_subcommands=ROOT_LAZY_SUBCOMMANDS,
     context_settings=GROUP_CONTEXT_SETTINGS,
     invoke_without_command=True,  # Always invoke the cli() function
     help="Inspect, validate, and manage TopMark headers and configuration.",
@@ -110,11 +121,3 @@ def cli(
         )
         state: TopmarkCliState = bootstrap_cli_state(ctx)
         state.console.print(ctx.get_help())
-
-
-cli.add_command(config_command)
-cli.add_command(probe_command)
-cli.add_command(check_command)
-cli.add_command(strip_command)
-cli.add_command(registry_command)
-cli.add_command(version_command)
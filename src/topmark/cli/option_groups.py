@@ -58,13 +58,21 @@ CHECK_OR_STRIP_ONLY_PIPELINE_OPTIONS: Final[tuple[str, ...]] = (
     CliOpt.WRITE_MODE,
     CliOpt.RENDER_DIFF,
     CliOpt.RESULTS_SUMMARY_MODE,
+    CliOpt.PROGRESS,
+    CliOpt.PROFILE,
     CliOpt.REPORT,
+    CliOpt.RESULT_CACHE,
+    CliOpt.NO_RESULT_CACHE,
+    CliOpt.CLEAR_RESULT_CACHE,
+    CliOpt.CHANGED_SINCE,
+    CliOpt.STAGED,
 )
 """Pipeline mutation/reporting controls accepted by `check` and `strip`.
 
-These options either control writes, patch/diff previews, or report scope. They
-are intentionally rejected by `topmark probe`, which remains read-only and
-focused on discovery diagnostics.
+These options either control writes, patch/diff previews, report scope, the
+persistent result cache, or incremental git-based file selection. They are
+intentionally rejected by `topmark probe`, which remains read-only and focused
+on discovery diagnostics.
 """
 
 PROBE_FORBIDDEN_OPTIONS: Final[dict[str, str]] = {
@@ -746,6 +746,47 @@ def common_files_from_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
     return f
 
 
+def git_changed_files_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Apply incremental git-based file selection options for `check` and `strip`.
+
+    Adds the following options:
+        - ``--changed-since REV``: take candidates from files changed since `REV`.
+        - ``--staged``: take candidates from files staged in the git index.
+
+    Args:
+        f: The Click command function to decorate.
+
+    Returns:
+        The decorated function.
+    """
+    f = option_with_underscore_traps(
+        CliOpt.CHANGED_SINCE,
+        ArgKey.CHANGED_SINCE,
+        type=str,
+        default=None,
+        metavar="REV",
+        help=(
+            "Source: only consider files changed between git revision REV and the working "
+            "tree (local git only). PATHS, when given, restrict the changed files; "
+            "filters still apply."
+        ),
+    )(f)
+
+    f = option_with_underscore_traps(
+        CliOpt.STAGED,
+        ArgKey.STAGED,
+        is_flag=True,
+        default=False,
+        help=(
+            "Source: only consider files staged in the git index (relative to HEAD, or to "
+            f"{CliOpt.CHANGED_SINCE} REV). PATHS, when given, restrict the staged files; "
+            "filters still apply."
+        ),
+    )(f)
+
+    return f
+
+
 def config_dump_files_from_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
     """Apply config dump file selection and filtering options.
 
@@ -934,6 +975,8 @@ def pipeline_reporting_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
 
     Adds the following options:
         - ``--summary``: show outcome counts instead of per-file details.
+        - ``--progress``: show a live progress line on an interactive STDERR.
+        - ``--profile``: report per-step timings after the run.
         - ``--report``: control which entries appear in **human per-file**
           output.
 
@@ -954,6 +997,29 @@ def pipeline_reporting_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
         help="Show summary of outcome counts instead of per-file details.",
     )(f)
 
+    f = option_with_underscore_traps(
+        CliOpt.PROGRESS,
+        ArgKey.PROGRESS,
+        is_flag=True,
+        default=False,
+        help=(
+            "Show a progress line (files/s, ETA) on STDERR while files are processed "
+            "(human output on a terminal only)."
+        ),
+    )(f)
+
+    f = option_with_underscore_traps(
+        CliOpt.PROFILE,
+        ArgKey.PROFILE,
+        is_flag=True,
+        default=False,
+        help=(
+            "Record per-step wall/CPU time and bytes read/written for every file and report "
+            "p50/p95/max and the slowest files per step. Set PYTHONTRACEMALLOC=1 to also "
+            "record memory allocation deltas."
+        ),
+    )(f)
+
     f = option_with_underscore_traps(
         CliOpt.REPORT,
         ArgKey.REPORT_SCOPE,
@@ -981,6 +1047,70 @@ def pipeline_reporting_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
     return f
 
 
+def pipeline_execution_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Apply execution options for pipeline-style commands.
+
+    Adds the following option:
+        - ``--jobs/-j``: number of worker processes used to run the pipeline.
+
+    Args:
+        f: The Click command function to decorate.
+
+    Returns:
+        The decorated function.
+    """
+    f = option_with_underscore_traps(
+        CliOpt.JOBS,
+        CliShortOpt.JOBS,
+        ArgKey.JOBS,
+        type=click.IntRange(min=0),
+        default=1,
+        show_default=True,
+        help=(
+            "Number of worker processes used to process files (0 = one per CPU). "
+            "Results are reported in input order. Content written to STDOUT is always "
+            "processed sequentially."
+        ),
+    )(f)
+
+    return f
+
+
+def result_cache_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Apply persistent result-cache options for `check` and `strip`.
+
+    Adds the following options:
+        - ``--cache/--no-cache``: reuse cached results for unchanged files.
+        - ``--clear-cache``: delete the result cache before running.
+
+    Args:
+        f: The Click command function to decorate.
+
+    Returns:
+        The decorated function.
+    """
+    f = option_with_underscore_traps(
+        f"{CliOpt.RESULT_CACHE}/{CliOpt.NO_RESULT_CACHE}",
+        ArgKey.RESULT_CACHE,
+        is_flag=True,
+        default=False,
+        help=(
+            "Reuse cached results for files whose content and effective configuration are "
+            "unchanged since a previous run (cache stored in `.topmark_cache/`)."
+        ),
+    )(f)
+
+    f = option_with_underscore_traps(
+        CliOpt.CLEAR_RESULT_CACHE,
+        ArgKey.CLEAR_RESULT_CACHE,
+        is_flag=True,
+        default=False,
+        help="Delete the result cache before running.",
+    )(f)
+
+    return f
+
+
 def registry_details_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
     """Apply details mode output options for registry commands.
 
@@ -1292,6 +1422,37 @@ def remediation_policy_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
     return f
 
 
+def serve_transport_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
+    """Apply transport options for `topmark serve`.
+
+    Adds ``--socket PATH`` and ``--stdio``.
+
+    Args:
+        f: The Click command function to decorate.
+
+    Returns:
+        The decorated function.
+    """
+    f = option_with_underscore_traps(
+        CliOpt.SERVE_SOCKET,
+        ArgKey.SERVE_SOCKET,
+        type=click.Path(dir_okay=False),
+        default=None,
+        metavar="PATH",
+        help="Listen on this Unix socket (default: a per-user socket in the temporary directory).",
+    )(f)
+
+    f = option_with_underscore_traps(
+        CliOpt.SERVE_STDIO,
+        ArgKey.SERVE_STDIO,
+        is_flag=True,
+        default=False,
+        help="Answer newline-delimited JSON-RPC requests on STDIN/STDOUT instead of a socket.",
+    )(f)
+
+    return f
+
+
 def version_format_options(f: Callable[_P, _R]) -> Callable[_P, _R]:
     """Apply version formatting options.
 
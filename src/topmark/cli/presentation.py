@@ -93,25 +93,36 @@ from __future__ import annotations
 from collections.abc import Callable
 from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Final
+from functools import cache
+from typing import TYPE_CHECKING
 from typing import TypeAlias
 
-from rich.console import Console as RichConsole
-from rich.text import Text
-
 from topmark.core.presentation import StyleRole
 
+if TYPE_CHECKING:
+    from rich.console import Console as RichConsole
+
 TextStyler: TypeAlias = Callable[[str], str]
 """Callable which styles a str."""
 
-_RICH_CONSOLE: Final[RichConsole] = RichConsole(
-    color_system="standard",
-    force_terminal=True,
-    legacy_windows=False,
-    no_color=False,
-    soft_wrap=True,
-    width=120,
-)
+
+@cache
+def _rich_console() -> RichConsole:
+    """Return the shared capture console used by `rich_styler`.
+
+    Rich is imported on first use so that importing this module (and building
+    `DEFAULT_THEME`) stays cheap for commands that never emit styled output.
+    """
+    from rich.console import Console as RichConsole
+
+    return RichConsole(
+        color_system="standard",
+        force_terminal=True,
+        legacy_windows=False,
+        no_color=False,
+        soft_wrap=True,
+        width=120,
+    )
 
 
 def rich_styler(style: str) -> TextStyler:
@@ -134,9 +145,12 @@ def rich_styler(style: str) -> TextStyler:
     """
 
     def apply_style(text: str) -> str:
+        from rich.text import Text
+
+        console: RichConsole = _rich_console()
         rich_text = Text(text, style=style)
-        with _RICH_CONSOLE.capture() as capture:
-            _RICH_CONSOLE.print(rich_text, end="")
+        with console.capture() as capture:
+            console.print(rich_text, end="")
         return capture.get()
 
     return apply_style
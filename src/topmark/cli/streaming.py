@@ -18,7 +18,10 @@ console abstraction: helpers here describe CLI output intent, while
 
 from __future__ import annotations
 
+import sys
+import time
 from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 
 import click
@@ -27,9 +30,8 @@ from topmark.core.exit_codes import ExitCode
 from topmark.pipeline.engine import exit_code_from_pipeline_results
 from topmark.pipeline.machine.streaming import MachineProcessingResultEvent
 from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
-from topmark.pipeline.machine.streaming import MachineRunCompletedEvent
 from topmark.pipeline.machine.streaming import MachineRunStartedEvent
-from topmark.pipeline.reduction import iter_processing_results
+from topmark.pipeline.machine.streaming import iter_machine_processing_stream
 from topmark.pipeline.status import WriteStatus
 
 if TYPE_CHECKING:
@@ -38,9 +40,11 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from pathlib import Path
 
-    from topmark.pipeline.context.model import ProcessingContext
+    from topmark.cli.console.protocols import ConsoleProtocol
     from topmark.pipeline.kinds import PipelineKindLiteral
+    from topmark.pipeline.profiling import PipelineProfiler
     from topmark.pipeline.result import ProcessingResult
+    from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
 
 
 _EXIT_CODE_PRIORITY: dict[ExitCode, int] = {
@@ -64,12 +68,14 @@ class ProcessingStreamStats:
         failed: Number of files whose writer status is `FAILED`.
         would_change: Whether any observed result matches the command's dry-run
             would-change predicate.
+        profiler: Per-step timing aggregator for `--profile` runs, or `None`.
     """
 
     exit_code: ExitCode | None = None
     written: int = 0
     failed: int = 0
     would_change: bool = False
+    profiler: PipelineProfiler | None = None
 
     def observe(self, result: ProcessingResult, *, would_change: bool) -> None:
         """Update stream statistics from one durable processing result.
@@ -91,6 +97,9 @@ class ProcessingStreamStats:
         if would_change:
             self.would_change = True
 
+        if self.profiler is not None:
+            self.profiler.add(result)
+
 
 @dataclass(kw_only=True, slots=True)
 class ProbeStreamStats:
@@ -184,42 +193,34 @@ def emit_stdout_payload(payload: str, *, nl: bool = True) -> None:
 
 
 def iter_cli_processing_stream(
-    contexts: Iterable[ProcessingContext],
+    results: Iterable[ProcessingResult],
     *,
     command: PipelineKindLiteral,
     paths: Iterable[Path],
-    release_views: bool,
 ) -> Iterator[MachineProcessingStreamEvent]:
-    """Yield internal machine events from pipeline contexts without batch reduction.
+    """Yield internal machine events from durable results without batch reduction.
+
+    The run-start event is built from the resolved path list, so results are
+    pulled from `results` one at a time as the consumer advances the stream.
 
     Args:
-        contexts: Completed processing contexts in deterministic command order.
+        results: Durable processing results in deterministic command order, as
+            produced by [`iter_results_for_files`][topmark.pipeline.engine.iter_results_for_files]
+            followed by any synthetic results.
         command: Command family represented by the stream.
         paths: Ordered paths represented by the run, including synthetic missing
             inputs appended after selected paths.
-        release_views: Whether to release context-owned transient views after each
-            durable result snapshot is created.
 
     Yields:
         Internal machine stream events suitable for presentation or NDJSON output.
     """
     path_tuple: tuple[Path, ...] = tuple(paths)
-    yield MachineRunStartedEvent(
+    yield from iter_machine_processing_stream(
+        results,
         command=command,
         selected_count=len(path_tuple),
         paths=path_tuple,
     )
-    for index, result in enumerate(
-        iter_processing_results(contexts, release_views=release_views),
-    ):
-        yield MachineProcessingResultEvent(
-            command=command,
-            index=index,
-            result=result,
-        )
-    yield MachineRunCompletedEvent(
-        command=command,
-    )
 
 
 def observe_processing_stream(
@@ -245,3 +246,199 @@ def observe_processing_stream(
                 would_change=would_change(event.result),
             )
         yield event
+
+
+def format_processing_progress(*, done: int, total: int, elapsed: float) -> str:
+    """Format a one-line processing progress report.
+
+    Args:
+        done: Number of files processed so far.
+        total: Number of files selected for the run.
+        elapsed: Seconds elapsed since the run started.
+
+    Returns:
+        Progress text such as ``[ 12/345] 85.3 files/s, ETA 0:04``.
+    """
+    width: int = len(str(total))
+    rate: float = done / elapsed if elapsed > 0 else 0.0
+    if rate > 0:
+        remaining: int = round(max(total - done, 0) / rate)
+        minutes, seconds = divmod(remaining, 60)
+        eta: str = f"{minutes}:{seconds:02d}"
+    else:
+        eta = "-:--"
+    return f"[{done:>{width}}/{total}] {rate:.1f} files/s, ETA {eta}"
+
+
+@dataclass(kw_only=True, slots=True)
+class ProcessingProgressLine:
+    """Transient progress line written to an interactive STDERR.
+
+    The line is redrawn in place with a carriage return and must be cleared
+    before any other output is written to the same terminal. Redraws are
+    throttled so that fast runs do not spend their time repainting the line.
+
+    Attributes:
+        total: Number of files selected for the run.
+        done: Number of files processed so far.
+        clock: Monotonic clock returning seconds.
+        min_interval: Minimum number of seconds between two redraws.
+    """
+
+    total: int = 0
+    done: int = 0
+    clock: Callable[[], float] = time.monotonic
+    min_interval: float = 0.1
+    _started: float | None = field(default=None, init=False)
+    _last_draw: float | None = field(default=None, init=False)
+    _visible: bool = field(default=False, init=False)
+
+    def start(self, *, total: int) -> None:
+        """Start measuring a run.
+
+        Args:
+            total: Number of files selected for the run.
+        """
+        self.total = total
+        self.done = 0
+        self._started = self.clock()
+
+    def advance(self) -> None:
+        """Record one processed file and redraw the line when due."""
+        self.done += 1
+        now: float = self.clock()
+        if self._last_draw is not None and now - self._last_draw < self.min_interval:
+            return
+        self._last_draw = now
+        elapsed: float = now - (self._started if self._started is not None else now)
+        text: str = format_processing_progress(
+            done=self.done,
+            total=self.total,
+            elapsed=elapsed,
+        )
+        # `color=True` keeps the erase-line sequence; Click would strip it otherwise.
+        click.echo(f"\r{text}\x1b[K", nl=False, err=True, color=True)
+        self._visible = True
+
+    def clear(self) -> None:
+        """Erase the line if it is currently shown."""
+        if self._visible:
+            click.echo("\r\x1b[K", nl=False, err=True, color=True)
+            self._visible = False
+            # Redraw on the next file so the line reappears below new output.
+            self._last_draw = None
+
+
+def stderr_supports_progress() -> bool:
+    """Return whether STDERR is an interactive terminal that can show progress.
+
+    Returns:
+        `True` when STDERR is attached to a TTY.
+    """
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def track_processing_progress(
+    events: Iterable[MachineProcessingStreamEvent],
+    *,
+    progress: ProcessingProgressLine,
+) -> Iterator[MachineProcessingStreamEvent]:
+    """Yield processing stream events while updating a progress line.
+
+    Args:
+        events: Internal machine processing stream events.
+        progress: Progress line to start on run-start and advance per file.
+
+    Yields:
+        The original events, preserving order and object identity.
+    """
+    for event in events:
+        if isinstance(event, MachineRunStartedEvent):
+            progress.start(total=event.selected_count)
+        elif isinstance(event, MachineProcessingResultEvent):
+            progress.advance()
+        yield event
+
+
+@dataclass(kw_only=True, slots=True)
+class _LineTerminatedStream:
+    """Writer that ends every fragment of one stream on a line boundary.
+
+    Incremental fragments carry the separator between two items as a leading
+    newline on the later fragment, so an item's last line stays open until the
+    next item arrives. When STDOUT and STDERR share a terminal, the other
+    stream would then continue that open line. This writer terminates every
+    fragment immediately and drops the leading newline of the following
+    fragment, so the stream's text is unchanged as a whole.
+
+    Attributes:
+        write: Callable writing raw text to the stream.
+        wrote: Whether any text has been written.
+    """
+
+    write: Callable[[str], None]
+    wrote: bool = False
+    _owes_newline: bool = field(default=False, init=False)
+
+    def emit(self, text: str) -> None:
+        """Write one fragment, ending it with a newline.
+
+        Args:
+            text: Fragment text. Empty strings are ignored.
+        """
+        if not text:
+            return
+        if self._owes_newline and text.startswith("\n"):
+            text = text[1:]
+        self._owes_newline = False
+        if not text:
+            return
+        if not text.endswith("\n"):
+            text += "\n"
+            self._owes_newline = True
+        self.write(text)
+        self.wrote = True
+
+    def close(self) -> None:
+        """Write the stream's closing newline unless a fragment already did."""
+        if self.wrote and not self._owes_newline:
+            self.write("\n")
+
+
+def emit_human_stream_output(
+    fragments: Iterable[PipelineCommandHumanOutput],
+    *,
+    console: ConsoleProtocol,
+    show_report: bool,
+    progress: ProcessingProgressLine | None = None,
+) -> None:
+    """Write incremental human pipeline output as the fragments arrive.
+
+    Payload fragments go to STDOUT and report fragments to the human console.
+    Each non-empty stream is terminated by one newline, so the text written to
+    each stream matches emitting the concatenated output in one go. Fragments
+    are written up to a line boundary, so the two streams interleave cleanly
+    when they share a terminal.
+
+    Args:
+        fragments: Incremental output fragments in stream order.
+        console: Console receiving the human report.
+        show_report: Whether report fragments are written at all.
+        progress: Optional progress line to clear before writing a fragment.
+    """
+    payload = _LineTerminatedStream(write=lambda text: emit_stdout_payload(text, nl=False))
+    report = _LineTerminatedStream(write=lambda text: console.print(text, nl=False))
+    for fragment in fragments:
+        if progress is not None:
+            progress.clear()
+        payload.emit(fragment.stdout)
+        if show_report:
+            report.emit(fragment.stderr)
+
+    if progress is not None:
+        progress.clear()
+    payload.close()
+    report.close()
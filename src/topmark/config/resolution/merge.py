@@ -14,6 +14,7 @@ This module contains pure helpers that:
     - select which config provenance layers apply to a target path
     - merge config provenance layers in stable precedence order
     - build effective per-path mutable config drafts
+    - intern effective per-path frozen configs by applicable layer set
 
 Layer construction from resolved TOML sources lives in
 [`topmark.config.resolution.layers`][topmark.config.resolution.layers].
@@ -21,6 +22,8 @@ Layer construction from resolved TOML sources lives in
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 
 from topmark.config.io.deserializers import mutable_config_from_defaults
@@ -29,8 +32,10 @@ from topmark.utils.path import canonical_processing_path
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Sequence
     from pathlib import Path
 
+    from topmark.config.model import FrozenConfig
     from topmark.config.model import MutableConfig
     from topmark.config.resolution.layers import ConfigLayer
     from topmark.core.logging import TopmarkLogger
@@ -145,3 +150,103 @@ def build_effective_config_for_path(
     )
 
     return draft
+
+
+@dataclass(kw_only=True, slots=True)
+class EffectiveConfigCacheStats:
+    """Counters describing how well per-path config interning is working.
+
+    Attributes:
+        lookups: Number of paths resolved through the interner.
+        directories: Number of distinct canonical parent directories seen.
+        distinct_configs: Number of distinct applicable layer sets, i.e. the
+            number of effective configs actually merged and frozen.
+    """
+
+    lookups: int = 0
+    directories: int = 0
+    distinct_configs: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups served by an already-built effective config."""
+        return self.lookups - self.distinct_configs
+
+
+@dataclass(kw_only=True, slots=True)
+class EffectiveConfigInterner:
+    """Build each distinct per-path effective config only once.
+
+    Layer applicability depends only on a file's canonical parent directory,
+    and the effective config depends only on the set of applicable layers. Large
+    runs typically touch thousands of files but only a handful of layer
+    combinations, so this helper memoizes both steps: directories map to the
+    indexes of their applicable layers, and each distinct layer-index tuple maps
+    to one shared [`FrozenConfig`][topmark.config.model.FrozenConfig].
+
+    The result for a path is identical to
+    `build_effective_config_for_path(layers, path).freeze()`, except that paths
+    with the same applicable layers share the same config object.
+
+    Attributes:
+        layers: Candidate config provenance layers in precedence order.
+        stats: Interning counters, useful for debug output.
+    """
+
+    layers: Sequence[ConfigLayer]
+    stats: EffectiveConfigCacheStats = field(default_factory=EffectiveConfigCacheStats)
+    _scope_roots: tuple[Path | None, ...] = field(init=False, repr=False)
+    _layer_keys_by_directory: dict[Path, tuple[int, ...]] = field(
+        init=False,
+        repr=False,
+        default_factory=lambda: {},
+    )
+    _configs_by_layer_key: dict[tuple[int, ...], FrozenConfig] = field(
+        init=False,
+        repr=False,
+        default_factory=lambda: {},
+    )
+
+    def __post_init__(self) -> None:
+        """Resolve layer scope roots once instead of once per path."""
+        self._scope_roots = tuple(
+            None if layer.scope_root is None else layer.scope_root.resolve()
+            for layer in self.layers
+        )
+
+    def _applicable_layer_key(self, directory: Path) -> tuple[int, ...]:
+        """Return the indexes of the layers that apply to files in `directory`."""
+        key: tuple[int, ...] | None = self._layer_keys_by_directory.get(directory)
+        if key is None:
+            key = tuple(
+                index
+                for index, scope_root in enumerate(self._scope_roots)
+                if scope_root is None or directory.is_relative_to(scope_root)
+            )
+            self._layer_keys_by_directory[directory] = key
+            self.stats.directories += 1
+        return key
+
+    def config_for_path(self, path: Path) -> FrozenConfig:
+        """Return the shared effective frozen config for a file path.
+
+        Args:
+            path: Existing file path selected for processing.
+
+        Returns:
+            The effective config built from the layers applicable to `path`.
+        """
+        self.stats.lookups += 1
+        directory: Path = canonical_processing_path(path).parent
+        key: tuple[int, ...] = self._applicable_layer_key(directory)
+        config: FrozenConfig | None = self._configs_by_layer_key.get(key)
+        if config is None:
+            config = merge_layers_globally(self.layers[index] for index in key).freeze()
+            self._configs_by_layer_key[key] = config
+            self.stats.distinct_configs += 1
+            logger.debug(
+                "Built effective config for %s from %d applicable layer(s)",
+                directory,
+                len(key),
+            )
+        return config
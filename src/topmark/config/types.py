@@ -147,3 +147,22 @@ class FileWriteStrategy(KeyedStrEnum):
 
     ATOMIC = ("atomic", "Safe atomic writer (default)", ("ATOMIC", "safe", "default"))
     INPLACE = ("inplace", "Fast in-place writer", ("IN_PLACE", "INPLACE", "in_place", "fast"))
+
+
+class WriteDurability(KeyedStrEnum):
+    """When atomic writes make their directory entries durable.
+
+    The enum `.value` is the stable machine key used in config.
+    The human label lives in `.label`.
+    """
+
+    BATCHED = (
+        "batched",
+        "Sync each touched directory once at the end of the run (default)",
+        ("BATCHED", "default"),
+    )
+    PER_FILE = (
+        "per_file",
+        "Sync the directory after every written file",
+        ("PER_FILE", "per-file", "paranoid"),
+    )
@@ -443,6 +443,37 @@ class DuplicateProcessorKeyError(TopmarkError):
         self.new_class: Final[str] = new_class
 
 
+# ---- File selection errors ----
+
+
+class GitSelectionError(TopmarkError):
+    """Raised when changed files cannot be obtained from git.
+
+    This covers a missing `git` executable, a working directory outside any git
+    work tree, and revisions that git cannot resolve.
+
+    Args:
+        message: Human-readable error message.
+        path: Directory in which git was invoked.
+        details: Optional diagnostic lines, such as git's own error output.
+    """
+
+    def __init__(
+        self,
+        *,
+        message: str,
+        path: Path,
+        details: tuple[str, ...] = (),
+    ) -> None:
+        super().__init__(
+            ErrorContext(
+                message=message,
+                path=path,
+                details=details,
+            )
+        )
+
+
 # ---- Policy / reporting boundary errors ----
 
 
@@ -498,6 +529,83 @@ class InvalidReportScopeError(TopmarkError):
         self.report_value: Final[str | None] = report_value
 
 
+class InvalidContentInputError(TopmarkError):
+    """Raised when in-memory content is supplied without exactly one logical path.
+
+    Content passed to the API (or the server) is processed as the content of a
+    single file, so the accompanying paths must name exactly one file.
+
+    Args:
+        message: Human-readable error message.
+        path_count: Number of paths supplied with the content.
+    """
+
+    def __init__(
+        self,
+        *,
+        message: str,
+        path_count: int,
+    ) -> None:
+        super().__init__(
+            ErrorContext(
+                message=message,
+            )
+        )
+        self.path_count: Final[int] = path_count
+
+
+# ---- Server errors ----
+
+
+class ServerUnavailableError(TopmarkError):
+    """Raised when no TopMark server answers on a socket.
+
+    Clients catch this error to fall back to in-process execution.
+
+    Args:
+        message: Human-readable error message.
+        path: Socket path that could not be reached.
+    """
+
+    def __init__(
+        self,
+        *,
+        message: str,
+        path: Path,
+    ) -> None:
+        super().__init__(
+            ErrorContext(
+                message=message,
+                path=path,
+            )
+        )
+
+
+class ServerRequestError(TopmarkError):
+    """Raised when a TopMark server rejects or fails a request.
+
+    The service raises it for malformed requests; clients raise it when a server
+    answers with a JSON-RPC error response.
+
+    Args:
+        message: Error message reported by the server.
+        code: JSON-RPC error code reported by the server.
+    """
+
+    def __init__(
+        self,
+        *,
+        message: str,
+        code: int,
+    ) -> None:
+        super().__init__(
+            ErrorContext(
+                message=message,
+            )
+        )
+        self.code: Final[int] = code
+
+
 # ---- TOML document errors ----
 
 
@@ -45,6 +45,8 @@ class ArgKey(str, Enum):
     INCLUDE_FROM = "include_from"
     EXCLUDE_FROM = "exclude_from"
     FILES_FROM = "files_from"
+    CHANGED_SINCE = "changed_since"
+    STAGED = "staged"
     INCLUDE_FILE_TYPES = "include_file_types"
     EXCLUDE_FILE_TYPES = "exclude_file_types"
 
@@ -77,11 +79,18 @@ class ArgKey(str, Enum):
     # Pipeline result reporting
     REPORT_SCOPE = "report_scope"
 
+    # Pipeline execution
+    JOBS = "jobs"
+    RESULT_CACHE = "result_cache"
+    CLEAR_RESULT_CACHE = "clear_result_cache"
+
     # Output / write behavior
     WRITE_MODE = "write_mode"
     APPLY_CHANGES = "apply_changes"
     RENDER_DIFF = "diff"
     RESULTS_SUMMARY_MODE = "summary_mode"
+    PROGRESS = "show_progress"
+    PROFILE = "profile"
     OUTPUT_FORMAT = "output_format"
     SHOW_DETAILS = "show_details"
 
@@ -105,5 +114,9 @@ class ArgKey(str, Enum):
     # Config root
     CONFIG_ROOT = "config_root"
 
+    # Server
+    SERVE_SOCKET = "socket_path"
+    SERVE_STDIO = "stdio"
+
     # Machine metadata payload
     META = "meta_payload"
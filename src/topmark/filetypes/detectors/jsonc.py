@@ -14,6 +14,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from topmark.utils.source import read_path_prefix
+
 if TYPE_CHECKING:
     from pathlib import Path
 
@@ -25,14 +27,15 @@ def looks_like_jsonc(path: Path) -> bool:
     JSON strings by using a tiny state machine over a limited prefix.
 
     Strategy (fast, best-effort):
-    - Read up to ~128 KiB, UTF-8 with surrogate escapes ignored.
+    - Read up to 128 KiB (from the pipeline's shared source when active), decoded
+      as UTF-8 with invalid sequences ignored.
     - Track states: in_string (JSON double-quoted), in_line_comment, in_block_comment.
     - Properly handle string escapes (e.g. ``\"``), including backslash runs.
     - Report True if ``//`` or ``/* ... */`` is encountered while **not** in a
       string and **not** in an existing block comment.
     """
     try:
-        text: str = path.read_text(encoding="utf-8", errors="ignore")[:131072]
+        text: str = read_path_prefix(path, 131072).decode("utf-8", errors="ignore")
     except OSError:
         return False
 
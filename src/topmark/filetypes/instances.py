@@ -34,7 +34,6 @@ from __future__ import annotations
 from collections.abc import Iterable
 from functools import lru_cache
 from importlib import import_module
-from importlib.metadata import EntryPoints
 from importlib.metadata import entry_points
 from typing import TYPE_CHECKING
 from typing import Final
@@ -42,12 +41,15 @@ from typing import cast
 
 from topmark.core.logging import get_logger
 from topmark.filetypes.model import FileType
+from topmark.registry.snapshot import get_registry_snapshot
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from importlib.metadata import EntryPoint
     from types import ModuleType
 
     from topmark.core.logging import TopmarkLogger
+    from topmark.registry.snapshot import RegistrySnapshot
 
 logger: TopmarkLogger = get_logger(__name__)
 
@@ -89,21 +91,37 @@ def _iter_builtin_filetypes() -> Iterable[FileType]:
             logger.exception("Failed to import built-in filetypes from %s", modname)
 
 
-def _iter_plugin_filetypes() -> Generator[FileType, None, None]:
-    """Yield `FileType` objects provided by plugin entry points.
+def discover_plugin_entry_points() -> tuple[EntryPoint, ...]:
+    """Return the ``topmark.filetypes`` entry points of the current environment.
 
-    Yields:
-        Plugin-provided `FileType` instances loaded from the
-        ``topmark.filetypes`` entry point group.
+    Returns:
+        Entry points in discovery order; empty if entry points cannot be read.
     """
     try:
         eps = entry_points()
     except Exception:
         logger.exception("Failed to read entry points")
-        return
+        return ()
 
     # Python 3.10+ API: EntryPoints.select is available and typed
-    candidates: EntryPoints = eps.select(group=_ENTRYPOINT_GROUP)
+    return tuple(eps.select(group=_ENTRYPOINT_GROUP))
+
+
+def _iter_plugin_filetypes(
+    candidates: Iterable[EntryPoint] | None = None,
+) -> Generator[FileType, None, None]:
+    """Yield `FileType` objects provided by plugin entry points.
+
+    Args:
+        candidates: Entry points to load; discovered from the environment when
+            `None`.
+
+    Yields:
+        Plugin-provided `FileType` instances loaded from the
+        ``topmark.filetypes`` entry point group.
+    """
+    if candidates is None:
+        candidates = discover_plugin_entry_points()
 
     for ep in candidates:
         try:
@@ -158,15 +176,21 @@ def _dedupe_by_local_key(items: Iterable[FileType]) -> list[FileType]:
     return acc
 
 
-def _aggregate_all_filetypes() -> list[FileType]:
+def _aggregate_all_filetypes(
+    plugin_entry_points: Iterable[EntryPoint] | None = None,
+) -> list[FileType]:
     """Collect all built-in and plugin file types into one ordered sequence.
 
+    Args:
+        plugin_entry_points: Plugin entry points to load; discovered from the
+            environment when `None`.
+
     Returns:
         Deduplicated list containing built-in file types followed by plugin
         file types.
     """
     ordered: list[FileType] = list(_iter_builtin_filetypes())
-    ordered.extend(list(_iter_plugin_filetypes()))
+    ordered.extend(list(_iter_plugin_filetypes(plugin_entry_points)))
     return _dedupe_by_local_key(ordered)
 
 
@@ -190,12 +214,47 @@ def _generate_registry(filetypes: Iterable[FileType]) -> dict[str, FileType]:
     return registry
 
 
+def build_base_file_type_registry(
+    *,
+    plugin_entry_points: Iterable[EntryPoint] | None = None,
+) -> dict[str, FileType]:
+    """Build a fresh (uncached) base file type registry.
+
+    Args:
+        plugin_entry_points: Plugin entry points to load; discovered from the
+            environment when `None`.
+
+    Returns:
+        Mapping of file type local key to `FileType`.
+    """
+    return _generate_registry(_aggregate_all_filetypes(plugin_entry_points))
+
+
+@lru_cache(maxsize=1)
+def get_plugin_entry_points() -> tuple[EntryPoint, ...]:
+    """Return and cache the plugin entry points used by the base registries.
+
+    When a registry snapshot is enabled and current, the recorded entry points
+    are returned; otherwise the environment is scanned once per process.
+
+    Returns:
+        ``topmark.filetypes`` entry points in discovery order.
+    """
+    snapshot: RegistrySnapshot | None = get_registry_snapshot()
+    if snapshot is not None:
+        return snapshot.entry_points_for(_ENTRYPOINT_GROUP)
+    return discover_plugin_entry_points()
+
+
 @lru_cache(maxsize=1)
 def get_base_file_type_registry() -> dict[str, FileType]:
     """Return and cache the base file type registry.
 
     The base registry contains built-in and plugin-provided file types keyed by
-    ``FileType.local_key``.
+    ``FileType.local_key``. When a registry snapshot is enabled (see
+    [`topmark.registry.snapshot`][topmark.registry.snapshot]), plugin entry
+    points are taken from the snapshot instead of scanning the environment
+    (see [`get_plugin_entry_points()`][topmark.filetypes.instances.get_plugin_entry_points]).
 
     Returns:
         Cached mapping of file type local key to `FileType`.
@@ -205,7 +264,8 @@ def get_base_file_type_registry() -> dict[str, FileType]:
         tests and advanced callers), use
         [`topmark.registry.filetypes.FileTypeRegistry.as_mapping`][topmark.registry.filetypes.FileTypeRegistry.as_mapping].
     """
-    all_types: list[FileType] = _aggregate_all_filetypes()
-    registry: dict[str, FileType] = _generate_registry(all_types)
+    registry: dict[str, FileType] = build_base_file_type_registry(
+        plugin_entry_points=get_plugin_entry_points(),
+    )
     logger.debug("Loaded %d file types", len(registry))
     return registry
@@ -267,7 +267,7 @@ class FileType:
 
     >> def looks_like_cjson(path: Path) -> bool:
     >>     try:
-    >>         text = path.read_text(encoding="utf-8", errors="ignore")
+    >>         text = read_path_prefix(path, 65536).decode("utf-8", errors="ignore")
     >>     except OSError:
     >>         return False
     >>     # Heuristics: allow // or /* */ outside of strings (simple check)
@@ -287,6 +287,9 @@ class FileType:
         * Content matchers should read a small portion of the file where possible
           to remain fast on large trees. The current implementation leaves that
           policy to the callable to keep the base class simple.
+          [`read_path_prefix()`][topmark.utils.source.read_path_prefix] serves the
+          bytes from the pipeline's shared per-file buffer during resolution, so
+          the probed file is not opened a second time.
     """
 
     local_key: str
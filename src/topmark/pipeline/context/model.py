@@ -51,10 +51,13 @@ from topmark.pipeline.hints import HintLog
 from topmark.pipeline.hints import KnownCode
 from topmark.pipeline.hints import make_hint
 from topmark.pipeline.status import FsStatus
+from topmark.pipeline.views import BoundedFileImageView
 from topmark.pipeline.views import UpdatedContent
 from topmark.pipeline.views import UpdatedView
 from topmark.pipeline.views import Views
+from topmark.pipeline.views import source_tail_for_edit
 from topmark.utils.path import format_machine_path
+from topmark.utils.source import FileSource
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -69,6 +72,11 @@ if TYPE_CHECKING:
     from topmark.filetypes.model import FileType
     from topmark.pipeline.outcome_snapshot import OutcomeSnapshot
     from topmark.pipeline.protocols import Step
+    from topmark.pipeline.step_timing import StepTiming
+    from topmark.pipeline.views import DiskTailLines
+    from topmark.pipeline.views import FileImageView
+    from topmark.pipeline.views import PlannedEdit
+    from topmark.pipeline.views import SourceTail
     from topmark.processors.base import HeaderProcessor
     from topmark.resolution.probe import ResolutionProbeResult
     from topmark.runtime.model import RunOptions
@@ -99,6 +107,25 @@ class HaltState:
     step_name: str = ""  # step name that requested the halt
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class WriteStats:
+    """Byte counters reported by the writer's sink for a single file.
+
+    Attributes:
+        bytes_written: Number of bytes written to the sink.
+        bytes_copied: Portion of ``bytes_written`` copied verbatim from the source file
+            instead of being encoded from updated lines.
+    """
+
+    bytes_written: int = 0
+    bytes_copied: int = 0
+
+    @property
+    def bytes_encoded(self) -> int:
+        """Portion of ``bytes_written`` encoded from updated lines."""
+        return self.bytes_written - self.bytes_copied
+
+
 @dataclass(kw_only=True, slots=True)
 class ProcessingContext:
     r"""Context for header processing in the TopMark pipeline.
@@ -161,6 +188,11 @@ class ProcessingContext:
             for summarization.
         views: Bundle that carries image/header/build/render/updated/ diff views for this file. The
             runner may prune heavy views after processing.
+        source: Shared read-once byte buffer for the file, created on first use by
+            `open_source()` and released once ingestion is complete.
+        write_stats: Byte counters reported by the writer's sink, or ``None`` when the
+            writer did not run a sink for this file.
+        step_timings: Per-step measurements recorded when `run_options.profile` is set.
     """
 
     config: FrozenConfig  # Effective layered config for this file
@@ -227,6 +259,38 @@ class ProcessingContext:
     # View-based properties
     views: Views = field(default_factory=Views)
 
+    # Shared single-read ingestion buffer (resolver content probes, sniffer, reader)
+    source: FileSource | None = None
+
+    # Writer sink byte counters (encoded vs. copied)
+    write_stats: WriteStats | None = None
+
+    # Per-step profiling measurements (only recorded for profiled runs)
+    step_timings: list[StepTiming] = field(default_factory=lambda: [])
+
+    def open_source(self) -> FileSource:
+        """Return the shared byte source for `path`, creating it on first use.
+
+        Creating the source performs no I/O; the file is read on first access. In
+        STDIN content mode the source serves `run_options.stdin_content` from memory.
+
+        Returns:
+            The context's [`FileSource`][topmark.utils.source.FileSource].
+        """
+        if self.source is None:
+            content: bytes | None = self.run_options.stdin_content
+            self.source = (
+                FileSource(self.path)
+                if content is None
+                else FileSource.from_bytes(self.path, content)
+            )
+        return self.source
+
+    def release_source(self) -> None:
+        """Drop the shared source buffer; its I/O counters stay available."""
+        if self.source is not None:
+            self.source.release()
+
     def get_effective_policy(self) -> FrozenPolicy:
         """Return the effective policy for this processing context.
 
@@ -332,6 +396,49 @@ class ProcessingContext:
             return self.views.image.line_count()
         return 0
 
+    def split_image_for_editing(self) -> tuple[list[str], Sequence[str]]:
+        """Return the editable head of the image and the tail that edits leave untouched.
+
+        For a bounded image (see
+        [`BoundedFileImageView`][topmark.pipeline.views.BoundedFileImageView]) the head
+        holds the header region and the tail streams the rest of the file from disk.
+        For a fully read image the head is the whole file and the tail is empty, so
+        callers can treat both cases uniformly: edit the head, then append the tail.
+
+        Returns:
+            A ``(head, tail)`` pair. ``head`` is a fresh list; ``tail`` must not be mutated.
+        """
+        image: FileImageView | None = self.views.image
+        if isinstance(image, BoundedFileImageView):
+            head: list[str]
+            tail: DiskTailLines
+            head, tail = image.split()
+            return list(head), tail
+        return self.materialize_image_lines(), ()
+
+    def source_tail_for_edit(
+        self,
+        edit: PlannedEdit | None,
+        original_lines: Sequence[str],
+    ) -> SourceTail | None:
+        """Describe the source bytes that `edit` leaves untouched, for verbatim copying.
+
+        Args:
+            edit: Planned edit computed against `original_lines`.
+            original_lines: Editable image head returned by `split_image_for_editing()`.
+
+        Returns:
+            The [`SourceTail`][topmark.pipeline.views.SourceTail] a file sink may copy,
+            or ``None`` when the tail is absent, too short, or cannot be located.
+        """
+        return source_tail_for_edit(
+            edit=edit,
+            original_lines=original_lines,
+            path=self.path,
+            stat=self.source.stat if self.source is not None else None,
+            leading_bom=self.leading_bom,
+        )
+
     def iter_updated_lines(self) -> Iterable[str]:
         """Iterate the updated file image lines, if present.
 
@@ -0,0 +1,166 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : durability.py
+#   file_relpath : src/topmark/pipeline/durability.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Directory durability for atomic file writes (group commit).
+
+[`AtomicFileSink`][topmark.pipeline.steps.writer.AtomicFileSink] makes a write
+durable in two parts: it `fsync()`s the temporary file before `os.replace()`, and
+it `fsync()`s the parent directory so that the rename itself survives a crash.
+The first part is required for every file; the second only has to happen once
+per directory after all renames into that directory.
+
+With [`WriteDurability.BATCHED`][topmark.config.types.WriteDurability] (the
+default) the writer skips the per-file directory sync and the engine records the
+directory of every written file in a
+[`DirectorySyncBatch`][topmark.pipeline.durability.DirectorySyncBatch]. When the
+run ends, the batch syncs each directory once (the *commit phase*) and reports
+its cost as [`CommitStats`][topmark.pipeline.durability.CommitStats].
+`WriteDurability.PER_FILE` keeps the directory sync after every rename.
+
+Directory `fsync()` is POSIX-only; on platforms without `os.O_DIRECTORY` it is
+skipped, exactly as in the per-file path.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from topmark.config.types import FileWriteStrategy
+from topmark.config.types import OutputTarget
+from topmark.config.types import WriteDurability
+from topmark.core.logging import get_logger
+from topmark.pipeline.status import WriteStatus
+
+if TYPE_CHECKING:
+    from topmark.core.logging import TopmarkLogger
+    from topmark.runtime.model import RunOptions
+
+logger: TopmarkLogger = get_logger(__name__)
+
+
+def sync_directory(path: Path) -> bool:
+    """`fsync()` a directory so that renames into it are durable.
+
+    Args:
+        path: Directory to sync.
+
+    Returns:
+        True if the directory was synced; False when directory `fsync()` is not
+        available on this platform or filesystem (best-effort durability).
+    """
+    o_directory: int | None = getattr(os, "O_DIRECTORY", None)
+    if o_directory is None:
+        logger.debug("Directory fsync not available on this platform")
+        return False
+    try:
+        dir_fd: int = os.open(str(path), o_directory)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        # Best-effort durability; ignore on platforms/filesystems that don't support it.
+        logger.debug("Directory fsync not supported for %s", path, exc_info=True)
+        return False
+    return True
+
+
+def defers_directory_sync(run_options: RunOptions) -> bool:
+    """Return whether directory syncs of this run are deferred to the commit phase.
+
+    Only atomic file writes rename into a directory; in-place writes and STDOUT
+    output have no directory entry to make durable.
+
+    Args:
+        run_options: Invocation-wide runtime options.
+
+    Returns:
+        True for apply-mode atomic file writes with batched durability.
+    """
+    return (
+        run_options.apply_changes is True
+        and not run_options.stdin_mode
+        and run_options.output_target != OutputTarget.STDOUT
+        and run_options.file_write_strategy != FileWriteStrategy.INPLACE
+        and run_options.write_durability != WriteDurability.PER_FILE
+    )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CommitStats:
+    """Cost of the commit phase of one run.
+
+    Attributes:
+        files: Files written during the run.
+        directories: Distinct directories that received written files.
+        synced: Directories actually synced (directory `fsync()` is best-effort).
+        elapsed_ns: Wall-clock duration of the commit phase in nanoseconds.
+    """
+
+    files: int
+    directories: int
+    synced: int
+    elapsed_ns: int
+
+
+@dataclass(kw_only=True, slots=True)
+class DirectorySyncBatch:
+    """Directories awaiting one `fsync()` each at the end of a run.
+
+    Attributes:
+        files: Number of written files recorded so far.
+        directories: Parent directories of the recorded files.
+    """
+
+    files: int = 0
+    directories: set[Path] = field(default_factory=lambda: set[Path]())
+
+    def record(self, path: Path, write_status: WriteStatus) -> None:
+        """Record the directory of `path` if the writer wrote it.
+
+        Args:
+            path: Processing path of a file.
+            write_status: Final write status of the file.
+        """
+        if write_status == WriteStatus.WRITTEN:
+            self.files += 1
+            self.directories.add(path.parent)
+
+    def commit(self) -> CommitStats:
+        """Sync every recorded directory once and reset the batch.
+
+        Returns:
+            The cost of the commit phase.
+        """
+        start_ns: int = time.perf_counter_ns()
+        directories: list[Path] = sorted(self.directories)
+        synced: int = sum(1 for directory in directories if sync_directory(directory))
+        stats: CommitStats = CommitStats(
+            files=self.files,
+            directories=len(directories),
+            synced=synced,
+            elapsed_ns=time.perf_counter_ns() - start_ns,
+        )
+        self.files = 0
+        self.directories.clear()
+        if stats.files:
+            logger.info(
+                "Commit phase: synced %d of %d directories for %d written file(s) in %.2f ms",
+                stats.synced,
+                stats.directories,
+                stats.files,
+                stats.elapsed_ns / 1_000_000,
+            )
+        return stats
@@ -36,26 +36,60 @@ Typical usage:
         # CLI would map this to a process exit; API callers may handle it differently.
         ...
 
+Parallel execution:
+  `iter_results_for_files()` optionally fans files out to a process pool when
+  `RunOptions.jobs` requests more than one worker. Workers reduce each context to
+  a durable `ProcessingResult` before handing it back, so only picklable value
+  objects cross the process boundary. Results are still yielded in input order,
+  the hard-link duplicate guard is computed once over the whole file list, and
+  the first engine-level error code is preserved exactly as in sequential mode.
+
+Write-behind:
+  Sequential apply runs execute the writer step of each file on a small
+  background thread pool, so the `fsync()` of file N overlaps with reading,
+  scanning and rendering file N+1. Contexts are still yielded in input order and
+  only after their write has resolved, so `WriteStatus` is final when a context is
+  reduced. Writes in flight are bounded by the source bytes they keep alive.
+
+Commit phase:
+  Atomic apply-mode writes with batched durability (the default) defer their
+  directory `fsync()` to the end of the run. The engine records the directory of
+  every written file and syncs each directory once after the last file (see
+  [`topmark.pipeline.durability`][topmark.pipeline.durability]); the cost of that
+  phase is reported separately in `PipelineExecutionState.commit`.
+
 This module is intentionally minimal to keep the dependency graph acyclic and
 the execution path easy to test in isolation.
 """
 
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from typing import Final
 from typing import Protocol
 
 from topmark.config.policy import PolicyRegistry
 from topmark.config.policy import make_policy_registry
+from topmark.config.types import OutputTarget
 from topmark.core.exit_codes import ExitCode
 from topmark.core.logging import get_logger
 from topmark.pipeline import runner
 from topmark.pipeline.context.model import HaltState
 from topmark.pipeline.context.model import ProcessingContext
+from topmark.pipeline.durability import DirectorySyncBatch
+from topmark.pipeline.durability import defers_directory_sync
 from topmark.pipeline.hints import Axis
 from topmark.pipeline.hints import Cluster
 from topmark.pipeline.hints import KnownCode
+from topmark.pipeline.reduction import iter_processing_results
+from topmark.pipeline.result import ProcessingResult
+from topmark.pipeline.result_cache import ResultCache
 from topmark.pipeline.status import ContentStatus
 from topmark.pipeline.status import FsStatus
 from topmark.pipeline.status import RenderStatus
@@ -73,11 +107,25 @@ if TYPE_CHECKING:
 
     from topmark.config.model import FrozenConfig
     from topmark.core.logging import TopmarkLogger
+    from topmark.pipeline.durability import CommitStats
     from topmark.pipeline.pipelines import PipelineSelection
+    from topmark.pipeline.result_cache import ResultCacheStats
     from topmark.runtime.model import RunOptions
 
 logger: TopmarkLogger = get_logger(__name__)
 
+_PENDING_FILES_PER_WORKER: Final[int] = 4
+"""Number of in-flight files per worker process before results are drained in order."""
+
+_WRITE_BEHIND_THREADS: Final[int] = 4
+"""Background threads running the writer step of sequential apply runs."""
+
+_WRITE_BEHIND_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+"""Budget of source bytes whose write may be in flight before the engine waits."""
+
+_WRITE_BEHIND_MAX_FILES: Final[int] = _WRITE_BEHIND_THREADS * _PENDING_FILES_PER_WORKER
+"""Number of processed files that may wait for earlier writes before the engine waits."""
+
 
 class SupportsPipelineExitStatus(Protocol):
     """Minimum result surface required for pipeline exit-code selection."""
@@ -216,9 +264,15 @@ class PipelineExecutionState:
     Attributes:
         exit_code: First non-success engine-level exit code encountered while
             iterating files, or `None` when no such error occurred.
+        result_cache: Result-cache counters for the run, or `None` when the
+            result cache is disabled.
+        commit: Cost of the deferred directory syncs of the run, or `None` when
+            the run did not defer them. Set once the iteration finishes.
     """
 
     exit_code: ExitCode | None = None
+    result_cache: ResultCacheStats | None = None
+    commit: CommitStats | None = None
 
 
 def exit_code_from_pipeline_results(
@@ -307,7 +361,8 @@ def iter_steps_for_files(
         pipeline: The pipeline steps to execute for the run.
         file_list: List of file Path instances to be processed in the run.
         state: Optional mutable execution state updated with the first
-            non-success engine-level exit code encountered while iterating.
+            non-success engine-level exit code encountered while iterating, and
+            with the commit-phase cost once iteration ends.
 
     Yields:
         Processing contexts in input-file order for files that were processed
@@ -331,6 +386,8 @@ def iter_steps_for_files(
           user-visible messaging and exiting the process if desired.
         - When multiple files are processed, only the *first* error code is preserved
           (a conventional behavior for batch tools). Subsequent files continue to run.
+        - In apply runs the writer step runs on a background thread while later
+          files are processed; each context is yielded once its write resolved.
     """
     execution_state: PipelineExecutionState = (
         state if state is not None else PipelineExecutionState()
@@ -338,59 +395,665 @@ def iter_steps_for_files(
     default_policy_registry: PolicyRegistry | None = (
         None if path_configs is not None else make_policy_registry(config)
     )
+    # Per-path configs are typically shared between many paths (see
+    # `EffectiveConfigInterner`), so build one policy registry per config object.
+    policy_registries: dict[int, tuple[FrozenConfig, PolicyRegistry]] = {}
     hard_link_duplicate_paths: set[Path] = _hard_link_duplicate_paths(file_list)
+    sync_batch: DirectorySyncBatch | None = (
+        DirectorySyncBatch() if defers_directory_sync(run_options) else None
+    )
+
+    # Apply runs hand the writer step of each file to background threads; the
+    # context is yielded (and reduced) only once its write has resolved.
+    writer_index: int | None = _write_behind_start(run_options, pipeline)
+    write_behind: ThreadPoolExecutor | None = (
+        ThreadPoolExecutor(
+            max_workers=_WRITE_BEHIND_THREADS,
+            thread_name_prefix="topmark-writer",
+        )
+        if writer_index is not None
+        else None
+    )
+    pending: deque[_PendingWrite] = deque()
+    bytes_in_flight: int = 0
+
+    def _finish_one() -> ProcessingContext | None:
+        nonlocal bytes_in_flight
+        entry: _PendingWrite = pending.popleft()
+        bytes_in_flight -= entry.size
+        if entry.write is not None:
+            try:
+                entry.write.result()
+            except Exception as e:  # noqa: BLE001 - logged and mapped by _exit_code_for_exception
+                execution_state.exit_code = execution_state.exit_code or _exit_code_for_exception(
+                    entry.ctx.path, e
+                )
+                return None
+        if sync_batch is not None:
+            sync_batch.record(entry.ctx.path, entry.ctx.status.write)
+        return entry.ctx
 
     # Process each path independently; collect contexts and degrade gracefully
     # on non-fatal errors (recording the first encountered exit code).
-    for path in file_list:
-        try:
-            effective_config: FrozenConfig = (
-                path_configs[path] if path_configs is not None else config
-            )
-            policy_registry: PolicyRegistry | None = (
-                make_policy_registry(effective_config)
-                if path_configs is not None
-                else default_policy_registry
-            )
-            if path in hard_link_duplicate_paths:
-                yield _build_hard_link_duplicate_context(
+    try:
+        for path in file_list:
+            hard_link_duplicate: bool = path in hard_link_duplicate_paths
+            try:
+                effective_config: FrozenConfig = (
+                    path_configs[path] if path_configs is not None else config
+                )
+                policy_registry: PolicyRegistry | None = (
+                    _policy_registry_for(effective_config, policy_registries)
+                    if path_configs is not None
+                    else default_policy_registry
+                )
+                ctx: ProcessingContext = _run_file(
                     path=path,
                     config=effective_config,
-                    run_options=run_options,
                     policy_registry=policy_registry,
+                    run_options=run_options,
+                    pipeline=pipeline,
+                    hard_link_duplicate=hard_link_duplicate,
+                    stop=writer_index,
+                )
+                write: Future[ProcessingContext] | None = None
+                if (
+                    write_behind is not None
+                    and writer_index is not None
+                    and not hard_link_duplicate
+                ):
+                    if pipeline.steps[writer_index].may_proceed(ctx):
+                        write = write_behind.submit(
+                            _run_steps, ctx, run_options, pipeline, start=writer_index
+                        )
+                    else:
+                        # Nothing to write: finish inline instead of paying a thread handoff.
+                        _run_steps(ctx, run_options, pipeline, start=writer_index)
+            except Exception as e:  # noqa: BLE001 - logged and mapped by _exit_code_for_exception
+                execution_state.exit_code = execution_state.exit_code or _exit_code_for_exception(
+                    path, e
                 )
                 continue
 
-            # When no precomputed registry is supplied, bootstrap() derives one from config.
-            ctx_obj: ProcessingContext = ProcessingContext.bootstrap(
-                path=path,
-                config=effective_config,
-                run_options=run_options,
-                policy_registry_override=policy_registry,
-            )
-            yield runner.run(
-                ctx_obj,
-                pipeline.steps,
-                prune_views=run_options.prune_views,
-                keep_diff_view=run_options.emit_diff,
+            size: int = _bytes_in_flight(ctx) if write is not None else 0
+            pending.append(_PendingWrite(ctx=ctx, write=write, size=size))
+            bytes_in_flight += size
+            while pending and (
+                pending[0].write is None
+                or pending[0].write.done()
+                or bytes_in_flight > _WRITE_BEHIND_MAX_BYTES
+                or len(pending) > _WRITE_BEHIND_MAX_FILES
+            ):
+                finished: ProcessingContext | None = _finish_one()
+                if finished is not None:
+                    yield finished
+        while pending:
+            finished = _finish_one()
+            if finished is not None:
+                yield finished
+    finally:
+        if write_behind is not None:
+            # Writes already handed to the pool always complete (also when the
+            # consumer stops early) so that no temp file is left half-written.
+            write_behind.shutdown(wait=True)
+        # Commit even when the consumer stops early: renamed files are already visible.
+        if sync_batch is not None:
+            execution_state.commit = sync_batch.commit()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _PendingWrite:
+    """A processed file waiting for its background write before it is yielded.
+
+    Attributes:
+        ctx: Processing context of the file.
+        write: Future running the writer step, or `None` when the context is complete.
+        size: Source bytes counted against the bytes-in-flight budget.
+    """
+
+    ctx: ProcessingContext
+    write: Future[ProcessingContext] | None
+    size: int
+
+
+def _write_behind_start(
+    run_options: RunOptions,
+    pipeline: PipelineSelection,
+) -> int | None:
+    """Return the index of the writer step when writes may run on background threads.
+
+    Only apply-mode file writes qualify. STDOUT output must stay ordered on the
+    calling thread, and dry runs have no writer step.
+
+    Args:
+        run_options: Invocation-wide runtime options.
+        pipeline: The pipeline steps to execute for the run.
+
+    Returns:
+        Index of the step whose primary axis is `WRITE`, or `None` when the run
+        writes inline.
+    """
+    if (
+        run_options.apply_changes is not True
+        or run_options.stdin_mode
+        or run_options.output_target == OutputTarget.STDOUT
+    ):
+        return None
+    for index, step in enumerate(pipeline.steps):
+        if step.primary_axis is Axis.WRITE:
+            return index
+    return None
+
+
+def _bytes_in_flight(ctx: ProcessingContext) -> int:
+    """Return the size charged to the write-behind budget for `ctx`.
+
+    The source size is a cheap upper-bound proxy for the updated content kept
+    alive until the write completes.
+    """
+    if ctx.source is not None and ctx.source.stat is not None:
+        return ctx.source.stat.st_size
+    return 0
+
+
+def _policy_registry_for(
+    config: FrozenConfig,
+    registries: dict[int, tuple[FrozenConfig, PolicyRegistry]],
+) -> PolicyRegistry:
+    """Return the policy registry for `config`, building it once per config object.
+
+    Args:
+        config: Effective config whose policy registry is requested.
+        registries: Per-run memo keyed by config identity. Entries keep the config
+            alive so its `id()` cannot be reused while the memo exists.
+
+    Returns:
+        The shared policy registry for `config`.
+    """
+    cached: tuple[FrozenConfig, PolicyRegistry] | None = registries.get(id(config))
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    registry: PolicyRegistry = make_policy_registry(config)
+    registries[id(config)] = (config, registry)
+    logger.debug("Built policy registry #%d for per-path config", len(registries))
+    return registry
+
+
+def _run_file(
+    *,
+    path: Path,
+    config: FrozenConfig,
+    policy_registry: PolicyRegistry | None,
+    run_options: RunOptions,
+    pipeline: PipelineSelection,
+    hard_link_duplicate: bool,
+    stop: int | None = None,
+) -> ProcessingContext:
+    """Bootstrap and run the pipeline for a single file.
+
+    Args:
+        path: Processing path for the file.
+        config: Effective layered config for the file.
+        policy_registry: Optional precomputed policy registry for `config`.
+        run_options: Invocation-wide runtime options shared by all files in the run.
+        pipeline: The pipeline steps to execute for the run.
+        hard_link_duplicate: Whether the file shares storage with another
+            selected path and must be blocked without running the pipeline.
+        stop: Index of the first step left to the caller (the writer step in
+            write-behind runs), or `None` to run the whole pipeline.
+
+    Returns:
+        The processed (or hard-link-blocked) context for the file.
+    """
+    if hard_link_duplicate:
+        return _build_hard_link_duplicate_context(
+            path=path,
+            config=config,
+            run_options=run_options,
+            policy_registry=policy_registry,
+        )
+
+    # When no precomputed registry is supplied, bootstrap() derives one from config.
+    ctx_obj: ProcessingContext = ProcessingContext.bootstrap(
+        path=path,
+        config=config,
+        run_options=run_options,
+        policy_registry_override=policy_registry,
+    )
+    return _run_steps(ctx_obj, run_options, pipeline, stop=stop)
+
+
+def _run_steps(
+    ctx: ProcessingContext,
+    run_options: RunOptions,
+    pipeline: PipelineSelection,
+    *,
+    start: int = 0,
+    stop: int | None = None,
+) -> ProcessingContext:
+    """Run `pipeline.steps[start:stop]` for one context with the run's pruning options."""
+    return runner.run(
+        ctx,
+        pipeline.steps,
+        prune_views=run_options.prune_views,
+        keep_diff_view=run_options.emit_diff,
+        start=start,
+        stop=stop,
+        profile=run_options.profile,
+    )
+
+
+def _exit_code_for_exception(path: Path, exc: Exception) -> ExitCode:
+    """Log a per-file engine-level failure and return its exit code.
+
+    Must be called from within the `except` block that caught `exc` so that
+    unexpected failures are logged with their traceback.
+
+    Args:
+        path: Path whose processing raised `exc`.
+        exc: Exception raised while processing `path`.
+
+    Returns:
+        The exit code documented for the exception category.
+    """
+    if isinstance(exc, FileNotFoundError | PermissionError | IsADirectoryError):
+        logger.error("Filesystem error while processing %s: %s", path, exc)
+        logger.error("%s: %s", exc, path)
+        if isinstance(exc, FileNotFoundError | IsADirectoryError):
+            return ExitCode.FILE_NOT_FOUND
+        return ExitCode.PERMISSION_DENIED
+    if isinstance(exc, UnicodeDecodeError):
+        logger.error("Encoding error while reading %s: %s", path, exc)
+        return ExitCode.ENCODING_ERROR
+    logger.exception("Unexpected error processing %s: %s", path, exc)
+    return ExitCode.PIPELINE_ERROR
+
+
+# ---- Parallel (multi-process) execution ----
+
+
+def resolve_job_count(jobs: int) -> int:
+    """Return the effective number of worker processes for a `jobs` request.
+
+    Args:
+        jobs: Requested worker count. `0` selects one worker per available CPU;
+            negative values are treated as `1`.
+
+    Returns:
+        The effective worker count (always at least `1`).
+    """
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def _supports_process_pool(run_options: RunOptions) -> bool:
+    """Return whether the run may execute files in worker processes.
+
+    Content-on-STDIN runs and STDOUT output targets write rewritten content to
+    the parent process's STDOUT from `WriterStep`, so they always run
+    sequentially in-process to keep that payload ordered and unbuffered.
+    """
+    return not run_options.stdin_mode and run_options.output_target != OutputTarget.STDOUT
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _WorkerSetup:
+    """Run-wide state shipped once to each worker process.
+
+    Attributes:
+        run_options: Invocation-wide runtime options shared by all files in the run.
+        pipeline: The pipeline steps to execute for the run.
+        configs: Distinct effective configs used by the run, addressed by index
+            so each config is pickled once per worker rather than once per file.
+    """
+
+    run_options: RunOptions
+    pipeline: PipelineSelection
+    configs: tuple[FrozenConfig, ...]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _WorkerOutcome:
+    """Picklable per-file outcome returned by a worker process.
+
+    Attributes:
+        result: Durable processing result, or `None` when the file raised a
+            handled engine-level error.
+        exit_code: Engine-level exit code for a failed file, or `None`.
+    """
+
+    result: ProcessingResult | None
+    exit_code: ExitCode | None
+
+
+_worker_setup: _WorkerSetup | None = None
+_worker_policy_registries: dict[int, PolicyRegistry] = {}
+
+
+def _init_worker(setup: _WorkerSetup) -> None:
+    """Install run-wide state in a freshly started worker process."""
+    global _worker_setup
+    _worker_setup = setup
+    _worker_policy_registries.clear()
+
+
+def _run_file_in_worker(path: Path, config_index: int, hard_link_duplicate: bool) -> _WorkerOutcome:
+    """Run the pipeline for one file inside a worker process.
+
+    Args:
+        path: Processing path for the file.
+        config_index: Index of the file's effective config in `_WorkerSetup.configs`.
+        hard_link_duplicate: Whether the file is blocked by the hard-link guard.
+
+    Returns:
+        The reduced durable result, or the engine-level exit code when the file
+        raised a handled error.
+
+    Raises:
+        RuntimeError: If the worker process was not initialized.
+    """
+    setup: _WorkerSetup | None = _worker_setup
+    if setup is None:
+        raise RuntimeError("Pipeline worker process was not initialized")
+
+    config: FrozenConfig = setup.configs[config_index]
+    policy_registry: PolicyRegistry | None = _worker_policy_registries.get(config_index)
+    if policy_registry is None:
+        policy_registry = make_policy_registry(config)
+        _worker_policy_registries[config_index] = policy_registry
+
+    try:
+        ctx: ProcessingContext = _run_file(
+            path=path,
+            config=config,
+            policy_registry=policy_registry,
+            run_options=setup.run_options,
+            pipeline=setup.pipeline,
+            hard_link_duplicate=hard_link_duplicate,
+        )
+    except Exception as e:  # noqa: BLE001 - logged and mapped by _exit_code_for_exception
+        return _WorkerOutcome(result=None, exit_code=_exit_code_for_exception(path, e))
+
+    result: ProcessingResult = ProcessingResult.from_context(ctx)
+    ctx.views.release_all()
+    return _WorkerOutcome(result=result, exit_code=None)
+
+
+def _iter_results_in_process_pool(
+    *,
+    run_options: RunOptions,
+    config: FrozenConfig,
+    path_configs: Mapping[Path, FrozenConfig] | None,
+    pipeline: PipelineSelection,
+    file_list: list[Path],
+    state: PipelineExecutionState,
+    jobs: int,
+) -> Iterator[ProcessingResult]:
+    """Yield durable results computed by a pool of worker processes, in input order.
+
+    At most `jobs * _PENDING_FILES_PER_WORKER` files are in flight at any time,
+    so memory stays bounded while the head of the queue is drained in order.
+    """
+    hard_link_duplicate_paths: set[Path] = _hard_link_duplicate_paths(file_list)
+    sync_batch: DirectorySyncBatch | None = (
+        DirectorySyncBatch() if defers_directory_sync(run_options) else None
+    )
+
+    configs: list[FrozenConfig] = [config]
+    config_indexes: dict[int, int] = {id(config): 0}
+    pending: deque[tuple[Path, Future[_WorkerOutcome]]] = deque()
+    max_pending: int = jobs * _PENDING_FILES_PER_WORKER
+
+    def _config_index(path: Path) -> int:
+        effective_config: FrozenConfig = path_configs[path] if path_configs is not None else config
+        index: int | None = config_indexes.get(id(effective_config))
+        if index is None:
+            index = len(configs)
+            configs.append(effective_config)
+            config_indexes[id(effective_config)] = index
+        return index
+
+    # Resolve config indexes up front so every distinct config is shipped once
+    # through the worker initializer.
+    path_config_indexes: list[int | None] = []
+    for path in file_list:
+        try:
+            path_config_indexes.append(_config_index(path))
+        except Exception as e:  # noqa: BLE001 - logged and mapped by _exit_code_for_exception
+            state.exit_code = state.exit_code or _exit_code_for_exception(path, e)
+            path_config_indexes.append(None)
+
+    def _drain_one() -> Iterator[ProcessingResult]:
+        path, future = pending.popleft()
+        try:
+            outcome: _WorkerOutcome = future.result()
+        except Exception as e:  # noqa: BLE001 - logged and mapped by _exit_code_for_exception
+            # Worker crashes (e.g. a broken pool) are isolated per file like any
+            # other unexpected pipeline failure.
+            state.exit_code = state.exit_code or _exit_code_for_exception(path, e)
+            return
+        if outcome.exit_code is not None:
+            state.exit_code = state.exit_code or outcome.exit_code
+        if outcome.result is not None:
+            if sync_batch is not None:
+                sync_batch.record(outcome.result.path, outcome.result.status.write)
+            yield outcome.result
+
+    setup = _WorkerSetup(
+        run_options=run_options,
+        pipeline=pipeline,
+        configs=tuple(configs),
+    )
+    executor = ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(setup,),
+    )
+    try:
+        for path, config_index in zip(file_list, path_config_indexes, strict=True):
+            if config_index is None:
+                continue
+            pending.append(
+                (
+                    path,
+                    executor.submit(
+                        _run_file_in_worker,
+                        path,
+                        config_index,
+                        path in hard_link_duplicate_paths,
+                    ),
+                )
             )
-        except (FileNotFoundError, PermissionError, IsADirectoryError) as e:
-            logger.error("Filesystem error while processing %s: %s", path, e)
-            if isinstance(e, FileNotFoundError | IsADirectoryError):
-                logger.error("%s: %s", e, path)
-                execution_state.exit_code = execution_state.exit_code or ExitCode.FILE_NOT_FOUND
-            else:
-                logger.error("%s: %s", e, path)
-                execution_state.exit_code = execution_state.exit_code or ExitCode.PERMISSION_DENIED
-            continue
-        except UnicodeDecodeError as e:
-            logger.error("Encoding error while reading %s: %s", path, e)
-            execution_state.exit_code = execution_state.exit_code or ExitCode.ENCODING_ERROR
+            while len(pending) >= max_pending:
+                yield from _drain_one()
+        while pending:
+            yield from _drain_one()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Workers only rename; the parent syncs each touched directory once.
+        if sync_batch is not None:
+            state.commit = sync_batch.commit()
+
+
+def iter_results_for_files(
+    *,
+    run_options: RunOptions,
+    config: FrozenConfig,
+    path_configs: Mapping[Path, FrozenConfig] | None = None,
+    pipeline: PipelineSelection,
+    file_list: list[Path],
+    state: PipelineExecutionState | None = None,
+) -> Iterator[ProcessingResult]:
+    """Yield durable processing results for files in input order.
+
+    This is the result-oriented engine boundary. When `run_options.jobs`
+    resolves to a single worker it reduces the contexts produced by
+    `iter_steps_for_files()` one at a time, releasing their views immediately.
+    Otherwise files are fanned out to a process pool; each worker runs the
+    same per-file pipeline and returns a reduced `ProcessingResult`.
+
+    Parallel execution preserves the sequential contract:
+
+    - results are yielded in input-file order;
+    - the hard-link duplicate guard is computed across the whole file list;
+    - files that raise handled engine-level errors are skipped and only the
+      first corresponding exit code is recorded in `state`.
+
+    Runs that write rewritten content to STDOUT (content-on-STDIN mode or the
+    STDOUT output target) always execute sequentially.
+
+    When `run_options.result_cache_dir` is set, unchanged files are looked up in
+    the persistent [`ResultCache`][topmark.pipeline.result_cache.ResultCache]
+    first and only cache misses are executed; cache counters are recorded in
+    `state.result_cache`.
+
+    Args:
+        run_options: Invocation-wide runtime options shared by all files in the run.
+        config: Default layered TopMark configuration for the run.
+        path_configs: Optional per-path effective layered configs. When provided, a
+            path-specific config is used for bootstrap; otherwise the shared `config`
+            is used.
+        pipeline: The pipeline steps to execute for the run.
+        file_list: List of file Path instances to be processed in the run.
+        state: Optional mutable execution state updated with the first
+            non-success engine-level exit code encountered while iterating.
+
+    Yields:
+        Durable processing results in input-file order for files that were
+        processed successfully by the engine layer.
+
+    Notes:
+        Worker processes resolve file types and processors from the registries
+        visible to a freshly imported `topmark` package (built-ins and
+        installed entry points). Runtime-only registry overlays registered in
+        the calling process are only honored in sequential mode.
+    """
+    execution_state: PipelineExecutionState = (
+        state if state is not None else PipelineExecutionState()
+    )
+    if run_options.result_cache_dir is not None and not run_options.stdin_mode:
+        yield from _iter_results_with_cache(
+            run_options=run_options,
+            config=config,
+            path_configs=path_configs,
+            pipeline=pipeline,
+            file_list=file_list,
+            state=execution_state,
+            cache_dir=run_options.result_cache_dir,
+        )
+        return
+
+    yield from _iter_uncached_results(
+        run_options=run_options,
+        config=config,
+        path_configs=path_configs,
+        pipeline=pipeline,
+        file_list=file_list,
+        state=execution_state,
+    )
+
+
+def _iter_uncached_results(
+    *,
+    run_options: RunOptions,
+    config: FrozenConfig,
+    path_configs: Mapping[Path, FrozenConfig] | None,
+    pipeline: PipelineSelection,
+    file_list: list[Path],
+    state: PipelineExecutionState,
+) -> Iterator[ProcessingResult]:
+    """Run the pipeline for every file, sequentially or in a process pool."""
+    jobs: int = min(resolve_job_count(run_options.jobs), len(file_list))
+    if jobs <= 1 or not _supports_process_pool(run_options):
+        yield from iter_processing_results(
+            iter_steps_for_files(
+                run_options=run_options,
+                config=config,
+                path_configs=path_configs,
+                pipeline=pipeline,
+                file_list=file_list,
+                state=state,
+            ),
+            release_views=True,
+        )
+        return
+
+    logger.debug("Running pipeline for %d file(s) with %d worker processes", len(file_list), jobs)
+    yield from _iter_results_in_process_pool(
+        run_options=run_options,
+        config=config,
+        path_configs=path_configs,
+        pipeline=pipeline,
+        file_list=file_list,
+        state=state,
+        jobs=jobs,
+    )
+
+
+def _iter_results_with_cache(
+    *,
+    run_options: RunOptions,
+    config: FrozenConfig,
+    path_configs: Mapping[Path, FrozenConfig] | None,
+    pipeline: PipelineSelection,
+    file_list: list[Path],
+    state: PipelineExecutionState,
+    cache_dir: Path,
+) -> Iterator[ProcessingResult]:
+    """Yield results in input order, reusing cached results for unchanged files.
+
+    Cache lookups happen up front so that only misses are handed to the
+    (possibly parallel) pipeline. Hard-linked paths always run: the hard-link
+    guard depends on the whole selection, not on a single file's content.
+    Missed files keep their relative order, so their results are merged back by
+    matching the processing path of the next pending result.
+    """
+    cache: ResultCache = ResultCache.for_run(cache_dir, run_options=run_options, pipeline=pipeline)
+    state.result_cache = cache.stats
+    hard_link_duplicate_paths: set[Path] = _hard_link_duplicate_paths(file_list)
+
+    def _effective_config(path: Path) -> FrozenConfig:
+        return path_configs.get(path, config) if path_configs is not None else config
+
+    cached: list[ProcessingResult | None] = []
+    misses: list[Path] = []
+    for path in file_list:
+        hit: ProcessingResult | None = (
+            None
+            if path in hard_link_duplicate_paths
+            else cache.lookup(path, config=_effective_config(path))
+        )
+        cached.append(hit)
+        if hit is None:
+            misses.append(path)
+
+    logger.debug(
+        "Result cache %s: %d hit(s), %d file(s) to process",
+        cache_dir,
+        cache.stats.hits,
+        len(misses),
+    )
+
+    computed: Iterator[ProcessingResult] = _iter_uncached_results(
+        run_options=run_options,
+        config=config,
+        path_configs=path_configs,
+        pipeline=pipeline,
+        file_list=misses,
+        state=state,
+    )
+    pending: ProcessingResult | None = next(computed, None)
+    for path, hit in zip(file_list, cached, strict=True):
+        if hit is not None:
+            yield hit
             continue
-        except Exception as e:
-            logger.exception("Unexpected error processing %s: %s", path, e)
-            execution_state.exit_code = execution_state.exit_code or ExitCode.PIPELINE_ERROR
+        # Files that raised engine-level errors produce no result; skip them.
+        if pending is None or pending.path != path:
             continue
+        cache.store(pending, config=_effective_config(path))
+        yield pending
+        pending = next(computed, None)
 
 
 def run_steps_for_files(
@@ -19,12 +19,13 @@ It is intentionally:
 
 Responsibilities:
 - **JSON**: build a single top-level envelope containing `meta`, `config`,
-  `config_diagnostics`, and either processing data (`results` / `summary`) or
-  probe data (`probes`).
+  `config_diagnostics`, and either processing data (`results` / `summary`, plus
+  `profile` for profiled runs) or probe data (`probes`).
 - **NDJSON**: yield a stream of per-record mappings following the project's
   NDJSON contract (Pattern A: every record includes `kind` and `meta`), starting
-  with config prefix records and followed by processing records (`result` /
-  `summary`) or probe records (`probe`).
+  with config prefix records, followed by processing records (`result` /
+  `summary` / `profile`) or probe records (`probe`), and closed by one `totals`
+  record.
 
 Where config diagnostics are included, this module exposes the flattened
 compatibility view derived from staged config-validation logs.
@@ -50,16 +51,20 @@ from topmark.core.machine.envelopes import build_ndjson_record
 from topmark.core.machine.schemas import MachineDomain
 from topmark.core.machine.schemas import MetaPayload
 from topmark.diagnostic.machine.envelopes import iter_diagnostic_ndjson_records
+from topmark.pipeline.machine.payloads import build_outcome_summary_rows_payload
 from topmark.pipeline.machine.payloads import build_probe_result_payload
 from topmark.pipeline.machine.payloads import build_processing_result_payload
-from topmark.pipeline.machine.payloads import build_processing_results_summary_rows_payload
+from topmark.pipeline.machine.payloads import build_run_totals_payload
 from topmark.pipeline.machine.payloads import build_standalone_processing_diff_payload
+from topmark.pipeline.machine.payloads import build_step_profile_rows_payload
 from topmark.pipeline.machine.schemas import PipelineKey
 from topmark.pipeline.machine.schemas import PipelineRecordKind
 from topmark.pipeline.machine.schemas import StandaloneProcessingDiffPayload
 from topmark.pipeline.machine.streaming import MachineProcessingResultEvent
 from topmark.pipeline.machine.streaming import MachineRunCompletedEvent
 from topmark.pipeline.machine.streaming import MachineRunStartedEvent
+from topmark.pipeline.profiling import PipelineProfiler
+from topmark.pipeline.reduction import ProcessingSummary
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -70,7 +75,6 @@ if TYPE_CHECKING:
     from topmark.config.model import FrozenConfig
     from topmark.diagnostic.model import FrozenDiagnosticLog
     from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
-    from topmark.pipeline.result import ProcessingResult
     from topmark.toml.resolution import ResolvedTopmarkTomlSources
 
 
@@ -219,7 +223,8 @@ def iter_probe_results_stream_ndjson_records(
         events: Internal machine stream events in deterministic producer order.
 
     Yields:
-        Shaped NDJSON records preserving the existing probe machine schema.
+        Shaped NDJSON records preserving the existing probe machine schema,
+        ending with one `totals` record.
 
     Raises:
         ValueError: If the stream contains events for another command, duplicate
@@ -289,6 +294,12 @@ def iter_probe_results_stream_ndjson_records(
     if not completed:
         raise _missing_completion_error("Probe NDJSON")
 
+    yield build_ndjson_record(
+        kind=PipelineRecordKind.TOTALS,
+        meta=meta,
+        payload=build_run_totals_payload(expected_index),
+    )
+
 
 def build_processing_results_stream_json_envelope(
     *,
@@ -297,6 +308,7 @@ def build_processing_results_stream_json_envelope(
     resolved_toml: ResolvedTopmarkTomlSources,
     events: Iterable[MachineProcessingStreamEvent],
     summary_mode: bool,
+    profile: bool = False,
 ) -> dict[str, object]:
     """Build the processing JSON envelope from durable-result stream events.
 
@@ -306,6 +318,7 @@ def build_processing_results_stream_json_envelope(
         resolved_toml: ResolvedTopmarkTomlSources.
         events: Internal machine stream events in deterministic producer order.
         summary_mode: If True, emit flat summary rows instead of per-file results.
+        profile: If True, add per-step profiling rows under `"profile"`.
 
     Returns:
         JSON-serializable envelope mapping preserving the existing processing JSON schema.
@@ -323,7 +336,10 @@ def build_processing_results_stream_json_envelope(
     started: bool = False
     completed: bool = False
     result_payloads: list[dict[str, object]] = []
-    summary_results: list[ProcessingResult] = []
+    # Summary mode folds each result into constant-size counters instead of
+    # retaining it, so memory does not grow with the number of files.
+    summary: ProcessingSummary = ProcessingSummary()
+    profiler: PipelineProfiler | None = PipelineProfiler() if profile else None
     for event in events:
         match event:
             case MachineRunStartedEvent(command="check" | "strip"):
@@ -344,8 +360,10 @@ def build_processing_results_stream_json_envelope(
                         actual_index=event.index,
                     )
                 expected_index += 1
+                if profiler is not None:
+                    profiler.add(event.result)
                 if summary_mode:
-                    summary_results.append(event.result)
+                    summary.add(event.result)
                 else:
                     result_payloads.append(build_processing_result_payload(event.result))
             case MachineRunCompletedEvent(command="check" | "strip"):
@@ -366,8 +384,8 @@ def build_processing_results_stream_json_envelope(
         payload: dict[str, object] = {
             ConfigKey.CONFIG.value: cfg_payload,
             ConfigKey.CONFIG_DIAGNOSTICS.value: cfg_diag_payload,
-            PipelineKey.SUMMARY.value: build_processing_results_summary_rows_payload(
-                summary_results,
+            PipelineKey.SUMMARY.value: build_outcome_summary_rows_payload(
+                summary.outcome_reason_rows(),
             ),
         }
     else:
@@ -376,6 +394,10 @@ def build_processing_results_stream_json_envelope(
             ConfigKey.CONFIG_DIAGNOSTICS.value: cfg_diag_payload,
             PipelineKey.RESULTS.value: result_payloads,
         }
+    if profiler is not None:
+        payload[PipelineKey.PROFILE.value] = build_step_profile_rows_payload(
+            profiler.profiles(),
+        )
 
     return build_json_envelope(
         meta=meta,
@@ -390,6 +412,7 @@ def iter_processing_results_stream_ndjson_records(
     resolved_toml: ResolvedTopmarkTomlSources,
     events: Iterable[MachineProcessingStreamEvent],
     summary_mode: bool,
+    profile: bool = False,
 ) -> Iterator[dict[str, object]]:
     """Yield processing NDJSON records from an internal processing stream.
 
@@ -399,9 +422,11 @@ def iter_processing_results_stream_ndjson_records(
         resolved_toml: ResolvedTopmarkTomlSources.
         events: Internal machine stream events in deterministic producer order.
         summary_mode: Whether to emit summary records instead of per-file result records.
+        profile: Whether to emit one trailing `profile` record per pipeline step.
 
     Yields:
-        Shaped NDJSON records preserving the existing processing machine schema.
+        Shaped NDJSON records preserving the existing processing machine schema,
+        ending with one `totals` record.
 
     Raises:
         ValueError: If the stream contains events for another command, duplicate
@@ -432,7 +457,10 @@ def iter_processing_results_stream_ndjson_records(
     expected_index: int = 0
     started: bool = False
     completed: bool = False
-    summary_results: list[ProcessingResult] = []
+    # Summary mode folds each result into constant-size counters instead of
+    # retaining it, so memory does not grow with the number of files.
+    summary: ProcessingSummary = ProcessingSummary()
+    profiler: PipelineProfiler | None = PipelineProfiler() if profile else None
     for event in events:
         match event:
             case MachineRunStartedEvent(command="check" | "strip"):
@@ -453,8 +481,10 @@ def iter_processing_results_stream_ndjson_records(
                         actual_index=event.index,
                     )
                 expected_index += 1
+                if profiler is not None:
+                    profiler.add(event.result)
                 if summary_mode:
-                    summary_results.append(event.result)
+                    summary.add(event.result)
                 else:
                     yield build_ndjson_record(
                         kind=PipelineRecordKind.RESULT,
@@ -490,9 +520,23 @@ def iter_processing_results_stream_ndjson_records(
         raise _missing_completion_error("Processing NDJSON")
 
     if summary_mode:
-        for record in build_processing_results_summary_rows_payload(summary_results):
+        for record in build_outcome_summary_rows_payload(summary.outcome_reason_rows()):
             yield build_ndjson_record(
                 kind=PipelineRecordKind.SUMMARY,
                 meta=meta,
                 payload=record,
             )
+
+    if profiler is not None:
+        for row in build_step_profile_rows_payload(profiler.profiles()):
+            yield build_ndjson_record(
+                kind=PipelineRecordKind.PROFILE,
+                meta=meta,
+                payload=row,
+            )
+
+    yield build_ndjson_record(
+        kind=PipelineRecordKind.TOTALS,
+        meta=meta,
+        payload=build_run_totals_payload(expected_index),
+    )
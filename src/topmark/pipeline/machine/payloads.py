@@ -50,7 +50,10 @@ if TYPE_CHECKING:
 
     from topmark.pipeline.machine.schemas import EmbeddedProcessingDiffPayload
     from topmark.pipeline.machine.schemas import OutcomeSummaryRow
+    from topmark.pipeline.machine.schemas import RunTotalsPayload
     from topmark.pipeline.machine.schemas import StandaloneProcessingDiffPayload
+    from topmark.pipeline.machine.schemas import StepProfileRow
+    from topmark.pipeline.profiling import StepProfile
     from topmark.pipeline.result import ProcessingResult
 
 
@@ -170,11 +173,15 @@ def build_standalone_processing_diff_payload(
     }
 
 
-def _summary_rows_from_counts(
-    counts: list[OutcomeReasonCount],
+def build_outcome_summary_rows_payload(
+    counts: Iterable[OutcomeReasonCount],
 ) -> list[OutcomeSummaryRow]:
     """Build JSON-friendly summary rows from grouped outcome counts.
 
+    Use this with pre-aggregated counts (e.g. from a
+    [`ProcessingSummary`][topmark.pipeline.reduction.ProcessingSummary]) to
+    shape summary output without retaining per-file results.
+
     Args:
         counts: Ordered outcome/reason/count rows.
 
@@ -222,7 +229,7 @@ def build_processing_results_summary_rows_payload(
     counts: list[OutcomeReasonCount] = collect_outcome_reason_counts(
         results,
     )
-    return _summary_rows_from_counts(counts)
+    return build_outcome_summary_rows_payload(counts)
 
 
 def iter_processing_results_summary_entries(
@@ -246,4 +253,47 @@ def iter_processing_results_summary_entries(
         results,
     )
 
-    yield from _summary_rows_from_counts(counts)
+    yield from build_outcome_summary_rows_payload(counts)
+
+
+def build_step_profile_rows_payload(
+    profiles: Iterable[StepProfile],
+) -> list[StepProfileRow]:
+    """Build JSON-friendly per-step profiling rows.
+
+    Args:
+        profiles: Aggregated step profiles in step order.
+
+    Returns:
+        List of [`StepProfileRow`][topmark.pipeline.machine.schemas.StepProfileRow] objects.
+    """
+    return [
+        {
+            "step": profile.step,
+            "files": profile.files,
+            "wall_total": profile.wall_total,
+            "wall_p50": profile.wall_p50,
+            "wall_p95": profile.wall_p95,
+            "wall_max": profile.wall_max,
+            "cpu_total": profile.cpu_total,
+            "bytes_read": profile.bytes_read,
+            "bytes_written": profile.bytes_written,
+            "alloc_bytes": profile.alloc_bytes,
+            "slowest": [
+                {"path": item.path, "wall_seconds": item.wall_seconds} for item in profile.slowest
+            ],
+        }
+        for profile in profiles
+    ]
+
+
+def build_run_totals_payload(count: int) -> RunTotalsPayload:
+    """Build the totals payload that closes an NDJSON stream.
+
+    Args:
+        count: Number of per-file results (or probed paths) in the run.
+
+    Returns:
+        A [`RunTotalsPayload`][topmark.pipeline.machine.schemas.RunTotalsPayload].
+    """
+    return {"count": count}
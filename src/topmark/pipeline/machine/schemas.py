@@ -41,6 +41,9 @@ fragments** (not full JSON/NDJSON envelopes):
   [`ResolutionProbeResult`][topmark.resolution.probe.ResolutionProbeResult], including
   filtered explicit inputs that never reached file-type probing.
 
+- **NDJSON streams** of processing and probe commands end with one `kind="totals"`
+  record whose payload follows `RunTotalsPayload`.
+
 Notes:
     - These are `TypedDict` definitions (static typing only). Runtime validation is
       intentionally out-of-scope.
@@ -66,6 +69,8 @@ class PipelineKey(str, Enum):
         RESULTS: Container key for a JSON list of processing results.
         SUMMARY: Container key for pipeline outcome summaries.
         DIFF: Container key for a single processing diff payload.
+        PROFILE: Container key for per-step profiling statistics.
+        TOTALS: Container key for the run totals that close an NDJSON stream.
     """
 
     PROBE = "probe"
@@ -74,6 +79,8 @@ class PipelineKey(str, Enum):
     RESULTS = "results"
     SUMMARY = "summary"
     DIFF = "diff"
+    PROFILE = "profile"
+    TOTALS = "totals"
 
 
 class PipelineRecordKind(str, Enum):
@@ -84,12 +91,16 @@ class PipelineRecordKind(str, Enum):
         RESULT: One per-file processing result record.
         SUMMARY: One per-summary-row record.
         DIFF: One per-file diff payload record when diff text is available.
+        PROFILE: One per-step profiling record for `--profile` runs.
+        TOTALS: One final record per stream carrying the run totals.
     """
 
     PROBE = "probe"
     RESULT = "result"
     SUMMARY = "summary"
     DIFF = "diff"
+    PROFILE = "profile"
+    TOTALS = "totals"
 
 
 class OutcomeSummaryRow(TypedDict):
@@ -113,6 +124,72 @@ class OutcomeSummaryRow(TypedDict):
     count: int
 
 
+class RunTotalsPayload(TypedDict):
+    """Run totals closing a processing or probe NDJSON stream.
+
+    Used as the payload under the `"totals"` container key of the last NDJSON
+    record. Its presence tells stream consumers that the run completed.
+
+    Shape:
+        `{"count": int}`
+
+    Fields:
+        count: Number of processed files (`check` / `strip`, in detail and
+            summary mode) or probed paths (`probe`).
+    """
+
+    count: int
+
+
+class SlowFileRow(TypedDict):
+    """One slowest-file entry of a step profile row.
+
+    Shape:
+        `{"path": str, "wall_seconds": float}`
+
+    Fields:
+        path: Human-facing file path.
+        wall_seconds: Wall time of the step for this file.
+    """
+
+    path: str
+    wall_seconds: float
+
+
+class StepProfileRow(TypedDict):
+    """Per-step profiling statistics shared by JSON and NDJSON output.
+
+    Used both:
+    - as one element of the JSON `"profile"` list, and
+    - as the payload under the `"profile"` container key of an NDJSON record.
+
+    Fields:
+        step: Pipeline step name.
+        files: Number of files for which the step was executed.
+        wall_total: Total wall time in seconds.
+        wall_p50: Median per-file wall time in seconds.
+        wall_p95: 95th-percentile per-file wall time in seconds.
+        wall_max: Maximum per-file wall time in seconds.
+        cpu_total: Total CPU time in seconds.
+        bytes_read: Total bytes loaded from file sources.
+        bytes_written: Total bytes written by the writer sink.
+        alloc_bytes: Net traced-memory delta, or `null` without `tracemalloc`.
+        slowest: Slowest files for the step, slowest first.
+    """
+
+    step: str
+    files: int
+    wall_total: float
+    wall_p50: float
+    wall_p95: float
+    wall_max: float
+    cpu_total: float
+    bytes_read: int
+    bytes_written: int
+    alloc_bytes: int | None
+    slowest: list[SlowFileRow]
+
+
 class EmbeddedProcessingDiffPayload(TypedDict):
     """Embedded unified diff payload for one JSON processing result.
 
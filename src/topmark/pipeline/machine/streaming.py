@@ -20,6 +20,7 @@ carrying the durable result needed to preserve the current schema exactly.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from typing import Literal
@@ -43,13 +44,15 @@ class MachineRunStartedEvent:
     Attributes:
         kind: Stable internal event kind.
         command: Command family represented by this stream.
-        selected_count: Number of selected file paths.
-        paths: Ordered selected paths associated with the run.
+        selected_count: Number of selected file paths known at run start.
+        paths: Ordered selected paths associated with the run, or an empty tuple
+            when the producer streams results without exposing its path list.
 
     Args:
         command: Command family represented by this stream.
-        selected_count: Number of selected file paths.
-        paths: Ordered selected paths associated with the run.
+        selected_count: Number of selected file paths known at run start.
+        paths: Ordered selected paths associated with the run. Defaults to an
+            empty tuple.
     """
 
     kind: Literal[StreamEventKind.RUN_STARTED]
@@ -62,7 +65,7 @@ class MachineRunStartedEvent:
         *,
         command: PipelineKindLiteral,
         selected_count: int,
-        paths: tuple[Path, ...],
+        paths: tuple[Path, ...] = (),
     ) -> None:
         # Fixed attributes:
         object.__setattr__(self, "kind", StreamEventKind.RUN_STARTED)
@@ -144,24 +147,45 @@ def iter_machine_processing_stream(
     results: Iterable[ProcessingResult],
     *,
     command: PipelineKindLiteral,
+    selected_count: int | None = None,
+    paths: tuple[Path, ...] | None = None,
 ) -> Iterator[MachineProcessingStreamEvent]:
     """Yield internal machine stream events for durable processing results.
 
+    Results are consumed lazily: each per-file event is yielded as soon as the
+    producer yields its result, so a caller that serializes and flushes events
+    one at a time sees every file as it finishes and never holds the whole run.
+
     Args:
         results: Durable processing or probe results in command order.
         command: Command family represented by the stream.
+        selected_count: Number of selected files known from file-list resolution.
+            When omitted, `results` must be a sized sequence and its length is used.
+        paths: Ordered selected paths for the run-start event. When omitted, paths
+            are taken from `results` if it is a sequence and left empty otherwise.
 
     Yields:
         One run-start event, one per-file result event per durable result, and
         one run-completed event in deterministic order.
+
+    Raises:
+        TypeError: If `selected_count` is omitted and `results` is not a sequence.
     """
-    result_tuple: tuple[ProcessingResult, ...] = tuple(results)
+    if selected_count is None:
+        if not isinstance(results, Sequence):
+            raise TypeError(
+                "selected_count is required when results are streamed from an iterator."
+            )
+        selected_count = len(results)
+    if paths is None:
+        paths = tuple(result.path for result in results) if isinstance(results, Sequence) else ()
+
     yield MachineRunStartedEvent(
         command=command,
-        selected_count=len(result_tuple),
-        paths=tuple(result.path for result in result_tuple),
+        selected_count=selected_count,
+        paths=paths,
     )
-    for index, result in enumerate(result_tuple):
+    for index, result in enumerate(results):
         yield MachineProcessingResultEvent(
             command=command,
             index=index,
@@ -37,6 +37,7 @@ Notes:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 from enum import Enum
 from typing import TYPE_CHECKING
 from typing import Protocol
@@ -583,26 +584,6 @@ def classify_outcome(
 
 
 # Helper functions for bucketing and sorting outcome reasons/counts.
-def _count_buckets(
-    buckets: Iterable[ResultBucket],
-) -> dict[tuple[Outcome, str], int]:
-    """Count result buckets by `(outcome, reason)`.
-
-    Args:
-        buckets: Buckets to count.
-
-    Returns:
-        Mapping from `(outcome, reason)` to occurrence count.
-    """
-    counts: dict[tuple[Outcome, str], int] = {}
-    for bucket in buckets:
-        outcome: Outcome = bucket.outcome
-        reason: str = bucket.reason or NO_REASON_PROVIDED
-        key: tuple[Outcome, str] = (outcome, reason)
-        counts[key] = counts.get(key, 0) + 1
-    return counts
-
-
 def _sorted_outcome_reason_rows(
     counts: dict[tuple[Outcome, str], int],
 ) -> list[OutcomeReasonCount]:
@@ -643,7 +624,39 @@ def collect_outcome_reason_counts(
     Returns:
         Sorted list of `OutcomeReasonCount` rows.
     """
-    buckets: Iterable[ResultBucket] = (
-        map_bucket(r, apply=r.execution_mode.apply_changes) for r in results
-    )
-    return _sorted_outcome_reason_rows(_count_buckets(buckets))
+    counter = OutcomeReasonCounter()
+    for r in results:
+        counter.add(map_bucket(r, apply=r.execution_mode.apply_changes))
+    return counter.rows()
+
+
+@dataclass(kw_only=True, slots=True)
+class OutcomeReasonCounter:
+    """Incremental counter for `(outcome, reason)` summary buckets.
+
+    Buckets are folded one at a time, so summary views can be built without
+    retaining the classified results. `rows()` uses the same deterministic
+    ordering as `collect_outcome_reason_counts()`.
+
+    Attributes:
+        counts: Mapping from `(outcome, reason)` to occurrence count.
+    """
+
+    counts: dict[tuple[Outcome, str], int] = field(default_factory=lambda: {})
+
+    def add(self, bucket: ResultBucket) -> None:
+        """Count one classified bucket.
+
+        Args:
+            bucket: Bucket returned by `map_bucket()`.
+        """
+        key: tuple[Outcome, str] = (bucket.outcome, bucket.reason or NO_REASON_PROVIDED)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def rows(self) -> list[OutcomeReasonCount]:
+        """Return the counted buckets as sorted summary rows.
+
+        Returns:
+            Sorted list of `OutcomeReasonCount` rows.
+        """
+        return _sorted_outcome_reason_rows(self.counts)
@@ -0,0 +1,244 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : profiling.py
+#   file_relpath : src/topmark/pipeline/profiling.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Opt-in per-step profiling for pipeline runs.
+
+When [`RunOptions.profile`][topmark.runtime.model.RunOptions] is enabled, the
+[runner][topmark.pipeline.runner.run] records one
+[`StepTiming`][topmark.pipeline.step_timing.StepTiming] per executed step and
+file. Timings travel with the durable
+[`ProcessingResult`][topmark.pipeline.result.ProcessingResult] (so they also
+cross worker-process boundaries) and are folded into per-step statistics by
+[`PipelineProfiler`][topmark.pipeline.profiling.PipelineProfiler].
+
+Recorded per step and file:
+    - wall time (`time.perf_counter`);
+    - CPU time of the executing thread (`time.thread_time`), which stays
+      correct for the write-behind writer thread and for worker processes;
+    - bytes loaded from the file source and bytes written by the writer sink;
+    - the net traced-memory delta, only when `tracemalloc` is already tracing
+      (for example under `PYTHONTRACEMALLOC=1` or `python -X tracemalloc`).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import time
+import tracemalloc
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+from typing import Final
+
+from topmark.pipeline.step_timing import StepTiming
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from topmark.pipeline.context.model import ProcessingContext
+    from topmark.pipeline.protocols import Step
+    from topmark.pipeline.result import ProcessingResult
+
+DEFAULT_PROFILE_TOP_N: Final[int] = 5
+"""Default number of slowest files reported per step."""
+
+
+def _bytes_read(ctx: ProcessingContext) -> int:
+    """Return the number of bytes loaded so far from the context's file source."""
+    return ctx.source.stats.bytes_loaded if ctx.source is not None else 0
+
+
+def _bytes_written(ctx: ProcessingContext) -> int:
+    """Return the number of bytes written so far by the writer sink."""
+    return ctx.write_stats.bytes_written if ctx.write_stats is not None else 0
+
+
+def run_profiled_step(
+    step: Step[ProcessingContext],
+    ctx: ProcessingContext,
+) -> ProcessingContext:
+    """Run one step and append its measurements to `ctx.step_timings`.
+
+    Args:
+        step: Pipeline step to execute.
+        ctx: Mutable processing context for the current file.
+
+    Returns:
+        The context returned by the step.
+    """
+    tracing: bool = tracemalloc.is_tracing()
+    traced_before: int = tracemalloc.get_traced_memory()[0] if tracing else 0
+    read_before: int = _bytes_read(ctx)
+    written_before: int = _bytes_written(ctx)
+    cpu_start: float = time.thread_time()
+    wall_start: float = time.perf_counter()
+
+    ctx = step(ctx)
+
+    wall_seconds: float = time.perf_counter() - wall_start
+    cpu_seconds: float = time.thread_time() - cpu_start
+    ctx.step_timings.append(
+        StepTiming(
+            step=step.name,
+            wall_seconds=wall_seconds,
+            cpu_seconds=cpu_seconds,
+            bytes_read=_bytes_read(ctx) - read_before,
+            bytes_written=_bytes_written(ctx) - written_before,
+            alloc_bytes=(tracemalloc.get_traced_memory()[0] - traced_before) if tracing else None,
+        )
+    )
+    return ctx
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Values in ascending order.
+        fraction: Requested percentile as a fraction in `[0, 1]`.
+
+    Returns:
+        The smallest value such that at least `fraction` of the values are less
+        than or equal to it, or `0.0` for an empty sequence.
+    """
+    if not sorted_values:
+        return 0.0
+    rank: int = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FileStepTiming:
+    """Wall time of one step for one file, used for top-N listings.
+
+    Attributes:
+        path: Human-facing file path.
+        wall_seconds: Elapsed wall-clock time of the step for this file.
+    """
+
+    path: str
+    wall_seconds: float
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StepProfile:
+    """Aggregated measurements for one pipeline step across a run.
+
+    Attributes:
+        step: Step name.
+        files: Number of files for which the step was executed.
+        wall_total: Total wall time in seconds.
+        wall_p50: Median per-file wall time in seconds.
+        wall_p95: 95th-percentile per-file wall time in seconds.
+        wall_max: Maximum per-file wall time in seconds.
+        cpu_total: Total CPU time in seconds.
+        bytes_read: Total bytes loaded from file sources.
+        bytes_written: Total bytes written by the writer sink.
+        alloc_bytes: Total net traced-memory delta, or `None` when no file was
+            profiled with `tracemalloc` tracing.
+        slowest: Slowest files for this step, slowest first.
+    """
+
+    step: str
+    files: int
+    wall_total: float
+    wall_p50: float
+    wall_p95: float
+    wall_max: float
+    cpu_total: float
+    bytes_read: int
+    bytes_written: int
+    alloc_bytes: int | None
+    slowest: tuple[FileStepTiming, ...]
+
+
+@dataclass(kw_only=True, slots=True)
+class _StepAccumulator:
+    """Mutable per-step running totals used by `PipelineProfiler`."""
+
+    wall_times: list[float] = field(default_factory=lambda: [])
+    cpu_total: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    alloc_bytes: int | None = None
+    # Min-heap of `(wall_seconds, sequence, path)` holding the current top-N.
+    slowest: list[tuple[float, int, str]] = field(default_factory=lambda: [])
+
+
+@dataclass(kw_only=True, slots=True)
+class PipelineProfiler:
+    """Fold per-file step timings into per-step statistics.
+
+    Per-step wall times are kept to compute exact percentiles; everything else
+    is a running total, and the slowest files are tracked in a bounded heap.
+
+    Attributes:
+        top_n: Number of slowest files to keep per step.
+    """
+
+    top_n: int = DEFAULT_PROFILE_TOP_N
+    _steps: dict[str, _StepAccumulator] = field(init=False, default_factory=lambda: {})
+    _sequence: int = field(init=False, default=0)
+
+    def add(self, result: ProcessingResult) -> None:
+        """Fold the step timings of one durable result.
+
+        Args:
+            result: Durable result; results without timings are ignored.
+        """
+        for timing in result.step_timings:
+            acc: _StepAccumulator = self._steps.setdefault(timing.step, _StepAccumulator())
+            acc.wall_times.append(timing.wall_seconds)
+            acc.cpu_total += timing.cpu_seconds
+            acc.bytes_read += timing.bytes_read
+            acc.bytes_written += timing.bytes_written
+            if timing.alloc_bytes is not None:
+                acc.alloc_bytes = (acc.alloc_bytes or 0) + timing.alloc_bytes
+            if self.top_n > 0:
+                self._sequence += 1
+                entry: tuple[float, int, str] = (
+                    timing.wall_seconds,
+                    -self._sequence,
+                    result.display_path,
+                )
+                if len(acc.slowest) < self.top_n:
+                    heapq.heappush(acc.slowest, entry)
+                else:
+                    heapq.heappushpop(acc.slowest, entry)
+
+    def profiles(self) -> tuple[StepProfile, ...]:
+        """Return per-step statistics in first-executed step order.
+
+        Returns:
+            One `StepProfile` per step that recorded at least one timing.
+        """
+        profiles: list[StepProfile] = []
+        for step, acc in self._steps.items():
+            wall_times: list[float] = sorted(acc.wall_times)
+            profiles.append(
+                StepProfile(
+                    step=step,
+                    files=len(wall_times),
+                    wall_total=sum(wall_times),
+                    wall_p50=percentile(wall_times, 0.50),
+                    wall_p95=percentile(wall_times, 0.95),
+                    wall_max=wall_times[-1],
+                    cpu_total=acc.cpu_total,
+                    bytes_read=acc.bytes_read,
+                    bytes_written=acc.bytes_written,
+                    alloc_bytes=acc.alloc_bytes,
+                    slowest=tuple(
+                        FileStepTiming(path=path, wall_seconds=wall)
+                        for wall, _, path in sorted(acc.slowest, reverse=True)
+                    ),
+                )
+            )
+        return tuple(profiles)
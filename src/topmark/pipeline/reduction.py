@@ -19,22 +19,30 @@ view payloads immediately after each durable
 created.
 
 The batch helper remains available for callers that need stable, ordered
-materialization for summaries, machine-output envelopes, public API DTOs, or
-other full-run reporting contracts.
+materialization for machine-output envelopes, public API DTOs, or other
+full-run reporting contracts. Summary-only consumers should fold into a
+[`ProcessingSummary`][topmark.pipeline.reduction.ProcessingSummary] instead,
+which keeps memory constant in the number of processed files.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 
+from topmark.diagnostic.model import DiagnosticLevel
+from topmark.pipeline.outcomes import OutcomeReasonCounter
+from topmark.pipeline.outcomes import map_bucket
 from topmark.pipeline.result import ProcessingResult
+from topmark.pipeline.status import WriteStatus
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
 
     from topmark.pipeline.context.model import ProcessingContext
+    from topmark.pipeline.outcomes import OutcomeReasonCount
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -121,3 +129,52 @@ def reduce_processing_contexts(
         contexts=(),
         results=tuple(iter_processing_results(contexts, release_views=release_views)),
     )
+
+
+@dataclass(kw_only=True, slots=True)
+class ProcessingSummary:
+    """Constant-size aggregate of a processing run.
+
+    Each durable result is folded into counters as it arrives and can be
+    dropped immediately afterwards, so summary-only reporting does not retain
+    per-file state.
+
+    Attributes:
+        file_count: Number of folded files.
+        outcomes: `(outcome, reason)` bucket counter.
+        diagnostic_counts: Diagnostic totals keyed by level value
+            (``"info"``, ``"warning"``, ``"error"``).
+        written: Number of files whose changes were written.
+        failed: Number of files whose write failed.
+    """
+
+    file_count: int = 0
+    outcomes: OutcomeReasonCounter = field(default_factory=OutcomeReasonCounter)
+    diagnostic_counts: dict[str, int] = field(
+        default_factory=lambda: {level.value: 0 for level in DiagnosticLevel},
+    )
+    written: int = 0
+    failed: int = 0
+
+    def add(self, result: ProcessingResult) -> None:
+        """Fold one processed file into the aggregate counters.
+
+        Args:
+            result: Durable processing result for one file.
+        """
+        self.file_count += 1
+        self.outcomes.add(map_bucket(result, apply=result.execution_mode.apply_changes))
+        for diagnostic in result.diagnostics:
+            self.diagnostic_counts[diagnostic.level.value] += 1
+        if result.status.write == WriteStatus.WRITTEN:
+            self.written += 1
+        elif result.status.write == WriteStatus.FAILED:
+            self.failed += 1
+
+    def outcome_reason_rows(self) -> list[OutcomeReasonCount]:
+        """Return the folded outcome buckets as sorted summary rows.
+
+        Returns:
+            Rows ordered like `collect_outcome_reason_counts()`.
+        """
+        return self.outcomes.rows()
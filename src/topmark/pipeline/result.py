@@ -46,6 +46,7 @@ if TYPE_CHECKING:
     from topmark.pipeline.context.model import ProcessingContext
     from topmark.pipeline.hints import Hint
     from topmark.pipeline.kinds import PipelineKindLiteral
+    from topmark.pipeline.step_timing import StepTiming
     from topmark.resolution.probe import ResolutionProbeCandidate
     from topmark.resolution.probe import ResolutionProbeMatchSignals
     from topmark.resolution.probe import ResolutionProbeResult
@@ -496,6 +497,7 @@ class ProcessingResult:
         detail: Durable report-detail facts captured without retaining volatile
             context-owned views.
         probe: Durable resolution-probe snapshot for probe runs.
+        step_timings: Per-step measurements for profiled runs; empty otherwise.
     """
 
     path: Path
@@ -513,6 +515,7 @@ class ProcessingResult:
     outcome: OutcomeSnapshot
     detail: ProcessingDetailSnapshot
     probe: ProbeSnapshot | None
+    step_timings: tuple[StepTiming, ...] = ()
 
     @classmethod
     def from_context(
@@ -561,6 +564,7 @@ class ProcessingResult:
             outcome=OutcomeSnapshot.from_context(ctx),
             detail=ProcessingDetailSnapshot.from_context(ctx),
             probe=ProbeSnapshot.from_context(ctx),
+            step_timings=tuple(ctx.step_timings),
         )
 
     @property
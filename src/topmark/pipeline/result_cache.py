@@ -0,0 +1,454 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : result_cache.py
+#   file_relpath : src/topmark/pipeline/result_cache.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Persistent on-disk cache of unchanged per-file processing results.
+
+Most files in a mature repository already carry a compliant header, yet every
+run re-reads, re-scans, re-renders and re-compares them. The result cache lets
+the engine short-circuit those files: when a file's content and the effective
+run inputs are unchanged since the previous run, the stored
+[`ProcessingResult`][topmark.pipeline.result.ProcessingResult] is returned
+instead of running the pipeline.
+
+Only results whose public outcome is `UNCHANGED` are stored, so a cache hit can
+never hide a pending or applied change.
+
+Cache validation:
+    Each entry is keyed by processing path and records:
+
+    - the file's `(size, mtime_ns, inode)` signature;
+    - a content digest of the file bytes;
+    - a fingerprint of the TopMark version, the registered file-type/processor
+      bindings, the selected pipeline, the result-relevant runtime options and
+      the effective configuration for the path.
+
+    A fingerprint mismatch is always a miss. A matching signature is a hit
+    without reading the file; a differing signature falls back to comparing the
+    content digest, so touching a file does not invalidate its entry. As with
+    git's index, rewrites that preserve size, `mtime_ns` and inode within the
+    filesystem's timestamp granularity are not detected.
+
+Layout:
+    Entries are pickled under `<cache dir>/v<N>/<aa>/<digest>` where `<digest>`
+    hashes the processing path. The cache directory carries a `CACHEDIR.TAG`
+    marker and a `.gitignore` so backup and VCS tools, and TopMark's own file
+    discovery, skip it. The cache is
+    trusted local state: never point it at a directory shared with untrusted
+    users.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import shutil
+import stat
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from typing import Final
+
+from topmark.core.constants import TOPMARK_VERSION
+from topmark.core.logging import get_logger
+from topmark.core.outcomes import Outcome
+from topmark.pipeline.outcomes import map_bucket
+from topmark.pipeline.status import WriteStatus
+from topmark.utils.file import CACHEDIR_TAG_NAME
+from topmark.utils.file import CACHEDIR_TAG_SIGNATURE
+from topmark.utils.file import is_cachedir_tag
+from topmark.utils.file import safe_unlink
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from topmark.config.model import FrozenConfig
+    from topmark.core.logging import TopmarkLogger
+    from topmark.pipeline.pipelines import PipelineSelection
+    from topmark.pipeline.result import ProcessingResult
+    from topmark.runtime.model import RunOptions
+
+logger: TopmarkLogger = get_logger(__name__)
+
+DEFAULT_RESULT_CACHE_DIR: Final[str] = ".topmark_cache"
+"""Default cache directory name, relative to the current working directory."""
+
+_CACHE_FORMAT_VERSION: Final[int] = 2
+"""On-disk entry format version; bump to orphan entries written by older releases."""
+
+_CACHEDIR_TAG_CONTENT: Final[str] = (
+    f"{CACHEDIR_TAG_SIGNATURE}\n"
+    "# This file is a cache directory tag created by TopMark.\n"
+    "# For information about cache directory tags, see https://bford.info/cachedir/\n"
+)
+
+
+@dataclass(kw_only=True, slots=True)
+class ResultCacheStats:
+    """Mutable counters describing result-cache activity during one run.
+
+    Attributes:
+        hits: Files whose stored result was reused without running the pipeline.
+        misses: Files looked up in the cache that had to be processed.
+        stored: Results written to the cache after processing.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stored: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Return a JSON-friendly mapping of the cache counters.
+
+        Returns:
+            Mapping with `hits`, `misses` and `stored` counts.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stored": self.stored,
+        }
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FileSignature:
+    """Cheap filesystem signature used to validate a cache entry without reading.
+
+    Attributes:
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        inode: Inode number (`st_ino`).
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int
+
+    @classmethod
+    def for_path(cls, path: Path) -> FileSignature | None:
+        """Return the signature of a regular file, or `None` if it cannot be stat'ed.
+
+        Args:
+            path: File to inspect.
+
+        Returns:
+            The file signature, or `None` for missing or non-regular paths.
+        """
+        try:
+            stat_info: os.stat_result = path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(stat_info.st_mode):
+            return None
+        return cls(size=stat_info.st_size, mtime_ns=stat_info.st_mtime_ns, inode=stat_info.st_ino)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _CacheEntry:
+    """Pickled on-disk cache record for one processing path."""
+
+    format_version: int
+    fingerprint: str
+    signature: FileSignature
+    content_digest: str
+    result: ProcessingResult
+
+
+def _digest_bytes(data: bytes) -> str:
+    """Return the content digest used for cache validation."""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _content_digest(path: Path) -> str | None:
+    """Return the content digest of `path`, or `None` if it cannot be read."""
+    try:
+        return _digest_bytes(path.read_bytes())
+    except OSError:
+        return None
+
+
+def is_cacheable_result(result: ProcessingResult) -> bool:
+    """Return whether a processing result may be stored in the result cache.
+
+    Only results that classify as `UNCHANGED` and did not write are cached, so a
+    reused result can never suppress a pending or applied change.
+
+    Args:
+        result: Durable result produced by running the pipeline.
+
+    Returns:
+        `True` if the result is safe to reuse for an identical later run.
+    """
+    if result.from_stdin or result.status.write == WriteStatus.WRITTEN:
+        return False
+    return (
+        map_bucket(result, apply=result.execution_mode.apply_changes).outcome == Outcome.UNCHANGED
+    )
+
+
+def _registry_fingerprint() -> str:
+    """Return a digest of the effective file-type/processor bindings."""
+    from topmark.registry.registry import Registry
+
+    bindings: list[str] = sorted(repr(binding) for binding in Registry.bindings())
+    return _digest_bytes("\n".join(bindings).encode("utf-8"))
+
+
+def _config_fingerprint(config: FrozenConfig) -> str:
+    """Return a digest of the configuration fields that affect per-file results.
+
+    File-selection inputs (`files`, `*_from`, include/exclude patterns) and
+    config diagnostics are excluded: they decide *which* files run, not how a
+    selected file is processed.
+    """
+    payload: tuple[object, ...] = (
+        config.policy,
+        sorted(config.policy_by_type.items()),
+        config.header_fields,
+        sorted(config.field_values.items()),
+        config.align_fields,
+        config.max_header_line_length,
+        config.wrap_fields,
+        config.relative_to_raw,
+        config.relative_to,
+        sorted(config.include_file_types),
+        sorted(config.exclude_file_types),
+    )
+    return _digest_bytes(repr(payload).encode("utf-8"))
+
+
+def _run_fingerprint(*, run_options: RunOptions, pipeline: PipelineSelection) -> str:
+    """Return a digest of the run-wide inputs that affect per-file results."""
+    payload: tuple[object, ...] = (
+        _CACHE_FORMAT_VERSION,
+        TOPMARK_VERSION,
+        _registry_fingerprint(),
+        pipeline.kind,
+        pipeline.apply,
+        pipeline.diff,
+        pipeline.definition.name,
+        run_options.pipeline_kind,
+        run_options.apply_changes,
+        run_options.output_target,
+        run_options.file_write_strategy,
+        run_options.prune_views,
+        run_options.emit_diff,
+    )
+    return _digest_bytes(repr(payload).encode("utf-8"))
+
+
+def _ensure_cache_dir(directory: Path) -> None:
+    """Create the cache directory together with its tag and ignore files."""
+    directory.mkdir(parents=True, exist_ok=True)
+    tag: Path = directory / CACHEDIR_TAG_NAME
+    if not tag.exists():
+        tag.write_text(_CACHEDIR_TAG_CONTENT, encoding="utf-8")
+    gitignore: Path = directory / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("# Created by TopMark.\n*\n", encoding="utf-8")
+
+
+def clear_result_cache(directory: Path) -> bool:
+    """Delete a TopMark result-cache directory.
+
+    The directory is removed only when it carries TopMark's `CACHEDIR.TAG`
+    marker, so a mistyped path never deletes unrelated data.
+
+    Args:
+        directory: Cache directory to delete.
+
+    Returns:
+        `True` if the directory existed and was removed, else `False`.
+    """
+    if not directory.is_dir():
+        return False
+    if not is_cachedir_tag(directory / CACHEDIR_TAG_NAME):
+        logger.warning("Not clearing %s: missing %s marker", directory, CACHEDIR_TAG_NAME)
+        return False
+    shutil.rmtree(directory, ignore_errors=True)
+    logger.info("Cleared result cache at %s", directory)
+    return True
+
+
+@dataclass(kw_only=True, slots=True)
+class ResultCache:
+    """Persistent result cache bound to the inputs of one run.
+
+    Attributes:
+        directory: Root cache directory.
+        run_fingerprint: Digest of the run-wide inputs (version, registry,
+            pipeline and runtime options).
+        stats: Activity counters updated by `lookup()` and `store()`.
+    """
+
+    directory: Path
+    run_fingerprint: str
+    stats: ResultCacheStats = field(default_factory=ResultCacheStats)
+    _config_fingerprints: dict[int, tuple[FrozenConfig, str]] = field(
+        default_factory=lambda: {},
+        repr=False,
+    )
+    _miss_signatures: dict[Path, FileSignature] = field(
+        default_factory=lambda: {},
+        repr=False,
+    )
+
+    @classmethod
+    def for_run(
+        cls,
+        directory: Path,
+        *,
+        run_options: RunOptions,
+        pipeline: PipelineSelection,
+    ) -> ResultCache:
+        """Create a cache bound to the run-wide inputs of one pipeline run.
+
+        Args:
+            directory: Root cache directory.
+            run_options: Invocation-wide runtime options for the run.
+            pipeline: Pipeline selected for the run.
+
+        Returns:
+            A cache instance with fresh statistics.
+        """
+        return cls(
+            directory=directory,
+            run_fingerprint=_run_fingerprint(run_options=run_options, pipeline=pipeline),
+        )
+
+    def _fingerprint(self, config: FrozenConfig) -> str:
+        """Return the combined run and config fingerprint, memoized per config object."""
+        cached: tuple[FrozenConfig, str] | None = self._config_fingerprints.get(id(config))
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        fingerprint: str = _digest_bytes(
+            f"{self.run_fingerprint}:{_config_fingerprint(config)}".encode()
+        )
+        self._config_fingerprints[id(config)] = (config, fingerprint)
+        return fingerprint
+
+    def _entry_path(self, path: Path) -> Path:
+        """Return the on-disk entry location for a processing path."""
+        key: str = _digest_bytes(os.fsencode(path.absolute()))
+        return self.directory / f"v{_CACHE_FORMAT_VERSION}" / key[:2] / key
+
+    def _load(self, entry_path: Path) -> _CacheEntry | None:
+        """Load an entry, treating unreadable or foreign records as absent."""
+        try:
+            with entry_path.open("rb") as fh:
+                entry: object = pickle.load(fh)  # noqa: S301 - trusted local cache
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # noqa: BLE001 - a corrupt entry is just a miss
+            logger.debug("Ignoring unreadable result-cache entry %s: %s", entry_path, e)
+            return None
+        if not isinstance(entry, _CacheEntry) or entry.format_version != _CACHE_FORMAT_VERSION:
+            return None
+        return entry
+
+    def lookup(self, path: Path, *, config: FrozenConfig) -> ProcessingResult | None:
+        """Return the cached result for `path`, or `None` on a miss.
+
+        Args:
+            path: Processing path about to be run.
+            config: Effective configuration for `path`.
+
+        Returns:
+            The stored result when the file and run inputs are unchanged, else `None`.
+        """
+        result: ProcessingResult | None = self._lookup(path, config=config)
+        if result is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return result
+
+    def _lookup(self, path: Path, *, config: FrozenConfig) -> ProcessingResult | None:
+        """Return the cached result for `path` without updating statistics."""
+        signature: FileSignature | None = FileSignature.for_path(path)
+        if signature is None:
+            return None
+        # Remember the pre-run signature so `store()` can detect concurrent edits.
+        self._miss_signatures[path] = signature
+        entry_path: Path = self._entry_path(path)
+        entry: _CacheEntry | None = self._load(entry_path)
+        if entry is None or entry.fingerprint != self._fingerprint(config):
+            return None
+        if entry.result.path != path:
+            return None
+        if entry.signature == signature:
+            del self._miss_signatures[path]
+            return entry.result
+
+        # The file was touched, moved or copied: fall back to its content.
+        if _content_digest(path) != entry.content_digest:
+            return None
+        del self._miss_signatures[path]
+        self._write(
+            entry_path,
+            _CacheEntry(
+                format_version=_CACHE_FORMAT_VERSION,
+                fingerprint=entry.fingerprint,
+                signature=signature,
+                content_digest=entry.content_digest,
+                result=entry.result,
+            ),
+        )
+        return entry.result
+
+    def store(self, result: ProcessingResult, *, config: FrozenConfig) -> None:
+        """Store a freshly computed result when it is cacheable.
+
+        Only paths previously reported as misses by `lookup()` are stored. The
+        file is re-stat'ed and hashed after processing; results for files whose
+        signature changed since the lookup are not stored.
+
+        Args:
+            result: Durable result produced by running the pipeline.
+            config: Effective configuration used to produce `result`.
+        """
+        if not is_cacheable_result(result):
+            return
+        path: Path = result.path
+        signature: FileSignature | None = self._miss_signatures.pop(path, None)
+        if signature is None or FileSignature.for_path(path) != signature:
+            return
+        content_digest: str | None = _content_digest(path)
+        if content_digest is None or FileSignature.for_path(path) != signature:
+            return
+        stored: bool = self._write(
+            self._entry_path(path),
+            _CacheEntry(
+                format_version=_CACHE_FORMAT_VERSION,
+                fingerprint=self._fingerprint(config),
+                signature=signature,
+                content_digest=content_digest,
+                # Profiling timings describe this run only; cache hits replay no steps.
+                result=replace(result, step_timings=()),
+            ),
+        )
+        if stored:
+            self.stats.stored += 1
+
+    def _write(self, entry_path: Path, entry: _CacheEntry) -> bool:
+        """Atomically write one entry; cache write failures are logged and ignored."""
+        tmp_path: Path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            _ensure_cache_dir(self.directory)
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as fh:
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(entry_path)
+        except OSError as e:
+            logger.debug("Could not write result-cache entry %s: %s", entry_path, e)
+            safe_unlink(tmp_path)
+            return False
+        return True
@@ -21,6 +21,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from topmark.core.logging import get_logger
+from topmark.pipeline.profiling import run_profiled_step
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -39,9 +40,17 @@ def run(
     *,
     prune_views: bool = True,
     keep_diff_view: bool = False,
+    start: int = 0,
+    stop: int | None = None,
+    profile: bool = False,
 ) -> ProcessingContext:
     """Execute the pipeline sequentially.
 
+    A pipeline may be executed in two parts (for example when the engine runs the
+    writer step on a background thread) by passing `start`/`stop`. View pruning
+    always considers every later step of the full `steps` sequence, so views
+    consumed by the second part survive the first.
+
     Args:
         ctx: Mutable processing context.
         steps: Ordered sequence of pipeline steps. Each step takes and returns a context.
@@ -50,13 +59,18 @@ def run(
         keep_diff_view: Whether to preserve the diff view during between-step pruning
             (required when the pipeline generates a unified diff in
             [`PatcherStep`][topmark.pipeline.steps.patcher.PatcherStep]).
+        start: Index of the first step to execute (default: `0`).
+        stop: Index after the last step to execute, or `None` to run to the end.
+        profile: Record per-step timings in `ctx.step_timings` (default: `False`).
 
     Returns:
-        The final processing context after all steps have run.
+        The final processing context after the selected steps have run.
     """
     step_count: int = len(steps)
-    for index, step in enumerate(steps):
-        ctx = step(ctx)
+    end: int = step_count if stop is None else stop
+    for index in range(start, end):
+        step: Step[ProcessingContext] = steps[index]
+        ctx = run_profiled_step(step, ctx) if profile else step(ctx)
         if prune_views is True:
             remaining_view_consumers: set[ViewSlot] = set()
             for remaining_step in steps[index + 1 : step_count]:
@@ -66,4 +80,6 @@ def run(
                 keep_diff_view=keep_diff_view,
             )
 
+    # Steps that halt before the reader may leave the shared ingestion buffer loaded.
+    ctx.release_source()
     return ctx
@@ -0,0 +1,45 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : step_timing.py
+#   file_relpath : src/topmark/pipeline/step_timing.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Per-step timing value recorded by profiled pipeline runs.
+
+[`StepTiming`][topmark.pipeline.step_timing.StepTiming] is carried by both
+[`ProcessingContext`][topmark.pipeline.context.model.ProcessingContext] and
+[`ProcessingResult`][topmark.pipeline.result.ProcessingResult]. It lives in this
+leaf module so that neither of them depends on
+[`topmark.pipeline.profiling`][topmark.pipeline.profiling], which in turn works
+on contexts and results.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class StepTiming:
+    """Measurements for one pipeline step executed for one file.
+
+    Attributes:
+        step: Step name.
+        wall_seconds: Elapsed wall-clock time.
+        cpu_seconds: CPU time consumed by the executing thread.
+        bytes_read: Bytes loaded from the file source during the step.
+        bytes_written: Bytes written by the writer sink during the step.
+        alloc_bytes: Net change in traced memory, or `None` when `tracemalloc`
+            was not tracing.
+    """
+
+    step: str
+    wall_seconds: float
+    cpu_seconds: float
+    bytes_read: int
+    bytes_written: int
+    alloc_bytes: int | None = None
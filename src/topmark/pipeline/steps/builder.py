@@ -139,7 +139,7 @@ class BuilderStep(BaseStep):
               and its target are both selected, and avoids casing-only metadata drift
               on case-insensitive filesystems.
             - In stdin mode, `file`, `file_relpath`, and `file_abspath` are derived from
-              the logical `stdin_filename`, not the materialized temporary file path.
+              the logical `stdin_filename`, not the content path.
             - `file_relpath` and `relpath` are computed by calling
               `compute_relpath(header_path, relative_to)` and serialized with
               `format_header_metadata_path()`.
@@ -178,14 +178,15 @@ class BuilderStep(BaseStep):
         # Prepare built-in fields related to the file system.
         #
         # STDIN content mode needs special care:
-        #   - `ctx.path` is the *materialized* temp file that TopMark can read/write.
+        #   - `ctx.path` is the content path. When the content is served from memory
+        #     (`run_options.stdin_content`), it is the logical path itself and need not exist.
         #   - `run_options.stdin_filename` is a user-supplied *logical* filename that may not exist
         #     on disk (it is used only for metadata and discovery anchoring).
         #
         # Therefore:
         #   - `file` / `file_relpath` / `file_abspath` / `relpath` are derived from the logical
         #     header path.
-        #   - `abspath` is still derived from the on-disk content path, since it represents the
+        #   - `abspath` is still derived from the content path, since it represents the
         #     containing directory of the actual processed content.
 
         content_path: Path = file_path
@@ -205,9 +206,11 @@ class BuilderStep(BaseStep):
         )
 
         # File absolute path is derived from the logical header path so stdin mode reports the
-        # user-facing logical filename rather than the ephemeral materialized temp file.
+        # user-facing logical filename rather than a materialized content path.
         absolute_path: Path = header_path.resolve()
-        content_absolute_path: Path = content_path.resolve(strict=True)
+        content_absolute_path: Path = content_path.resolve(
+            strict=ctx.run_options.stdin_content is None
+        )
 
         # Relative paths are computed against `relative_to` using the logical header path.
         # Note: `header_path` may not exist in stdin mode, so `compute_relpath()` must not rely
@@ -30,6 +30,7 @@ from topmark.pipeline.status import HeaderStatus
 from topmark.pipeline.status import RenderStatus
 from topmark.pipeline.steps.base import BaseStep
 from topmark.pipeline.views import ViewSlot
+from topmark.pipeline.views import planned_edits_are_well_formed
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -39,7 +40,6 @@ if TYPE_CHECKING:
     from topmark.pipeline.views import BuilderView
     from topmark.pipeline.views import EditView
     from topmark.pipeline.views import HeaderView
-    from topmark.pipeline.views import PlannedEdit
     from topmark.pipeline.views import RenderView
     from topmark.pipeline.views import UpdatedView
 
@@ -110,8 +110,8 @@ class ComparerStep(BaseStep):
         """Set comparison status using the ordered view-based decision tree.
 
         `may_proceed()` admits a rendered result or an updated-lines payload. Once
-        admitted, malformed headers are skipped first. A single in-bounds structured
-        edit then proves a change without materializing full images. Otherwise an
+        admitted, malformed headers are skipped first. Well-formed, in-bounds structured
+        edits then prove a change without materializing full images. Otherwise an
         available updated image is compared with the current image. If neither path
         applies, rendered flows compare header/build mappings and exact header/render
         text when the existing content is known. A missing header is known empty text,
@@ -148,20 +148,19 @@ class ComparerStep(BaseStep):
         # non-empty edit means the file image would change without needing to
         # materialize both complete images just to prove inequality.
         edit_view: EditView | None = ctx.views.edit
-        if edit_view is not None and len(edit_view.edits) == 1:
-            edit: PlannedEdit = edit_view.edits[0]
-            if (
-                edit.old_start >= 0
-                and edit.old_end >= edit.old_start
-                and edit.old_end <= ctx.image_line_count()
-            ):
-                ctx.status.comparison = ComparisonStatus.CHANGED
-                logger.debug(
-                    "comparer: single-edit comparison for %s -> %s",
-                    ctx.path,
-                    ctx.status.comparison.value,
-                )
-                return
+        if (
+            edit_view is not None
+            and edit_view.edits
+            and planned_edits_are_well_formed(edit_view.edits, line_count=ctx.image_line_count())
+        ):
+            ctx.status.comparison = ComparisonStatus.CHANGED
+            logger.debug(
+                "comparer: planned-edit comparison (%d edit(s)) for %s -> %s",
+                len(edit_view.edits),
+                ctx.path,
+                ctx.status.comparison.value,
+            )
+            return
 
         # If we have a precomputed full file updated content but no usable edit
         # metadata, fall back to direct full-image comparison.
@@ -10,8 +10,8 @@
 
 """Patch (diff) generation step for the TopMark pipeline (view-based).
 
-This step uses the original file image (``ctx.views.image``) plus either one
-structured edit or the pipeline's updated image (``ctx.views.updated``) to produce
+This step uses the original file image (``ctx.views.image``) plus either the
+structured planned edits or the pipeline's updated image (``ctx.views.updated``) to produce
 a unified diff suitable for CLI/CI consumption. It mutates only the processing
 context and performs no I/O.
 
@@ -35,6 +35,7 @@ import difflib
 import logging
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
+from typing import Final
 
 from topmark.core.logging import get_logger
 from topmark.pipeline.context.policy import source_lines_with_remediated_bom
@@ -47,8 +48,10 @@ from topmark.pipeline.steps.base import BaseStep
 from topmark.pipeline.structured_diff import render_structured_unified_diff
 from topmark.pipeline.views import DiffView
 from topmark.pipeline.views import EditView
+from topmark.pipeline.views import HeadTailLines
 from topmark.pipeline.views import UpdatedView
 from topmark.pipeline.views import ViewSlot
+from topmark.pipeline.views import planned_edits_are_well_formed
 from topmark.presentation.formatters.unified_diff import format_patch_plain
 from topmark.presentation.shared.paths import get_display_path
 from topmark.utils.timestamp import format_gnu_diff_timestamp
@@ -61,30 +64,51 @@ if TYPE_CHECKING:
 
 logger: TopmarkLogger = get_logger(__name__)
 
+_DIFF_CONTEXT_LINES: Final[int] = 3
+"""Context lines around each hunk, for both the structured and the difflib backend."""
 
-def _apply_single_edit(
+
+def _edits_match_updated_lines(
     *,
     original_lines: Sequence[str],
-    edit: PlannedEdit,
-) -> list[str] | None:
-    """Apply one planned edit to original lines for optional validation.
+    edits: Sequence[PlannedEdit],
+    updated_lines: Sequence[str],
+    context: int,
+) -> bool:
+    """Check planned edits against a materialized updated image, window by window.
+
+    Only the replacement lines and the ``context`` lines around each edit (the
+    lines a rendered diff shows) are compared, plus the overall line count.
+    Unchanged regions between the windows are trusted as planned.
 
     Args:
         original_lines: Original file image lines.
-        edit: Planned edit to apply.
+        edits: Well-formed planned edits in ascending order.
+        updated_lines: Materialized updated image.
+        context: Number of context lines rendered around each edit.
 
     Returns:
-        list[str] | None: Updated lines when the edit span is valid, otherwise
-        ``None``.
+        bool: True when the updated image agrees with the edits in every window.
     """
-    if edit.old_start < 0 or edit.old_end < edit.old_start or edit.old_end > len(original_lines):
-        return None
-
-    return [
-        *original_lines[: edit.old_start],
-        *edit.new_lines,
-        *original_lines[edit.old_end :],
-    ]
+    delta: int = 0
+    for index, edit in enumerate(edits):
+        # Context windows stop at neighbouring edits; those check their own lines.
+        gap_start: int = edits[index - 1].old_end if index > 0 else 0
+        gap_end: int = edits[index + 1].old_start if index + 1 < len(edits) else len(original_lines)
+        before: int = min(context, edit.old_start - gap_start)
+        after: int = min(context, gap_end - edit.old_end)
+        new_start: int = edit.old_start + delta
+        new_end: int = new_start + len(edit.new_lines)
+        if (
+            tuple(updated_lines[new_start:new_end]) != edit.new_lines
+            or list(updated_lines[new_start - before : new_start])
+            != list(original_lines[edit.old_start - before : edit.old_start])
+            or list(updated_lines[new_end : new_end + after])
+            != list(original_lines[edit.old_end : edit.old_end + after])
+        ):
+            return False
+        delta += len(edit.new_lines) - (edit.old_end - edit.old_start)
+    return len(updated_lines) == len(original_lines) + delta
 
 
 def _render_difflib_unified_diff(
@@ -119,7 +143,7 @@ def _render_difflib_unified_diff(
             tofile=tofile,
             fromfiledate=fromfiledate,
             tofiledate=tofiledate,
-            n=3,
+            n=_DIFF_CONTEXT_LINES,
             lineterm=lineterm,
         )
     )
@@ -136,13 +160,13 @@ def _render_structured_patch_lines(
     tofiledate: str,
     lineterm: str,
 ) -> list[str] | None:
-    """Render patch lines directly from valid single-edit metadata.
+    """Render patch lines directly from valid planned-edit metadata.
 
     Args:
         current_lines: Original file image lines.
         edit_view: Structured planned edits, when available.
         expected_updated_lines: Optional materialized updated image to validate
-            caller-provided metadata without additional materialization.
+            caller-provided metadata against, within each edit's context window.
         fromfile: Diff label for the original file.
         tofile: Diff label for the updated file.
         fromfiledate: Timestamp label for the original file.
@@ -153,30 +177,32 @@ def _render_structured_patch_lines(
         list[str] | None: Structured unified diff lines, or ``None`` when the
         metadata is absent, invalid, or unsupported by the structured renderer.
     """
-    if edit_view is None or len(edit_view.edits) != 1:
+    if edit_view is None or not edit_view.edits:
         return None
 
-    edit: PlannedEdit = edit_view.edits[0]
-    applied_lines: list[str] | None = _apply_single_edit(
-        original_lines=current_lines,
-        edit=edit,
-    )
-    if applied_lines is None:
+    edits: tuple[PlannedEdit, ...] = edit_view.edits
+    if not planned_edits_are_well_formed(edits, line_count=len(current_lines)):
         return None
 
-    if expected_updated_lines is not None and applied_lines != list(expected_updated_lines):
+    # Validation reads only the diff windows, never the unchanged regions between them.
+    if expected_updated_lines is not None and not _edits_match_updated_lines(
+        original_lines=current_lines,
+        edits=edits,
+        updated_lines=expected_updated_lines,
+        context=_DIFF_CONTEXT_LINES,
+    ):
         logger.debug("structured diff metadata did not match updated image; falling back")
         return None
 
     return render_structured_unified_diff(
         original_lines=current_lines,
-        edit=edit,
+        edits=edits,
         fromfile=fromfile,
         tofile=tofile,
         fromfiledate=fromfiledate,
         tofiledate=tofiledate,
         lineterm=lineterm,
-        context=3,
+        context=_DIFF_CONTEXT_LINES,
     )
 
 
@@ -184,7 +210,7 @@ class PatcherStep(BaseStep):
     """Produce a unified diff between the original image and planned content.
 
     Generates a unified diff (CLI/CI friendly) when comparison indicates a
-    change and either one usable structured edit or an updated image is present.
+    change and either usable structured edits or an updated image is present.
     Normalizes `ComparisonStatus` to `UNCHANGED` if the computed diff is empty.
 
     This step does not print; the CLI or API decides how to display diffs.
@@ -250,7 +276,7 @@ class PatcherStep(BaseStep):
 
         The step runs only after comparison. If the comparison status is
         ``UNCHANGED``, the diff is omitted. A changed comparison requires either
-        one usable structured edit or an updated image; otherwise patch generation
+        usable structured edits or an updated image; otherwise patch generation
         fails.
 
         Unified diff file labels use the shared human-facing display path policy,
@@ -280,11 +306,14 @@ class PatcherStep(BaseStep):
 
         # ctx.status.comparison == ComparisonStatus.CHANGED:
 
-        # Materialize original file lines from views once for diffing
-        current_lines: list[str] = source_lines_with_remediated_bom(
-            ctx.materialize_image_lines(),
-            ctx,
-        )
+        # Materialize original file lines from views once for diffing. A bounded image
+        # keeps its tail on disk; the structured renderer only reads the edit's context.
+        head: list[str]
+        tail: Sequence[str]
+        head, tail = ctx.split_image_for_editing()
+        current_lines: Sequence[str] = source_lines_with_remediated_bom(head, ctx)
+        if tail:
+            current_lines = HeadTailLines(head=current_lines, tail=tail)
 
         display_path: str = get_display_path(ctx)
 
@@ -331,7 +360,7 @@ class PatcherStep(BaseStep):
 
             #  Render the generic difflib unified diff fallback.
             patch_lines = _render_difflib_unified_diff(
-                current_lines=current_lines,
+                current_lines=list(current_lines) if tail else current_lines,
                 updated_lines=updated_lines,
                 fromfile=fromfile,
                 tofile=tofile,
@@ -71,6 +71,7 @@ from topmark.pipeline.views import UpdatedView
 from topmark.pipeline.views import ViewSlot
 from topmark.pipeline.views import compose_updated_content
 from topmark.pipeline.views import infer_single_planned_edit
+from topmark.pipeline.views import with_image_tail
 from topmark.processors.base import NO_LINE_ANCHOR
 
 if TYPE_CHECKING:
@@ -309,9 +310,14 @@ class PlannerStep(BaseStep):
             False if ctx.run_options.apply_changes is None else ctx.run_options.apply_changes
         )
 
-        # Materialize original image once (list[str]) for splice operations.
-        original_lines: list[str] = list(ctx.iter_image_lines())
+        # Materialize the editable image once (list[str]) for splice operations. For a
+        # bounded image this is the header region only: edits computed on it are valid
+        # for the whole file, and the untouched tail is appended to every updated image.
+        original_lines: list[str]
+        tail: Sequence[str]
+        original_lines, tail = ctx.split_image_for_editing()
         source_lines: list[str] = source_lines_with_remediated_bom(original_lines, ctx)
+        image_content: UpdatedContent | Sequence[str] = with_image_tail(original_lines, tail)
 
         if ctx.status.content != ContentStatus.OK and not allow_insert_into_empty_like(ctx):
             ctx.status.plan = PlanStatus.SKIPPED
@@ -326,7 +332,7 @@ class PlannerStep(BaseStep):
             HeaderStatus.MALFORMED_SOME_FIELDS,
         }:
             ctx.status.plan = PlanStatus.SKIPPED
-            ctx.views.updated = UpdatedView(lines=original_lines)
+            ctx.views.updated = UpdatedView(lines=image_content)
             reason = "Existing header has malformed fields; TopMark will not update it."
             ctx.diagnostics.add_warning(reason)
             ctx.request_halt(reason=reason, at_step=self)
@@ -356,7 +362,7 @@ class PlannerStep(BaseStep):
             # ✅ Preserve empty list as a valid updated image
             seq: UpdatedContent | Sequence[str] | Iterable[str] = updated_view.lines
             if not ctx.leading_bom:
-                ctx.views.updated = UpdatedView(lines=seq)
+                ctx.views.updated = UpdatedView(lines=seq, source_tail=updated_view.source_tail)
                 ctx.status.plan = PlanStatus.REMOVED if apply else PlanStatus.PREVIEWED
                 return
 
@@ -377,7 +383,7 @@ class PlannerStep(BaseStep):
         if ctx.status.comparison == ComparisonStatus.UNCHANGED:
             ctx.status.plan = PlanStatus.SKIPPED
             # Preserve the original image as the "updated" content for downstream steps.
-            ctx.views.updated = UpdatedView(lines=original_lines)
+            ctx.views.updated = UpdatedView(lines=image_content)
             logger.trace("Updater: no-op (comparison=UNCHANGED) for %s", ctx.path)
             return
 
@@ -440,7 +446,7 @@ class PlannerStep(BaseStep):
                         "pre-insert: %s - %s", getattr(cap, "value", cap), pre_insert_reason
                     )
                     # Preserve original image; mark as skipped
-                    ctx.views.updated = UpdatedView(lines=original_lines)
+                    ctx.views.updated = UpdatedView(lines=image_content)
                     ctx.status.plan = PlanStatus.SKIPPED
                     reason = f"{pre_insert_reason} (origin: {origin})"
                     ctx.diagnostics.add_warning(reason)
@@ -463,7 +469,7 @@ class PlannerStep(BaseStep):
                         getattr(ctx.pre_insert_capability, "value", ctx.pre_insert_capability),
                         pre_insert_reason,
                     )
-                    ctx.views.updated = UpdatedView(lines=original_lines)
+                    ctx.views.updated = UpdatedView(lines=image_content)
                     ctx.status.plan = PlanStatus.SKIPPED
                     reason = f"{pre_insert_reason} (origin: {origin})"
                     ctx.diagnostics.add_warning(reason)
@@ -483,7 +489,7 @@ class PlannerStep(BaseStep):
                     getattr(ctx.pre_insert_capability, "value", ctx.pre_insert_capability),
                     pre_insert_reason,
                 )
-                ctx.views.updated = UpdatedView(lines=original_lines)
+                ctx.views.updated = UpdatedView(lines=image_content)
                 ctx.status.plan = PlanStatus.SKIPPED
                 reason = f"{pre_insert_reason} (origin: {origin})"
                 ctx.diagnostics.add_warning(reason)
@@ -522,16 +528,19 @@ class PlannerStep(BaseStep):
             # If replacement is identical to the original, treat as a no-op.
             if materialized_new_lines == source_lines:
                 ctx.status.plan = PlanStatus.SKIPPED
-                ctx.views.updated = UpdatedView(lines=original_lines)
+                ctx.views.updated = UpdatedView(lines=image_content)
                 logger.trace("Updater: replacement yields no changes for %s", ctx.path)
                 return
             ctx.status.plan = PlanStatus.REPLACED if apply else PlanStatus.PREVIEWED
-            ctx.views.updated = UpdatedView(lines=new_content)
             planned_edit: PlannedEdit | None = infer_single_planned_edit(
                 kind=PlanEditKind.REPLACE,
                 original_lines=source_lines,
                 updated_lines=materialized_new_lines,
             )
+            ctx.views.updated = UpdatedView(
+                lines=with_image_tail(new_content, tail),
+                source_tail=ctx.source_tail_for_edit(planned_edit, original_lines),
+            )
             ctx.views.edit = (
                 None
                 if planned_edit is None
@@ -613,17 +622,20 @@ class PlannerStep(BaseStep):
                     new_text = "".join(new_lines_tmp)
 
                 if new_text == "".join(source_lines):
-                    ctx.views.updated = UpdatedView(lines=original_lines)
+                    ctx.views.updated = UpdatedView(lines=image_content)
                     ctx.status.plan = PlanStatus.SKIPPED
                     logger.trace("Updater: text-based insertion yields no changes for %s", ctx.path)
                     return
                 materialized_new_lines = new_text.splitlines(keepends=True)
-                ctx.views.updated = UpdatedView(lines=materialized_new_lines)
                 planned_edit = infer_single_planned_edit(
                     kind=PlanEditKind.INSERT,
                     original_lines=source_lines,
                     updated_lines=materialized_new_lines,
                 )
+                ctx.views.updated = UpdatedView(
+                    lines=with_image_tail(materialized_new_lines, tail),
+                    source_tail=ctx.source_tail_for_edit(planned_edit, original_lines),
+                )
                 ctx.views.edit = (
                     None
                     if planned_edit is None
@@ -695,16 +707,19 @@ class PlannerStep(BaseStep):
         # Prepend BOM if needed
         new_lines = _prepend_bom_to_lines_if_needed(new_lines, ctx)
         if new_lines == source_lines:
-            ctx.views.updated = UpdatedView(lines=original_lines)
+            ctx.views.updated = UpdatedView(lines=image_content)
             ctx.status.plan = PlanStatus.SKIPPED
             logger.trace("Updater: line-based insertion yields no changes for %s", ctx.path)
             return
-        ctx.views.updated = UpdatedView(lines=new_lines)
         planned_edit = infer_single_planned_edit(
             kind=PlanEditKind.INSERT,
             original_lines=source_lines,
             updated_lines=new_lines,
         )
+        ctx.views.updated = UpdatedView(
+            lines=with_image_tail(new_lines, tail),
+            source_tail=ctx.source_tail_for_edit(planned_edit, original_lines),
+        )
         ctx.views.edit = (
             None
             if planned_edit is None
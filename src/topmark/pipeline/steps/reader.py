@@ -10,21 +10,38 @@
 
 r"""File reader step for the TopMark pipeline.
 
-This step loads the authoritative full UTF-8 text image while preserving physical
+This step loads the authoritative UTF-8 text image while preserving physical
 line endings. It updates the processing context with full-file newline facts,
 whether the file ends with a newline, decoded emptiness facts, and the image used
 by subsequent steps (see `ctx.views.image`). The preceding sniffer owns bounded
 binary and strict UTF-8 classification; direct reader invocation is retained as a
 focused test seam once resolver attachments are present.
+
+Large files (at least `_BOUNDED_READ_MIN_BYTES`) are read in *bounded* mode when
+the header processor allows it: only a head of roughly `_BOUNDED_HEAD_BYTES` is
+decoded into memory, while newline facts for the remainder are counted on raw
+bytes and the remainder itself is exposed as a lazily re-read tail (see
+[`BoundedFileImageView`][topmark.pipeline.views.BoundedFileImageView]). The reader
+falls back to a full read whenever the head cannot be shown to contain every
+header decision: a leading BOM, header markers past the head, an insertion anchor
+near the cut, or a processor with ``requires_full_image`` set. It also falls back
+when the remainder is not valid UTF-8, so undecodable bytes are replaced exactly
+as in a small file instead of being carried over from disk.
 """
 
 from __future__ import annotations
 
+import codecs
+import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from typing import Final
 
 from topmark.config.policy import BomBeforeShebangMode
 from topmark.config.policy import MixedLineEndingsMode
 from topmark.core.constants import STANDARD_NEWLINES
+from topmark.core.constants import TOPMARK_END_MARKER
+from topmark.core.constants import TOPMARK_START_MARKER
 from topmark.core.logging import get_logger
 from topmark.filetypes.model import FileType
 from topmark.pipeline.adapters import PreInsertViewAdapter
@@ -37,17 +54,213 @@ from topmark.pipeline.hints import KnownCode
 from topmark.pipeline.status import ContentStatus
 from topmark.pipeline.status import FsStatus
 from topmark.pipeline.steps.base import BaseStep
+from topmark.pipeline.views import BoundedFileImageView
+from topmark.pipeline.views import DiskTailLines
 from topmark.pipeline.views import ListFileImageView
 
 if TYPE_CHECKING:
+    import mmap
+    import os
+
     from topmark.core.logging import TopmarkLogger
     from topmark.filetypes.model import FileType
     from topmark.filetypes.model import InsertChecker
     from topmark.filetypes.model import InsertCheckResult
     from topmark.pipeline.context.model import ProcessingContext
+    from topmark.processors.base import HeaderProcessor
+    from topmark.utils.source import FileSource
 
 logger: TopmarkLogger = get_logger(__name__)
 
+_BOUNDED_READ_MIN_BYTES: Final[int] = 1024 * 1024
+"""Files at least this large are read in bounded mode when the processor allows it."""
+
+_BOUNDED_HEAD_BYTES: Final[int] = 64 * 1024
+"""Minimum number of bytes decoded into the in-memory head of a bounded image."""
+
+_BOUNDED_HEAD_MIN_LINES: Final[int] = 64
+"""Minimum number of lines in the in-memory head of a bounded image."""
+
+_BOUNDED_HEAD_GUARD_LINES: Final[int] = 8
+"""Trailing head lines that must stay clear of header markers and the insertion anchor."""
+
+_TAIL_SCAN_CHUNK_BYTES: Final[int] = 1024 * 1024
+"""Chunk size used when validating and counting line terminators in a bounded tail."""
+
+_LINE_TERMINATOR_RE: Final[re.Pattern[bytes]] = re.compile(rb"\r\n|\r|\n")
+_CRLF_RE: Final[re.Pattern[bytes]] = re.compile(rb"\r\n")
+_LONE_CR_RE: Final[re.Pattern[bytes]] = re.compile(rb"\r(?!\n)")
+_LONE_LF_RE: Final[re.Pattern[bytes]] = re.compile(rb"(?<!\r)\n")
+_HEADER_MARKERS: Final[tuple[str, str]] = (TOPMARK_START_MARKER, TOPMARK_END_MARKER)
+_UTF8_BOM: Final[bytes] = b"\xef\xbb\xbf"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _BoundedRead:
+    """Result of a bounded read: decoded head, lazy tail, and tail newline facts.
+
+    Attributes:
+        head: Decoded leading lines held in memory.
+        tail: Lazy sequence over the remaining lines.
+        tail_hist: Line-terminator counts for the tail.
+        tail_newline_order: Terminators in order of first appearance within the tail.
+        ends_with_newline: Whether the whole file ends with a line terminator.
+    """
+
+    head: list[str]
+    tail: DiskTailLines
+    tail_hist: dict[str, int]
+    tail_newline_order: tuple[str, ...]
+    ends_with_newline: bool
+
+
+def _find_head_cut(data: bytes | mmap.mmap, *, limit: int) -> int | None:
+    """Return the byte offset that ends the head of a bounded image.
+
+    The cut falls just after a line terminator once the head holds at least
+    `_BOUNDED_HEAD_BYTES` bytes and `_BOUNDED_HEAD_MIN_LINES` lines. A CRLF pair is
+    never split.
+
+    Args:
+        data: Raw file bytes.
+        limit: Largest acceptable cut offset.
+
+    Returns:
+        The cut offset, or ``None`` when no cut exists below `limit`.
+    """
+    line_count: int
+    match: re.Match[bytes]
+    for line_count, match in enumerate(_LINE_TERMINATOR_RE.finditer(data, 0, limit), start=1):
+        end: int = match.end()
+        if end >= _BOUNDED_HEAD_BYTES and line_count >= _BOUNDED_HEAD_MIN_LINES:
+            # `endpos` can truncate a CRLF pair into a lone CR; keep the pair whole.
+            if data[end - 1 : end] == b"\r" and data[end : end + 1] == b"\n":
+                end += 1
+            return end
+    return None
+
+
+def _is_utf8_tail(data: bytes | mmap.mmap, *, start: int) -> bool:
+    """Return whether `data[start:]` is valid UTF-8, decoding one chunk at a time.
+
+    Args:
+        data: Raw file bytes.
+        start: Offset of the first tail byte; always just after a line terminator.
+
+    Returns:
+        True if the tail decodes without errors.
+    """
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for pos in range(start, len(data), _TAIL_SCAN_CHUNK_BYTES):
+            decoder.decode(data[pos : pos + _TAIL_SCAN_CHUNK_BYTES])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _tail_newline_facts(
+    data: bytes | mmap.mmap,
+    *,
+    start: int,
+) -> tuple[dict[str, int], tuple[str, ...]]:
+    """Count line terminators in `data[start:]` without decoding it.
+
+    Args:
+        data: Raw file bytes.
+        start: Offset of the first tail byte; never inside a CRLF pair.
+
+    Returns:
+        A ``(histogram, first_appearance_order)`` pair over LF, CRLF, and CR.
+    """
+    lf_total: int = 0
+    cr_total: int = 0
+    crlf: int = 0
+    prev_ends_with_cr: bool = False
+    for pos in range(start, len(data), _TAIL_SCAN_CHUNK_BYTES):
+        chunk: bytes = data[pos : pos + _TAIL_SCAN_CHUNK_BYTES]
+        crlf += chunk.count(b"\r\n")
+        if prev_ends_with_cr and chunk.startswith(b"\n"):
+            crlf += 1
+        lf_total += chunk.count(b"\n")
+        cr_total += chunk.count(b"\r")
+        prev_ends_with_cr = chunk.endswith(b"\r")
+    hist: dict[str, int] = {"\n": lf_total - crlf, "\r\n": crlf, "\r": cr_total - crlf}
+
+    first_seen: list[tuple[int, str]] = []
+    for newline, match in (
+        ("\r\n", _CRLF_RE.search(data, start)),
+        ("\r", _LONE_CR_RE.search(data, start)),
+        ("\n", _LONE_LF_RE.search(data, start)),
+    ):
+        if match is not None:
+            first_seen.append((match.start(), newline))
+    return hist, tuple(newline for _, newline in sorted(first_seen))
+
+
+def _read_bounded(ctx: ProcessingContext) -> _BoundedRead | None:
+    """Attempt a bounded read of a large file, or return ``None`` for a full read.
+
+    Args:
+        ctx: Processing context with a resolved header processor and an open source.
+
+    Returns:
+        The bounded read, or ``None`` when the file is small, the processor needs the
+        full image, the head cannot be shown to contain every header decision, or
+        the tail is not valid UTF-8.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    processor: HeaderProcessor | None = ctx.header_processor
+    if processor is None or processor.requires_full_image:
+        return None
+
+    source: FileSource = ctx.open_source()
+    data: bytes | mmap.mmap = source.data()
+    size: int = len(data)
+    st: os.stat_result | None = source.stat
+    if size < _BOUNDED_READ_MIN_BYTES or st is None or data[: len(_UTF8_BOM)] == _UTF8_BOM:
+        return None
+
+    # Keep the head well below the file size: otherwise a full read costs about the same.
+    cut: int | None = _find_head_cut(data, limit=size // 2)
+    if cut is None:
+        return None
+    if any(data.find(marker.encode("ascii"), cut) != -1 for marker in _HEADER_MARKERS):
+        return None
+
+    head: list[str] = source.text_lines(end=cut)
+    guard: list[str] = head[-_BOUNDED_HEAD_GUARD_LINES:]
+    if not head[-1].strip() or any(marker in line for line in guard for marker in _HEADER_MARKERS):
+        return None
+    anchor: int = processor.compute_insertion_anchor(head)
+    if not 0 <= anchor <= len(head) - _BOUNDED_HEAD_GUARD_LINES:
+        return None
+    # The tail is copied from disk on write; a lossy decode must not be hidden there.
+    if not _is_utf8_tail(data, start=cut):
+        return None
+
+    tail_hist: dict[str, int]
+    tail_order: tuple[str, ...]
+    tail_hist, tail_order = _tail_newline_facts(data, start=cut)
+    ends_with_newline: bool = data[size - 1 : size] in (b"\n", b"\r")
+    tail_length: int = sum(tail_hist.values()) + (0 if ends_with_newline else 1)
+    return _BoundedRead(
+        head=head,
+        tail=DiskTailLines(
+            path=ctx.path,
+            offset=cut,
+            length=tail_length,
+            size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        ),
+        tail_hist=tail_hist,
+        tail_newline_order=tail_order,
+        ends_with_newline=ends_with_newline,
+    )
+
 
 def _newline_histogram(
     lines: list[str],
@@ -185,6 +398,8 @@ class ReaderStep(BaseStep):
               provides streaming access through `ctx.iter_file_lines()`, and records
               `ctx.ends_with_newline`, a precise newline histogram in `ctx.newline_hist`,
               and the dominant newline style in `ctx.newline_style`.
+            - Large files may instead get a `BoundedFileImageView` (head in memory, tail
+              re-read from disk); newline and end-of-file facts still cover the whole file.
         """
         logger.debug("ctx: %s", ctx)
 
@@ -249,13 +464,12 @@ class ReaderStep(BaseStep):
         # we load the full file as text and compute precise metadata.
 
         try:
-            with ctx.path.open(
-                "r",
-                encoding="utf-8",
-                errors="replace",
-                newline="",
-            ) as f:
-                lines: list[str] = list(f)
+            # Decode from the shared source the sniffer (and any content matcher)
+            # already loaded, then drop the raw bytes: the image is authoritative now.
+            # Large files keep only their header region in memory (bounded read).
+            bounded: _BoundedRead | None = _read_bounded(ctx)
+            lines: list[str] = ctx.open_source().text_lines() if bounded is None else bounded.head
+            ctx.release_source()
 
             # Normalize a leading UTF-8 BOM so downstream steps work on BOM-free text.
             # We remember its presence to re-attach it at write time in the updater.
@@ -278,10 +492,12 @@ class ReaderStep(BaseStep):
             #   must be represented via `ctx.is_effectively_empty` / `ctx.is_logically_empty`
             #   so newline-style and round-trip placeholders remain stable.
             if len(lines) == 0:
-                try:
-                    st_size: int = ctx.path.stat().st_size
-                except OSError:
-                    st_size = 0
+                st_size: int = 0
+                if not ctx.open_source().in_memory:
+                    try:
+                        st_size = ctx.path.stat().st_size
+                    except OSError:
+                        st_size = 0
 
                 if st_size == 0:
                     # Edge case: file truncated to 0 bytes between sniff and read.
@@ -303,16 +519,27 @@ class ReaderStep(BaseStep):
                 return
 
             # Record whether the file ends with a newline (used when generating patches)
-            ctx.ends_with_newline = lines[-1].endswith(STANDARD_NEWLINES)
+            ctx.ends_with_newline = (
+                lines[-1].endswith(STANDARD_NEWLINES)
+                if bounded is None
+                else bounded.ends_with_newline
+            )
 
             # Preserve original line endings; each element contains its own terminator
-            ctx.views.image = ListFileImageView(lines)
+            ctx.views.image = (
+                ListFileImageView(lines)
+                if bounded is None
+                else BoundedFileImageView(lines, bounded.tail)
+            )
 
             # Ensure emptiness flags remain consistent with the loaded image.
             ctx.is_effectively_empty, ctx.is_logically_empty = _compute_empty_flags(lines)
 
             # Compute detailed newline histogram
             hist: dict[str, int] = _newline_histogram(lines)
+            if bounded is not None:
+                for newline, count in bounded.tail_hist.items():
+                    hist[newline] += count
             ctx.newline_hist = {k: v for k, v in hist.items() if v > 0}
             total: int = sum(hist.values())
             if total > 0:
@@ -325,6 +552,10 @@ class ReaderStep(BaseStep):
                             if candidate not in encountered:
                                 encountered.append(candidate)
                             break
+                if bounded is not None:
+                    encountered.extend(
+                        nl for nl in bounded.tail_newline_order if nl not in encountered
+                    )
                 dom_nl = max(encountered, key=lambda candidate: hist[candidate])
                 dom_cnt = hist[dom_nl]
                 ctx.dominant_newline = dom_nl if dom_cnt > 0 else None
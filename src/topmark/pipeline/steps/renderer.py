@@ -253,6 +253,8 @@ class RendererStep(BaseStep):
             # line_indent_override stays as default so fields still use processor's
             # after-prefix spacing
             soft_overflow_fields=soft_overflow_fields,
+            # Values from [fields] are identical for every file sharing this config
+            static_fields=ctx.config.field_values.keys(),
         )
         for field_name in sorted(soft_overflow_fields):
             ctx.hint(
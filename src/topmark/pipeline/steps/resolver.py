@@ -56,11 +56,14 @@ def _ensure_resolution_probe(
         Resolution probe result stored on the context.
     """
     if ctx.resolution_probe is None:
-        ctx.resolution_probe = probe_resolution_for_path(
-            ctx.path,
-            include_file_types=ctx.config.include_file_types or None,
-            exclude_file_types=ctx.config.exclude_file_types or None,
-        )
+        # Content matchers read through the context's shared source, so a probed
+        # file is not read again by the sniffer and reader.
+        with ctx.open_source().activate():
+            ctx.resolution_probe = probe_resolution_for_path(
+                ctx.path,
+                include_file_types=ctx.config.include_file_types or None,
+                exclude_file_types=ctx.config.exclude_file_types or None,
+            )
     return ctx.resolution_probe
 
 
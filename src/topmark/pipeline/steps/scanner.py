@@ -66,7 +66,7 @@ def _select_header_newline(
     header_range: tuple[int, int] | None,
 ) -> str:
     """Select a deterministic local newline for newly rendered header content."""
-    lines: list[str] = list(ctx.iter_image_lines())
+    lines: list[str] = ctx.split_image_for_editing()[0]
     if header_range is not None:
         start, end = header_range
         for line in lines[start : end + 1]:
@@ -194,9 +194,11 @@ class ScannerStep(BaseStep):
             logger.error("scan(): No file lines available for %s", ctx.path)
             return
 
-        # Use header_processor.get_header_bounds() to locate header start and end indices
+        # Use header_processor.get_header_bounds() to locate header start and end indices.
+        # A bounded image only exposes its head here; the reader guarantees that any
+        # header and the insertion anchor lie inside it.
         hb: HeaderBounds = ctx.header_processor.get_header_bounds(
-            lines=ctx.iter_image_lines(),
+            lines=ctx.split_image_for_editing()[0],
             newline_style=ctx.newline_style,
         )
 
@@ -15,7 +15,7 @@ that inspects files between resolution and full text loading. It performs:
 
 * existence and permission checks
 * fast binary sniff using a NUL-byte heuristic
-* strict UTF-8 validation on small chunks
+* strict UTF-8 validation of the bounded sniff window
 * BOM + shebang ordering checks for shebang-aware file types
 * raw newline histogram construction (LF/CRLF/CR) with mixed-newline detection
 
@@ -56,11 +56,16 @@ from topmark.pipeline.steps.base import BaseStep
 from topmark.utils.timestamp import get_path_mtime_utc
 
 if TYPE_CHECKING:
-    from os import stat_result
-
     from topmark.filetypes.model import FileType
     from topmark.filetypes.policy import FileTypeHeaderPolicy
     from topmark.pipeline.context.model import ProcessingContext
+    from topmark.utils.source import FileSource
+
+
+# Bytes inspected by the NUL-byte binary heuristic.
+_SNIFF_PREFIX_BYTES: int = 4096
+# Bytes inspected for UTF-8 validity and newline statistics.
+_SNIFF_WINDOW_BYTES: int = 64 * 1024
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -76,6 +81,10 @@ def _count_newlines(
 ) -> tuple[_NLCounts, bool]:
     """Count newline sequences in a bytes buffer.
 
+    Counting uses the C-level `bytes.count` primitive instead of a per-byte
+    scan: every CRLF pair is counted once, and the remaining LF and CR counts
+    are derived by subtracting the pairs from the raw LF and CR totals.
+
     Args:
         buf: Byte chunk to inspect.
         carry_cr: Whether a CR from the previous chunk should be paired with the first LF.
@@ -84,39 +93,28 @@ def _count_newlines(
         A tuple of (_NLCounts, new_carry_cr) where new_carry_cr indicates whether the last byte in
         this chunk was an unmatched CR that may pair with an LF in the next chunk.
     """
-    lf: int = 0
     crlf: int = 0
     cr: int = 0
-    i: int = 0
-    n: int = len(buf)
+    start: int = 0
+    end: int = len(buf)
 
     # If previous chunk ended with CR, and current chunk starts with LF → count one CRLF
     if carry_cr:
-        if n and buf[0:1] == b"\n":
+        if buf.startswith(b"\n"):
             crlf += 1
-            i = 1
+            start = 1
         else:
             cr += 1  # lone CR previously
-    # Scan the rest
-    while i < n:
-        b: bytes = buf[i : i + 1]
-        if b == b"\r":
-            if i + 1 < n and buf[i + 1 : i + 2] == b"\n":
-                crlf += 1
-                i += 2
-            else:
-                # If CR is the last byte of this chunk, carry it to the next chunk
-                if i + 1 == n:
-                    return _NLCounts(lf=lf, crlf=crlf, cr=cr), True
-                # Otherwise, it's a standalone CR within this chunk: count it and continue
-                cr += 1
-                i += 1
-        elif b == b"\n":
-            lf += 1
-            i += 1
-        else:
-            i += 1
-    return _NLCounts(lf=lf, crlf=crlf, cr=cr), (n > 0 and buf[-1:] == b"\r")
+
+    # A CR as the last byte may pair with an LF in the next chunk: carry it instead.
+    new_carry_cr: bool = end > start and buf.endswith(b"\r")
+    if new_carry_cr:
+        end -= 1
+
+    pairs: int = buf.count(b"\r\n", start, end)
+    lf: int = buf.count(b"\n", start, end) - pairs
+    cr += buf.count(b"\r", start, end) - pairs
+    return _NLCounts(lf=lf, crlf=crlf + pairs, cr=cr), new_carry_cr
 
 
 def inspect_bom_shebang(
@@ -217,7 +215,7 @@ def _sniff_stream(
     This helper performs the core sniffing logic for `SnifferStep.run`:
 
     - Binary detection via NUL-byte heuristic.
-    - Strict UTF-8 validation on a small prefix and limited subsequent chunks.
+    - Strict UTF-8 validation of the first 64 KiB, sliced from the context's shared source.
     - BOM + shebang ordering policy for shebang-aware file types.
     - Newline counting (LF / CRLF / CR) and mixed-newline detection.
     - Population of newline histogram and derived stats via `_commit_newline_stats`.
@@ -235,101 +233,78 @@ def _sniff_stream(
         should stop further processing in run(). Returns None when no terminal status was set and
         the caller may mark the filesystem as OK.
     """
-    with ctx.path.open("rb") as bf:
-        prefix: bytes = bf.read(4096)
-        # Binary heuristic: NUL anywhere in prefix → not text
-        if b"\0" in prefix:
-            ctx.diagnostics.add_error("NUL byte detected; treating this as a binary file.")
-            return FsStatus.BINARY
-
-        # Initialize a strict UTF-8 incremental decoder to catch invalid sequences
-        decoder: codecs.BufferedIncrementalDecoder = codecs.getincrementaldecoder("utf-8")("strict")
-
-        # Inspect BOM and shebang ordering in the first bytes
-        has_bom, has_shebang, shebang_after_bom = inspect_bom_shebang(prefix)
-        ctx.leading_bom = has_bom
-        ctx.has_shebang = has_shebang
-
-        # If the file type supports shebang and BOM precedes shebang, treat as policy violation
-        policy: FileTypeHeaderPolicy | None = (
-            ctx.file_type.header_policy if ctx.file_type is not None else None
-        )
-        supports_shebang: bool = bool(policy and getattr(policy, "supports_shebang", False))
-        if shebang_after_bom and supports_shebang:
-            if bom_before_shebang_mode(ctx) == BomBeforeShebangMode.REMOVE_BOM:
-                ctx.diagnostics.add_warning(
-                    "UTF-8 BOM appears before the shebang; policy remove_bom will remove it "
-                    "so '#!' begins at byte 0."
-                )
-            else:
-                ctx.diagnostics.add_error(
-                    "Policy: UTF-8 BOM appears before the shebang; POSIX requires '#!' at byte 0. "
-                    "TopMark will not modify this file by default."
-                )
-            return FsStatus.BOM_BEFORE_SHEBANG
-
-        # Newline counting on prefix and subsequent chunks (bounded),
-        # and strict UTF-8 decode
-        counts = _NLCounts()
-        carry_cr: bool = False
-        total_bytes: int = len(prefix)
-        chunk: bytes = prefix
-        while True:
-            try:
-                # Attempt to decode the current chunk strictly as UTF-8
-                decoder.decode(chunk)
-            except UnicodeDecodeError:
-                ctx.diagnostics.add_error(
-                    "Invalid UTF-8 byte sequence detected; treating as non-text file."
-                )
-                return FsStatus.UNICODE_DECODE_ERROR
-
-            # Proceed with newline counting on the raw bytes
-            c: _NLCounts
-            c, carry_cr = _count_newlines(chunk, carry_cr)
-            counts = _NLCounts(
-                lf=counts.lf + c.lf,
-                crlf=counts.crlf + c.crlf,
-                cr=counts.cr + c.cr,
+    # The window is a slice of the context's shared source, which the reader
+    # decodes later; later checks slice into it by offset.
+    window: bytes = ctx.open_source().prefix(_SNIFF_WINDOW_BYTES)
+
+    # Binary heuristic: NUL anywhere in prefix → not text
+    if window.find(b"\0", 0, _SNIFF_PREFIX_BYTES) != -1:
+        ctx.diagnostics.add_error("NUL byte detected; treating this as a binary file.")
+        return FsStatus.BINARY
+
+    # Inspect BOM and shebang ordering in the first bytes
+    has_bom, has_shebang, shebang_after_bom = inspect_bom_shebang(window)
+    ctx.leading_bom = has_bom
+    ctx.has_shebang = has_shebang
+
+    # If the file type supports shebang and BOM precedes shebang, treat as policy violation
+    policy: FileTypeHeaderPolicy | None = (
+        ctx.file_type.header_policy if ctx.file_type is not None else None
+    )
+    supports_shebang: bool = bool(policy and getattr(policy, "supports_shebang", False))
+    if shebang_after_bom and supports_shebang:
+        if bom_before_shebang_mode(ctx) == BomBeforeShebangMode.REMOVE_BOM:
+            ctx.diagnostics.add_warning(
+                "UTF-8 BOM appears before the shebang; policy remove_bom will remove it "
+                "so '#!' begins at byte 0."
             )
-            # Limit total inspected bytes to ~64 KiB to stay lightweight
-            if total_bytes >= 64 * 1024:
-                break
-            chunk = bf.read(4096)
-            if not chunk:
-                break
-            total_bytes += len(chunk)
-
-        # After loop, flush the decoder to catch any incomplete trailing sequences
-        try:
-            decoder.decode(b"", final=True)
-        except UnicodeDecodeError:
+        else:
             ctx.diagnostics.add_error(
-                "Invalid UTF-8 sequence at end-of-file; treating as non-text file."
+                "Policy: UTF-8 BOM appears before the shebang; POSIX requires '#!' at byte 0. "
+                "TopMark will not modify this file by default."
             )
-            return FsStatus.UNICODE_DECODE_ERROR
+        return FsStatus.BOM_BEFORE_SHEBANG
+
+    # Strict UTF-8 validation of the whole window. A non-final decode raises for
+    # invalid sequences and leaves an incomplete trailing sequence unconsumed.
+    try:
+        _, consumed = codecs.utf_8_decode(window, "strict", False)
+    except UnicodeDecodeError:
+        ctx.diagnostics.add_error(
+            "Invalid UTF-8 byte sequence detected; treating as non-text file."
+        )
+        return FsStatus.UNICODE_DECODE_ERROR
+    if consumed != len(window):
+        ctx.diagnostics.add_error(
+            "Invalid UTF-8 sequence at end-of-file; treating as non-text file."
+        )
+        return FsStatus.UNICODE_DECODE_ERROR
 
-        if carry_cr:
-            counts = _NLCounts(lf=counts.lf, crlf=counts.crlf, cr=counts.cr + 1)
+    # Newline counting on the raw window; a trailing CR has nothing left to pair with.
+    counts: _NLCounts
+    carry_cr: bool
+    counts, carry_cr = _count_newlines(window, carry_cr=False)
+    if carry_cr:
+        counts = _NLCounts(lf=counts.lf, crlf=counts.crlf, cr=counts.cr + 1)
 
-        # Commit newline histogram and derived stats to context
-        _commit_newline_stats(ctx, counts)
+    # Commit newline histogram and derived stats to context
+    _commit_newline_stats(ctx, counts)
 
-        if ctx.mixed_newlines:
-            if ctx.get_effective_policy().mixed_line_endings is MixedLineEndingsMode.PRESERVE:
-                return FsStatus.MIXED_LINE_ENDINGS
-            lf: int = ctx.newline_hist.get("\n", 0)
-            crlf: int = ctx.newline_hist.get("\r\n", 0)
-            cr: int = ctx.newline_hist.get("\r", 0)
-            ctx.diagnostics.add_error(
-                "Mixed line endings detected during sniff "
-                f"(LF={lf}, CRLF={crlf}, CR={cr}). "
-                "Strict policy refuses to process files with mixed line endings."
-            )
+    if ctx.mixed_newlines:
+        if ctx.get_effective_policy().mixed_line_endings is MixedLineEndingsMode.PRESERVE:
             return FsStatus.MIXED_LINE_ENDINGS
+        lf: int = ctx.newline_hist.get("\n", 0)
+        crlf: int = ctx.newline_hist.get("\r\n", 0)
+        cr: int = ctx.newline_hist.get("\r", 0)
+        ctx.diagnostics.add_error(
+            "Mixed line endings detected during sniff "
+            f"(LF={lf}, CRLF={crlf}, CR={cr}). "
+            "Strict policy refuses to process files with mixed line endings."
+        )
+        return FsStatus.MIXED_LINE_ENDINGS
 
-        # No final state
-        return None
+    # No final state
+    return None
 
 
 class SnifferStep(BaseStep):
@@ -390,9 +365,11 @@ class SnifferStep(BaseStep):
 
         Responsibilities:
         - Confirm file exists and is readable.
-        - Fast text-vs-binary sniff (NUL bytes, incremental UTF-8 decode of tiny chunks).
+        - Fast text-vs-binary sniff over one bounded 64 KiB read (NUL bytes in the first
+          4 KiB, then strict `codecs.utf_8_decode(final=False)` of the whole window).
         - BOM + shebang ordering check for shebang-aware file types.
-        - Quick newline histogram (bytes-level) and strict mixed-newlines skip.
+        - Quick newline histogram (`bytes.count` over the same window) and strict
+          mixed-newlines skip.
         - Establish a tentative newline_style (dominant or default to LF) without loading full text.
 
         Notes:
@@ -404,33 +381,40 @@ class SnifferStep(BaseStep):
         )
         ctx.status.fs = FsStatus.PENDING
 
-        # Existence / permission
-        try:
-            st: stat_result = ctx.path.stat()
-        except FileNotFoundError:
-            ctx.status.fs = FsStatus.NOT_FOUND
-            reason: str = f"File not found: {ctx.path}"
-            ctx.request_halt(reason=reason, at_step=self)
-            return
-        except PermissionError as e:
-            ctx.status.fs = FsStatus.NO_READ_PERMISSION
-            reason = f"Permission denied: {e}"
-            ctx.diagnostics.add_error(reason)
-            ctx.request_halt(reason=reason, at_step=self)
-            return
+        size: int
+        source: FileSource = ctx.open_source()
+        if source.in_memory:
+            # STDIN content: nothing on disk to stat or write back to.
+            size = len(source.data())
+            ctx.timestamp = ctx.run_options.started_at
+        else:
+            # Existence / permission
+            try:
+                size = ctx.path.stat().st_size
+            except FileNotFoundError:
+                ctx.status.fs = FsStatus.NOT_FOUND
+                reason: str = f"File not found: {ctx.path}"
+                ctx.request_halt(reason=reason, at_step=self)
+                return
+            except PermissionError as e:
+                ctx.status.fs = FsStatus.NO_READ_PERMISSION
+                reason = f"Permission denied: {e}"
+                ctx.diagnostics.add_error(reason)
+                ctx.request_halt(reason=reason, at_step=self)
+                return
 
-        # Get the path's modification timestamp
-        ctx.timestamp = get_path_mtime_utc(path=ctx.path)
+            # Get the path's modification timestamp
+            ctx.timestamp = get_path_mtime_utc(path=ctx.path)
 
-        # Apply mode: check write permission upfront
-        if apply is True and not os.access(ctx.path, os.W_OK):
-            ctx.status.fs = FsStatus.NO_WRITE_PERMISSION
-            reason = "Permission denied: cannot write to file"
-            ctx.diagnostics.add_error(reason)
-            ctx.request_halt(reason=reason, at_step=self)
-            return
+            # Apply mode: check write permission upfront
+            if apply is True and not os.access(ctx.path, os.W_OK):
+                ctx.status.fs = FsStatus.NO_WRITE_PERMISSION
+                reason = "Permission denied: cannot write to file"
+                ctx.diagnostics.add_error(reason)
+                ctx.request_halt(reason=reason, at_step=self)
+                return
 
-        if st.st_size == 0:
+        if size == 0:
             ctx.status.fs = FsStatus.EMPTY
 
             # If policy does NOT allow inserting headers into empty files for this type,
@@ -466,6 +450,8 @@ class SnifferStep(BaseStep):
                 # Final state
                 ctx.status.fs = fs_status
                 if fs_status in {FsStatus.BINARY, FsStatus.UNICODE_DECODE_ERROR}:
+                    # No later step decodes this file; drop the shared buffer now.
+                    ctx.release_source()
                     ctx.request_halt(reason=fs_status.value, at_step=self)
                 return
         except FileNotFoundError:
@@ -39,11 +39,14 @@ from topmark.pipeline.views import PlanEditKind
 from topmark.pipeline.views import UpdatedView
 from topmark.pipeline.views import ViewSlot
 from topmark.pipeline.views import infer_single_planned_edit
+from topmark.pipeline.views import with_image_tail
 from topmark.processors.types import StripDiagKind
 from topmark.processors.types import StripDiagnostic
 from topmark.processors.types import StripHeaderResult
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from topmark.core.logging import TopmarkLogger
     from topmark.filetypes.policy import FileTypeHeaderPolicy
     from topmark.pipeline.context.model import ProcessingContext
@@ -193,14 +196,18 @@ class StripperStep(BaseStep):
 
         if ctx.status.header is HeaderStatus.MISSING:
             if should_remove_bom_before_shebang(ctx):
-                original_lines: list[str] = list(ctx.iter_image_lines())
+                # BOM remediation never runs on a bounded image (the reader reads BOM files fully).
+                original_lines: list[str] = ctx.materialize_image_lines()
                 source_lines: list[str] = source_lines_with_remediated_bom(original_lines, ctx)
-                ctx.views.updated = UpdatedView(lines=original_lines)
                 planned_edit: PlannedEdit | None = infer_single_planned_edit(
                     kind=PlanEditKind.REMOVE,
                     original_lines=source_lines,
                     updated_lines=original_lines,
                 )
+                ctx.views.updated = UpdatedView(
+                    lines=original_lines,
+                    source_tail=ctx.source_tail_for_edit(planned_edit, original_lines),
+                )
                 ctx.views.edit = None if planned_edit is None else EditView(edits=(planned_edit,))
                 ctx.status.strip = StripStatus.READY
                 ctx.diagnostics.add_info(
@@ -229,8 +236,13 @@ class StripperStep(BaseStep):
                 ctx.request_halt(reason=reason, at_step=self)
             return
 
-        original_lines = list(ctx.iter_image_lines())
+        # For a bounded image only the head (which holds the header) is edited; the
+        # untouched tail is appended to the stripped image. The head always ends with a
+        # line terminator, so end-of-file handling applies to it only without a tail.
+        tail: Sequence[str]
+        original_lines, tail = ctx.split_image_for_editing()
         source_lines = source_lines_with_remediated_bom(original_lines, ctx)
+        ends_with_newline: bool | None = True if tail else ctx.ends_with_newline
         if not original_lines:
             # Empty file
             ctx.status.strip = StripStatus.NOT_NEEDED
@@ -245,7 +257,7 @@ class StripperStep(BaseStep):
             lines=original_lines,
             span=span,
             newline_style=ctx.header_newline_style or ctx.newline_style,
-            ends_with_newline=ctx.ends_with_newline,
+            ends_with_newline=ends_with_newline,
         )
         new_lines: list[str] = strip_result.lines
         removed: tuple[int, int] | None = strip_result.removed_span
@@ -353,9 +365,9 @@ class StripperStep(BaseStep):
         # Preserve original final-newline (FNL) semantics: if the original file did not
         # end with a newline, strip a single trailing newline sequence from the final line
         # of the stripped image. This keeps single-line XML round-trips stable.
-        if ctx.ends_with_newline is False and updated_lines:
+        if ends_with_newline is False and updated_lines:
             # Only trim when you know the original had no final newline
-            # (ctx.ends_with_newline is neither None nor True):
+            # (ends_with_newline is neither None nor True):
             last: str = updated_lines[-1]
             if last.endswith("\r\n"):
                 updated_lines[-1] = last[:-2]
@@ -407,12 +419,15 @@ class StripperStep(BaseStep):
                 # Case 4: Otherwise, leave as-is (body has non-blank content).
 
         # A header was present and removed
-        ctx.views.updated = UpdatedView(lines=updated_lines)
         planned_edit: PlannedEdit | None = infer_single_planned_edit(
             kind=PlanEditKind.REMOVE,
             original_lines=source_lines,
             updated_lines=updated_lines,
         )
+        ctx.views.updated = UpdatedView(
+            lines=with_image_tail(updated_lines, tail),
+            source_tail=ctx.source_tail_for_edit(planned_edit, original_lines),
+        )
         ctx.views.edit = (
             None
             if planned_edit is None
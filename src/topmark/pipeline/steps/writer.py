@@ -18,7 +18,11 @@ This step is responsible for the final I/O after all other steps have computed
 `ctx.views.updated` and selected the intended `PlanStatus` (INSERTED, REPLACED, REMOVED,
 or PREVIEWED for stdout output). File and stdout sinks stream from repeatable updated
 content via `ProcessingContext.iter_updated_lines()` instead of requiring an eagerly
-materialized updated-line list.
+materialized updated-line list. When the planner recorded a
+[`SourceTail`][topmark.pipeline.views.SourceTail], file sinks encode only the lines
+before it and copy the untouched remainder from the source file as raw bytes
+(`os.copy_file_range()` or `os.sendfile()` where available, large buffered copies
+otherwise).
 It also applies policy gates (e.g., header mutation mode) so that command-line intent
 and config policies are centralized here.
 
@@ -28,7 +32,9 @@ Sinks
 - AtomicFileSink: writes through a same-directory temporary file and atomically replaces the target.
   POSIX-only durability and permission helpers such as `os.fchmod()` and `os.O_DIRECTORY` are used
   only when available; Windows falls back to best-effort path-based permission handling and skips
-  directory `fsync()`.
+  directory `fsync()`. Unless `WriteDurability.PER_FILE` is selected, the directory `fsync()` is
+  left to the engine's commit phase (see
+  [`topmark.pipeline.durability`][topmark.pipeline.durability]).
 - StdoutSink: streams the updated content to stdout (stdin-content mode).
 
 The step respects
@@ -40,39 +46,57 @@ and `ProcessingContext.can_change`.
 from __future__ import annotations
 
 import contextlib
+import errno
 import os
 import secrets
 import stat
 import sys
 from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING
+from typing import Final
 from typing import Protocol
 
 from topmark.config.policy import HeaderMutationMode
 from topmark.config.types import FileWriteStrategy
 from topmark.config.types import OutputTarget
+from topmark.config.types import WriteDurability
 from topmark.core.logging import get_logger
+from topmark.pipeline.context.model import WriteStats
 from topmark.pipeline.context.policy import can_change
+from topmark.pipeline.durability import sync_directory
 from topmark.pipeline.hints import Axis
 from topmark.pipeline.hints import Cluster
 from topmark.pipeline.hints import KnownCode
 from topmark.pipeline.status import PlanStatus
 from topmark.pipeline.status import WriteStatus
 from topmark.pipeline.steps.base import BaseStep
+from topmark.pipeline.views import SegmentUpdatedContent
 from topmark.pipeline.views import ViewSlot
+from topmark.pipeline.views import source_prefix_digest
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
     from typing import BinaryIO
 
     from topmark.config.policy import FrozenPolicy
     from topmark.core.logging import TopmarkLogger
     from topmark.pipeline.context.model import ProcessingContext
+    from topmark.pipeline.views import SourceTail
     from topmark.pipeline.views import UpdatedView
 
 
 logger: TopmarkLogger = get_logger(__name__)
 
+_COPY_CHUNK_BYTES: Final[int] = 1024 * 1024
+"""Buffer size for the portable read/write fallback of tail copies."""
+
+_COPY_FALLBACK_ERRNOS: Final[frozenset[int]] = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK, errno.EBADF}
+)
+"""Errors that mean a kernel copy primitive does not support this pair of files."""
+
 
 # --- DRY helpers for writer sinks ---
 def _has_updated_lines(
@@ -94,24 +118,226 @@ def _write_encoded_lines(
     *,
     ctx: ProcessingContext,
     file: BinaryIO,
+    lines: Iterable[str] | None = None,
 ) -> int:
     """Stream updated lines to a binary file object.
 
     Args:
         ctx: Processing context containing repeatable updated content.
         file: Binary file object to receive UTF-8 encoded lines.
+        lines: Pre-read updated lines to write instead of iterating ``ctx``.
 
     Returns:
         Number of UTF-8 bytes written.
     """
     bytes_written: int = 0
-    for line in ctx.iter_updated_lines():
+    for line in ctx.iter_updated_lines() if lines is None else lines:
         encoded: bytes = line.encode("utf-8")
         file.write(encoded)
         bytes_written += len(encoded)
     return bytes_written
 
 
+def _source_tail(
+    ctx: ProcessingContext,
+) -> SourceTail | None:
+    """Return the planner's source tail for ``ctx``, if any.
+
+    Args:
+        ctx: Processing context.
+
+    Returns:
+        The recorded [`SourceTail`][topmark.pipeline.views.SourceTail], or ``None``.
+    """
+    uv: UpdatedView | None = ctx.views.updated
+    return uv.source_tail if uv is not None else None
+
+
+def _read_exact(fd: int, offset: int, count: int) -> bytes:
+    """Read ``count`` bytes starting at ``offset`` (fewer only at end-of-file).
+
+    Args:
+        fd: Readable file descriptor; its position is moved.
+        offset: Byte offset to read from.
+        count: Number of bytes to read.
+
+    Returns:
+        The bytes read.
+    """
+    os.lseek(fd, offset, os.SEEK_SET)
+    chunks: list[bytes] = []
+    remaining: int = count
+    while remaining > 0:
+        chunk: bytes = os.read(fd, min(remaining, _COPY_CHUNK_BYTES))
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _open_source_tail(tail: SourceTail) -> int | None:
+    """Open the source file when its tail can still be copied verbatim.
+
+    Args:
+        tail: Tail recorded by the planner.
+
+    Returns:
+        A read-only descriptor for the source file, or ``None`` when the file
+        changed since it was read or its leading bytes do not match the decoded image
+        (for example invalid UTF-8 before the tail). The caller closes the descriptor.
+    """
+    try:
+        fd: int = os.open(tail.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        logger.debug("source tail: cannot open %s", tail.path, exc_info=True)
+        return None
+    try:
+        st: os.stat_result = os.fstat(fd)
+        if (
+            st.st_size == tail.size
+            and st.st_mtime_ns == tail.mtime_ns
+            and source_prefix_digest(_read_exact(fd, 0, tail.offset)) == tail.prefix_digest
+        ):
+            return fd
+    except OSError:
+        logger.debug("source tail: cannot verify %s", tail.path, exc_info=True)
+    os.close(fd)
+    logger.debug("source tail: %s no longer matches its image; encoding all lines", tail.path)
+    return None
+
+
+def _read_source_tail(tail: SourceTail) -> bytes | None:
+    """Return the untouched source tail as raw bytes.
+
+    Args:
+        tail: Tail recorded by the planner.
+
+    Returns:
+        The tail bytes, or ``None`` when the file no longer matches its image.
+
+    Raises:
+        OSError: If the file cannot be read or ends before the recorded size.
+    """
+    src_fd: int | None = _open_source_tail(tail)
+    if src_fd is None:
+        return None
+    try:
+        data: bytes = _read_exact(src_fd, tail.offset, tail.length)
+    finally:
+        os.close(src_fd)
+    if len(data) != tail.length:
+        raise OSError(f"{tail.path} changed on disk since it was read")
+    return data
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to ``fd``, retrying short writes.
+
+    Args:
+        fd: Writable file descriptor.
+        data: Bytes to write.
+    """
+    view: memoryview = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _copy_file_region(src_fd: int, dst_fd: int, *, offset: int, count: int) -> int:
+    """Copy ``count`` bytes at ``offset`` of ``src_fd`` to the position of ``dst_fd``.
+
+    Uses `os.copy_file_range()` (in-kernel, possibly reflinked), then `os.sendfile()`,
+    then buffered `read()`/`write()`, moving to the next mechanism whenever one is
+    unavailable, unsupported for the two files, or stops short; each mechanism
+    resumes at ``offset`` plus the bytes already copied.
+
+    Args:
+        src_fd: Readable source descriptor.
+        dst_fd: Writable destination descriptor, positioned where the bytes belong.
+        offset: Source byte offset of the region.
+        count: Number of bytes to copy.
+
+    Returns:
+        Number of bytes copied (always ``count``).
+
+    Raises:
+        OSError: If copying fails or the source ends before ``count`` bytes.
+    """
+    copied: int = 0
+    for name in ("copy_file_range", "sendfile"):
+        primitive = getattr(os, name, None)
+        if primitive is None or copied == count:
+            continue
+        try:
+            while copied < count:
+                if name == "copy_file_range":
+                    n: int = primitive(src_fd, dst_fd, count - copied, offset + copied)
+                else:
+                    n = primitive(dst_fd, src_fd, offset + copied, count - copied)
+                if n == 0:
+                    break
+                copied += n
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            logger.debug("tail copy: os.%s unsupported (%s); falling back", name, exc)
+            continue
+        if copied < count:
+            logger.debug(
+                "tail copy: os.%s stopped at %d of %d bytes; falling back", name, copied, count
+            )
+
+    if copied < count:
+        os.lseek(src_fd, offset + copied, os.SEEK_SET)
+        while copied < count:
+            chunk: bytes = os.read(src_fd, min(count - copied, _COPY_CHUNK_BYTES))
+            if not chunk:
+                break
+            _write_all(dst_fd, chunk)
+            copied += len(chunk)
+
+    if copied != count:
+        raise OSError(f"source file shrank while copying its tail ({copied} of {count} bytes)")
+    return copied
+
+
+def _write_updated_content(
+    *,
+    ctx: ProcessingContext,
+    file: BinaryIO,
+) -> tuple[int, int]:
+    """Write the updated image, copying an untouched source tail verbatim when possible.
+
+    Args:
+        ctx: Processing context containing repeatable updated content.
+        file: Binary file object (with a real descriptor) receiving the content.
+
+    Returns:
+        ``(bytes_written, bytes_copied)``: total bytes written, and how many of them
+        were copied from the source file instead of being encoded.
+    """
+    tail: SourceTail | None = _source_tail(ctx)
+    src_fd: int | None = _open_source_tail(tail) if tail is not None else None
+    if tail is None or src_fd is None:
+        return _write_encoded_lines(ctx=ctx, file=file), 0
+    try:
+        encoded: int = _write_encoded_lines(
+            ctx=ctx,
+            file=file,
+            lines=islice(ctx.iter_updated_lines(), tail.head_line_count),
+        )
+        file.flush()
+        copied: int = _copy_file_region(
+            src_fd,
+            file.fileno(),
+            offset=tail.offset,
+            count=tail.length,
+        )
+    finally:
+        os.close(src_fd)
+    return encoded + copied, copied
+
+
 def _write_stdout_lines(
     ctx: ProcessingContext,
 ) -> int:
@@ -164,13 +390,20 @@ class WriteResult:
 
     Attributes:
         status: Final status reported by the sink.
-        bytes_written: Number of bytes written when reported by the sink. Stdout
-            reports emitted UTF-8 bytes; file sinks currently report zero after
-            successful writes.
+        bytes_written: Number of bytes written by the sink (zero when nothing was
+            written or the write failed).
+        bytes_copied: Portion of ``bytes_written`` copied verbatim from the source
+            file instead of being encoded from updated lines.
     """
 
     status: WriteStatus
     bytes_written: int = 0
+    bytes_copied: int = 0
+
+    @property
+    def bytes_encoded(self) -> int:
+        """Portion of ``bytes_written`` encoded from updated lines."""
+        return self.bytes_written - self.bytes_copied
 
 
 class StdoutSink:
@@ -229,7 +462,9 @@ class InplaceFileSink(WriteSink):
         Opens the file in binary write mode, truncates its contents, and streams
         `ctx.iter_updated_lines()` to the target file. This operation preserves the
         inode identity but may leave a truncated file if the process is interrupted
-        mid-write.
+        mid-write. An untouched source tail is read back as raw bytes before
+        truncation and written after the encoded lines; it cannot be copied
+        in-kernel because it is overwritten by the shifted content.
 
         Args:
             ctx: The active processing context, expected to provide repeatable updated
@@ -248,15 +483,38 @@ class InplaceFileSink(WriteSink):
             except OSError:
                 mode = None
 
+            # Both the source tail and content that streams a bounded image's tail
+            # re-read this very file, so read them completely before truncating.
+            lines: list[str] | None = None
+            tail: SourceTail | None = _source_tail(ctx)
+            tail_bytes: bytes | None = _read_source_tail(tail) if tail is not None else None
+            if tail is not None and tail_bytes is not None:
+                lines = list(islice(ctx.iter_updated_lines(), tail.head_line_count))
+            else:
+                updated_view: UpdatedView | None = ctx.views.updated
+                if (
+                    updated_view is not None
+                    and isinstance(updated_view.lines, SegmentUpdatedContent)
+                    and updated_view.lines.reads_from_disk
+                ):
+                    lines = ctx.materialize_updated_lines()
+
             with path.open("wb") as f:
-                _write_encoded_lines(ctx=ctx, file=f)
+                size: int = _write_encoded_lines(ctx=ctx, file=f, lines=lines)
+                if tail_bytes is not None:
+                    f.write(tail_bytes)
+                    size += len(tail_bytes)
                 f.flush()
                 os.fsync(f.fileno())
             if mode is not None:
                 # Best-effort: preserve original permissions.
                 with contextlib.suppress(OSError):
                     path.chmod(mode)
-            return WriteResult(status=WriteStatus.WRITTEN)
+            return WriteResult(
+                status=WriteStatus.WRITTEN,
+                bytes_written=size,
+                bytes_copied=len(tail_bytes) if tail_bytes is not None else 0,
+            )
         except (OSError, UnicodeError) as e:
             ctx.diagnostics.add_error(f"In-place write failed: {e}")
             return WriteResult(status=WriteStatus.FAILED)
@@ -271,7 +529,8 @@ class AtomicFileSink(WriteSink):
     Permission preservation and directory durability are best-effort and platform-aware:
     POSIX uses `os.fchmod()` and directory `fsync()` when available, while Windows falls back to
     path-based `chmod()` and skips directory `fsync()` because `os.fchmod` and `os.O_DIRECTORY` are
-    not exposed there.
+    not exposed there. With the default batched durability the directory `fsync()` is deferred to
+    the end of the run, so a directory receiving many files is synced once.
 
     Pros:
         - Atomic visibility; crash-safe (old file remains until replace).
@@ -291,6 +550,8 @@ class AtomicFileSink(WriteSink):
         calls `os.fsync()` to ensure durability, and performs `os.replace()` to
         atomically swap it in place. The operation guarantees that readers will
         either see the old file or the complete new file, never a partial write.
+        An untouched source tail is copied from the original file into the
+        temporary file without decoding it.
 
         Args:
             ctx: The active processing context, expected to provide repeatable updated
@@ -331,28 +592,17 @@ class AtomicFileSink(WriteSink):
                         # directly as a best-effort fallback.
                         with contextlib.suppress(OSError):
                             tmp.chmod(mode)
-                _write_encoded_lines(ctx=ctx, file=f)
+                size, copied = _write_updated_content(ctx=ctx, file=f)
                 f.flush()
                 os.fsync(f.fileno())
 
             tmp.replace(path)
 
-            # Try to fsync the directory for durability (POSIX only).
-            o_directory: int | None = getattr(os, "O_DIRECTORY", None)
-            if o_directory is not None:
-                try:
-                    dir_fd: int = os.open(str(dirpath), o_directory)
-                    try:
-                        os.fsync(dir_fd)
-                    finally:
-                        os.close(dir_fd)
-                except OSError:
-                    # Best-effort durability; ignore on platforms/filesystems that don't support it.
-                    logger.debug("AtomicFileSink: directory fsync not supported", exc_info=True)
-            else:
-                logger.debug("AtomicFileSink: directory fsync not available on this platform")
+            # Batched durability leaves the directory fsync to the engine's commit phase.
+            if ctx.run_options.write_durability == WriteDurability.PER_FILE:
+                sync_directory(dirpath)
 
-            return WriteResult(status=WriteStatus.WRITTEN)
+            return WriteResult(status=WriteStatus.WRITTEN, bytes_written=size, bytes_copied=copied)
         except (OSError, UnicodeError) as e:
             # Best-effort cleanup of the temp file
             try:
@@ -522,6 +772,10 @@ class WriterStep(BaseStep):
 
         # Update write status:
         ctx.status.write = result.status
+        ctx.write_stats = WriteStats(
+            bytes_written=result.bytes_written,
+            bytes_copied=result.bytes_copied,
+        )
 
     def hint(
         self,
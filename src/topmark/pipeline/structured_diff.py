@@ -8,19 +8,26 @@
 #
 # topmark:header:end
 
-"""Structured unified-diff rendering for contiguous TopMark edits.
+"""Structured unified-diff rendering for planned TopMark edits.
 
 This module renders a unified diff from explicit planned-edit metadata instead
-of rediscovering the edit through a generic sequence comparison. The initial
-implementation intentionally supports one contiguous splice only. Callers should
-fall back to generic diff generation when no structured edit is available or
-when multiple edits are present.
+of rediscovering the edits through a generic sequence comparison. Edits are
+trusted as planned: the renderer reads only the edited lines and their context
+windows, so the cost is proportional to the edits rather than to the file.
+
+Edits closer than ``2 * context`` lines are merged into one hunk, matching the
+grouping of `difflib.unified_diff`. Callers should fall back to generic diff
+generation when no structured edit is available or the edits are not
+well-formed.
 """
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
+from topmark.pipeline.views import planned_edits_are_well_formed
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -45,10 +52,33 @@ def _format_range_unified(*, start: int, length: int) -> str:
     return f"{beginning},{length}"
 
 
+def _group_edits(
+    edits: Sequence[PlannedEdit],
+    *,
+    context: int,
+) -> list[list[PlannedEdit]]:
+    """Group ordered edits whose context windows touch or overlap into hunks.
+
+    Args:
+        edits: Well-formed, ordered, non-empty edits.
+        context: Number of surrounding context lines.
+
+    Returns:
+        list[list[PlannedEdit]]: One list of edits per hunk.
+    """
+    hunks: list[list[PlannedEdit]] = []
+    for edit in edits:
+        if hunks and edit.old_start - hunks[-1][-1].old_end <= 2 * context:
+            hunks[-1].append(edit)
+        else:
+            hunks.append([edit])
+    return hunks
+
+
 def render_structured_unified_diff(
     *,
     original_lines: Sequence[str],
-    edit: PlannedEdit,
+    edits: Sequence[PlannedEdit],
     fromfile: str,
     tofile: str,
     fromfiledate: str,
@@ -56,11 +86,11 @@ def render_structured_unified_diff(
     lineterm: str,
     context: int = 3,
 ) -> list[str] | None:
-    """Render a unified diff for a single contiguous splice.
+    """Render a unified diff for ordered, non-overlapping splices.
 
     Args:
         original_lines: Original file image lines with line endings preserved.
-        edit: Planned contiguous edit to render.
+        edits: Planned edits in ascending original-file order.
         fromfile: Label for the original file image.
         tofile: Label for the updated file image.
         fromfiledate: Timestamp label for the original image.
@@ -69,47 +99,63 @@ def render_structured_unified_diff(
         context: Number of surrounding context lines.
 
     Returns:
-        list[str] | None: Unified diff lines, or ``None`` when the edit is not
-        representable as a safe single-splice diff.
+        list[str] | None: Unified diff lines (empty when every edit is a no-op),
+        or ``None`` when the edits are not representable as safe splices.
     """
-    if edit.old_start < 0 or edit.old_end < edit.old_start:
-        return None
-    if edit.old_end > len(original_lines):
-        return None
-    if context < 0:
+    if context < 0 or not planned_edits_are_well_formed(edits, line_count=len(original_lines)):
         return None
 
-    new_lines: tuple[str, ...] = edit.new_lines
-    if edit.old_start == edit.old_end and not new_lines:
+    # Drop no-op edits and coalesce touching ones, as difflib reports them as one change.
+    effective: list[PlannedEdit] = []
+    for edit in edits:
+        if edit.old_start == edit.old_end and not edit.new_lines:
+            continue
+        if effective and effective[-1].old_end == edit.old_start:
+            previous: PlannedEdit = effective[-1]
+            effective[-1] = replace(
+                previous,
+                old_end=edit.old_end,
+                new_lines=previous.new_lines + edit.new_lines,
+            )
+            continue
+        effective.append(edit)
+    if not effective:
         return []
 
-    prefix_start: int = max(0, edit.old_start - context)
-    suffix_end: int = min(len(original_lines), edit.old_end + context)
-
-    old_range_start: int = prefix_start
-    old_range_length: int = suffix_end - prefix_start
-    new_range_start: int = prefix_start
-    new_range_length: int = (
-        (edit.old_start - prefix_start) + len(new_lines) + (suffix_end - edit.old_end)
-    )
-
     diff_lines: list[str] = [
         f"--- {fromfile}\t{fromfiledate}{lineterm}",
         f"+++ {tofile}\t{tofiledate}{lineterm}",
-        (
-            f"@@ -{_format_range_unified(start=old_range_start, length=old_range_length)} "
-            f"+{_format_range_unified(start=new_range_start, length=new_range_length)} @@"
-            f"{lineterm}"
-        ),
     ]
 
-    for line in original_lines[prefix_start : edit.old_start]:
-        diff_lines.append(f" {line}")
-    for line in original_lines[edit.old_start : edit.old_end]:
-        diff_lines.append(f"-{line}")
-    for line in new_lines:
-        diff_lines.append(f"+{line}")
-    for line in original_lines[edit.old_end : suffix_end]:
-        diff_lines.append(f" {line}")
+    # Line-count delta of all edits preceding the current hunk.
+    delta: int = 0
+    for hunk in _group_edits(effective, context=context):
+        prefix_start: int = max(0, hunk[0].old_start - context)
+        suffix_end: int = min(len(original_lines), hunk[-1].old_end + context)
+        hunk_delta: int = sum(
+            len(edit.new_lines) - (edit.old_end - edit.old_start) for edit in hunk
+        )
+
+        old_range_length: int = suffix_end - prefix_start
+        new_range_length: int = old_range_length + hunk_delta
+        diff_lines.append(
+            f"@@ -{_format_range_unified(start=prefix_start, length=old_range_length)} "
+            f"+{_format_range_unified(start=prefix_start + delta, length=new_range_length)} @@"
+            f"{lineterm}"
+        )
+
+        cursor: int = prefix_start
+        for edit in hunk:
+            for line in original_lines[cursor : edit.old_start]:
+                diff_lines.append(f" {line}")
+            for line in original_lines[edit.old_start : edit.old_end]:
+                diff_lines.append(f"-{line}")
+            for line in edit.new_lines:
+                diff_lines.append(f"+{line}")
+            cursor = edit.old_end
+        for line in original_lines[cursor:suffix_end]:
+            diff_lines.append(f" {line}")
+
+        delta += hunk_delta
 
     return diff_lines
@@ -22,10 +22,18 @@ dataclasses per phase.
 
 from __future__ import annotations
 
+import hashlib
+import io
+import os
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
+from itertools import chain
+from itertools import islice
 from typing import TYPE_CHECKING
+from typing import Final
 from typing import Protocol
+from typing import overload
 from typing import runtime_checkable
 
 from topmark.core.logging import get_logger
@@ -34,13 +42,18 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
     from collections.abc import Mapping
-    from collections.abc import Sequence
+    from pathlib import Path
 
     from topmark.core.logging import TopmarkLogger
 
 
 logger: TopmarkLogger = get_logger(__name__)
 
+SOURCE_TAIL_MIN_BYTES: Final[int] = 64 * 1024
+"""Unchanged file tails at least this large are copied by file sinks instead of re-encoded."""
+
+_UTF8_BOM: Final[bytes] = b"\xef\xbb\xbf"
+
 
 class ViewSlot(str, Enum):
     """Named view slots that pipeline steps may consume.
@@ -151,6 +164,185 @@ class ListFileImageView:
         self._lines = None
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DiskTailLines(Sequence[str]):
+    """Lazily decoded trailing lines of a file, re-read from disk on each iteration.
+
+    A bounded read keeps only the leading lines of a large file in memory; the
+    remainder is exposed through this sequence. Every iteration reopens the file,
+    verifies that its size and modification time still match the values observed
+    when it was read, seeks to ``offset``, and decodes lines with the reader's
+    semantics (UTF-8, ``errors="replace"``, ``newline=""``).
+
+    Attributes:
+        path: File holding the tail.
+        offset: Byte offset of the first tail line; always just after a line terminator.
+        length: Number of logical lines in the tail.
+        size: File size in bytes when the head was read.
+        mtime_ns: File modification time in nanoseconds when the head was read.
+    """
+
+    path: Path
+    offset: int
+    length: int
+    size: int
+    mtime_ns: int
+
+    def __len__(self) -> int:
+        """Return the number of tail lines without touching the file."""
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        """Return one tail line, or a materialized list for a slice.
+
+        Args:
+            index: Line index (negative values count from the end) or slice.
+
+        Returns:
+            The requested line or lines.
+
+        Raises:
+            IndexError: If an integer index is out of range.
+        """
+        if isinstance(index, slice):
+            return list(self)[index]
+        position: int = index + self.length if index < 0 else index
+        if not 0 <= position < self.length:
+            raise IndexError("tail line index out of range")
+        return next(islice(self, position, None))
+
+    def __iter__(self) -> Iterator[str]:
+        """Decode the tail lines from disk.
+
+        Yields:
+            str: Tail lines with their original terminators.
+
+        Raises:
+            OSError: If the file cannot be read or changed since the head was read.
+        """
+        with self.path.open("rb") as raw:
+            st: os.stat_result = os.fstat(raw.fileno())
+            if st.st_size != self.size or st.st_mtime_ns != self.mtime_ns:
+                raise OSError(f"{self.path} changed on disk since it was read")
+            raw.seek(self.offset)
+            with io.TextIOWrapper(raw, encoding="utf-8", errors="replace", newline="") as text:
+                yield from text
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class HeadTailLines(Sequence[str]):
+    """Read-only concatenation of in-memory head lines and a lazy tail.
+
+    Indexing and slicing inside ``head`` never touch the tail, so consumers that
+    only look at the header region (such as the structured diff renderer) work on
+    a bounded image without reading the rest of the file.
+
+    Attributes:
+        head: Leading lines held in memory.
+        tail: Remaining lines, typically a [`DiskTailLines`][topmark.pipeline.views.DiskTailLines].
+    """
+
+    head: Sequence[str]
+    tail: Sequence[str]
+
+    def __len__(self) -> int:
+        """Return the combined line count."""
+        return len(self.head) + len(self.tail)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | Sequence[str]:
+        """Return one line, or a slice (served from ``head`` when it fits).
+
+        Args:
+            index: Line index (negative values count from the end) or slice.
+
+        Returns:
+            The requested line or lines.
+        """
+        head_len: int = len(self.head)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and stop <= head_len:
+                return self.head[start:stop]
+            return list(self)[index]
+        position: int = index + len(self) if index < 0 else index
+        if 0 <= position < head_len:
+            return self.head[position]
+        return self.tail[position - head_len]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate head lines, then tail lines.
+
+        Returns:
+            Iterator[str]: All lines in order.
+        """
+        return chain(self.head, self.tail)
+
+
+@dataclass(kw_only=True, slots=True, eq=False)
+class BoundedFileImageView:
+    """``FileImageView`` over a large file whose header region alone is in memory.
+
+    The reader builds this view when a file is large enough for a bounded read:
+    ``head`` holds the leading lines (which contain any TopMark header and the
+    insertion anchor) and ``tail`` lazily re-reads the rest from disk. Steps that
+    only edit the header region use `split()` to work on the head and splice the
+    tail back unchanged.
+
+    Args:
+        head: Leading lines of the file, each with its original terminator.
+        tail: Lazy sequence of the remaining lines.
+    """
+
+    _head: list[str] | None
+    tail: DiskTailLines
+
+    def __init__(self, head: list[str], tail: DiskTailLines) -> None:
+        self._head: list[str] | None = head
+        self.tail: DiskTailLines = tail
+
+    def line_count(self) -> int:
+        """Return the number of lines in the whole file.
+
+        Returns:
+            int: Head plus tail line count.
+        """
+        return 0 if self._head is None else len(self._head) + len(self.tail)
+
+    def iter_lines(self) -> Iterable[str]:
+        """Iterate head lines, then read tail lines from disk.
+
+        Returns:
+            Iterable[str]: An iterator over all file lines.
+        """
+        if self._head is None:
+            return iter(())
+        return chain(self._head, self.tail)
+
+    def split(self) -> tuple[list[str], DiskTailLines]:
+        """Return the in-memory head and the lazy tail.
+
+        Returns:
+            tuple[list[str], DiskTailLines]: Head lines (not copied) and tail.
+        """
+        return self._head or [], self.tail
+
+    def release(self) -> None:
+        """Release the materialized head lines."""
+        self._head = None
+
+
 @dataclass(kw_only=True, slots=True)
 class HeaderView(Releasable):
     """Structured view of the *existing* header detected by the scanner.
@@ -277,6 +469,11 @@ class SegmentUpdatedContent:
         for segment in self.segments:
             yield from segment
 
+    @property
+    def reads_from_disk(self) -> bool:
+        """Whether iterating the content re-reads a file (a bounded image's tail)."""
+        return any(isinstance(segment, DiskTailLines) for segment in self.segments)
+
 
 def compose_updated_content(*segments: Sequence[str]) -> SegmentUpdatedContent:
     """Create a repeatable segment-backed updated-content view.
@@ -293,6 +490,29 @@ def compose_updated_content(*segments: Sequence[str]) -> SegmentUpdatedContent:
     return SegmentUpdatedContent(segments=tuple(segments))
 
 
+def with_image_tail(
+    content: UpdatedContent | Sequence[str],
+    tail: Sequence[str],
+) -> UpdatedContent | Sequence[str]:
+    """Append the untouched tail of a bounded image to updated head content.
+
+    Args:
+        content: Updated lines computed from the editable head of the image.
+        tail: Lines after the head (empty for a fully read image).
+
+    Returns:
+        UpdatedContent | Sequence[str]: ``content`` itself when ``tail`` is empty,
+        otherwise segment-backed content that streams ``tail`` after ``content``.
+    """
+    if not tail:
+        return content
+    if isinstance(content, SegmentUpdatedContent):
+        return compose_updated_content(*content.segments, tail)
+    if isinstance(content, UpdatedContent):
+        return compose_updated_content(list(content.iter_lines()), tail)
+    return compose_updated_content(content, tail)
+
+
 class PlanEditKind(str, Enum):
     """Kind of contiguous edit planned for an updated file image."""
 
@@ -324,13 +544,13 @@ class PlannedEdit:
 class EditView(Releasable):
     """Structured view of planned contiguous edits.
 
-    The first implementation uses this as metadata for shadow diff validation.
-    It deliberately allows multiple edits so the model can grow to multi-hunk
-    rendering later, while the initial structured renderer only consumes a
-    single edit and falls back to generic diffing otherwise.
+    The comparer uses the edits as proof of change and the patcher renders them
+    directly as (possibly multi-hunk) unified diffs, see
+    [`planned_edits_are_well_formed()`][topmark.pipeline.views.planned_edits_are_well_formed]
+    for the invariants both rely on.
 
     Attributes:
-        edits: Planned edits in ascending original-file order.
+        edits: Planned edits in ascending, non-overlapping original-file order.
     """
 
     edits: tuple[PlannedEdit, ...]
@@ -340,6 +560,29 @@ class EditView(Releasable):
         self.edits = ()
 
 
+def planned_edits_are_well_formed(
+    edits: Sequence[PlannedEdit],
+    *,
+    line_count: int,
+) -> bool:
+    """Return whether edits are ordered, non-overlapping, and within the original image.
+
+    Args:
+        edits: Planned edits to check.
+        line_count: Number of lines in the original image the edits refer to.
+
+    Returns:
+        bool: True when every edit satisfies ``0 <= old_start <= old_end <=
+        line_count`` and each edit starts at or after the end of the previous one.
+    """
+    previous_end: int = 0
+    for edit in edits:
+        if edit.old_start < previous_end or edit.old_end < edit.old_start:
+            return False
+        previous_end = edit.old_end
+    return previous_end <= line_count
+
+
 def infer_single_planned_edit(
     *,
     kind: PlanEditKind,
@@ -383,6 +626,102 @@ def infer_single_planned_edit(
     )
 
 
+def source_prefix_digest(data: bytes) -> bytes:
+    """Return the digest used to verify the source bytes before a `SourceTail`.
+
+    Args:
+        data: Source bytes preceding the tail.
+
+    Returns:
+        bytes: A 16-byte BLAKE2b digest.
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SourceTail:
+    """Unchanged trailing bytes of the source file that end an updated image.
+
+    A planned edit that leaves a large suffix of the file untouched lets file sinks
+    encode only the first ``head_line_count`` updated lines and copy bytes
+    ``offset`` to ``size`` of the source file verbatim. The sink first checks that
+    the file still has the recorded size and modification time and that its bytes
+    before ``offset`` hash to ``prefix_digest``; otherwise it writes the updated
+    lines as usual.
+
+    Attributes:
+        path: Source file holding the tail.
+        head_line_count: Number of leading updated lines written before the tail.
+        offset: Byte offset of the tail in the source file.
+        size: Source file size in bytes when it was read.
+        mtime_ns: Source file modification time in nanoseconds when it was read.
+        prefix_digest: [`source_prefix_digest()`][topmark.pipeline.views.source_prefix_digest]
+            of the source bytes before ``offset``, as implied by the decoded image.
+    """
+
+    path: Path
+    head_line_count: int
+    offset: int
+    size: int
+    mtime_ns: int
+    prefix_digest: bytes
+
+    @property
+    def length(self) -> int:
+        """Number of tail bytes."""
+        return self.size - self.offset
+
+
+def source_tail_for_edit(
+    *,
+    edit: PlannedEdit | None,
+    original_lines: Sequence[str],
+    path: Path,
+    stat: os.stat_result | None,
+    leading_bom: bool,
+) -> SourceTail | None:
+    """Describe the untouched source tail that follows a single planned edit.
+
+    The updated image equals ``original_lines[:edit.old_start] + edit.new_lines +
+    original_lines[edit.old_end:]`` followed by any bounded-image tail, so every
+    source byte from line ``edit.old_end`` onwards is unchanged.
+
+    Args:
+        edit: The planned edit, or ``None`` when the images are identical.
+        original_lines: Editable image lines the edit indices refer to (BOM-stripped).
+        path: Source file path.
+        stat: Source file status captured when the file was read, if known.
+        leading_bom: Whether the source file starts with a UTF-8 BOM.
+
+    Returns:
+        SourceTail | None: The tail descriptor, or ``None`` when there is no edit,
+        the file status is unknown, the tail would include the BOM, the tail is
+        shorter than [`SOURCE_TAIL_MIN_BYTES`][topmark.pipeline.views.SOURCE_TAIL_MIN_BYTES],
+        or its decoded lines contain U+FFFD replacement characters.
+    """
+    if edit is None or stat is None or stat.st_size < SOURCE_TAIL_MIN_BYTES:
+        return None
+    if leading_bom and edit.old_end == 0:
+        return None
+    prefix: bytes = (_UTF8_BOM if leading_bom else b"") + "".join(
+        islice(original_lines, edit.old_end)
+    ).encode("utf-8")
+    if stat.st_size - len(prefix) < SOURCE_TAIL_MIN_BYTES:
+        return None
+    # A replacement character may stand for undecodable bytes that a verbatim copy
+    # would carry over; re-encode such tails as a short file would.
+    if any("\ufffd" in line for line in islice(original_lines, edit.old_end, None)):
+        return None
+    return SourceTail(
+        path=path,
+        head_line_count=edit.old_start + len(edit.new_lines),
+        offset=len(prefix),
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        prefix_digest=source_prefix_digest(prefix),
+    )
+
+
 @dataclass(kw_only=True, slots=True)
 class UpdatedView(Releasable):
     """View of the pipeline's updated file image.
@@ -394,6 +733,8 @@ class UpdatedView(Releasable):
     Attributes:
         lines: Updated file image as a sequence or iterable of lines, or ``None`` when no update
             was produced.
+        source_tail: Untouched source bytes that end the updated image, when a file
+            sink may copy them instead of encoding the corresponding lines.
 
     Notes:
         Pruning is handled by calling `release()`, which clears the updated file
@@ -402,10 +743,12 @@ class UpdatedView(Releasable):
     """
 
     lines: UpdatedContent | Sequence[str] | None
+    source_tail: SourceTail | None = None
 
     def release(self) -> None:
         """Release the updated file image payload to reduce memory usage."""
         self.lines = None
+        self.source_tail = None
 
 
 @dataclass(kw_only=True, slots=True)
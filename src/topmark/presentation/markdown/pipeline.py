@@ -32,8 +32,8 @@ from topmark.cli.keys import CliCmd
 from topmark.cli.keys import CliOpt
 from topmark.core.logging import get_logger
 from topmark.pipeline.outcomes import ResultActionIntent
-from topmark.pipeline.outcomes import collect_outcome_reason_counts
 from topmark.pipeline.outcomes import determine_result_action_intent
+from topmark.pipeline.reduction import ProcessingSummary
 from topmark.pipeline.reporting import ReportScope
 from topmark.pipeline.status import HeaderStatus
 from topmark.pipeline.status import WriteStatus
@@ -44,6 +44,9 @@ from topmark.presentation.markdown.utils import markdown_code_span
 from topmark.presentation.markdown.utils import render_fenced_code_block_markdown
 from topmark.presentation.markdown.utils import render_markdown_table
 from topmark.presentation.shared.paths import get_display_path
+from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
+from topmark.presentation.shared.pipeline import PipelineCommandHumanReport
+from topmark.presentation.shared.pipeline import get_report_outcome_counts
 from topmark.presentation.shared.pipeline import summarize_pipeline_file
 
 if TYPE_CHECKING:
@@ -54,9 +57,11 @@ if TYPE_CHECKING:
     from topmark.pipeline.hints import Hint
     from topmark.pipeline.kinds import PipelineKindLiteral
     from topmark.pipeline.outcomes import OutcomeReasonCount
+    from topmark.pipeline.profiling import StepProfile
     from topmark.pipeline.result import ProcessingResult
-    from topmark.presentation.shared.pipeline import PipelineCommandHumanReport
+    from topmark.pipeline.result_cache import ResultCacheStats
     from topmark.presentation.shared.pipeline import PipelineFileSummary
+    from topmark.presentation.shared.pipeline import PipelineHumanPresentationOptions
 
 
 logger: TopmarkLogger = get_logger(__name__)
@@ -248,6 +253,46 @@ def _render_strip_guidance_message_markdown(
     return f"🛠️  Run {cmd_md} to {action}."
 
 
+def _guidance_message_builder_markdown(
+    pipeline_kind: PipelineKindLiteral,
+) -> Callable[[ProcessingResult], str | None]:
+    """Return the per-file guidance message builder for a pipeline kind.
+
+    Args:
+        pipeline_kind: Pipeline command kind (`check` or `strip`).
+
+    Returns:
+        Per-file guidance message builder.
+
+    Raises:
+        RuntimeError: If an invalid pipeline kind was selected.
+    """
+    if pipeline_kind == "check":
+        return _render_check_guidance_message_markdown
+    if pipeline_kind == "strip":
+        return _render_strip_guidance_message_markdown
+    # Defensive guard.
+    raise RuntimeError(f"Invalid pipeline kind selected: {pipeline_kind}")
+
+
+def _render_unsupported_notice_markdown(
+    *,
+    unsupported_count: int,
+) -> str:
+    """Render the notice for unsupported files hidden from the per-file listing.
+
+    Args:
+        unsupported_count: Number of unsupported files.
+
+    Returns:
+        Markdown blockquote notice followed by a newline.
+    """
+    return (
+        f"> ⚠️ Unsupported: {unsupported_count} file(s) "
+        f"(use {CliOpt.REPORT}={ReportScope.NONCOMPLIANT.value} to list)\n"
+    )
+
+
 # ---- Per-file rendering ----
 
 
@@ -277,15 +322,16 @@ def _render_file_summary_line_markdown(
     return f"`{get_display_path(result)}` - `{summary.key}`: {summary.label}{suffix}"
 
 
-def _render_per_file_guidance_markdown(
+def _render_file_section_markdown(
+    result: ProcessingResult,
     *,
-    results: Sequence[ProcessingResult],
+    idx: int,
     make_message: Callable[[ProcessingResult], str | None],
     show_diffs: bool,
 ) -> str:
-    """Render per-file Markdown sections.
+    """Render the Markdown list item of a single file.
 
-    For each file, this includes:
+    The item includes:
         1. A summary line.
         2. An optional guidance message.
         3. Diagnostics when present.
@@ -295,74 +341,103 @@ def _render_per_file_guidance_markdown(
     Unlike TEXT output, Markdown always renders available diagnostics and hints.
 
     Args:
-        results: Durable processing results to render.
+        result: Durable processing result to render.
+        idx: One-based list item number.
         make_message: Per-file guidance message builder.
-        show_diffs: Whether to include unified diffs.
+        show_diffs: Whether to include the unified diff.
 
     Returns:
-        Markdown fragment containing all rendered file sections.
+        Markdown list item ending with a blank separator line.
     """
     blocks: list[str] = []
 
-    if not results:
-        return ""
-
-    blocks.append("## Files")
-    blocks.append("")
+    # 1. summary line.
+    blocks.append(
+        f"{idx}. "
+        + _render_file_summary_line_markdown(
+            result=result,
+        )
+    )
 
-    for idx, result in enumerate(results, start=1):
-        # 1. summary line.
-        blocks.append(
-            f"{idx}. "
-            + _render_file_summary_line_markdown(
-                result=result,
+    # 2. guidance message for actionable check/strip outcomes.
+    msg: str | None = make_message(result)
+    if msg:
+        blocks.append(f"  - {msg}")
+
+    # 3. diagnostics block; Markdown shows diagnostics whenever present.
+    if result.diagnostics:
+        diag_md: str = render_diagnostics_markdown(
+            diagnostics=result.diagnostics,
+        ).rstrip()
+        # Triage summary is nonempty if there are diagnostics:
+        for line in diag_md.splitlines():
+            blocks.append(f"  {line}" if line else "")
+
+    # 4. hints; Markdown shows all hints whenever present.
+    hints: list[Hint] = list(result.hints)
+    hints_count: int = len(hints)
+    if hints_count > 0:
+        blocks.append(f"  - Hints: {hints_count}")
+
+        for i, h in enumerate(hints, start=1):
+            blocks.append(
+                _render_hint_markdown(
+                    hint=h,
+                    last=i == hints_count,
+                )
             )
+
+    # 5. optional diff block
+    if show_diffs:
+        patch: str | None = _render_diff_markdown(
+            result.detail.diff_text,
         )
 
-        # 2. guidance message for actionable check/strip outcomes.
-        msg: str | None = make_message(result)
-        if msg:
-            blocks.append(f"  - {msg}")
-
-        # 3. diagnostics block; Markdown shows diagnostics whenever present.
-        if result.diagnostics:
-            diag_md: str = render_diagnostics_markdown(
-                diagnostics=result.diagnostics,
-            ).rstrip()
-            # Triage summary is nonempty if there are diagnostics:
-            for line in diag_md.splitlines():
-                blocks.append(f"  {line}" if line else "")
-
-        # 4. hints; Markdown shows all hints whenever present.
-        hints: list[Hint] = list(result.hints)
-        hints_count: int = len(hints)
-        if hints_count > 0:
-            blocks.append(f"  - Hints: {hints_count}")
-
-            for i, h in enumerate(hints, start=1):
-                blocks.append(
-                    _render_hint_markdown(
-                        hint=h,
-                        last=i == hints_count,
-                    )
+        if patch:
+            blocks.append("")
+            blocks.append(
+                render_fenced_code_block_markdown(
+                    text=patch.rstrip("\n"),
+                    language="diff",
                 )
-
-        # 5. optional diff block
-        if show_diffs:
-            patch: str | None = _render_diff_markdown(
-                result.detail.diff_text,
             )
 
-            if patch:
-                blocks.append("")
-                blocks.append(
-                    render_fenced_code_block_markdown(
-                        text=patch.rstrip("\n"),
-                        language="diff",
-                    )
-                )
+    blocks.append("")
+
+    return "\n".join(blocks)
 
-        blocks.append("")
+
+def _render_per_file_guidance_markdown(
+    *,
+    results: Sequence[ProcessingResult],
+    make_message: Callable[[ProcessingResult], str | None],
+    show_diffs: bool,
+) -> str:
+    """Render per-file Markdown sections.
+
+    See `_render_file_section_markdown()` for the content of each section.
+
+    Args:
+        results: Durable processing results to render.
+        make_message: Per-file guidance message builder.
+        show_diffs: Whether to include unified diffs.
+
+    Returns:
+        Markdown fragment containing all rendered file sections.
+    """
+    if not results:
+        return ""
+
+    blocks: list[str] = ["## Files", ""]
+    for idx, result in enumerate(results, start=1):
+        blocks.append(
+            _render_file_section_markdown(
+                result,
+                idx=idx,
+                make_message=make_message,
+                show_diffs=show_diffs,
+            )
+        )
 
     return "\n".join(blocks).rstrip() + "\n"
 
@@ -399,6 +474,40 @@ def _render_diff_markdown(
     return None
 
 
+def _render_diff_section_markdown(
+    result: ProcessingResult,
+    *,
+    show_line_numbers: bool = False,
+) -> str | None:
+    """Render the Markdown diff subsection of a single file.
+
+    Args:
+        result: Durable processing result to inspect for a retained diff.
+        show_line_numbers: Whether to prepend line numbers.
+
+    Returns:
+        Path heading followed by a fenced diff block, or `None` when no diff
+        is available.
+    """
+    patch: str | None = _render_diff_markdown(
+        result.detail.diff_text,
+        show_line_numbers=show_line_numbers,
+    )
+    if not patch:
+        return None
+
+    return "\n".join(
+        [
+            f"### {render_path_display_markdown(result)}",
+            "",
+            render_fenced_code_block_markdown(
+                text=patch.rstrip("\n"),
+                language="diff",
+            ),
+        ]
+    )
+
+
 def _render_pipeline_diffs_markdown(
     *,
     results: Sequence[ProcessingResult],
@@ -415,20 +524,13 @@ def _render_pipeline_diffs_markdown(
     """
     diff_blocks: list[str] = []
     for result in results:
-        patch: str | None = _render_diff_markdown(
-            result.detail.diff_text,
+        section: str | None = _render_diff_section_markdown(
+            result,
             show_line_numbers=show_line_numbers,
         )
 
-        if patch:
-            diff_blocks.append(f"### {render_path_display_markdown(result)}")
-            diff_blocks.append("")
-            diff_blocks.append(
-                render_fenced_code_block_markdown(
-                    text=patch.rstrip("\n"),
-                    language="diff",
-                )
-            )
+        if section:
+            diff_blocks.append(section)
             diff_blocks.append("")
 
     if not diff_blocks:
@@ -470,23 +572,21 @@ def render_pipeline_diffs_markdown(
 
 def _render_summary_counts_markdown(
     *,
-    view_results: Sequence[ProcessingResult],
+    outcome_counts: Sequence[OutcomeReasonCount],
     total: int,
 ) -> str:
     """Render summary counts grouped by `(outcome, reason)` as a Markdown table.
 
     Args:
-        view_results: Durable processing results included in the rendered view.
+        outcome_counts: Sorted `(outcome, reason)` rows for the rendered view.
         total: Total number of candidate files before view filtering.
 
     Returns:
         Markdown summary table with grouped outcome counts.
     """
-    counts: list[OutcomeReasonCount] = collect_outcome_reason_counts(view_results)
-
     headers: list[str] = ["Outcome", "Reason", "Count"]
     rows: list[list[str]] = []
-    for row in counts:
+    for row in outcome_counts:
         rows.append([row.outcome.value, row.reason, str(row.count)])
 
     table: str = render_markdown_table(headers, rows, align={2: "right"}).rstrip()
@@ -515,18 +615,10 @@ def render_pipeline_output_markdown(
 
     Returns:
         Rendered Markdown output.
-
-    Raises:
-        RuntimeError: If an invalid pipeline kind was selected.
     """
-    make_message: Callable[[ProcessingResult], str | None] | None = None
-    if report.pipeline_kind == "check":
-        make_message = _render_check_guidance_message_markdown
-    elif report.pipeline_kind == "strip":
-        make_message = _render_strip_guidance_message_markdown
-    else:
-        # Defensive guard.
-        raise RuntimeError(f"Invalid pipeline kind selected: {report.pipeline_kind}")
+    make_message: Callable[[ProcessingResult], str | None] = _guidance_message_builder_markdown(
+        report.pipeline_kind
+    )
 
     parts: list[str] = []
 
@@ -549,7 +641,7 @@ def render_pipeline_output_markdown(
             )
         parts.append(
             _render_summary_counts_markdown(
-                view_results=report.view_results,
+                outcome_counts=get_report_outcome_counts(report),
                 total=report.file_list_total,
             )
         )
@@ -571,13 +663,147 @@ def render_pipeline_output_markdown(
         and (report.unsupported_count > 0)
     ):
         parts.append(
-            f"\n> ⚠️ Unsupported: {report.unsupported_count} file(s) "
-            f"(use {CliOpt.REPORT}={ReportScope.NONCOMPLIANT.value} to list)\n"
+            "\n" + _render_unsupported_notice_markdown(unsupported_count=report.unsupported_count)
         )
 
     return "\n".join(parts)
 
 
+class PipelineCommandMarkdownOutputStream:
+    """Incremental Markdown output for a pipeline command, split by target stream.
+
+    Feeding every durable result through `add()` between `begin()` and `end()`
+    yields fragments whose concatenation equals the `stdout` and `stderr`
+    strings produced by
+    [`render_pipeline_command_human_output`][topmark.presentation.output.pipeline.render_pipeline_command_human_output]
+    for the same results. The most recent file section and diff section are
+    held back by one result so the document can be closed without trailing
+    blank lines.
+
+    In summary mode the grouped counts depend on every result, so only the diff
+    payload is incremental and the report is rendered by `end()`.
+    """
+
+    def __init__(self, options: PipelineHumanPresentationOptions) -> None:
+        """Initialize the stream.
+
+        Args:
+            options: Human presentation configuration for the command.
+        """
+        self._options: PipelineHumanPresentationOptions = options
+        self._make_message: Callable[[ProcessingResult], str | None] = (
+            _guidance_message_builder_markdown(options.pipeline_kind)
+        )
+        self._summary: ProcessingSummary = ProcessingSummary()
+        self._file_sections: int = 0
+        self._pending_file_section: str | None = None
+        self._pending_diff_section: str | None = None
+
+    def begin(self, *, file_count: int) -> PipelineCommandHumanOutput:
+        """Start the output of a run.
+
+        Args:
+            file_count: Number of files selected for the run.
+
+        Returns:
+            Leading output fragments (the document banner).
+        """
+        options: PipelineHumanPresentationOptions = self._options
+        if options.summary_mode:
+            return PipelineCommandHumanOutput(stdout="", stderr="")
+        banner: str = _render_pipeline_banner_markdown(
+            pipeline_kind=options.pipeline_kind,
+            n_files=file_count,
+        )
+        return PipelineCommandHumanOutput(stdout="", stderr=f"{banner}\n\n")
+
+    def add(self, result: ProcessingResult, *, listed: bool) -> PipelineCommandHumanOutput:
+        """Render the output fragments of one durable result.
+
+        Args:
+            result: Durable processing result in stream order.
+            listed: Whether the report scope lists this result in the
+                per-file report.
+
+        Returns:
+            Diff payload and per-file report fragments that are now final.
+        """
+        options: PipelineHumanPresentationOptions = self._options
+
+        stdout: str = ""
+        if options.show_diffs:
+            section: str | None = _render_diff_section_markdown(result)
+            if section:
+                if self._pending_diff_section is None:
+                    stdout = "## Diffs\n\n"
+                else:
+                    stdout = f"{self._pending_diff_section}\n\n"
+                self._pending_diff_section = section
+
+        stderr: str = ""
+        if options.summary_mode:
+            self._summary.add(result)
+        elif listed:
+            if self._pending_file_section is None:
+                stderr = "## Files\n\n"
+            else:
+                stderr = f"{self._pending_file_section}\n"
+            self._file_sections += 1
+            self._pending_file_section = _render_file_section_markdown(
+                result,
+                idx=self._file_sections,
+                make_message=self._make_message,
+                show_diffs=False,
+            )
+
+        return PipelineCommandHumanOutput(stdout=stdout, stderr=stderr)
+
+    def end(self, *, unsupported_count: int) -> PipelineCommandHumanOutput:
+        """Finish the output of a run.
+
+        Args:
+            unsupported_count: Number of unsupported results across the run.
+
+        Returns:
+            Trailing output fragments (held-back sections, then the summary or
+            the unsupported notice).
+        """
+        options: PipelineHumanPresentationOptions = self._options
+        stdout: str = (
+            self._pending_diff_section.rstrip() if self._pending_diff_section is not None else ""
+        )
+
+        if options.summary_mode:
+            summary: ProcessingSummary = self._summary
+            return PipelineCommandHumanOutput(
+                stdout=stdout,
+                stderr=render_pipeline_output_markdown(
+                    PipelineCommandHumanReport(
+                        pipeline_kind=options.pipeline_kind,
+                        file_list_total=summary.file_count,
+                        view_results=(),
+                        report_scope=options.report_scope,
+                        unsupported_count=unsupported_count,
+                        verbosity_level=options.verbosity_level,
+                        summary_mode=True,
+                        show_diffs=False,
+                        apply_changes=options.apply_changes,
+                        styled=options.styled,
+                        outcome_counts=summary.outcome_reason_rows(),
+                    )
+                ),
+            )
+
+        parts: list[str] = []
+        if self._pending_file_section is not None:
+            parts.append(self._pending_file_section.rstrip() + "\n")
+        if options.report_scope == ReportScope.ACTIONABLE and unsupported_count > 0:
+            parts.append(
+                "\n\n" + _render_unsupported_notice_markdown(unsupported_count=unsupported_count)
+            )
+        return PipelineCommandHumanOutput(stdout=stdout, stderr="".join(parts))
+
+
 def render_pipeline_apply_summary_markdown(
     *,
     command_path: str,
@@ -606,3 +832,98 @@ def render_pipeline_apply_summary_markdown(
         )
 
     return "\n".join(parts)
+
+
+def render_result_cache_summary_markdown(
+    *,
+    command_path: str,
+    stats: ResultCacheStats,
+) -> str:
+    """Render the result-cache statistics footer for Markdown output.
+
+    Args:
+        command_path: Command path, such as `topmark check`.
+        stats: Result-cache counters for the run.
+
+    Returns:
+        Rendered Markdown footer.
+    """
+    cmd_md: str = markdown_code_span(command_path)
+    return (
+        f"\nℹ️ {cmd_md}: result cache: **{stats.hits}** hit(s), "
+        f"**{stats.misses}** miss(es), **{stats.stored}** stored.\n"
+    )
+
+
+def render_pipeline_profile_markdown(
+    *,
+    command_path: str,
+    profiles: Sequence[StepProfile],
+) -> str:
+    """Render the per-step profiling report for Markdown output.
+
+    Args:
+        command_path: Command path, such as `topmark check`.
+        profiles: Aggregated step profiles in step order.
+
+    Returns:
+        Rendered Markdown section with a step table and the slowest files per step.
+    """
+    cmd_md: str = markdown_code_span(command_path)
+    if not profiles:
+        return f"\nℹ️ {cmd_md}: profile: no pipeline steps were executed.\n"
+
+    headers: list[str] = [
+        "Step",
+        "Files",
+        "Total ms",
+        "p50 ms",
+        "p95 ms",
+        "Max ms",
+        "CPU ms",
+        "Read B",
+        "Written B",
+        "Alloc B",
+    ]
+    rows: list[list[str]] = [
+        [
+            profile.step,
+            str(profile.files),
+            f"{profile.wall_total * 1000:.2f}",
+            f"{profile.wall_p50 * 1000:.3f}",
+            f"{profile.wall_p95 * 1000:.3f}",
+            f"{profile.wall_max * 1000:.3f}",
+            f"{profile.cpu_total * 1000:.2f}",
+            str(profile.bytes_read),
+            str(profile.bytes_written),
+            "-" if profile.alloc_bytes is None else str(profile.alloc_bytes),
+        ]
+        for profile in profiles
+    ]
+    parts: list[str] = [
+        "",
+        "## Profile by step",
+        "",
+        render_markdown_table(headers, rows, align=dict.fromkeys(range(1, 10), "right")).rstrip(),
+    ]
+
+    slowest_rows: list[list[str]] = [
+        [profile.step, f"{item.wall_seconds * 1000:.3f}", markdown_code_span(item.path)]
+        for profile in profiles
+        for item in profile.slowest
+    ]
+    if slowest_rows:
+        parts.extend(
+            [
+                "",
+                "### Slowest files by step",
+                "",
+                render_markdown_table(
+                    ["Step", "Wall ms", "Path"],
+                    slowest_rows,
+                    align={1: "right"},
+                ).rstrip(),
+            ]
+        )
+
+    return "\n".join(parts) + "\n"
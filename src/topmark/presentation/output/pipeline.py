@@ -17,9 +17,9 @@ rendered content belongs in the payload stream and which content belongs in the
 human-report stream.
 
 The split is intentionally independent from Click and Rich console objects. CLI
-commands receive a value object and perform the actual writes themselves. This
-keeps command modules small while leaving room for a later streaming
-presentation-event model.
+commands receive value objects, either one complete output or incremental
+fragments rendered as durable results arrive, and perform the actual writes
+themselves. This keeps command modules small.
 """
 
 from __future__ import annotations
@@ -33,6 +33,7 @@ from topmark.pipeline.machine.streaming import MachineRunCompletedEvent
 from topmark.pipeline.machine.streaming import MachineRunStartedEvent
 from topmark.pipeline.reporting import ReportScope
 from topmark.pipeline.reporting import filter_results_for_report
+from topmark.presentation.markdown.pipeline import PipelineCommandMarkdownOutputStream
 from topmark.presentation.markdown.pipeline import render_pipeline_diffs_markdown
 from topmark.presentation.markdown.pipeline import render_pipeline_output_markdown
 from topmark.presentation.markdown.probe import render_probe_output_markdown
@@ -40,6 +41,7 @@ from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
 from topmark.presentation.shared.pipeline import PipelineCommandHumanReport
 from topmark.presentation.shared.pipeline import PipelineHumanPresentationOptions
 from topmark.presentation.shared.pipeline import ProbeCommandHumanReport
+from topmark.presentation.text.pipeline import PipelineCommandTextOutputStream
 from topmark.presentation.text.pipeline import render_pipeline_diffs_text
 from topmark.presentation.text.pipeline import render_pipeline_output_text
 from topmark.presentation.text.probe import render_probe_output_text
@@ -47,27 +49,33 @@ from topmark.presentation.text.probe import render_probe_output_text
 if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Sequence
 
     from topmark.pipeline.kinds import PipelineKindLiteral
     from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
     from topmark.pipeline.reporting import ReportFilterResult
     from topmark.pipeline.result import ProcessingResult
+    from topmark.presentation.shared.pipeline import PipelineCommandHumanOutputStream
 
 
-def _collect_stream_results(
+def _iter_validated_stream_events(
     events: Iterable[MachineProcessingStreamEvent],
     *,
     options: PipelineHumanPresentationOptions,
-) -> tuple[ProcessingResult, ...]:
-    """Collect durable processing results from an internal presentation stream.
+) -> Iterator[MachineProcessingStreamEvent]:
+    """Yield internal presentation stream events after validating their lifecycle.
+
+    Each event is checked before it is yielded, so consumers may render it
+    immediately. Missing lifecycle events are only detectable once `events` is
+    exhausted and are reported after the last event has been yielded.
 
     Args:
         events: Internal stream events carrying durable processing results.
         options: Human presentation options whose pipeline kind must match the stream.
 
-    Returns:
-        Durable processing results in stream order.
+    Yields:
+        The validated stream events, in order.
 
     Raises:
         ValueError: If the stream lifecycle, command identity, or per-file index
@@ -76,7 +84,6 @@ def _collect_stream_results(
     started: bool = False
     completed: bool = False
     expected_index: int = 0
-    results: list[ProcessingResult] = []
 
     # These checks are intentionally defensive. The internal machine stream
     # adapter normally emits a single well-ordered stream for one command, but
@@ -111,7 +118,6 @@ def _collect_stream_results(
                         f"got {event.index}."
                     )
                 expected_index += 1
-                results.append(event.result)
             case MachineRunCompletedEvent(command=options.pipeline_kind):
                 if not started:
                     raise ValueError(
@@ -126,13 +132,33 @@ def _collect_stream_results(
                 raise ValueError(
                     "Human presentation stream contains an event for a different command."
                 )
+        yield event
 
     if not started:
         raise ValueError("Human presentation stream is missing a run-start event.")
     if not completed:
         raise ValueError("Human presentation stream is missing a run-completed event.")
 
-    return tuple(results)
+
+def _collect_stream_results(
+    events: Iterable[MachineProcessingStreamEvent],
+    *,
+    options: PipelineHumanPresentationOptions,
+) -> tuple[ProcessingResult, ...]:
+    """Collect durable processing results from an internal presentation stream.
+
+    Args:
+        events: Internal stream events carrying durable processing results.
+        options: Human presentation options whose pipeline kind must match the stream.
+
+    Returns:
+        Durable processing results in stream order.
+    """
+    return tuple(
+        event.result
+        for event in _iter_validated_stream_events(events, options=options)
+        if isinstance(event, MachineProcessingResultEvent)
+    )
 
 
 def render_probe_command_human_stream_output(
@@ -187,46 +213,6 @@ def render_probe_command_human_stream_output(
     raise RuntimeError(msg)
 
 
-def _report_for_stream_results(
-    *,
-    options: PipelineHumanPresentationOptions,
-    results: Sequence[ProcessingResult],
-    would_change: Callable[[ProcessingResult], bool],
-) -> PipelineCommandHumanReport:
-    """Return a human report whose view is derived from stream results.
-
-    Args:
-        options: Presentation configuration and report-scope policy.
-        results: Durable processing results collected from the presentation stream.
-        would_change: Command-specific actionable predicate for report filtering.
-
-    Returns:
-        Report with stream-derived file totals, view results, and hidden
-        unsupported counts. Summary mode intentionally uses the full result set
-        so grouped counts are not distorted by report-scope filtering.
-    """
-    filtered: ReportFilterResult[ProcessingResult] = filter_results_for_report(
-        results,
-        report_scope=options.report_scope,
-        would_change=would_change,
-    )
-    human_results: Sequence[ProcessingResult] = (
-        results if options.summary_mode else filtered.view_results
-    )
-    return PipelineCommandHumanReport(
-        pipeline_kind=options.pipeline_kind,
-        file_list_total=len(results),
-        view_results=human_results,
-        report_scope=options.report_scope,
-        unsupported_count=filtered.unsupported_count_all,
-        verbosity_level=options.verbosity_level,
-        summary_mode=options.summary_mode,
-        show_diffs=options.show_diffs,
-        apply_changes=options.apply_changes,
-        styled=options.styled,
-    )
-
-
 def _without_embedded_diffs(
     report: PipelineCommandHumanReport,
 ) -> PipelineCommandHumanReport:
@@ -287,6 +273,70 @@ def render_pipeline_command_human_output(
     return PipelineCommandHumanOutput(stdout=stdout, stderr=stderr)
 
 
+def iter_pipeline_command_human_stream_output(
+    *,
+    options: PipelineHumanPresentationOptions,
+    events: Iterable[MachineProcessingStreamEvent],
+    fmt: OutputFormat,
+    would_change: Callable[[ProcessingResult], bool],
+) -> Iterator[PipelineCommandHumanOutput]:
+    """Render human pipeline command output incrementally from a result stream.
+
+    Fragments are yielded as soon as the corresponding durable results arrive,
+    so commands can write per-file report sections and diffs while later files
+    are still being processed. Concatenating the `stdout` and `stderr` parts of
+    every fragment yields the output of
+    [`render_pipeline_command_human_stream_output`][topmark.presentation.output.pipeline.render_pipeline_command_human_stream_output].
+
+    Report-scope filtering is applied per result. The banner file count is the
+    run-start `selected_count`, which equals the streamed result count for
+    well-formed streams. Summary mode streams only the diff payload and renders
+    the grouped counts once the run has completed.
+
+    Args:
+        options: Human presentation configuration.
+        events: Internal durable-result stream in deterministic processing order.
+        fmt: Selected human output format.
+        would_change: Command-specific actionable predicate for report filtering.
+
+    Yields:
+        Non-empty output fragments split into payload and human-report content.
+
+    Raises:
+        RuntimeError: If an unsupported human output format is selected.
+    """
+    stream: PipelineCommandHumanOutputStream
+    if fmt == OutputFormat.TEXT:
+        stream = PipelineCommandTextOutputStream(options)
+    elif fmt == OutputFormat.MARKDOWN:
+        stream = PipelineCommandMarkdownOutputStream(options)
+    else:
+        msg: str = f"Unsupported human output format: {fmt.value}"
+        raise RuntimeError(msg)
+
+    unsupported_count: int = 0
+    for event in _iter_validated_stream_events(events, options=options):
+        fragment: PipelineCommandHumanOutput
+        if isinstance(event, MachineRunStartedEvent):
+            fragment = stream.begin(file_count=event.selected_count)
+        elif isinstance(event, MachineProcessingResultEvent):
+            filtered: ReportFilterResult[ProcessingResult] = filter_results_for_report(
+                (event.result,),
+                report_scope=options.report_scope,
+                would_change=would_change,
+            )
+            unsupported_count += filtered.unsupported_count_all
+            fragment = stream.add(event.result, listed=bool(filtered.view_results))
+        else:
+            continue
+        if fragment.stdout or fragment.stderr:
+            yield fragment
+
+    fragment = stream.end(unsupported_count=unsupported_count)
+    if fragment.stdout or fragment.stderr:
+        yield fragment
+
+
 def render_pipeline_command_human_stream_output(
     *,
     options: PipelineHumanPresentationOptions,
@@ -306,17 +356,15 @@ def render_pipeline_command_human_stream_output(
     Returns:
         Rendered output split into payload and human-report content.
     """
-    results: tuple[ProcessingResult, ...] = _collect_stream_results(
-        events,
-        options=options,
-    )
-    stream_report: PipelineCommandHumanReport = _report_for_stream_results(
-        options=options,
-        results=results,
-        would_change=would_change,
+    fragments: list[PipelineCommandHumanOutput] = list(
+        iter_pipeline_command_human_stream_output(
+            options=options,
+            events=events,
+            fmt=fmt,
+            would_change=would_change,
+        )
     )
-    return render_pipeline_command_human_output(
-        report=stream_report,
-        results=results,
-        fmt=fmt,
+    return PipelineCommandHumanOutput(
+        stdout="".join(fragment.stdout for fragment in fragments),
+        stderr="".join(fragment.stderr for fragment in fragments),
     )
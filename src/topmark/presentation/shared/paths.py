@@ -36,10 +36,9 @@ def get_display_path(
 ) -> str:
     """Return the user-facing path to display for processing output.
 
-    TopMark may process *content-on-STDIN* by writing it to a temporary file.
-    In that mode, `ProcessingContext.path` points at the temporary file on disk,
-    while `ProcessingResult.display_path` captures the logical display path at
-    the reduction boundary. Users expect messages to refer to the logical
+    TopMark may process *content-on-STDIN*, in which case the content path
+    need not exist on disk. `ProcessingResult.display_path` captures the logical
+    display path at the reduction boundary. Users expect messages to refer to the logical
     filename supplied via `--stdin-filename`.
 
     This helper centralizes the shared policy while both pre-reduction context
@@ -29,7 +29,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from typing import Protocol
 
+from topmark.pipeline.outcomes import collect_outcome_reason_counts
 from topmark.pipeline.outcomes import map_bucket
 from topmark.pipeline.status import FsStatus
 
@@ -38,6 +40,7 @@ if TYPE_CHECKING:
 
     from topmark.pipeline.context.model import ProcessingContext
     from topmark.pipeline.kinds import PipelineKindLiteral
+    from topmark.pipeline.outcomes import OutcomeReasonCount
     from topmark.pipeline.outcomes import ResultBucket
     from topmark.pipeline.reporting import ReportScope
     from topmark.pipeline.result import ProcessingResult
@@ -116,6 +119,9 @@ class PipelineCommandHumanReport:
         summary_mode: Whether to render grouped outcome counts instead of per-file sections.
         show_diffs: Whether to render unified diffs as separate payload output.
         apply_changes: Whether the command runs in apply mode.
+        outcome_counts: Pre-aggregated `(outcome, reason)` rows for summary mode, or
+            `None` to count `view_results`. Streaming renderers fold results into
+            these rows so summary-only runs do not retain per-file results.
     """
 
     verbosity_level: int
@@ -128,6 +134,7 @@ class PipelineCommandHumanReport:
     summary_mode: bool
     show_diffs: bool
     apply_changes: bool
+    outcome_counts: Sequence[OutcomeReasonCount] | None = None
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -175,6 +182,45 @@ class PipelineCommandHumanOutput:
     stderr: str
 
 
+class PipelineCommandHumanOutputStream(Protocol):
+    """Incremental renderer for split human pipeline command output.
+
+    Implementations render `PipelineCommandHumanOutput` fragments as durable
+    results arrive. Concatenating every fragment returned by `begin()`, `add()`,
+    and `end()` yields the same streams as rendering the complete result set at
+    once.
+    """
+
+    def begin(self, *, file_count: int) -> PipelineCommandHumanOutput:
+        """Return the fragments that open the output of a run."""
+        ...
+
+    def add(self, result: ProcessingResult, *, listed: bool) -> PipelineCommandHumanOutput:
+        """Return the fragments that became final after adding one result."""
+        ...
+
+    def end(self, *, unsupported_count: int) -> PipelineCommandHumanOutput:
+        """Return the fragments that close the output of a run."""
+        ...
+
+
+def get_report_outcome_counts(
+    report: PipelineCommandHumanReport,
+) -> Sequence[OutcomeReasonCount]:
+    """Return the summary rows for a pipeline command report.
+
+    Args:
+        report: Prepared human report for the pipeline command.
+
+    Returns:
+        The report's pre-aggregated rows when present, otherwise rows counted
+        from `report.view_results`.
+    """
+    if report.outcome_counts is not None:
+        return report.outcome_counts
+    return collect_outcome_reason_counts(report.view_results)
+
+
 def get_file_type_label(
     ctx: ProcessingContext | ProcessingResult,
 ) -> str | None:
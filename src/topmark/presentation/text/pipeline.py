@@ -44,13 +44,17 @@ from topmark.core.presentation import StyleRole
 from topmark.pipeline.hints import Cluster
 from topmark.pipeline.outcomes import ResultActionIntent
 from topmark.pipeline.outcomes import determine_result_action_intent
+from topmark.pipeline.reduction import ProcessingSummary
 from topmark.pipeline.reporting import ReportScope
 from topmark.pipeline.status import HeaderStatus
 from topmark.pipeline.status import WriteStatus
-from topmark.presentation.shared.outcomes import collect_outcome_counts_styled
 from topmark.presentation.shared.outcomes import get_outcome_style_role
+from topmark.presentation.shared.outcomes import get_outcome_styler
 from topmark.presentation.shared.paths import get_display_path
 from topmark.presentation.shared.paths import render_path_display_text
+from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
+from topmark.presentation.shared.pipeline import PipelineCommandHumanReport
+from topmark.presentation.shared.pipeline import get_report_outcome_counts
 from topmark.presentation.shared.pipeline import summarize_pipeline_file
 from topmark.presentation.text.diagnostic import render_diagnostics_text
 
@@ -62,9 +66,11 @@ if TYPE_CHECKING:
     from topmark.pipeline.hints import Hint
     from topmark.pipeline.kinds import PipelineKindLiteral
     from topmark.pipeline.outcomes import OutcomeReasonCount
+    from topmark.pipeline.profiling import StepProfile
     from topmark.pipeline.result import ProcessingResult
-    from topmark.presentation.shared.pipeline import PipelineCommandHumanReport
+    from topmark.pipeline.result_cache import ResultCacheStats
     from topmark.presentation.shared.pipeline import PipelineFileSummary
+    from topmark.presentation.shared.pipeline import PipelineHumanPresentationOptions
 
 
 logger: TopmarkLogger = get_logger(__name__)
@@ -340,6 +346,53 @@ def _render_strip_guidance_message_text(
     return f"🛠️  Run `{apply_cmd}` to {action}."
 
 
+def _guidance_message_builder_text(
+    pipeline_kind: PipelineKindLiteral,
+) -> Callable[[ProcessingResult], str | None]:
+    """Return the per-file guidance message builder for a pipeline kind.
+
+    Args:
+        pipeline_kind: Pipeline command kind (`check` or `strip`).
+
+    Returns:
+        Per-file guidance message builder.
+
+    Raises:
+        RuntimeError: If an invalid pipeline kind was selected.
+    """
+    if pipeline_kind == "check":
+        return _render_check_guidance_message_text
+    if pipeline_kind == "strip":
+        return _render_strip_guidance_message_text
+    # Defensive guard.
+    raise RuntimeError(f"Invalid pipeline kind selected: {pipeline_kind}")
+
+
+def _render_unsupported_notice_text(
+    *,
+    unsupported_count: int,
+    styled: bool,
+) -> str:
+    """Render the notice for unsupported files hidden from the per-file listing.
+
+    Args:
+        unsupported_count: Number of unsupported files.
+        styled: Whether ANSI-capable styling is enabled.
+
+    Returns:
+        Styled TEXT notice line.
+    """
+    # Style helpers already respect the selected color policy.
+    warning_styler: TextStyler = style_for_role(
+        StyleRole.WARNING,
+        styled=styled,
+    )
+    return warning_styler(
+        f"⚠️  Unsupported: {unsupported_count} file(s) "
+        f"(use {CliOpt.REPORT}={ReportScope.NONCOMPLIANT.value} to list)"
+    )
+
+
 # ---- Per-file rendering ----
 
 
@@ -413,17 +466,17 @@ def _render_file_summary_line_text(
     return " ".join(parts) + diag_show_hint
 
 
-def _render_per_file_guidance_text(
+def _render_file_section_text(
+    result: ProcessingResult,
     *,
-    results: Sequence[ProcessingResult],
     make_message: Callable[[ProcessingResult], str | None],
     show_diffs: bool,
     verbosity_level: int,
     styled: bool,
 ) -> str:
-    """Render per-file TEXT sections.
+    """Render the TEXT section of a single file.
 
-    For each file, this includes:
+    The section includes:
         1. A summary line.
         2. An optional guidance message.
         3. Diagnostics at `-v` and above.
@@ -431,117 +484,147 @@ def _render_per_file_guidance_text(
         5. An optional diff block.
 
     Args:
-        results: Durable processing results to render.
+        result: Durable processing result to render.
         make_message: Per-file guidance message builder.
-        show_diffs: Whether to include unified diffs.
+        show_diffs: Whether to include the unified diff.
         verbosity_level: Effective TEXT verbosity level.
         styled: Whether ANSI-capable styling is enabled.
 
     Returns:
-        TEXT fragment containing all rendered file sections.
+        TEXT section ending with a blank separator line.
     """
-    line_width: Final[int] = get_console_line_width()
-
     parts: list[str] = []
 
     # Style helpers already respect the selected color policy.
-    muted_styler: TextStyler = style_for_role(
-        StyleRole.MUTED,
-        styled=styled,
-    )
     emphasis_styler: TextStyler = style_for_role(
         StyleRole.EMPHASIS,
         styled=styled,
     )
 
-    # Use the Box Drawing Light Horizontal character (U+2500) for a solid line
-    diff_start_fence: Final[str] = " diff - start ".center(line_width, "─")
-    diff_end_fence: Final[str] = " diff - end ".center(line_width, "─")
+    # 1. summary line; at verbosity 0, keep output compact.
+    parts.append(
+        _render_file_summary_line_text(
+            result=result,
+            verbosity_level=verbosity_level,
+            styled=styled,
+        )
+    )
 
-    for result in results:
-        # 1. summary line; at verbosity 0, keep output compact.
+    # 2. guidance message for actionable check/strip outcomes.
+    msg: str | None = make_message(result)
+    if msg:
         parts.append(
-            _render_file_summary_line_text(
-                result=result,
-                verbosity_level=verbosity_level,
-                styled=styled,
+            emphasis_styler(
+                f"  {msg}",
             )
         )
 
-        # 2. guidance message for actionable check/strip outcomes.
-        msg: str | None = make_message(result)
-        if msg:
-            parts.append(
-                emphasis_styler(
-                    f"  {msg}",
-                )
+    # 3. diagnostics log (shown at -v and above)
+    if verbosity_level > 0 and len(result.diagnostics) > 0:
+        parts.append(
+            render_diagnostics_text(
+                diagnostics=result.diagnostics,
+                verbosity_level=verbosity_level,
+                color=styled,
             )
+        )
 
-        # 3. diagnostics log (shown at -v and above)
-        if verbosity_level > 0 and len(result.diagnostics) > 0:
-            parts.append(
-                render_diagnostics_text(
-                    diagnostics=result.diagnostics,
-                    verbosity_level=verbosity_level,
-                    color=styled,
-                )
+    # 4. hints (one hint at -v, full list at -vv and above)
+    hints: list[Hint] = list(result.hints)
+    hints_count: int = len(hints)
+    if verbosity_level > 0 and hints_count > 0:
+        extended_hint_info: str = (
+            ""
+            if verbosity_level > 1
+            else f" (use {CliShortOpt.VERBOSE}{CliShortOpt.VERBOSE[-1]} to view all hints)"
+        )
+        parts.append(
+            emphasis_styler(
+                f"  Hints: {len(hints)}{extended_hint_info}",
             )
+        )
 
-        # 4. hints (one hint at -v, full list at -vv and above)
-        hints: list[Hint] = list(result.hints)
-        hints_count: int = len(hints)
-        if verbosity_level > 0 and hints_count > 0:
-            extended_hint_info: str = (
-                ""
-                if verbosity_level > 1
-                else f" (use {CliShortOpt.VERBOSE}{CliShortOpt.VERBOSE[-1]} to view all hints)"
-            )
+        # Only display the last hint when verbosity_level==1
+        hints_to_show: list[Hint] = [hints[-1]] if verbosity_level == 1 else hints
+        hints_to_show_count: int = len(hints_to_show)
+        for i, h in enumerate(hints_to_show, start=1):
             parts.append(
-                emphasis_styler(
-                    f"  Hints: {len(hints)}{extended_hint_info}",
+                _render_hint_text(
+                    h,
+                    last=i == hints_to_show_count,
+                    verbosity_level=verbosity_level,
+                    styled=styled,
                 )
             )
 
-            # Only display the last hint when verbosity_level==1
-            hints_to_show: list[Hint] = [hints[-1]] if verbosity_level == 1 else hints
-            hints_to_show_count: int = len(hints_to_show)
-            for i, h in enumerate(hints_to_show, start=1):
-                parts.append(
-                    _render_hint_text(
-                        h,
-                        last=i == hints_to_show_count,
-                        verbosity_level=verbosity_level,
-                        styled=styled,
-                    )
-                )
+    # 5. optional diff block
+    if show_diffs:
+        patch: str | None = _render_diff_text(
+            result.detail.diff_text,
+            styled=styled,
+        )
 
-        # 5. optional diff block
-        if show_diffs:
-            patch: str | None = _render_diff_text(
-                result.detail.diff_text,
+        if patch:
+            line_width: Final[int] = get_console_line_width()
+            muted_styler: TextStyler = style_for_role(
+                StyleRole.MUTED,
                 styled=styled,
             )
 
-            if patch:
-                parts.append("")
-                parts.append(
-                    muted_styler(
-                        diff_start_fence,
-                    )
+            # Use the Box Drawing Light Horizontal character (U+2500) for a solid line
+            parts.append("")
+            parts.append(
+                muted_styler(
+                    " diff - start ".center(line_width, "─"),
                 )
-                parts.append(patch)
-                parts.append(
-                    muted_styler(
-                        diff_end_fence,
-                    )
+            )
+            parts.append(patch)
+            parts.append(
+                muted_styler(
+                    " diff - end ".center(line_width, "─"),
                 )
+            )
 
-        # 6. blank line between file records
-        parts.append("")
+    # 6. blank line between file records
+    parts.append("")
 
     return "\n".join(parts)
 
 
+def _render_per_file_guidance_text(
+    *,
+    results: Sequence[ProcessingResult],
+    make_message: Callable[[ProcessingResult], str | None],
+    show_diffs: bool,
+    verbosity_level: int,
+    styled: bool,
+) -> str:
+    """Render per-file TEXT sections.
+
+    See `_render_file_section_text()` for the content of each section.
+
+    Args:
+        results: Durable processing results to render.
+        make_message: Per-file guidance message builder.
+        show_diffs: Whether to include unified diffs.
+        verbosity_level: Effective TEXT verbosity level.
+        styled: Whether ANSI-capable styling is enabled.
+
+    Returns:
+        TEXT fragment containing all rendered file sections.
+    """
+    return "\n".join(
+        _render_file_section_text(
+            result,
+            make_message=make_message,
+            show_diffs=show_diffs,
+            verbosity_level=verbosity_level,
+            styled=styled,
+        )
+        for result in results
+    )
+
+
 # ---- Diff rendering ----
 
 
@@ -681,14 +764,14 @@ def render_pipeline_diffs_text(
 
 def _render_summary_counts_text(
     *,
-    view_results: Sequence[ProcessingResult],
+    outcome_counts: Sequence[OutcomeReasonCount],
     total: int,
     styled: bool,
 ) -> str:
     """Render summary counts grouped by `(outcome, reason)` as TEXT output.
 
     Args:
-        view_results: Durable processing results included in the rendered view.
+        outcome_counts: Sorted `(outcome, reason)` rows for the rendered view.
         total: Total number of candidate files before view filtering.
         styled: Whether ANSI-capable styling is enabled.
 
@@ -714,9 +797,9 @@ def _render_summary_counts_text(
     parts.append("")
     parts.append(heading_styler("Summary by outcome:"))
 
-    counts: list[tuple[OutcomeReasonCount, Callable[[str], str]]] = collect_outcome_counts_styled(
-        view_results
-    )
+    counts: list[tuple[OutcomeReasonCount, Callable[[str], str]]] = [
+        (row, get_outcome_styler(row.outcome)) for row in outcome_counts
+    ]
     outcome_width: int = max(
         max((len(row.outcome.value) for row, _ in counts), default=0),
         len("TOTAL"),
@@ -764,23 +847,9 @@ def render_pipeline_output_text(
 
     Returns:
         Rendered TEXT output for the prepared pipeline report.
-
-    Raises:
-        RuntimeError: If an invalid pipeline kind was selected.
     """
-    make_message: Callable[[ProcessingResult], str | None] | None = None
-    if report.pipeline_kind == "check":
-        make_message = _render_check_guidance_message_text
-    elif report.pipeline_kind == "strip":
-        make_message = _render_strip_guidance_message_text
-    else:
-        # Defensive guard.
-        raise RuntimeError(f"Invalid pipeline kind selected: {report.pipeline_kind}")
-
-    # Style helpers already respect the selected color policy.
-    warning_styler: TextStyler = style_for_role(
-        StyleRole.WARNING,
-        styled=report.styled,
+    make_message: Callable[[ProcessingResult], str | None] = _guidance_message_builder_text(
+        report.pipeline_kind
     )
 
     parts: list[str] = []
@@ -806,7 +875,7 @@ def render_pipeline_output_text(
             )
         parts.append(
             _render_summary_counts_text(
-                view_results=report.view_results,
+                outcome_counts=get_report_outcome_counts(report),
                 total=report.file_list_total,
                 styled=report.styled,
             )
@@ -832,15 +901,166 @@ def render_pipeline_output_text(
         and (report.unsupported_count > 0)
     ):
         parts.append(
-            warning_styler(
-                f"⚠️  Unsupported: {report.unsupported_count} file(s) "
-                f"(use {CliOpt.REPORT}={ReportScope.NONCOMPLIANT.value} to list)"
+            _render_unsupported_notice_text(
+                unsupported_count=report.unsupported_count,
+                styled=report.styled,
             )
         )
 
     return "\n".join(parts)
 
 
+class PipelineCommandTextOutputStream:
+    """Incremental TEXT output for a pipeline command, split by target stream.
+
+    Feeding every durable result through `add()` between `begin()` and `end()`
+    yields fragments whose concatenation equals the `stdout` and `stderr`
+    strings produced by
+    [`render_pipeline_command_human_output`][topmark.presentation.output.pipeline.render_pipeline_command_human_output]
+    for the same results. Commands can therefore write per-file sections and
+    diffs as soon as each result arrives.
+
+    In summary mode the grouped counts depend on every result, so only the diff
+    payload is incremental and the report is rendered by `end()`.
+    """
+
+    def __init__(self, options: PipelineHumanPresentationOptions) -> None:
+        """Initialize the stream.
+
+        Args:
+            options: Human presentation configuration for the command.
+        """
+        self._options: PipelineHumanPresentationOptions = options
+        self._make_message: Callable[[ProcessingResult], str | None] = (
+            _guidance_message_builder_text(options.pipeline_kind)
+        )
+        self._summary: ProcessingSummary = ProcessingSummary()
+        self._stderr_segments: int = 0
+        self._file_sections: int = 0
+        self._patches: int = 0
+
+    def _stderr_segment(self, text: str) -> str:
+        """Return a report segment prefixed with its separator.
+
+        Args:
+            text: Report segment to emit.
+
+        Returns:
+            The segment, preceded by a newline unless it is the first one.
+        """
+        separator: str = "\n" if self._stderr_segments else ""
+        self._stderr_segments += 1
+        return separator + text
+
+    def begin(self, *, file_count: int) -> PipelineCommandHumanOutput:
+        """Start the output of a run.
+
+        Args:
+            file_count: Number of files selected for the run.
+
+        Returns:
+            Leading output fragments (the banner at `-v` and above).
+        """
+        options: PipelineHumanPresentationOptions = self._options
+        if options.summary_mode or options.verbosity_level <= 0:
+            return PipelineCommandHumanOutput(stdout="", stderr="")
+        return PipelineCommandHumanOutput(
+            stdout="",
+            stderr=self._stderr_segment(
+                _render_pipeline_banner_text(
+                    pipeline_kind=options.pipeline_kind,
+                    n_files=file_count,
+                    styled=options.styled,
+                )
+            ),
+        )
+
+    def add(self, result: ProcessingResult, *, listed: bool) -> PipelineCommandHumanOutput:
+        """Render the output fragments of one durable result.
+
+        Args:
+            result: Durable processing result in stream order.
+            listed: Whether the report scope lists this result in the
+                per-file report.
+
+        Returns:
+            The result's diff payload and per-file report section, if any.
+        """
+        options: PipelineHumanPresentationOptions = self._options
+
+        stdout: str = ""
+        if options.show_diffs:
+            patch: str | None = _render_diff_text(
+                result.detail.diff_text,
+                styled=options.styled,
+            )
+            if patch:
+                stdout = ("\n\n" if self._patches else "") + patch.rstrip("\n")
+                self._patches += 1
+
+        stderr: str = ""
+        if options.summary_mode:
+            self._summary.add(result)
+        elif listed:
+            stderr = self._stderr_segment(
+                _render_file_section_text(
+                    result,
+                    make_message=self._make_message,
+                    show_diffs=False,
+                    verbosity_level=options.verbosity_level,
+                    styled=options.styled,
+                )
+            )
+            self._file_sections += 1
+
+        return PipelineCommandHumanOutput(stdout=stdout, stderr=stderr)
+
+    def end(self, *, unsupported_count: int) -> PipelineCommandHumanOutput:
+        """Finish the output of a run.
+
+        Args:
+            unsupported_count: Number of unsupported results across the run.
+
+        Returns:
+            Trailing output fragments (the summary, or the unsupported notice).
+        """
+        options: PipelineHumanPresentationOptions = self._options
+        if options.summary_mode:
+            summary: ProcessingSummary = self._summary
+            return PipelineCommandHumanOutput(
+                stdout="",
+                stderr=render_pipeline_output_text(
+                    PipelineCommandHumanReport(
+                        pipeline_kind=options.pipeline_kind,
+                        file_list_total=summary.file_count,
+                        view_results=(),
+                        report_scope=options.report_scope,
+                        unsupported_count=unsupported_count,
+                        verbosity_level=options.verbosity_level,
+                        summary_mode=True,
+                        show_diffs=False,
+                        apply_changes=options.apply_changes,
+                        styled=options.styled,
+                        outcome_counts=summary.outcome_reason_rows(),
+                    )
+                ),
+            )
+
+        parts: list[str] = []
+        if not self._file_sections:
+            parts.append(self._stderr_segment(""))
+        if options.report_scope == ReportScope.ACTIONABLE and unsupported_count > 0:
+            parts.append(
+                self._stderr_segment(
+                    _render_unsupported_notice_text(
+                        unsupported_count=unsupported_count,
+                        styled=options.styled,
+                    )
+                )
+            )
+        return PipelineCommandHumanOutput(stdout="", stderr="".join(parts))
+
+
 def render_pipeline_apply_summary_text(
     *,
     command_path: str,
@@ -884,3 +1104,105 @@ def render_pipeline_apply_summary_text(
         )
 
     return "\n".join(parts)
+
+
+def render_result_cache_summary_text(
+    *,
+    command_path: str,
+    stats: ResultCacheStats,
+    styled: bool,
+) -> str:
+    """Render the result-cache statistics footer for TEXT output.
+
+    Args:
+        command_path: Command path, such as `topmark check`.
+        stats: Result-cache counters for the run.
+        styled: Whether ANSI-capable styling is enabled.
+
+    Returns:
+        Rendered TEXT footer.
+    """
+    info_styler: TextStyler = style_for_role(StyleRole.INFO, styled=styled)
+    return info_styler(
+        f"\nℹ️  {command_path}: result cache: {stats.hits} hit(s), "
+        f"{stats.misses} miss(es), {stats.stored} stored."
+    )
+
+
+def render_pipeline_profile_text(
+    *,
+    command_path: str,
+    profiles: Sequence[StepProfile],
+    styled: bool,
+) -> str:
+    """Render the per-step profiling report for TEXT output.
+
+    Args:
+        command_path: Command path, such as `topmark check`.
+        profiles: Aggregated step profiles in step order.
+        styled: Whether ANSI-capable styling is enabled.
+
+    Returns:
+        Rendered TEXT report with one row per step and the slowest files per step.
+    """
+    info_styler: TextStyler = style_for_role(StyleRole.INFO, styled=styled)
+    heading_styler: TextStyler = style_for_role(StyleRole.HEADING_TITLE, styled=styled)
+    emphasis_styler: TextStyler = style_for_role(StyleRole.EMPHASIS, styled=styled)
+
+    if not profiles:
+        return info_styler(f"\nℹ️  {command_path}: profile: no pipeline steps were executed.")
+
+    headers: tuple[str, ...] = (
+        "step",
+        "files",
+        "total ms",
+        "p50 ms",
+        "p95 ms",
+        "max ms",
+        "cpu ms",
+        "read B",
+        "written B",
+        "alloc B",
+    )
+    rows: list[tuple[str, ...]] = [
+        (
+            profile.step,
+            str(profile.files),
+            f"{profile.wall_total * 1000:.2f}",
+            f"{profile.wall_p50 * 1000:.3f}",
+            f"{profile.wall_p95 * 1000:.3f}",
+            f"{profile.wall_max * 1000:.3f}",
+            f"{profile.cpu_total * 1000:.2f}",
+            str(profile.bytes_read),
+            str(profile.bytes_written),
+            "-" if profile.alloc_bytes is None else str(profile.alloc_bytes),
+        )
+        for profile in profiles
+    ]
+    widths: list[int] = [
+        max(len(headers[col]), *(len(row[col]) for row in rows)) for col in range(len(headers))
+    ]
+
+    def _format_row(cells: Sequence[str]) -> str:
+        first: str = f"{cells[0]:<{widths[0]}}"
+        rest: list[str] = [f"{cell:>{widths[i]}}" for i, cell in enumerate(cells) if i > 0]
+        return "  " + "  ".join([first, *rest])
+
+    parts: list[str] = [
+        "",
+        heading_styler(f"{command_path}: profile by step:"),
+        emphasis_styler(_format_row(headers)),
+        *(_format_row(row) for row in rows),
+    ]
+
+    slowest: list[str] = [
+        f"  {profile.step:<{widths[0]}}  {item.wall_seconds * 1000:>10.3f} ms  {item.path}"
+        for profile in profiles
+        for item in profile.slowest
+    ]
+    if slowest:
+        parts.append("")
+        parts.append(heading_styler("Slowest files by step:"))
+        parts.extend(slowest)
+
+    return "\n".join(parts)
@@ -64,6 +64,7 @@ from topmark.registry.identity import validate_reserved_topmark_namespace
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Collection
     from collections.abc import Iterable
     from collections.abc import Mapping
     from collections.abc import Sequence
@@ -136,6 +137,10 @@ _CONTINUATION_TOKEN_RE: Final[re.Pattern[str]] = re.compile(r"^[ \t]*(\|=|\||>=|
 _FIELD_RE: Final[re.Pattern[str]] = re.compile(r"^(?P<name>[^:]+?)(?P<padding> *):(?P<tail>.*)$")
 _SPACE_RUN_RE: Final[re.Pattern[str]] = re.compile(r" +")
 
+# Bound on cached render templates per processor and on cached static field encodings per
+# template. A full cache is cleared rather than evicted entry by entry.
+_RENDER_CACHE_LIMIT: Final[int] = 256
+
 
 def normalize_semantic_newlines(
     value: str,
@@ -153,6 +158,22 @@ class _ContinuationRecord:
     exact: bool
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _RenderTemplate:
+    """Run-invariant parts of a rendered header for one set of render settings.
+
+    Attributes:
+        preamble: Rendered preamble lines.
+        postamble: Rendered postamble lines.
+        static_lines: Physical lines and soft-overflow flag per ``(field, value)`` for fields
+            whose value does not depend on the processed file.
+    """
+
+    preamble: tuple[str, ...]
+    postamble: tuple[str, ...]
+    static_lines: dict[tuple[str, str], tuple[tuple[str, ...], bool]]
+
+
 def _equals_affix_ignoring_space_tab(line: str, affix: str) -> bool:
     """Return True if `line` equals `affix` when ignoring only spaces/tabs and EOLs.
 
@@ -213,6 +234,15 @@ class HeaderProcessor:
           `get_header_insertion_index()` and implement
           `get_header_insertion_char_offset()`; the pipeline will prefer this path.
 
+    Bounded reads:
+        For large files the reader may keep only the leading lines in memory and
+        stream the rest from disk (see
+        [`BoundedFileImageView`][topmark.pipeline.views.BoundedFileImageView]).
+        Header detection, anchor computation, and stripping then receive that
+        head only. Processors whose placement or detection depends on content
+        beyond the first lines (end-of-file anchors, whole-text character offsets)
+        must set ``requires_full_image = True`` to opt out.
+
     Public API note:
         In the stable public surface, consider typing against a minimal protocol
         rather than this concrete base if you are authoring plugins. The registry
@@ -234,6 +264,8 @@ class HeaderProcessor:
         namespace: Processor namespace class metadata.
         local_key: Unique processor identity class metadata within its namespace.
         description: Human-readable processor description class metadata.
+        requires_full_image: Whether the processor needs the whole file image rather than
+            a bounded head (class metadata; defaults to ``False``).
         file_type: The `FileType` bound to this processor instance by the registry.
         block_prefix: The prefix string for block-style header start.
         block_suffix: The suffix string for block-style header end.
@@ -244,6 +276,9 @@ class HeaderProcessor:
         header_indent: The indentation applied *before* the comment prefix; used
             to preserve existing leading indentation when replacing an indented
             header block inside a document (e.g., nested JSONC).
+        bounds_scan_window: Number of lines past the insertion anchor that
+            `get_header_bounds` scans line by line before checking the rest of
+            the file for markers in a single pass.
     """
 
     namespace: ClassVar[str] = TOPMARK_NAMESPACE
@@ -251,6 +286,7 @@ class HeaderProcessor:
     description: ClassVar[str] = (
         "Base header processor class. All header processor classes must subclass this class."
     )
+    requires_full_image: ClassVar[bool] = False
 
     @property
     def qualified_key(self) -> str:
@@ -318,6 +354,10 @@ class HeaderProcessor:
     # when replacing an indented header inside a document, e.g. JSONC nested blocks).
     header_indent: str = ""
 
+    # Lines past the insertion anchor scanned line by line for header markers; the rest
+    # of the file is only swept when a whole-buffer search finds a marker there.
+    bounds_scan_window: int = 64
+
     def __init__(
         self,
         *,
@@ -347,6 +387,9 @@ class HeaderProcessor:
         self._encoding_pattern: re.Pattern[str] | None = None
         self._encoding_pattern_src: str | None = None
 
+        # Cache of run-invariant header parts, keyed by the settings that shape them
+        self._render_templates: dict[tuple[object, ...], _RenderTemplate] = {}
+
     def parse_fields(self, context: ProcessingContextLike) -> HeaderParseResult:
         """Parse key-value pairs from the detected header block (*view-based*).
 
@@ -1191,6 +1234,7 @@ class HeaderProcessor:
         line_indent_override: str | None = None,
         header_indent_override: str | None = None,
         soft_overflow_fields: set[str] | None = None,
+        static_fields: Collection[str] | None = None,
     ) -> list[str]:
         """Render a header block from configuration, template, and overrides.
 
@@ -1198,6 +1242,11 @@ class HeaderProcessor:
         or folded continuation records, then applies the processor affixes and selected
         physical newline style to every emitted line.
 
+        The preamble, the postamble, and the encoded lines of `static_fields` are
+        cached per processor for each combination of newline style, affixes,
+        indentation, alignment width, and wrapping settings. Only the remaining
+        (typically path-derived) fields are encoded on every call.
+
         Args:
             header_values: Mapping of header fields to render.
             config: TopMark configuration (defines header fields and options).
@@ -1214,6 +1263,9 @@ class HeaderProcessor:
                 existing leading indentation on replace).
             soft_overflow_fields: Optional mutable collector populated with field
                 names whose canonical active-wrapping output exceeds the soft target.
+            static_fields: Optional names of fields whose value is the same for
+                every file of a run (for example values from ``[fields]``). Their
+                encoded lines are cached; caching never changes the output.
 
         Returns:
             Rendered header lines ending with ``newline_style``.
@@ -1248,95 +1300,154 @@ class HeaderProcessor:
         else:
             width = 0
 
-        # Build the header lines
-        lines: list[str] = []
-
-        # Compose preamble
-        lines.extend(
-            self.render_preamble_lines(
-                newline_style=newline_style,
-                block_prefix=block_prefix,
-                line_prefix=line_prefix,
-                line_suffix=line_suffix,
-                header_indent=header_indent,
-            )
+        template_key: tuple[object, ...] = (
+            newline_style,
+            block_prefix,
+            block_suffix,
+            line_prefix,
+            line_suffix,
+            effective_line_indent,
+            header_indent,
+            width,
+            config.max_header_line_length,
+            tuple(config.wrap_fields),
         )
-
-        # Field lines (no blanks in-between)
-        for field in config.header_fields:
-            value: str = normalize_semantic_newlines(header_values.get(field, ""))
-
-            def measure_payload_line(
-                inner: str,
-                continuation: bool,
-            ) -> int:
-                """Return the complete physical payload-line length without its terminator."""
-                return len(
-                    self._wrap_line(
-                        inner,
-                        newline_style="",
+        template: _RenderTemplate | None = self._render_templates.get(template_key)
+        if template is None:
+            template = _RenderTemplate(
+                preamble=tuple(
+                    self.render_preamble_lines(
+                        newline_style=newline_style,
+                        block_prefix=block_prefix,
                         line_prefix=line_prefix,
                         line_suffix=line_suffix,
                         header_indent=header_indent,
-                        after_prefix_indent=(
-                            effective_line_indent + "  " if continuation else effective_line_indent
-                        ),
                     )
-                )
-
-            wrap_active: bool = (
-                config.max_header_line_length is not None
-                and field in config.wrap_fields
-                and "\n" not in value
-            )
-            encoded_lines: list[str] = self._encode_field_lines(
-                field_name=field,
-                field_value=value,
-                width=width,
-                max_line_length=config.max_header_line_length if wrap_active else None,
-                measure_line=measure_payload_line,
-            )
-            if (
-                wrap_active
-                and soft_overflow_fields is not None
-                and config.max_header_line_length is not None
-                and any(
-                    measure_payload_line(inner, index > 0) > config.max_header_line_length
-                    for index, inner in enumerate(encoded_lines)
-                )
-            ):
-                soft_overflow_fields.add(field)
-            for encoded_index, inner in enumerate(encoded_lines):
-                lines.append(
-                    self._wrap_line(
-                        inner,
+                ),
+                postamble=tuple(
+                    self.render_postamble_lines(
                         newline_style=newline_style,
+                        block_suffix=block_suffix,
                         line_prefix=line_prefix,
                         line_suffix=line_suffix,
                         header_indent=header_indent,
-                        after_prefix_indent=(
-                            effective_line_indent
-                            if encoded_index == 0
-                            else effective_line_indent + "  "
-                        ),
                     )
-                )
+                ),
+                static_lines={},
+            )
+            if len(self._render_templates) >= _RENDER_CACHE_LIMIT:
+                self._render_templates.clear()
+            self._render_templates[template_key] = template
 
-        # Compose postamble
-        lines.extend(
-            self.render_postamble_lines(
+        def render_field(field_name: str, value: str) -> tuple[tuple[str, ...], bool]:
+            return self._render_field_lines(
+                field_name=field_name,
+                field_value=value,
+                config=config,
+                width=width,
                 newline_style=newline_style,
-                block_suffix=block_suffix,
                 line_prefix=line_prefix,
                 line_suffix=line_suffix,
+                line_indent=effective_line_indent,
                 header_indent=header_indent,
             )
-        )
+
+        # Build the header lines: preamble, field lines (no blanks in-between), postamble
+        lines: list[str] = list(template.preamble)
+        for field in config.header_fields:
+            value: str = normalize_semantic_newlines(header_values.get(field, ""))
+            field_lines: tuple[str, ...]
+            overflow: bool
+            if static_fields is not None and field in static_fields:
+                cached: tuple[tuple[str, ...], bool] | None = template.static_lines.get(
+                    (field, value)
+                )
+                if cached is None:
+                    cached = render_field(field, value)
+                    if len(template.static_lines) >= _RENDER_CACHE_LIMIT:
+                        template.static_lines.clear()
+                    template.static_lines[field, value] = cached
+                field_lines, overflow = cached
+            else:
+                field_lines, overflow = render_field(field, value)
+            if overflow and soft_overflow_fields is not None:
+                soft_overflow_fields.add(field)
+            lines.extend(field_lines)
+        lines.extend(template.postamble)
 
         logger.debug("Rendered %d header lines:\n%s", len(lines), "".join(lines))
 
         return lines
 
+    def _render_field_lines(
+        self,
+        *,
+        field_name: str,
+        field_value: str,
+        config: RuntimeConfigLike,
+        width: int,
+        newline_style: str,
+        line_prefix: str,
+        line_suffix: str,
+        line_indent: str,
+        header_indent: str,
+    ) -> tuple[tuple[str, ...], bool]:
+        """Render the physical lines of one normalized field.
+
+        Returns:
+            The wrapped lines, and whether active wrapping left a line above the
+            configured soft maximum.
+        """
+
+        def measure_payload_line(
+            inner: str,
+            continuation: bool,
+        ) -> int:
+            """Return the complete physical payload-line length without its terminator."""
+            return len(
+                self._wrap_line(
+                    inner,
+                    newline_style="",
+                    line_prefix=line_prefix,
+                    line_suffix=line_suffix,
+                    header_indent=header_indent,
+                    after_prefix_indent=line_indent + "  " if continuation else line_indent,
+                )
+            )
+
+        wrap_active: bool = (
+            config.max_header_line_length is not None
+            and field_name in config.wrap_fields
+            and "\n" not in field_value
+        )
+        encoded_lines: list[str] = self._encode_field_lines(
+            field_name=field_name,
+            field_value=field_value,
+            width=width,
+            max_line_length=config.max_header_line_length if wrap_active else None,
+            measure_line=measure_payload_line,
+        )
+        overflow: bool = (
+            wrap_active
+            and config.max_header_line_length is not None
+            and any(
+                measure_payload_line(inner, index > 0) > config.max_header_line_length
+                for index, inner in enumerate(encoded_lines)
+            )
+        )
+        lines: tuple[str, ...] = tuple(
+            self._wrap_line(
+                inner,
+                newline_style=newline_style,
+                line_prefix=line_prefix,
+                line_suffix=line_suffix,
+                header_indent=header_indent,
+                after_prefix_indent=line_indent if index == 0 else line_indent + "  ",
+            )
+            for index, inner in enumerate(encoded_lines)
+        )
+        return lines, overflow
+
     def _encode_field_lines(
         self,
         *,
@@ -1543,7 +1654,9 @@ class HeaderProcessor:
         """Check whether a line contains the directive with the expected affixes.
 
         This method is used by ``get_header_bounds()`` to locate header start/end markers.
-        Subclasses may override this method for more flexible or format-specific matching.
+        Subclasses may override this method for more flexible or format-specific matching,
+        but must only match lines that contain ``directive``: ``get_header_bounds()``
+        consults it for marker lines only.
 
         Args:
             line: The line of text to check (whitespace is trimmed internally).
@@ -1629,6 +1742,13 @@ class HeaderProcessor:
         It then applies format-aware detection and proximity validation to return
         a valid span when present.
 
+        Markers are located once. Lines up to ``bounds_scan_window`` past the
+        insertion anchor are checked one by one; the rest of the file is searched
+        as a single joined buffer and only swept line by line when that search
+        finds a marker, so stray markers anywhere still make the file malformed.
+        Both the preflight and the format-aware detection then visit marker lines
+        only.
+
         Args:
             lines: Logical file lines (``keepends=True``). The iterable
                 may be list-backed or lazy (e.g., a generator).
@@ -1648,27 +1768,51 @@ class HeaderProcessor:
             and location validation but should preserve the discriminated-union
             semantics of the return value.
         """
-        # Materialize once for look-ahead and validation.
-        buf: list[str] = list(lines)
+        # Materialize once for look-ahead and validation (list inputs are used as-is).
+        buf: list[str] = lines if isinstance(lines, list) else list(lines)
 
         if not buf:
             return HeaderBounds(kind=BoundsKind.NONE)
 
+        # --- Insertion anchor (also bounds the line-by-line marker scan) --------
+        text: str | None = None
+        anchor_idx: int = self.compute_insertion_anchor(buf)
+        if anchor_idx == NO_LINE_ANCHOR:
+            text = "".join(buf)
+            char_off: int | None = self.get_header_insertion_char_offset(text)
+            if char_off is not None:
+                # Translate char offset to a line index using newline_style
+                # (best-effort; the default processor doesn't rely on it further).
+                nl: str = newline_style or "\n"
+                anchor_idx = text[:char_off].count(nl)
+            else:
+                anchor_idx = 0
+
+        # --- Marker lines: window first, then at most one sweep of the rest -----
+        # Accept either exact directive lines or markers inside a single-line comment
+        # wrapper; the more exact check (line_has_directive) happens later.
+        window_end: int = min(len(buf), max(anchor_idx, 0) + max(self.bounds_scan_window, 0))
+        markers: list[tuple[int, bool, bool]] = self._collect_marker_lines(buf, 0, window_end)
+        if window_end < len(buf):
+            rest_has_marker: bool
+            if text is not None:
+                offset: int = sum(map(len, buf[:window_end]))
+                rest_has_marker = (
+                    text.find(TOPMARK_START_MARKER, offset) != -1
+                    or text.find(TOPMARK_END_MARKER, offset) != -1
+                )
+            else:
+                rest: str = "".join(buf[window_end:])
+                rest_has_marker = TOPMARK_START_MARKER in rest or TOPMARK_END_MARKER in rest
+            if rest_has_marker:
+                markers.extend(self._collect_marker_lines(buf, window_end, len(buf)))
+
         # --- Preflight: marker-shape scan (format-agnostic) --------------------
-        start_idxs: list[int] = []
-        end_idxs: list[int] = []
-        i: int
-        ln: str
-        for i, ln in enumerate(buf):
-            # Accept either exact directive lines or markers inside a single-line comment
-            # wrapper; the more exact check (line_has_directive) happens later.
-            if TOPMARK_START_MARKER in ln:
-                start_idxs.append(i)
-            if TOPMARK_END_MARKER in ln:
-                end_idxs.append(i)
+        start_idxs: list[int] = [i for i, has_start, _ in markers if has_start]
+        end_idxs: list[int] = [i for i, _, has_end in markers if has_end]
 
         if end_idxs and not start_idxs:
-            i = end_idxs[0]
+            i: int = end_idxs[0]
             reason: str = "end marker without preceding start"
             logger.debug(reason)
             return HeaderBounds(
@@ -1709,9 +1853,7 @@ class HeaderProcessor:
         # non-overlapping complete headers remain deterministic, while nested or
         # dangling markers make the overall shape malformed.
         open_start: int | None = None
-        for marker_idx, marker_line in enumerate(buf):
-            has_start: bool = TOPMARK_START_MARKER in marker_line
-            has_end: bool = TOPMARK_END_MARKER in marker_line
+        for marker_idx, has_start, has_end in markers:
             if has_start and has_end:
                 return HeaderBounds(
                     kind=BoundsKind.MALFORMED,
@@ -1747,23 +1889,14 @@ class HeaderProcessor:
             )
 
         # --- Policy-aware detection near computed anchor -----------------------
-        anchor_idx: int = self.compute_insertion_anchor(buf)
-        if anchor_idx == NO_LINE_ANCHOR:
-            text: str = "".join(buf)
-            char_off: int | None = self.get_header_insertion_char_offset(text)
-            if char_off is not None:
-                # Translate char offset to a line index using newline_style
-                # (best-effort; the default processor doesn't rely on it further).
-                nl: str = newline_style or "\n"
-                anchor_idx = text[:char_off].count(nl)
-            else:
-                anchor_idx = 0
-
+        marker_idxs: list[int] = [marker_idx for marker_idx, _, _ in markers]
         if self.block_prefix and self.block_suffix:
-            candidates: list[tuple[int, int]] = self._collect_bounds_block_comments(buf)
+            candidates: list[tuple[int, int]] = self._collect_bounds_block_comments(
+                buf, marker_idxs
+            )
             # should return outer-inclusive spans
         else:
-            candidates = self._collect_bounds_line_comments(buf)
+            candidates = self._collect_bounds_line_comments(buf, marker_idxs)
 
         for s, e_inclusive in candidates:
             # Convert inclusive end → exclusive end for view/bounds consumers.
@@ -1779,6 +1912,22 @@ class HeaderProcessor:
         # No acceptable header near the anchor; treat as absent.
         return HeaderBounds(kind=BoundsKind.NONE)
 
+    @staticmethod
+    def _collect_marker_lines(
+        lines: list[str],
+        start: int,
+        stop: int,
+    ) -> list[tuple[int, bool, bool]]:
+        """Return ``(index, has_start, has_end)`` for lines in ``[start, stop)`` with a marker."""
+        markers: list[tuple[int, bool, bool]] = []
+        for i in range(start, stop):
+            ln: str = lines[i]
+            has_start: bool = TOPMARK_START_MARKER in ln
+            has_end: bool = TOPMARK_END_MARKER in ln
+            if has_start or has_end:
+                markers.append((i, has_start, has_end))
+        return markers
+
     def strip_header_block(
         self,
         *,
@@ -1942,47 +2091,81 @@ class HeaderProcessor:
             ),
         )
 
-    def _collect_bounds_line_comments(self, lines: list[str]) -> list[tuple[int, int]]:
-        """Collect all (start,end) pairs for pound-style headers in the file."""
+    def _collect_bounds_line_comments(
+        self,
+        lines: list[str],
+        marker_idxs: Sequence[int] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Collect all (start,end) pairs for pound-style headers in the file.
+
+        Args:
+            lines: File lines.
+            marker_idxs: Ascending indices of the lines that contain a marker; only
+                these can hold a directive. Defaults to every line.
+
+        Returns:
+            Inclusive ``(start, end)`` marker spans in file order.
+        """
+        if marker_idxs is None:
+            marker_idxs = range(len(lines))
         results: list[tuple[int, int]] = []
-        i: int = 0
-        n: int = len(lines)
-        while i < n:
+        pos: int = 0
+        n: int = len(marker_idxs)
+        while pos < n:
+            i: int = marker_idxs[pos]
             if self.line_has_directive(lines[i], TOPMARK_START_MARKER):
                 start: int = i
-                j: int = i + 1
-                while j < n and not self.line_has_directive(lines[j], TOPMARK_END_MARKER):
-                    j += 1
-                if j < n and self.line_has_directive(lines[j], TOPMARK_END_MARKER):
-                    results.append((start, j))
-                    i = j + 1
+                nxt: int = pos + 1
+                while nxt < n and not self.line_has_directive(
+                    lines[marker_idxs[nxt]], TOPMARK_END_MARKER
+                ):
+                    nxt += 1
+                if nxt < n:
+                    results.append((start, marker_idxs[nxt]))
+                    pos = nxt + 1
                     continue
-            i += 1
+            pos += 1
         return results
 
-    def _collect_bounds_block_comments(self, lines: list[str]) -> list[tuple[int, int]]:
+    def _collect_bounds_block_comments(
+        self,
+        lines: list[str],
+        marker_idxs: Sequence[int] | None = None,
+    ) -> list[tuple[int, int]]:
         """Collect all header spans for block-comment wrappers (e.g., HTML/XML).
 
         For each detected START..END pair, prefer returning the wrapper span
         (block_prefix..block_suffix) when both are immediately around the header
         without intervening non-blank content; otherwise return the markers only.
+
+        Args:
+            lines: File lines.
+            marker_idxs: Ascending indices of the lines that contain a marker; only
+                these can hold a directive. Defaults to every line.
+
+        Returns:
+            Inclusive spans in file order.
         """
+        if marker_idxs is None:
+            marker_idxs = range(len(lines))
         results: list[tuple[int, int]] = []
         n: int = len(lines)
-        i: int = 0
-        while i < n:
+        pos: int = 0
+        while pos < len(marker_idxs):
             # Find a START marker
-            if not self.line_has_directive(lines[i], TOPMARK_START_MARKER):
-                i += 1
+            if not self.line_has_directive(lines[marker_idxs[pos]], TOPMARK_START_MARKER):
+                pos += 1
                 continue
-            start_idx: int = i
+            start_idx: int = marker_idxs[pos]
             # Find the matching END marker after start
-            j: int = i + 1
-            while j < n and not self.line_has_directive(lines[j], TOPMARK_END_MARKER):
-                j += 1
-            if j >= n:
+            nxt: int = pos + 1
+            while nxt < len(marker_idxs) and not self.line_has_directive(
+                lines[marker_idxs[nxt]], TOPMARK_END_MARKER
+            ):
+                nxt += 1
+            if nxt >= len(marker_idxs):
                 break  # unmatched START; stop collecting further
-            end_idx: int = j
+            end_idx: int = marker_idxs[nxt]
 
             # Try to expand to block_prefix/block_suffix if they tightly wrap the header
             block_start: int | None = None
@@ -2022,7 +2205,7 @@ class HeaderProcessor:
             else:
                 results.append((start_idx, end_idx))
 
-            i = end_idx + 1
+            pos = nxt + 1
         return results
 
     def prepare_header_for_insertion(
@@ -98,6 +98,8 @@ class XmlHeaderProcessor(HeaderProcessor):
     description: ClassVar[str] = (
         "Header processor for files with HTML/XML-style block comments (<!-- ... -->)."
     )
+    # Placement uses character offsets over the whole document text.
+    requires_full_image: ClassVar[bool] = True
 
     def __init__(self) -> None:
         super().__init__(
@@ -31,6 +31,11 @@ from topmark.processors.builtins.pound import PoundHeaderProcessor
 from topmark.processors.builtins.slash import SlashHeaderProcessor
 from topmark.processors.builtins.xml import XmlHeaderProcessor
 from topmark.registry.identity import make_qualified_key
+from topmark.registry.snapshot import RegistrySnapshot
+from topmark.registry.snapshot import compute_registry_fingerprint
+from topmark.registry.snapshot import get_registry_snapshot
+from topmark.registry.snapshot import registry_snapshot_path
+from topmark.registry.snapshot import store_registry_snapshot
 from topmark.registry.types import ProcessorDefinition
 
 if TYPE_CHECKING:
@@ -155,27 +160,20 @@ def _resolve_filetypes_by_local_key(
     return lookup
 
 
-@lru_cache(maxsize=1)
-def get_base_processor_binding_registry() -> dict[str, str]:
-    """Build and cache the base binding registry from explicit declarations.
+def build_base_processor_binding_registry(ft_registry: dict[str, FileType]) -> dict[str, str]:
+    """Resolve the explicit built-in bindings against a base file type registry.
 
-    The returned mapping is keyed by file type qualified key and stores the
-    bound processor qualified key as its value.
+    Args:
+        ft_registry: Base file type registry returned by
+            `get_base_file_type_registry()`.
 
     Returns:
-        Base mapping of file type qualified key to processor qualified key.
-
-    Notes:
-        The cached dictionary is shared process-wide and must be treated as
-        read-only by callers.
+        Fresh mapping of file type qualified key to processor qualified key.
 
     Raises:
         ProcessorBindingError: If a binding references an unknown file type or
             if multiple bindings target the same file type qualified key.
     """
-    from topmark.filetypes.instances import get_base_file_type_registry
-
-    ft_registry: dict[str, FileType] = get_base_file_type_registry()
     ft_by_local_key: dict[str, FileType] = _resolve_filetypes_by_local_key(ft_registry)
     registry: dict[str, str] = {}
 
@@ -208,6 +206,58 @@ def get_base_processor_binding_registry() -> dict[str, str]:
     return registry
 
 
+def build_registry_snapshot() -> RegistrySnapshot:
+    """Build a registry snapshot from the base registries of this process.
+
+    The plugin entry points and the file type registry come from their
+    process-wide caches, so a snapshot taken after a cold start does not scan
+    the environment again.
+
+    Returns:
+        A snapshot for the current environment.
+    """
+    from topmark.filetypes.instances import get_base_file_type_registry
+    from topmark.filetypes.instances import get_plugin_entry_points
+
+    return RegistrySnapshot(
+        fingerprint=compute_registry_fingerprint(),
+        entry_points=tuple((ep.group, ep.name, ep.value) for ep in get_plugin_entry_points()),
+        bindings=build_base_processor_binding_registry(get_base_file_type_registry()),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_base_processor_binding_registry() -> dict[str, str]:
+    """Build and cache the base binding registry from explicit declarations.
+
+    The returned mapping is keyed by file type qualified key and stores the
+    bound processor qualified key as its value. When a registry snapshot is
+    enabled (see [`topmark.registry.snapshot`][topmark.registry.snapshot]), the
+    recorded bindings are returned without building the file type registry;
+    a missing or stale snapshot is replaced with the outcome of this build.
+
+    Returns:
+        Base mapping of file type qualified key to processor qualified key.
+
+    Notes:
+        The cached dictionary is shared process-wide and must be treated as
+        read-only by callers.
+
+    Raises:
+        ProcessorBindingError: If a binding references an unknown file type or
+            if multiple bindings target the same file type qualified key.
+    """
+    from topmark.filetypes.instances import get_base_file_type_registry
+
+    if registry_snapshot_path() is None:
+        return build_base_processor_binding_registry(get_base_file_type_registry())
+    snapshot: RegistrySnapshot | None = get_registry_snapshot()
+    if snapshot is None:
+        snapshot = build_registry_snapshot()
+        store_registry_snapshot(snapshot)
+    return dict(snapshot.bindings)
+
+
 @lru_cache(maxsize=1)
 def get_base_processor_definition_registry() -> dict[str, ProcessorDefinition]:
     """Build and cache the base processor-definition registry.
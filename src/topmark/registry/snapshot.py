@@ -0,0 +1,319 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : snapshot.py
+#   file_relpath : src/topmark/registry/snapshot.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Precompiled, versioned snapshot of base registry discovery.
+
+Building the base registries on a cold start scans every installed
+distribution for ``topmark.filetypes`` entry points and resolves every built-in
+processor binding against the file type registry. Neither result changes
+between runs unless the Python environment or TopMark itself changes.
+
+When the ``TOPMARK_REGISTRY_SNAPSHOT`` environment variable names a file, both
+results are stored there as one small JSON document and loaded in one step by
+later processes:
+
+- the discovered plugin entry points, so
+  `importlib.metadata.entry_points()` is not called;
+- the base file-type-to-processor binding registry, so binding resolution does
+  not have to build the file type registry first.
+
+Snapshot validation:
+    A snapshot is used only when its fingerprint matches the current
+    environment. The fingerprint covers the snapshot schema version, the
+    TopMark version, the Python version, every `sys.path` entry together with
+    its modification time, and the modification times of TopMark's built-in
+    file type and processor declaration modules. Installing, upgrading or
+    removing a distribution adds or removes a `.dist-info` directory, which
+    changes the modification time of its `sys.path` directory, so the snapshot
+    is rebuilt on the next run. Unreadable, foreign, or stale snapshots are
+    ignored, and the outcome of the full discovery that replaces them is
+    written back by the processor binding registry.
+
+The snapshot only shortcuts *base* registry discovery. File type objects are
+still built by importing their declaring modules (they carry matcher
+callables), and overlay mutations through `FileTypeRegistry.register()` and
+friends are applied on top as usual.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import cast
+
+from topmark.core.constants import TOPMARK_VERSION
+from topmark.core.logging import get_logger
+from topmark.utils.file import safe_unlink
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from topmark.core.logging import TopmarkLogger
+
+logger: TopmarkLogger = get_logger(__name__)
+
+REGISTRY_SNAPSHOT_ENV: Final = "TOPMARK_REGISTRY_SNAPSHOT"
+"""Environment variable naming the registry snapshot file (unset: disabled)."""
+
+_SNAPSHOT_SCHEMA_VERSION: Final[int] = 1
+"""On-disk format version; bump to orphan snapshots written by older releases."""
+
+# Modules (relative to the `topmark` package) whose contents are captured by a snapshot.
+_BUILTIN_DECLARATION_GLOBS: Final[tuple[str, ...]] = (
+    "filetypes/builtins/*.py",
+    "processors/builtins/*.py",
+    "processors/instances.py",
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RegistrySnapshot:
+    """Recorded outcome of base registry discovery.
+
+    Attributes:
+        fingerprint: Environment fingerprint the snapshot was built for.
+        entry_points: Discovered plugin entry points as `(group, name, value)`.
+        bindings: Base binding registry (file type qualified key to processor
+            qualified key).
+    """
+
+    fingerprint: str
+    entry_points: tuple[tuple[str, str, str], ...]
+    bindings: Mapping[str, str]
+
+    def entry_points_for(self, group: str) -> tuple[EntryPoint, ...]:
+        """Return the recorded entry points of one group, in discovery order.
+
+        Args:
+            group: Entry point group name.
+
+        Returns:
+            `EntryPoint` objects that load exactly like the discovered ones.
+        """
+        return tuple(
+            EntryPoint(name=name, value=value, group=ep_group)
+            for ep_group, name, value in self.entry_points
+            if ep_group == group
+        )
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the JSON-serializable form of this snapshot."""
+        return {
+            "schema_version": _SNAPSHOT_SCHEMA_VERSION,
+            "fingerprint": self.fingerprint,
+            "entry_points": [list(ep) for ep in self.entry_points],
+            "bindings": dict(sorted(self.bindings.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data: object) -> RegistrySnapshot | None:
+        """Parse a snapshot document, returning `None` for foreign or malformed data.
+
+        Args:
+            data: Decoded JSON document.
+
+        Returns:
+            The parsed snapshot, or `None` if `data` is not a current-schema snapshot.
+        """
+        if not isinstance(data, dict):
+            return None
+        doc: dict[str, object] = cast("dict[str, object]", data)
+        if doc.get("schema_version") != _SNAPSHOT_SCHEMA_VERSION:
+            return None
+
+        fingerprint: object = doc.get("fingerprint")
+        entry_points: list[tuple[str, str, str]] | None = _parse_entry_points(
+            doc.get("entry_points")
+        )
+        bindings: dict[str, str] | None = _parse_bindings(doc.get("bindings"))
+        if not isinstance(fingerprint, str) or entry_points is None or bindings is None:
+            return None
+        return cls(
+            fingerprint=fingerprint,
+            entry_points=tuple(entry_points),
+            bindings=bindings,
+        )
+
+
+def _parse_entry_points(value: object) -> list[tuple[str, str, str]] | None:
+    """Return `value` as `(group, name, value)` rows, or `None` if malformed."""
+    if not isinstance(value, list):
+        return None
+    rows: list[tuple[str, str, str]] = []
+    for row in cast("list[object]", value):
+        if not isinstance(row, list):
+            return None
+        cells: list[object] = cast("list[object]", row)
+        if len(cells) != 3:
+            return None
+        group, name, target = cells
+        if not isinstance(group, str) or not isinstance(name, str) or not isinstance(target, str):
+            return None
+        rows.append((group, name, target))
+    return rows
+
+
+def _parse_bindings(value: object) -> dict[str, str] | None:
+    """Return `value` as a string-to-string mapping, or `None` if malformed."""
+    if not isinstance(value, dict):
+        return None
+    bindings: dict[str, str] = {}
+    for key, target in cast("dict[object, object]", value).items():
+        if not isinstance(key, str) or not isinstance(target, str):
+            return None
+        bindings[key] = target
+    return bindings
+
+
+def _mtime_ns(path: str | Path) -> int | None:
+    """Return the modification time of `path`, or `None` if it cannot be stat'ed."""
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def compute_registry_fingerprint() -> str:
+    """Return the fingerprint of the inputs to base registry discovery.
+
+    Returns:
+        Hex digest over the snapshot schema, TopMark and Python versions,
+        `sys.path` entries with their modification times, and the modification
+        times of TopMark's built-in declaration modules.
+    """
+    package_root: Path = Path(__file__).resolve().parents[1]
+    builtin_sources: list[tuple[str, int | None]] = [
+        (path.relative_to(package_root).as_posix(), _mtime_ns(path))
+        for pattern in _BUILTIN_DECLARATION_GLOBS
+        for path in sorted(package_root.glob(pattern))
+    ]
+    parts: list[object] = [
+        _SNAPSHOT_SCHEMA_VERSION,
+        TOPMARK_VERSION,
+        sys.version,
+        [(entry, _mtime_ns(entry or ".")) for entry in sys.path],
+        builtin_sources,
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def load_registry_snapshot(path: Path) -> RegistrySnapshot | None:
+    """Load a snapshot file, returning `None` when it is missing, foreign, or stale.
+
+    Args:
+        path: Snapshot file location.
+
+    Returns:
+        The snapshot if it matches the current environment fingerprint, else `None`.
+    """
+    try:
+        data: object = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable registry snapshot %s: %s", path, e)
+        return None
+    snapshot: RegistrySnapshot | None = RegistrySnapshot.from_dict(data)
+    if snapshot is None or snapshot.fingerprint != compute_registry_fingerprint():
+        logger.debug("Ignoring stale or foreign registry snapshot %s", path)
+        return None
+    return snapshot
+
+
+def write_registry_snapshot(snapshot: RegistrySnapshot, path: Path) -> bool:
+    """Atomically write a snapshot; write failures are logged and ignored.
+
+    Args:
+        snapshot: Snapshot to store.
+        path: Snapshot file location.
+
+    Returns:
+        True if the snapshot was written.
+    """
+    tmp_path: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(snapshot.to_dict(), indent=1) + "\n", encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.debug("Could not write registry snapshot %s: %s", path, e)
+        safe_unlink(tmp_path)
+        return False
+    return True
+
+
+def registry_snapshot_path() -> Path | None:
+    """Return the snapshot file named by `TOPMARK_REGISTRY_SNAPSHOT`, if any.
+
+    Returns:
+        The snapshot file location, or `None` when snapshots are disabled.
+    """
+    path_str: str = os.environ.get(REGISTRY_SNAPSHOT_ENV, "").strip()
+    return Path(path_str) if path_str else None
+
+
+@lru_cache(maxsize=1)
+def _load_cached(path_str: str) -> RegistrySnapshot | None:
+    """Load the snapshot at `path_str` once per process."""
+    path = Path(path_str)
+    snapshot: RegistrySnapshot | None = load_registry_snapshot(path)
+    if snapshot is not None:
+        logger.debug("Loaded registry snapshot %s", path)
+    return snapshot
+
+
+def get_registry_snapshot() -> RegistrySnapshot | None:
+    """Return the current registry snapshot for this process, if there is one.
+
+    The snapshot file is read at most once per process and path. A missing or
+    stale snapshot is not rebuilt here: the base registries fall back to a full
+    discovery, and
+    [`get_base_processor_binding_registry()`][topmark.processors.instances.get_base_processor_binding_registry]
+    stores its outcome with
+    [`store_registry_snapshot()`][topmark.registry.snapshot.store_registry_snapshot].
+
+    Returns:
+        The current snapshot, or `None` when snapshots are disabled or the file
+        is missing or stale.
+    """
+    path: Path | None = registry_snapshot_path()
+    if path is None:
+        return None
+    return _load_cached(str(path))
+
+
+def store_registry_snapshot(snapshot: RegistrySnapshot) -> bool:
+    """Write `snapshot` to the configured snapshot file and serve it from now on.
+
+    Args:
+        snapshot: Snapshot to store.
+
+    Returns:
+        True if snapshots are enabled and the snapshot was written.
+    """
+    path: Path | None = registry_snapshot_path()
+    if path is None or not write_registry_snapshot(snapshot, path):
+        return False
+    logger.debug("Wrote registry snapshot %s", path)
+    _load_cached.cache_clear()
+    return True
+
+
+def clear_registry_snapshot_cache() -> None:
+    """Forget the snapshot loaded by this process; the file itself is kept."""
+    _load_cached.cache_clear()
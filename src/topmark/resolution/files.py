@@ -39,8 +39,10 @@ normal traversal.
 
 from __future__ import annotations
 
+import fnmatch
 import os
 from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -56,6 +58,8 @@ from topmark.registry.filetypes import FileTypeRegistry
 from topmark.resolution.discovery import FileSelectionProbeResult
 from topmark.resolution.discovery import FileSelectionReason
 from topmark.resolution.discovery import FileSelectionStatus
+from topmark.utils.file import CACHEDIR_TAG_NAME
+from topmark.utils.file import is_cachedir_tag
 from topmark.utils.path import canonical_processing_path
 
 if TYPE_CHECKING:
@@ -154,6 +158,8 @@ def _read_input_paths_from_source(
 def _candidate_match_strings(
     path: Path,
     base: Path,
+    *,
+    is_dir: bool = False,
 ) -> tuple[str, ...]:
     """Return normalized gitignore-style candidate strings for a path.
 
@@ -161,24 +167,27 @@ def _candidate_match_strings(
     candidates are checked both without and with a trailing slash so patterns
     such as ``__pycache__/`` keep their directory-only semantics.
 
+    Both paths must already be resolved: this helper is pure path arithmetic and
+    performs no filesystem calls, because it runs once per candidate and matcher.
+
     Args:
-        path: Candidate path to test.
-        base: Base directory against which the candidate should be relativized.
+        path: Resolved candidate path to test.
+        base: Resolved base directory against which the candidate is relativized.
+        is_dir: Whether the candidate is a directory.
 
     Returns:
         One or more POSIX-style candidate strings to test against a compiled
         gitignore matcher.
     """
     try:
-        rel: Path = path.resolve().relative_to(base.resolve())
-        normalized: str = rel.as_posix()
-    except (OSError, ValueError):
-        normalized = path.resolve().as_posix()
+        normalized: str = path.relative_to(base).as_posix()
+    except ValueError:
+        normalized = path.as_posix()
 
     # PathSpec gitignore matching is path-string based. Directory-only rules such
     # as ``__pycache__/`` are most reliably honored when we also try a trailing
     # slash form for directory candidates.
-    if path.is_dir() and normalized:
+    if is_dir and normalized:
         slash_form: str = normalized.rstrip("/") + "/"
         return (normalized, slash_form)
     return (normalized,)
@@ -218,16 +227,18 @@ def _compile_matchers(
 def _matches_any(
     specs: list[tuple[GitIgnorePathSpec, Path]],
     path: Path,
+    *,
+    is_dir: bool = False,
 ) -> bool:
-    """Return True if `path` matches any compiled ``(spec, base)`` matcher.
+    """Return True if the resolved `path` matches any compiled ``(spec, base)`` matcher.
 
-    Each matcher evaluates the candidate relative to its own base directory.
-    Directory candidates are also tested with a trailing slash form so
-    gitignore-style directory rules continue to behave as expected.
+    Each matcher evaluates the candidate relative to its own (already resolved)
+    base directory. Directory candidates are also tested with a trailing slash
+    form so gitignore-style directory rules continue to behave as expected.
     """
     logger.debug("Matching %s to %r", path, specs)
     for spec, base in specs:
-        for candidate in _candidate_match_strings(path, base):
+        for candidate in _candidate_match_strings(path, base, is_dir=is_dir):
             if spec.match_file(candidate):
                 logger.debug(
                     "Matched path %s against base %s using candidate %s",
@@ -239,6 +250,65 @@ def _matches_any(
     return False
 
 
+@dataclass(kw_only=True, slots=True)
+class _DiscoveryCache:
+    """Filesystem facts recorded while walking directories for one resolution run.
+
+    Directory traversal learns, from `os.scandir()` entries, which candidates are
+    regular files and, for entries that are not symlinks, their canonical
+    processing path (the canonical parent directory joined with the on-disk entry
+    name). Later filter and finalization steps read those facts instead of issuing
+    one `stat()` and one full canonicalization per candidate. Paths not seen by
+    the walker (explicit files, glob hits, symlinks) fall back to the regular
+    filesystem queries, and their answers are memoized.
+
+    Attributes:
+        identities: Candidate path to canonical processing path.
+        files: Candidate paths known to be regular files.
+    """
+
+    identities: dict[Path, Path] = field(default_factory=lambda: {})
+    files: set[Path] = field(default_factory=lambda: set())
+
+    def record_file(self, path: Path, identity: Path | None) -> None:
+        """Record a regular file discovered by traversal.
+
+        Args:
+            path: Candidate path as spelled by traversal.
+            identity: Canonical processing path, or `None` when it still has to be
+                resolved (symlinked entries).
+        """
+        self.files.add(path)
+        if identity is not None:
+            self.identities[path] = identity
+
+    def is_file(self, path: Path) -> bool:
+        """Return whether `path` is a regular file, using traversal facts when known.
+
+        Args:
+            path: Candidate path.
+
+        Returns:
+            True if `path` is (or points to) a regular file.
+        """
+        return path in self.files or path.is_file()
+
+    def identity(self, path: Path) -> Path:
+        """Return the canonical processing path for an existing candidate.
+
+        Args:
+            path: Existing candidate path.
+
+        Returns:
+            The canonical processing path, computed at most once per candidate.
+        """
+        identity: Path | None = self.identities.get(path)
+        if identity is None:
+            identity = canonical_processing_path(path)
+            self.identities[path] = identity
+        return identity
+
+
 def _explicit_input_paths(config: FrozenConfig) -> list[Path]:
     """Return explicit path inputs supplied by the user.
 
@@ -349,14 +419,15 @@ def _is_excluded_by_path_filters(
         config.include_pattern_groups,
         config.include_from,
     )
-    if include_specs and not _matches_any(include_specs, path):
+    resolved: Path = path.resolve()
+    if include_specs and not _matches_any(include_specs, resolved):
         return True
 
     exclude_specs: list[tuple[GitIgnorePathSpec, Path]] = _compile_matchers(
         config.exclude_pattern_groups,
         config.exclude_from,
     )
-    return bool(exclude_specs and _matches_any(exclude_specs, path))
+    return bool(exclude_specs and _matches_any(exclude_specs, resolved))
 
 
 def _is_excluded_by_file_type_filters(
@@ -550,8 +621,60 @@ def _matches_any_file_type(
     return any(file_type.matches(path) for file_type in file_types)
 
 
+def _restrict_to_inputs(
+    changed_files: Sequence[Path],
+    input_paths: Sequence[Path],
+    *,
+    cache: _DiscoveryCache,
+    cwd: Path,
+) -> list[Path]:
+    """Return the changed files that lie within the explicit inputs.
+
+    Literal inputs select a changed file when it is that file or lies below that
+    directory. Glob inputs are matched with `fnmatch` against the CWD-relative
+    POSIX path of the changed file, so `*` also matches across `/`. Without
+    explicit inputs every changed file is kept.
+
+    Args:
+        changed_files: Existing changed files (absolute paths).
+        input_paths: Positional and `files_from` inputs.
+        cache: Discovery cache used to canonicalize paths once.
+        cwd: Resolved current working directory.
+
+    Returns:
+        Changed files selected by at least one input, in input order.
+    """
+    if not input_paths:
+        return list(changed_files)
+
+    roots: list[Path] = []
+    globs: list[str] = []
+    for raw in input_paths:
+        if "*" in str(raw):
+            globs.append(raw.as_posix())
+        elif raw.exists():
+            roots.append(cache.identity(raw))
+
+    kept: list[Path] = []
+    for path in changed_files:
+        identity: Path = cache.identity(path)
+        if any(identity == root or identity.is_relative_to(root) for root in roots):
+            kept.append(path)
+            continue
+        if globs:
+            try:
+                rel: str = identity.relative_to(cwd).as_posix()
+            except ValueError:
+                continue
+            if any(fnmatch.fnmatchcase(rel, pattern) for pattern in globs):
+                kept.append(path)
+    return kept
+
+
 def resolve_file_list_with_diagnostics(
     config: FrozenConfig,
+    *,
+    changed_files: Sequence[Path] | None = None,
 ) -> FileListResolution:
     """Return concrete input files plus discovery diagnostics.
 
@@ -579,8 +702,17 @@ def resolve_file_list_with_diagnostics(
          Selected paths represent TopMark's canonical processing paths, not
          necessarily the original CLI/config spelling.
 
+    When `changed_files` is given (incremental runs such as `--staged`), step 1 does
+    not walk or glob the filesystem: the candidate set is the changed files that
+    still exist, restricted to the positional and `files_from` inputs when there are
+    any (see `_restrict_to_inputs()`). Include globs do not seed candidates, and
+    glob inputs are not reported as unmatched. Steps 2-7 apply unchanged.
+
     Args:
         config: Effective layered configuration.
+        changed_files: Optional changed-file candidates (for example from
+            [`git_changed_files()`][topmark.resolution.git.git_changed_files]) that
+            replace directory traversal and glob expansion.
 
     Returns:
         A [FileListResolution][topmark.resolution.files.FileListResolution]
@@ -611,7 +743,9 @@ def resolve_file_list_with_diagnostics(
     if workspace_root is None:  # pragma: no cover - guarded by config defaults.
         workspace_root = Path.cwd()
 
-    cwd: Path = Path.cwd()
+    # Resolve once: the finalization step relativizes every selected identity.
+    cwd: Path = Path.cwd().resolve()
+    cache: _DiscoveryCache = _DiscoveryCache()
 
     if logger.isEnabledFor(TRACE_LEVEL):
         logger.trace(
@@ -649,15 +783,17 @@ def resolve_file_list_with_diagnostics(
         exclude_sources,
     )
 
-    def _is_excluded_dir(path: Path) -> bool:
+    def _is_excluded_dir(identity: Path) -> bool:
         """Return True if a directory should be pruned during traversal.
 
         This uses the same PathSpec semantics as the later exclude subtraction step,
         but is applied to directory paths so we can avoid descending into subtrees
         that would be entirely excluded anyway.
+
+        Args:
+            identity: Canonical processing path of the directory.
         """
-        identity: Path = canonical_processing_path(path)
-        return _matches_any(exclude_specs_all, identity)
+        return bool(exclude_specs_all) and _matches_any(exclude_specs_all, identity, is_dir=True)
 
     def _expand_path(p: Path) -> list[Path]:
         """Expand a base path into a list of files and directories.
@@ -673,29 +809,65 @@ def resolve_file_list_with_diagnostics(
         """
 
         def _walk_dir(root: Path) -> list[Path]:
-            """Walk a directory tree, pruning excluded subdirectories early."""
+            """Walk a directory tree, pruning excluded subdirectories early.
+
+            Like `os.walk()`, symlinked directories are not descended into and
+            unreadable directories are skipped. Directories holding a valid
+            `CACHEDIR.TAG` (such as TopMark's result cache) are skipped as a
+            whole. Only the root is canonicalized through the filesystem: below
+            it, a real directory's canonical path is its parent's canonical path
+            joined with the on-disk entry name, so only symlinked files need
+            their own resolution.
+            """
             out: list[Path] = []
 
             # If the root directory itself is excluded, skip its entire subtree.
-            if _is_excluded_dir(root):
+            root_identity: Path = canonical_processing_path(root)
+            if _is_excluded_dir(root_identity):
                 logger.debug("Skipping excluded root dir during expansion: %s", root)
                 return out
 
-            for dirpath, dirnames, filenames in os.walk(root):
-                dirpath_path: Path = Path(dirpath)
-
-                # Prune excluded subdirectories in-place so os.walk never enters them.
-                kept_dirnames: list[str] = []
-                for name in dirnames:
-                    subdir: Path = dirpath_path / name
-                    if _is_excluded_dir(subdir):
-                        logger.debug("Pruning excluded subdir during expansion: %s", subdir)
-                        continue
-                    kept_dirnames.append(name)
-                dirnames[:] = kept_dirnames
-
-                for fname in filenames:
-                    out.append(dirpath_path / fname)
+            pending: list[tuple[Path, Path]] = [(root, root_identity)]
+            while pending:
+                dir_path, dir_identity = pending.pop()
+                # Entries are collected per directory so that a cache directory tag
+                # seen anywhere in the listing discards the whole directory.
+                files: list[tuple[Path, Path | None]] = []
+                subdirs: list[tuple[Path, Path]] = []
+                is_cache_dir: bool = False
+                try:
+                    with os.scandir(dir_path) as entries:
+                        for entry in entries:
+                            entry_path: Path = dir_path / entry.name
+                            if entry.is_dir(follow_symlinks=False):
+                                subdir_identity: Path = dir_identity / entry.name
+                                # Prune excluded subdirectories so traversal never enters them.
+                                if _is_excluded_dir(subdir_identity):
+                                    logger.debug(
+                                        "Pruning excluded subdir during expansion: %s", entry_path
+                                    )
+                                    continue
+                                subdirs.append((entry_path, subdir_identity))
+                            elif entry.is_symlink():
+                                # Symlinked files are resolved later; symlinked
+                                # directories are not followed.
+                                if entry.is_file():
+                                    files.append((entry_path, None))
+                            elif entry.is_file(follow_symlinks=False):
+                                if entry.name == CACHEDIR_TAG_NAME and is_cachedir_tag(entry_path):
+                                    is_cache_dir = True
+                                    break
+                                files.append((entry_path, dir_identity / entry.name))
+                except OSError as exc:
+                    logger.debug("Skipping unreadable dir during expansion: %s (%s)", dir_path, exc)
+
+                if is_cache_dir:
+                    logger.debug("Skipping tagged cache dir during expansion: %s", dir_path)
+                    continue
+                for file_path, file_identity in files:
+                    cache.record_file(file_path, file_identity)
+                    out.append(file_path)
+                pending.extend(subdirs)
 
             return out
 
@@ -733,7 +905,8 @@ def resolve_file_list_with_diagnostics(
 
     # If there are no explicit inputs (positional or files-from) but include globs
     # were provided, expand them relative to the workspace root to seed candidates.
-    if not input_paths and include_pattern_groups:
+    # Incremental runs take their candidates from `changed_files` instead.
+    if changed_files is None and not input_paths and include_pattern_groups:
         # NOTE: This branch is reachable depending on CLI/config inputs;
         # some static analyzers may flag it falsely.
         expanded_from_includes: set[Path] = set()
@@ -758,19 +931,26 @@ def resolve_file_list_with_diagnostics(
     unmatched_patterns: list[str] = []
     missing_literals: list[Path] = []
 
-    for raw in input_paths:
-        p = Path(raw)
-        # Expand
-        expanded: list[Path] = _expand_path(p)
-        candidate_set.update(expanded)
-
-        # Report problems *after* expansion
-        if "*" in str(p):
-            if not expanded:
-                unmatched_patterns.append(p.as_posix())  # glob that matched nothing
-        else:
-            if not p.exists():
-                missing_literals.append(p)  # literal path that doesn't exist
+    if changed_files is not None:
+        existing_changes: list[Path] = [p for p in changed_files if cache.is_file(p)]
+        candidate_set.update(
+            _restrict_to_inputs(existing_changes, input_paths, cache=cache, cwd=cwd)
+        )
+        missing_literals.extend(p for p in input_paths if "*" not in str(p) and not p.exists())
+    else:
+        for raw in input_paths:
+            p = Path(raw)
+            # Expand
+            expanded: list[Path] = _expand_path(p)
+            candidate_set.update(expanded)
+
+            # Report problems *after* expansion
+            if "*" in str(p):
+                if not expanded:
+                    unmatched_patterns.append(p.as_posix())  # glob that matched nothing
+            else:
+                if not p.exists():
+                    missing_literals.append(p)  # literal path that doesn't exist
 
     # Emit warnings once (keeps logs tidy)
     if unmatched_patterns:
@@ -781,7 +961,7 @@ def resolve_file_list_with_diagnostics(
             logger.warning("No such file or directory: %s", ml)
 
     # Only keep files (drop directories) before filtering
-    candidate_set = {p for p in candidate_set if p.is_file()}
+    candidate_set = {p for p in candidate_set if cache.is_file(p)}
 
     # Step 3: Apply include intersection filter when at least one usable include
     # matcher exists. Empty pattern groups and unreadable include_from sources are
@@ -793,7 +973,7 @@ def resolve_file_list_with_diagnostics(
     if include_specs_all:
         kept: set[Path] = set()
         for p in candidate_set:
-            if _matches_any(include_specs_all, p):
+            if _matches_any(include_specs_all, cache.identity(p)):
                 kept.add(p)
         candidate_set = kept
 
@@ -802,7 +982,7 @@ def resolve_file_list_with_diagnostics(
     if exclude_specs_all:
         kept: set[Path] = set()
         for p in candidate_set:
-            if not _matches_any(exclude_specs_all, p):
+            if not _matches_any(exclude_specs_all, cache.identity(p)):
                 kept.add(p)
         candidate_set = kept
 
@@ -843,11 +1023,11 @@ def resolve_file_list_with_diagnostics(
     # so later pipeline steps generate stable metadata and avoid duplicate writes.
     out_by_identity: dict[Path, Path] = {}
     for p in filtered_paths:
-        identity: Path = canonical_processing_path(p)
+        identity: Path = cache.identity(p)
         try:
-            rel_to_cwd: Path = identity.relative_to(cwd.resolve())
+            rel_to_cwd: Path = identity.relative_to(cwd)
             rep: Path = rel_to_cwd
-        except (OSError, ValueError):
+        except ValueError:
             rep = identity  # keep absolute if not within CWD
         if identity not in out_by_identity:
             out_by_identity[identity] = rep
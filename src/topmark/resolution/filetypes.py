@@ -26,6 +26,12 @@ and selects at most one effective winner. Candidate overlap is therefore
 allowed, but the final selection must remain stable for the same path, content,
 and effective registry state.
 
+Name-based rules are looked up through a match index built once per composed
+registry snapshot (see `_FileTypeMatchIndex`). The index only narrows the set
+of file types evaluated for a path; signals, content gating, and scoring are
+still computed by the same helpers for every surviving candidate, so results
+are identical to a full scan of the registry.
+
 The module also constructs probe results for `topmark probe`. Probe result value
 objects live in [`topmark.resolution.probe`][topmark.resolution.probe], while the
 probe implementation remains here so it can share the exact same scoring and
@@ -52,7 +58,9 @@ from topmark.resolution.probe import ResolutionProbeStatus
 if TYPE_CHECKING:
     from collections.abc import Callable
     from collections.abc import Collection
+    from collections.abc import Iterable
     from collections.abc import Mapping
+    from collections.abc import Sequence
     from pathlib import Path
 
     from topmark.core.logging import TopmarkLogger
@@ -173,6 +181,8 @@ def _compute_match_signals(
     ft: FileType,
     base_name: str,
     path_str: str,
+    *,
+    compiled_patterns: Sequence[re.Pattern[str]] | None = None,
 ) -> MatchSignals:
     """Compute name-based match signals for a file type.
 
@@ -180,13 +190,14 @@ def _compute_match_signals(
         ft: File type whose rules are evaluated.
         base_name: Basename of the path (e.g., "settings.json").
         path_str: POSIX path string (used for tail matches like ".vscode/settings.json").
+        compiled_patterns: Optional precompiled form of `ft.patterns`. When
+            omitted, the pattern strings are matched with `re.fullmatch`.
 
     Returns:
         Booleans indicating extension, filename/tail, and pattern matches.
     """
     exts: list[str] = ft.extensions or []
     fnames: list[str] = ft.filenames or []
-    pats: list[str] = ft.patterns or []
     # Consider multi-dot extensions (e.g., ".d.ts") by checking the basename.
     ext_match: bool = any(base_name.endswith(ext) for ext in exts)
     fname_match = False
@@ -201,7 +212,11 @@ def _compute_match_signals(
             elif base_name == tail:
                 fname_match = True
                 break
-    pat_match: bool = any(re.fullmatch(p, base_name) is not None for p in pats)
+    pat_match: bool
+    if compiled_patterns is not None:
+        pat_match = any(regex.fullmatch(base_name) is not None for regex in compiled_patterns)
+    else:
+        pat_match = any(re.fullmatch(p, base_name) is not None for p in ft.patterns or [])
     return MatchSignals(
         extension=ext_match,
         filename=fname_match,
@@ -329,6 +344,366 @@ def _score_file_type_candidate(
     return s
 
 
+# --- Name-rule match index ---
+
+
+def _add_position(table: dict[str, list[int]], key: str, position: int) -> None:
+    """Append a registry position to a lookup table bucket, skipping duplicates."""
+    bucket: list[int] = table.setdefault(key, [])
+    if not bucket or bucket[-1] != position:
+        bucket.append(position)
+
+
+def _freeze_table(table: dict[str, list[int]]) -> dict[str, tuple[int, ...]]:
+    """Return a lookup table with immutable position buckets."""
+    return {key: tuple(positions) for key, positions in table.items()}
+
+
+_DEFAULT_PATTERN_FLAGS: int = re.compile("").flags
+_GROUP_REFERENCE_RE: re.Pattern[str] = re.compile(r"\\[0-9]|\(\?P[<=]|\(\?\(")
+_REGEX_METACHARACTERS: frozenset[str] = frozenset(".^$*+?{}[]\\|()")
+_REGEX_QUANTIFIERS: frozenset[str] = frozenset("*+?{")
+
+
+def _compile_patterns(ft: FileType) -> tuple[re.Pattern[str], ...] | None:
+    """Compile the basename patterns of a file type.
+
+    Args:
+        ft: File type whose patterns are compiled.
+
+    Returns:
+        The compiled patterns, or `None` when a pattern is not a valid regular
+        expression (the caller then keeps the uncompiled fallback path so the
+        error surfaces exactly as before).
+    """
+    try:
+        return tuple(re.compile(p) for p in ft.patterns or [])
+    except re.error:
+        return None
+
+
+def _is_combinable_pattern(regex: re.Pattern[str]) -> bool:
+    """Return whether a compiled pattern can be embedded in a combined alternation.
+
+    Plain capture groups are harmless inside the alternation, but patterns with
+    back-references or conditionals (whose group numbers would shift), named
+    groups (which may collide across patterns), or global inline flags (which
+    are only legal at the start of an expression) are kept out of the combined
+    regex and evaluated individually instead. The source check is conservative:
+    a false positive only costs an extra per-path evaluation.
+
+    Args:
+        regex: Compiled basename pattern.
+
+    Returns:
+        True if the pattern may be part of the combined alternation.
+    """
+    return (
+        regex.flags == _DEFAULT_PATTERN_FLAGS and _GROUP_REFERENCE_RE.search(regex.pattern) is None
+    )
+
+
+def _has_top_level_alternation(source: str) -> bool:
+    """Return whether a regular expression source contains a top-level `|`.
+
+    Args:
+        source: Regular expression source.
+
+    Returns:
+        True if an alternation outside any group or character class is present.
+    """
+    depth: int = 0
+    in_class: bool = False
+    i: int = 0
+    while i < len(source):
+        ch: str = source[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if in_class:
+            if ch == "]":
+                in_class = False
+        elif ch == "[":
+            in_class = True
+            # A leading `]` (optionally after `^`) is a literal class member.
+            if source[i + 1 : i + 2] == "^":
+                i += 1
+            if source[i + 1 : i + 2] == "]":
+                i += 1
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            return True
+        i += 1
+    return False
+
+
+def _literal_pattern_prefix(regex: re.Pattern[str]) -> str:
+    """Return the literal text every full match of a basename pattern starts with.
+
+    The scan is deliberately conservative: it stops at the first metacharacter,
+    at a character-class escape, and before any literal followed by a
+    quantifier, and it gives up entirely for top-level alternation or non-default
+    flags (e.g. `(?i)`). An empty result means "no usable prefix".
+
+    Args:
+        regex: Compiled basename pattern.
+
+    Returns:
+        The required literal prefix, possibly empty.
+    """
+    source: str = regex.pattern
+    if regex.flags != _DEFAULT_PATTERN_FLAGS or _has_top_level_alternation(source):
+        return ""
+    chars: list[str] = []
+    i: int = 0
+    while i < len(source):
+        ch: str = source[i]
+        if ch == "\\":
+            escaped: str = source[i + 1 : i + 2]
+            if not escaped or escaped.isalnum():
+                # Class escapes (`\d`), anchors (`\A`) and back-references.
+                break
+            literal, width = escaped, 2
+        elif ch in _REGEX_METACHARACTERS:
+            break
+        else:
+            literal, width = ch, 1
+        if source[i + width : i + width + 1] in _REGEX_QUANTIFIERS:
+            break
+        chars.append(literal)
+        i += width
+    return "".join(chars)
+
+
+def _may_match_without_name_rules(ft: FileType) -> bool:
+    """Return whether a file type can become a candidate without any name signal.
+
+    Mirrors `_should_probe_content` and `_should_include_candidate`: only a
+    callable content matcher behind `ContentGate.ALWAYS`, or behind
+    `ContentGate.IF_NONE` on a type without name rules, can include a file type
+    whose extension, filename, and pattern rules all miss.
+
+    Args:
+        ft: File type under evaluation.
+
+    Returns:
+        True if the file type must be evaluated for every path.
+    """
+    if not callable(ft.content_matcher or None):
+        return False
+    gate: ContentGate = ft.content_gate or ContentGate.NEVER
+    if gate is ContentGate.ALWAYS:
+        return True
+    if gate is ContentGate.IF_NONE:
+        return not ((ft.extensions or []) or (ft.filenames or []) or (ft.patterns or []))
+    return False
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _FileTypeMatchIndex:
+    """Precomputed name-rule lookup tables for one composed file type registry.
+
+    Lookup tables map rule values to registry positions, so the per-path cost
+    depends on the number of distinct rule lengths rather than on the number of
+    registered file types. Basename patterns are bucketed by their required
+    literal prefix where one exists; the remaining patterns share one combined
+    alternation that gates their individual evaluation. The index is a
+    pre-filter only: it returns a superset of the file types whose name rules
+    match a path, and the resolver still evaluates the regular match signals for
+    every returned position.
+
+    Attributes:
+        file_types: Registered file types in registry iteration order.
+        compiled_patterns: Compiled basename patterns per registry position, or
+            `None` where compilation failed.
+        suffixes: Extension value to registry positions.
+        suffix_lengths: Distinct extension lengths, longest first.
+        filenames: Exact basename rule to registry positions.
+        tails: Tail-subpath rule (containing `/`) to registry positions.
+        tail_lengths: Distinct tail-subpath rule lengths, longest first.
+        pattern_prefixes: Literal pattern prefix to registry positions.
+        pattern_prefix_lengths: Distinct literal pattern prefix lengths.
+        pattern_regex: Alternation of the combinable patterns without a literal
+            prefix, or `None` when there are none.
+        pattern_positions: Positions owning at least one pattern in
+            `pattern_regex`.
+        always: Positions evaluated for every path (content-only matches and
+            file types with patterns that cannot be pre-filtered).
+    """
+
+    file_types: tuple[FileType, ...]
+    compiled_patterns: tuple[tuple[re.Pattern[str], ...] | None, ...]
+    suffixes: Mapping[str, tuple[int, ...]]
+    suffix_lengths: tuple[int, ...]
+    filenames: Mapping[str, tuple[int, ...]]
+    tails: Mapping[str, tuple[int, ...]]
+    tail_lengths: tuple[int, ...]
+    pattern_prefixes: Mapping[str, tuple[int, ...]]
+    pattern_prefix_lengths: tuple[int, ...]
+    pattern_regex: re.Pattern[str] | None
+    pattern_positions: tuple[int, ...]
+    always: tuple[int, ...]
+
+    @classmethod
+    def build(cls, file_types: Iterable[FileType]) -> _FileTypeMatchIndex:
+        """Build the index from file types in registry iteration order.
+
+        Args:
+            file_types: Registered file types.
+
+        Returns:
+            The match index.
+        """
+        ordered: tuple[FileType, ...] = tuple(file_types)
+        compiled: list[tuple[re.Pattern[str], ...] | None] = []
+        suffixes: dict[str, list[int]] = {}
+        filenames: dict[str, list[int]] = {}
+        tails: dict[str, list[int]] = {}
+        prefixes: dict[str, list[int]] = {}
+        combined_sources: list[str] = []
+        pattern_positions: list[int] = []
+        always: list[int] = []
+
+        for position, ft in enumerate(ordered):
+            evaluate_always: bool = _may_match_without_name_rules(ft)
+
+            for ext in ft.extensions or []:
+                if not ext:
+                    # An empty extension matches every basename.
+                    evaluate_always = True
+                    continue
+                _add_position(suffixes, ext, position)
+
+            for fname in ft.filenames or []:
+                tail: str = fname.replace("\\", "/")
+                if not tail:
+                    evaluate_always = True
+                elif "/" in tail:
+                    _add_position(tails, tail, position)
+                else:
+                    _add_position(filenames, tail, position)
+
+            patterns: tuple[re.Pattern[str], ...] | None = _compile_patterns(ft)
+            compiled.append(patterns)
+            if patterns is None:
+                evaluate_always = True
+            else:
+                for regex in patterns:
+                    prefix: str = _literal_pattern_prefix(regex)
+                    if prefix:
+                        _add_position(prefixes, prefix, position)
+                    elif _is_combinable_pattern(regex):
+                        combined_sources.append(regex.pattern)
+                        if not pattern_positions or pattern_positions[-1] != position:
+                            pattern_positions.append(position)
+                    else:
+                        evaluate_always = True
+
+            if evaluate_always:
+                always.append(position)
+
+        pattern_regex: re.Pattern[str] | None = None
+        if combined_sources:
+            try:
+                pattern_regex = re.compile("|".join(f"(?:{src})" for src in combined_sources))
+            except re.error:
+                # Should not happen for individually valid, group-free patterns;
+                # fall back to evaluating every pattern-bearing type directly.
+                always = sorted({*always, *pattern_positions})
+                pattern_positions = []
+
+        return cls(
+            file_types=ordered,
+            compiled_patterns=tuple(compiled),
+            suffixes=_freeze_table(suffixes),
+            suffix_lengths=tuple(sorted({len(ext) for ext in suffixes}, reverse=True)),
+            filenames=_freeze_table(filenames),
+            tails=_freeze_table(tails),
+            tail_lengths=tuple(sorted({len(tail) for tail in tails}, reverse=True)),
+            pattern_prefixes=_freeze_table(prefixes),
+            pattern_prefix_lengths=tuple(sorted({len(prefix) for prefix in prefixes})),
+            pattern_regex=pattern_regex,
+            pattern_positions=tuple(pattern_positions),
+            always=tuple(always),
+        )
+
+    def candidate_positions(self, base_name: str, path_str: str) -> list[int]:
+        """Return registry positions of file types that may match a path.
+
+        Args:
+            base_name: Basename of the path.
+            path_str: POSIX path string of the path.
+
+        Returns:
+            Sorted registry positions; a superset of the file types with at least
+            one name signal or a name-independent content probe.
+        """
+        positions: set[int] = set(self.always)
+
+        name_len: int = len(base_name)
+        for length in self.suffix_lengths:
+            if length > name_len:
+                continue
+            hits: tuple[int, ...] | None = self.suffixes.get(base_name[-length:])
+            if hits:
+                positions.update(hits)
+
+        exact: tuple[int, ...] | None = self.filenames.get(base_name)
+        if exact:
+            positions.update(exact)
+
+        path_len: int = len(path_str)
+        for length in self.tail_lengths:
+            if length > path_len:
+                continue
+            hits = self.tails.get(path_str[-length:])
+            if hits:
+                positions.update(hits)
+
+        for length in self.pattern_prefix_lengths:
+            if length > name_len:
+                break
+            hits = self.pattern_prefixes.get(base_name[:length])
+            if hits:
+                positions.update(hits)
+
+        if self.pattern_regex is not None and self.pattern_regex.fullmatch(base_name):
+            positions.update(self.pattern_positions)
+
+        return sorted(positions)
+
+
+_match_index_cache: tuple[Mapping[str, FileType], _FileTypeMatchIndex] | None = None
+
+
+def _get_file_type_match_index(ft_registry: Mapping[str, FileType]) -> _FileTypeMatchIndex:
+    """Return the match index for a composed file type registry mapping.
+
+    `FileTypeRegistry.as_mapping()` returns the same read-only mapping until the
+    registry changes, so the index is cached against that mapping's identity and
+    rebuilt whenever registration, unregistration, or overlay changes produce a
+    new snapshot.
+
+    Args:
+        ft_registry: Composed file type registry mapping.
+
+    Returns:
+        The match index for `ft_registry`.
+    """
+    global _match_index_cache
+
+    cached: tuple[Mapping[str, FileType], _FileTypeMatchIndex] | None = _match_index_cache
+    if cached is not None and cached[0] is ft_registry:
+        return cached[1]
+    index: _FileTypeMatchIndex = _FileTypeMatchIndex.build(ft_registry.values())
+    _match_index_cache = (ft_registry, index)
+    logger.debug("Built file type match index for %d file type(s)", len(index.file_types))
+    return index
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class _ProbeCandidateDraft:
     """Internal candidate draft preserving probe match signals before final ranking."""
@@ -358,11 +733,13 @@ def _get_probe_candidate_drafts_for_path(
     drafts: list[_ProbeCandidateDraft] = []
 
     ft_registry: Mapping[str, FileType] = FileTypeRegistry.as_mapping()
+    index: _FileTypeMatchIndex = _get_file_type_match_index(ft_registry)
 
     effective_include: Collection[str] | None = include_file_types or None
     effective_exclude: Collection[str] | None = exclude_file_types or None
 
-    for ft in ft_registry.values():
+    for position in index.candidate_positions(base_name, path_str):
+        ft: FileType = index.file_types[position]
         if effective_include is not None and not _matches_file_type_filter(
             ft,
             effective_include,
@@ -374,7 +751,12 @@ def _get_probe_candidate_drafts_for_path(
         ):
             continue
 
-        sig: MatchSignals = _compute_match_signals(ft, base_name, path_str)
+        sig: MatchSignals = _compute_match_signals(
+            ft,
+            base_name,
+            path_str,
+            compiled_patterns=index.compiled_patterns[position],
+        )
         should_probe: bool = _should_probe_content(ft, sig)
 
         cm: Callable[[Path], bool] | None = ft.content_matcher or None
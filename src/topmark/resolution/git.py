@@ -0,0 +1,147 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : git.py
+#   file_relpath : src/topmark/resolution/git.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Changed-file candidates obtained from a local git repository.
+
+Incremental runs (`--changed-since REV`, `--staged`) take their candidate files
+from git instead of walking the input tree. This module asks the local `git`
+executable for the changed paths; it never contacts a remote. The returned paths
+are only candidates: [`topmark.resolution.files`][topmark.resolution.files] still
+applies positional inputs, include/exclude patterns, and file-type filters.
+
+Only added, copied, modified, renamed, and type-changed paths are returned.
+Deleted paths have nothing to process, and untracked files are not reported by
+`git diff`.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+
+from topmark.core.errors import GitSelectionError
+from topmark.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from topmark.core.logging import TopmarkLogger
+
+
+logger: TopmarkLogger = get_logger(__name__)
+
+_GIT_EXECUTABLE: Final[str] = "git"
+
+_CHANGED_DIFF_FILTER: Final[str] = "ACMRT"
+"""`git diff --diff-filter` letters for paths that still exist after the change."""
+
+
+def _run_git(args: list[str], *, cwd: Path) -> bytes:
+    """Run one git command and return its standard output.
+
+    Optional locks are disabled so read-only queries never take the index lock of
+    a repository that another git process (for example a pre-commit hook runner)
+    is using.
+
+    Args:
+        args: Arguments passed to git after the executable name.
+        cwd: Directory in which git is invoked.
+
+    Returns:
+        Raw standard output.
+
+    Raises:
+        GitSelectionError: If git is not installed or exits with a non-zero status.
+    """
+    env: dict[str, str] = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+    try:
+        completed: subprocess.CompletedProcess[bytes] = subprocess.run(  # noqa: S603 - fixed argv, no shell
+            [_GIT_EXECUTABLE, *args],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            check=False,
+        )
+    except FileNotFoundError as exc:
+        raise GitSelectionError(
+            message="Cannot select changed files: the git executable was not found.",
+            path=cwd,
+        ) from exc
+
+    if completed.returncode != 0:
+        stderr: str = completed.stderr.decode("utf-8", errors="replace").strip()
+        first_line: str = (
+            stderr.splitlines()[0] if stderr else f"exit status {completed.returncode}"
+        )
+        raise GitSelectionError(
+            message=f"Cannot select changed files: git {args[0]} failed: {first_line}",
+            path=cwd,
+            details=tuple(stderr.splitlines()),
+        )
+    return completed.stdout
+
+
+def git_changed_files(
+    *,
+    cwd: Path,
+    since: str | None = None,
+    staged: bool = False,
+) -> tuple[Path, ...]:
+    """Return files changed in the git work tree that contains `cwd`.
+
+    - `since` only: changes between revision `since` and the working tree
+      (committed and uncommitted changes).
+    - `staged` only: changes staged in the index relative to `HEAD`.
+    - both: changes staged in the index relative to revision `since`.
+
+    Args:
+        cwd: Directory inside the git work tree.
+        since: Revision to compare against, or `None`.
+        staged: Compare the index instead of the working tree.
+
+    Returns:
+        Absolute paths of changed files that still exist in the compared tree,
+        sorted and without duplicates.
+
+    Raises:
+        ValueError: If neither `since` nor `staged` is given.
+    """  # noqa: DOC503 - GitSelectionError propagates from _run_git()
+    if since is None and not staged:
+        raise ValueError("git_changed_files() requires `since`, `staged`, or both.")
+
+    toplevel_raw: bytes = _run_git(["rev-parse", "--show-toplevel"], cwd=cwd)
+    toplevel: Path = Path(os.fsdecode(toplevel_raw).rstrip("\n"))
+
+    args: list[str] = [
+        "diff",
+        "--name-only",
+        "-z",
+        "--no-ext-diff",
+        f"--diff-filter={_CHANGED_DIFF_FILTER}",
+    ]
+    if staged:
+        args.append("--cached")
+    if since is not None:
+        # `--end-of-options` keeps a revision starting with `-` from being read as an option.
+        args += ["--end-of-options", since]
+    args.append("--")
+
+    output: bytes = _run_git(args, cwd=toplevel)
+    names: list[str] = [os.fsdecode(name) for name in output.split(b"\0") if name]
+    changed: tuple[Path, ...] = tuple(sorted({toplevel / name for name in names}))
+    logger.debug(
+        "git reported %d changed file(s) in %s (since=%s, staged=%s)",
+        len(changed),
+        toplevel,
+        since,
+        staged,
+    )
+    return changed
@@ -30,9 +30,11 @@ from topmark.utils.timestamp import get_utc_now
 
 if TYPE_CHECKING:
     from datetime import datetime
+    from pathlib import Path
 
     from topmark.config.types import FileWriteStrategy
     from topmark.config.types import OutputTarget
+    from topmark.config.types import WriteDurability
     from topmark.pipeline.kinds import PipelineKindLiteral
 
 
@@ -75,11 +77,21 @@ class RunOptions:
         output_target: Where output should be emitted for this run.
         file_write_strategy: How file writes should be performed when
             `output_target` targets files.
+        write_durability: When atomic file writes sync their directory entries;
+            `None` selects the default batched mode.
         stdin_mode: Whether content is being provided on stdin for this run.
         stdin_filename: Synthetic filename associated with stdin content, used
             when header generation requires a file identity.
+        stdin_content: Raw file content read from STDIN in content mode. When set,
+            the pipeline reads it from memory instead of opening the file.
         prune_views: If True, release consumed volatile views between pipeline steps.
         emit_diff: Whether to emit diffs.
+        jobs: Number of worker processes used to execute the pipeline. `1`
+            runs every file sequentially in the calling process; `0` selects
+            one worker per available CPU.
+        result_cache_dir: Directory of the persistent result cache, or `None`
+            to disable result caching for this run.
+        profile: Whether to record per-step timings for each processed file.
         started_at: Timestamp captured once for the whole run.
     """
 
@@ -87,10 +99,15 @@ class RunOptions:
     apply_changes: bool | None = None
     output_target: OutputTarget | None = None
     file_write_strategy: FileWriteStrategy | None = None
+    write_durability: WriteDurability | None = None
     stdin_mode: bool = False
     stdin_filename: str | None = None
+    stdin_content: bytes | None = field(default=None, repr=False)
     prune_views: bool = True
     emit_diff: bool = False
+    jobs: int = 1
+    result_cache_dir: Path | None = None
+    profile: bool = False
 
     started_at: datetime = field(default_factory=get_utc_now)
 
@@ -103,7 +120,11 @@ class RunOptions:
         file_write_strategy: FileWriteStrategy | None = None,
         stdin_mode: bool = False,
         stdin_filename: str | None = None,
+        stdin_content: bytes | None = None,
         prune_views: bool = True,
+        jobs: int = 1,
+        result_cache_dir: Path | None = None,
+        profile: bool = False,
         started_at: datetime | None = None,
     ) -> RunOptions:
         """Build runtime options from a selected pipeline.
@@ -129,7 +150,13 @@ class RunOptions:
                 `output_target` targets files.
             stdin_mode: Whether content is being provided on stdin for this run.
             stdin_filename: Synthetic filename associated with stdin content.
+            stdin_content: Raw file content read from STDIN in content mode.
             prune_views: If True, release consumed volatile views between pipeline steps.
+            jobs: Number of worker processes used to execute the pipeline
+                (`1` = sequential, `0` = one worker per available CPU).
+            result_cache_dir: Directory of the persistent result cache, or
+                `None` to disable result caching.
+            profile: Whether to record per-step timings for each processed file.
             started_at: Optional timestamp captured once for the whole run. When
                 omitted, the normal `RunOptions` timestamp factory is used.
 
@@ -142,9 +169,13 @@ class RunOptions:
             apply_changes=selection.apply,
             stdin_mode=stdin_mode,
             stdin_filename=stdin_filename,
+            stdin_content=stdin_content,
             output_target=output_target,
             file_write_strategy=file_write_strategy,
             prune_views=prune_views,
             emit_diff=selection.diff,
+            jobs=jobs,
+            result_cache_dir=result_cache_dir,
+            profile=profile,
             started_at=started_at or get_utc_now(),
         )
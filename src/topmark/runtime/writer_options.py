@@ -28,6 +28,7 @@ from topmark.toml.utils import insert_if_present
 
 if TYPE_CHECKING:
     from topmark.config.types import FileWriteStrategy
+    from topmark.config.types import WriteDurability
     from topmark.runtime.model import RunOptions
     from topmark.toml.types import TomlTable
 
@@ -40,9 +41,13 @@ class WriterOptions:
         file_write_strategy: Preferred file write strategy declared in the
             `[writer]` table. `None` means that the TOML source does not
             specify a writer preference.
+        durability: When atomic writes sync their directory entries, declared
+            in the `[writer]` table. `None` means that the TOML source does not
+            specify a durability preference.
     """
 
     file_write_strategy: FileWriteStrategy | None = None
+    durability: WriteDurability | None = None
 
 
 def apply_resolved_writer_options(
@@ -54,12 +59,15 @@ def apply_resolved_writer_options(
     Persisted writer preferences are applied only when the invocation has not
     already selected a conflicting execution-only output mode.
 
-    Precedence:
+    Precedence for the file write strategy:
         1. explicit runtime output routing (for example STDOUT)
         2. explicit runtime file write strategy
         3. resolved TOML writer preference
         4. otherwise keep the original runtime options unchanged
 
+    The durability preference does not change output routing and applies
+    whenever the invocation has not selected one explicitly.
+
     Args:
         run_options: Execution-only runtime options for the current run.
         writer_options: Resolved persisted writer preferences, if any.
@@ -68,7 +76,13 @@ def apply_resolved_writer_options(
         Runtime options with the resolved writer preference applied when doing
         so does not conflict with explicit runtime intent.
     """
-    if writer_options is None or writer_options.file_write_strategy is None:
+    if writer_options is None:
+        return run_options
+
+    if writer_options.durability is not None and run_options.write_durability is None:
+        run_options = replace(run_options, write_durability=writer_options.durability)
+
+    if writer_options.file_write_strategy is None:
         return run_options
 
     if run_options.apply_changes is not True:
@@ -113,6 +127,11 @@ def writer_options_to_toml_table(
         Toml.KEY_STRATEGY,
         writer_options.file_write_strategy,
     )
+    insert_if_present(
+        writer_tbl,
+        Toml.KEY_DURABILITY,
+        writer_options.durability,
+    )
 
     if not writer_tbl:
         return {}
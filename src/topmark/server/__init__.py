@@ -0,0 +1,30 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : __init__.py
+#   file_relpath : src/topmark/server/__init__.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Long-lived TopMark server (`topmark serve`) and its thin client.
+
+Editor integrations and pre-commit hooks invoke TopMark on a handful of files at
+a time, so most of each short-lived run is spent importing modules, building the
+file type and processor registries, and discovering and parsing config files.
+The server pays those costs once and answers `check`, `strip`, and `probe`
+requests (for paths or in-memory buffers) through the public
+[`topmark.api`][topmark.api] functions:
+
+- [`topmark.server.protocol`][topmark.server.protocol]: newline-delimited
+  JSON-RPC 2.0 framing, error codes, and the default socket path.
+- [`topmark.server.service`][topmark.server.service]: request dispatch with warm
+  registries and an mtime-invalidated TOML source cache.
+- [`topmark.server.transport`][topmark.server.transport]: Unix-socket and stdio
+  serving loops.
+- [`topmark.server.client`][topmark.server.client]: client that talks to a running
+  server and falls back to in-process execution when none is available.
+"""
+
+from __future__ import annotations
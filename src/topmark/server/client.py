@@ -0,0 +1,215 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : client.py
+#   file_relpath : src/topmark/server/client.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Thin client of the TopMark server.
+
+[`TopmarkClient`][topmark.server.client.TopmarkClient] sends one JSON-RPC request
+per connection to a running `topmark serve --socket` process. When no server is
+listening and fallback is enabled (the default), the request is answered by an
+in-process [`TopmarkService`][topmark.server.service.TopmarkService] instead, so
+callers get the same JSON results either way.
+
+Requests default `cwd` to the client's working directory, so relative paths and
+config discovery behave as if TopMark ran in the caller's process.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from topmark.core.errors import ServerRequestError
+from topmark.core.errors import ServerUnavailableError
+from topmark.core.logging import get_logger
+from topmark.core.typing_guards import as_object_dict
+from topmark.core.typing_guards import is_mapping
+from topmark.server.protocol import INTERNAL_ERROR
+from topmark.server.protocol import default_socket_path
+from topmark.server.protocol import encode_message
+from topmark.server.protocol import make_request
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from topmark.core.logging import TopmarkLogger
+    from topmark.server.service import TopmarkService
+
+logger: TopmarkLogger = get_logger(__name__)
+
+
+class TopmarkClient:
+    """Send requests to a TopMark server, falling back to in-process execution.
+
+    Attributes:
+        socket_path: Unix socket of the server.
+        fallback: Whether to answer requests in-process when no server listens.
+        timeout: Socket timeout in seconds (`None` blocks).
+        used_fallback: True if the last request was answered in-process.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        *,
+        fallback: bool = True,
+        timeout: float | None = None,
+    ) -> None:
+        self.socket_path: Path = socket_path if socket_path is not None else default_socket_path()
+        self.fallback: bool = fallback
+        self.timeout: float | None = timeout
+        self.used_fallback: bool = False
+        self._next_id: int = 0
+        self._local: TopmarkService | None = None
+
+    def check(self, paths: Sequence[str | Path], **params: object) -> dict[str, object]:
+        """Run `check` for paths (or a buffer via `content=`).
+
+        Args:
+            paths: Files and/or directories to process.
+            **params: Further request parameters (`content`, `apply`, `diff`,
+                `report`, `config`, `policy`, ...).
+
+        Returns:
+            The `result` object and, for apply runs on a buffer, the updated `content`.
+        """
+        return self._call_paths("check", paths, params)
+
+    def strip(self, paths: Sequence[str | Path], **params: object) -> dict[str, object]:
+        """Run `strip` for paths (or a buffer via `content=`).
+
+        Args:
+            paths: Files and/or directories to process.
+            **params: Further request parameters, as for `check()`.
+
+        Returns:
+            The `result` object and, for apply runs on a buffer, the updated `content`.
+        """
+        return self._call_paths("strip", paths, params)
+
+    def probe(self, paths: Sequence[str | Path], **params: object) -> dict[str, object]:
+        """Run `probe` for paths (or a buffer via `content=`).
+
+        Args:
+            paths: Files and/or directories to probe.
+            **params: Further request parameters (`content`, `config`, `policy`, ...).
+
+        Returns:
+            The `result` object.
+        """
+        return self._call_paths("probe", paths, params)
+
+    def ping(self) -> dict[str, object]:
+        """Return the server's version, request count, and config-cache counters."""
+        return self._as_object(self.request("ping", {}))
+
+    def shutdown(self) -> None:
+        """Ask the server to stop after answering this request."""
+        self.request("shutdown", {})
+
+    def request(self, method: str, params: Mapping[str, object]) -> object:
+        """Send one request and return its result.
+
+        Args:
+            method: JSON-RPC method name.
+            params: Named request parameters.
+
+        Returns:
+            The `result` member of the response.
+
+        Raises:
+            ServerRequestError: If the server answers with an error response.
+            ServerUnavailableError: If no server listens and fallback is disabled.
+        """
+        self._next_id += 1
+        request: dict[str, object] = make_request(method, params, request_id=self._next_id)
+        try:
+            response: object = self._send(request)
+            self.used_fallback = False
+        except ServerUnavailableError:
+            if not self.fallback:
+                raise
+            logger.debug("No TopMark server on %s; running %s in-process", self.socket_path, method)
+            response = self._local_service().handle(request)
+            self.used_fallback = True
+
+        if not is_mapping(response):
+            raise ServerRequestError(message="malformed server response", code=INTERNAL_ERROR)
+        message: dict[str, object] = as_object_dict(response)
+        if "error" in message:
+            error: dict[str, object] = as_object_dict(message["error"])
+            code: object = error.get("code")
+            raise ServerRequestError(
+                message=str(error.get("message")),
+                code=code if isinstance(code, int) else INTERNAL_ERROR,
+            )
+        return message.get("result")
+
+    def _call_paths(
+        self,
+        method: str,
+        paths: Sequence[str | Path],
+        params: Mapping[str, object],
+    ) -> dict[str, object]:
+        request_params: dict[str, object] = {"cwd": str(Path.cwd()), **params}
+        request_params["paths"] = [str(path) for path in paths]
+        return self._as_object(self.request(method, request_params))
+
+    def _send(self, request: Mapping[str, object]) -> object:
+        """Send `request` over the socket and read one response line.
+
+        Only a failed connection is reported as unavailability: once the request
+        was sent, the server may have acted on it, so running it again in-process
+        would not be safe.
+
+        Raises:
+            ServerUnavailableError: If the socket cannot be reached.
+            ServerRequestError: If the connection fails after the request was sent.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise ServerUnavailableError(
+                message="Unix sockets are not supported on this platform",
+                path=self.socket_path,
+            )
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError as exc:
+                raise ServerUnavailableError(
+                    message=f"Cannot reach TopMark server: {exc}",
+                    path=self.socket_path,
+                ) from exc
+            try:
+                sock.sendall(encode_message(request))
+                with sock.makefile("rb") as stream:
+                    line: bytes = stream.readline()
+                return json.loads(line)
+            except (OSError, ValueError) as exc:
+                raise ServerRequestError(
+                    message=f"No valid response from TopMark server: {exc}",
+                    code=INTERNAL_ERROR,
+                ) from exc
+
+    def _local_service(self) -> TopmarkService:
+        if self._local is None:
+            # Imported lazily: the in-process service pulls in the whole pipeline.
+            from topmark.server.service import TopmarkService
+
+            self._local = TopmarkService()
+        return self._local
+
+    @staticmethod
+    def _as_object(result: object) -> dict[str, object]:
+        if not is_mapping(result):
+            raise ServerRequestError(message="unexpected result type", code=INTERNAL_ERROR)
+        return as_object_dict(result)
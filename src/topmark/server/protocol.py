@@ -0,0 +1,143 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : protocol.py
+#   file_relpath : src/topmark/server/protocol.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Wire protocol of the TopMark server.
+
+Messages are JSON-RPC 2.0 objects, one per line (newline-delimited JSON) in both
+directions, on a Unix socket or on stdin/stdout. Requests carry a `method`
+(`check`, `strip`, `probe`, `ping`, or `shutdown`) and an object of named
+`params`; notifications (requests without an `id`) receive no response.
+
+Result values are plain JSON: public API result dataclasses are converted with
+[`to_json_value()`][topmark.server.protocol.to_json_value].
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import tempfile
+from dataclasses import asdict
+from dataclasses import is_dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+
+from topmark.core.machine.schemas import normalize_payload
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+JSONRPC_VERSION: Final = "2.0"
+
+# Standard JSON-RPC 2.0 error codes.
+PARSE_ERROR: Final = -32700
+INVALID_REQUEST: Final = -32600
+METHOD_NOT_FOUND: Final = -32601
+INVALID_PARAMS: Final = -32602
+INTERNAL_ERROR: Final = -32603
+
+# Implementation-defined: a TopMark error raised while running the request.
+TOPMARK_ERROR: Final = -32000
+
+SOCKET_NAME: Final = "topmark.sock"
+
+
+def default_socket_path() -> Path:
+    """Return the per-user default socket path of `topmark serve`.
+
+    The socket lives in a user-specific directory below the system temporary
+    directory so that servers of different users never collide.
+
+    Returns:
+        The default Unix socket path.
+    """
+    return Path(tempfile.gettempdir()) / f"topmark-{getpass.getuser()}" / SOCKET_NAME
+
+
+def to_json_value(obj: object) -> object:
+    """Convert a result value (including API dataclasses) to plain JSON data.
+
+    Args:
+        obj: Value to convert.
+
+    Returns:
+        A JSON-serializable representation of `obj`.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return normalize_payload(asdict(obj))
+    return normalize_payload(obj)
+
+
+def encode_message(message: Mapping[str, object]) -> bytes:
+    """Encode one JSON-RPC message as a newline-terminated UTF-8 line.
+
+    Args:
+        message: JSON-RPC request or response object.
+
+    Returns:
+        The encoded message line.
+    """
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def make_request(
+    method: str,
+    params: Mapping[str, object],
+    *,
+    request_id: int,
+) -> dict[str, object]:
+    """Build a JSON-RPC request object.
+
+    Args:
+        method: Method name.
+        params: Named request parameters.
+        request_id: Request identifier echoed in the response.
+
+    Returns:
+        The request object.
+    """
+    return {
+        "jsonrpc": JSONRPC_VERSION,
+        "id": request_id,
+        "method": method,
+        "params": dict(params),
+    }
+
+
+def make_result(request_id: object, result: object) -> dict[str, object]:
+    """Build a JSON-RPC success response.
+
+    Args:
+        request_id: Identifier of the answered request.
+        result: JSON-serializable result value.
+
+    Returns:
+        The response object.
+    """
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": result}
+
+
+def make_error(request_id: object, *, code: int, message: str) -> dict[str, object]:
+    """Build a JSON-RPC error response.
+
+    Args:
+        request_id: Identifier of the failed request (`None` if unknown).
+        code: JSON-RPC error code.
+        message: Human-readable error message.
+
+    Returns:
+        The response object.
+    """
+    return {
+        "jsonrpc": JSONRPC_VERSION,
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
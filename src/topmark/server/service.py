@@ -0,0 +1,325 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : service.py
+#   file_relpath : src/topmark/server/service.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Request dispatch of the TopMark server.
+
+[`TopmarkService`][topmark.server.service.TopmarkService] turns JSON-RPC requests
+into calls of the public [`check()`][topmark.api.check],
+[`strip()`][topmark.api.strip], and [`probe()`][topmark.api.probe] functions.
+
+What stays warm between requests:
+
+- the file type, processor, and binding registries (process-global; built once
+  by [`TopmarkService.warm()`][topmark.server.service.TopmarkService.warm]);
+- split-parsed TOML config sources, held in a
+  [`TomlSourceCache`][topmark.toml.loaders.TomlSourceCache] keyed by file
+  modification time, size, and inode. Config discovery still runs for every
+  request, so new, deleted, and edited config files are always honored; only
+  the parsing of unchanged files is skipped.
+
+Requests run one at a time: a request may change the working directory (`cwd`)
+and captures standard output (where apply runs on buffers emit their result).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import cast
+
+from topmark.api import check
+from topmark.api import probe
+from topmark.api import strip
+from topmark.core.constants import TOPMARK_VERSION
+from topmark.core.errors import InvalidContentInputError
+from topmark.core.errors import InvalidPolicyError
+from topmark.core.errors import InvalidReportScopeError
+from topmark.core.errors import ServerRequestError
+from topmark.core.errors import TopmarkError
+from topmark.core.logging import get_logger
+from topmark.core.typing_guards import as_object_dict
+from topmark.core.typing_guards import is_mapping
+from topmark.core.typing_guards import is_str_list
+from topmark.registry.registry import Registry
+from topmark.server.protocol import INTERNAL_ERROR
+from topmark.server.protocol import INVALID_PARAMS
+from topmark.server.protocol import INVALID_REQUEST
+from topmark.server.protocol import JSONRPC_VERSION
+from topmark.server.protocol import METHOD_NOT_FOUND
+from topmark.server.protocol import TOPMARK_ERROR
+from topmark.server.protocol import make_error
+from topmark.server.protocol import make_result
+from topmark.server.protocol import to_json_value
+from topmark.toml.loaders import TomlSourceCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Generator
+    from collections.abc import Mapping
+
+    from topmark.api.types import PublicPolicy
+    from topmark.core.logging import TopmarkLogger
+
+logger: TopmarkLogger = get_logger(__name__)
+
+_CONTENT_PARAMS: frozenset[str] = frozenset(
+    {
+        "paths",
+        "content",
+        "cwd",
+        "apply",
+        "diff",
+        "report",
+        "config",
+        "policy",
+        "policy_by_type",
+        "include_file_types",
+        "exclude_file_types",
+    }
+)
+_PROBE_PARAMS: frozenset[str] = _CONTENT_PARAMS - {"apply", "diff", "report"}
+
+# Errors caused by invalid request arguments rather than by the run itself.
+_INVALID_ARGUMENT_ERRORS: tuple[type[TopmarkError], ...] = (
+    InvalidContentInputError,
+    InvalidPolicyError,
+    InvalidReportScopeError,
+)
+
+
+def _invalid_params(message: str) -> ServerRequestError:
+    return ServerRequestError(message=message, code=INVALID_PARAMS)
+
+
+def _get_bool(params: Mapping[str, object], key: str) -> bool:
+    value: object = params.get(key, False)
+    if not isinstance(value, bool):
+        raise _invalid_params(f"{key} must be a boolean")
+    return value
+
+
+def _get_str(params: Mapping[str, object], key: str) -> str | None:
+    value: object = params.get(key)
+    if value is not None and not isinstance(value, str):
+        raise _invalid_params(f"{key} must be a string")
+    return value
+
+
+def _get_str_list(params: Mapping[str, object], key: str) -> list[str] | None:
+    value: object = params.get(key)
+    if value is None:
+        return None
+    if not is_str_list(value):
+        raise _invalid_params(f"{key} must be a list of strings")
+    return list(value)
+
+
+def _get_mapping(params: Mapping[str, object], key: str) -> dict[str, object] | None:
+    value: object = params.get(key)
+    if value is None:
+        return None
+    if not is_mapping(value):
+        raise _invalid_params(f"{key} must be an object")
+    return as_object_dict(value)
+
+
+def _get_policy(params: Mapping[str, object]) -> PublicPolicy | None:
+    # Policy values are validated by the API (`InvalidPolicyError`).
+    return cast("PublicPolicy | None", _get_mapping(params, "policy"))
+
+
+def _get_policy_by_type(params: Mapping[str, object]) -> dict[str, PublicPolicy] | None:
+    return cast("dict[str, PublicPolicy] | None", _get_mapping(params, "policy_by_type"))
+
+
+@contextlib.contextmanager
+def _working_directory(cwd: str | None) -> Generator[None]:
+    """Run the block in `cwd` (if given) and restore the previous directory."""
+    if cwd is None:
+        yield
+        return
+    previous: Path = Path.cwd()
+    try:
+        os.chdir(cwd)
+    except OSError as exc:
+        raise _invalid_params(f"cwd is not a usable directory: {exc}") from exc
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+class TopmarkService:
+    """Answer TopMark JSON-RPC requests with warm registries and config caches.
+
+    Attributes:
+        toml_cache: Split-parse cache of TOML config sources, invalidated per
+            file when its `stat()` identity changes.
+        requests: Number of requests handled so far.
+        shutdown_requested: True once a `shutdown` request was handled.
+    """
+
+    def __init__(self) -> None:
+        self.toml_cache: TomlSourceCache = TomlSourceCache()
+        self.requests: int = 0
+        self.shutdown_requested: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        self._methods: dict[str, Callable[[Mapping[str, object]], object]] = {
+            "check": self._check,
+            "strip": self._strip,
+            "probe": self._probe,
+            "ping": self._ping,
+            "shutdown": self._shutdown,
+        }
+
+    def warm(self) -> None:
+        """Build the process-global registries ahead of the first request."""
+        filetypes: int = len(Registry.filetypes())
+        processors: int = len(Registry.processors())
+        bindings: int = len(Registry.bindings())
+        logger.info(
+            "Registries warm: %d file types, %d processors, %d bindings",
+            filetypes,
+            processors,
+            bindings,
+        )
+
+    def handle(self, request: object) -> dict[str, object] | None:
+        """Handle one decoded JSON-RPC request.
+
+        Args:
+            request: Decoded JSON value of one request line.
+
+        Returns:
+            The JSON-RPC response object, or `None` for a notification.
+        """
+        if not is_mapping(request):
+            return make_error(None, code=INVALID_REQUEST, message="request must be an object")
+        message: dict[str, object] = as_object_dict(request)
+        request_id: object = message.get("id")
+        method: object = message.get("method")
+        params: object = message.get("params", {})
+        if message.get("jsonrpc") != JSONRPC_VERSION or not isinstance(method, str):
+            return make_error(request_id, code=INVALID_REQUEST, message="invalid JSON-RPC request")
+        if not is_mapping(params):
+            return make_error(request_id, code=INVALID_PARAMS, message="params must be an object")
+
+        handler: Callable[[Mapping[str, object]], object] | None = self._methods.get(method)
+        if handler is None:
+            return make_error(
+                request_id, code=METHOD_NOT_FOUND, message=f"unknown method: {method}"
+            )
+
+        try:
+            with self._lock:
+                self.requests += 1
+                with self.toml_cache.activate():
+                    result: object = handler(as_object_dict(params))
+        except ServerRequestError as exc:
+            response: dict[str, object] = make_error(request_id, code=exc.code, message=str(exc))
+        except _INVALID_ARGUMENT_ERRORS as exc:
+            response = make_error(request_id, code=INVALID_PARAMS, message=str(exc))
+        except TopmarkError as exc:
+            response = make_error(request_id, code=TOPMARK_ERROR, message=str(exc))
+        except Exception as exc:
+            logger.exception("Request %r (%s) failed", request_id, method)
+            response = make_error(request_id, code=INTERNAL_ERROR, message=str(exc))
+        else:
+            response = make_result(request_id, result)
+
+        return None if "id" not in message else response
+
+    def _check(self, params: Mapping[str, object]) -> object:
+        return self._run_content(params, run=check)
+
+    def _strip(self, params: Mapping[str, object]) -> object:
+        return self._run_content(params, run=strip)
+
+    def _run_content(
+        self,
+        params: Mapping[str, object],
+        *,
+        run: Callable[..., object],
+    ) -> dict[str, object]:
+        """Run `check()` or `strip()` and capture buffer output of apply runs."""
+        self._reject_unknown(params, _CONTENT_PARAMS)
+        paths: list[str] = self._get_paths(params)
+        content: str | None = _get_str(params, "content")
+        apply: bool = _get_bool(params, "apply")
+        stdout = io.StringIO()
+        with _working_directory(_get_str(params, "cwd")), contextlib.redirect_stdout(stdout):
+            result: object = run(
+                paths,
+                apply=apply,
+                diff=_get_bool(params, "diff"),
+                config=_get_mapping(params, "config"),
+                policy=_get_policy(params),
+                policy_by_type=_get_policy_by_type(params),
+                include_file_types=_get_str_list(params, "include_file_types"),
+                exclude_file_types=_get_str_list(params, "exclude_file_types"),
+                report=_get_str(params, "report") or "actionable",
+                content=content,
+            )
+        return {
+            "result": to_json_value(result),
+            # Apply runs on a buffer emit the updated buffer instead of writing a file.
+            "content": stdout.getvalue() if content is not None and apply else None,
+        }
+
+    def _probe(self, params: Mapping[str, object]) -> dict[str, object]:
+        self._reject_unknown(params, _PROBE_PARAMS)
+        paths: list[str] = self._get_paths(params)
+        with _working_directory(_get_str(params, "cwd")):
+            result: object = probe(
+                paths,
+                config=_get_mapping(params, "config"),
+                policy=_get_policy(params),
+                policy_by_type=_get_policy_by_type(params),
+                include_file_types=_get_str_list(params, "include_file_types"),
+                exclude_file_types=_get_str_list(params, "exclude_file_types"),
+                content=_get_str(params, "content"),
+            )
+        return {"result": to_json_value(result)}
+
+    def _ping(self, params: Mapping[str, object]) -> dict[str, object]:
+        self._reject_unknown(params, frozenset())
+        return {
+            "version": TOPMARK_VERSION,
+            "pid": os.getpid(),
+            "requests": self.requests,
+            "toml_cache": {
+                "entries": len(self.toml_cache),
+                "hits": self.toml_cache.stats.hits,
+                "misses": self.toml_cache.stats.misses,
+                "invalidations": self.toml_cache.stats.invalidations,
+            },
+        }
+
+    def _shutdown(self, params: Mapping[str, object]) -> bool:
+        self._reject_unknown(params, frozenset())
+        self.shutdown_requested = True
+        return True
+
+    @staticmethod
+    def _reject_unknown(params: Mapping[str, object], allowed: frozenset[str]) -> None:
+        unknown: list[str] = sorted(set(params) - allowed)
+        if unknown:
+            raise _invalid_params(f"unknown parameter(s): {', '.join(unknown)}")
+
+    @staticmethod
+    def _get_paths(params: Mapping[str, object]) -> list[str]:
+        paths: list[str] | None = _get_str_list(params, "paths")
+        if paths is None:
+            raise _invalid_params("paths is required")
+        return paths
@@ -0,0 +1,166 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : transport.py
+#   file_relpath : src/topmark/server/transport.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Serving loops of the TopMark server (Unix socket and stdio).
+
+Both transports read newline-delimited JSON-RPC requests and hand them to one
+shared [`TopmarkService`][topmark.server.service.TopmarkService]. The Unix socket
+server accepts connections concurrently, but the service runs requests one at a
+time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import socket
+import socketserver
+import sys
+import threading
+from typing import IO
+from typing import TYPE_CHECKING
+
+from topmark.core.logging import get_logger
+from topmark.server.protocol import PARSE_ERROR
+from topmark.server.protocol import encode_message
+from topmark.server.protocol import make_error
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from topmark.core.logging import TopmarkLogger
+    from topmark.server.service import TopmarkService
+
+logger: TopmarkLogger = get_logger(__name__)
+
+
+def handle_line(service: TopmarkService, line: bytes) -> bytes | None:
+    """Decode one request line, handle it, and encode the response.
+
+    Args:
+        service: Service answering the request.
+        line: One newline-delimited request.
+
+    Returns:
+        The encoded response line, or `None` for notifications and blank lines.
+    """
+    if not line.strip():
+        return None
+    try:
+        request: object = json.loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        return encode_message(make_error(None, code=PARSE_ERROR, message=str(exc)))
+    response: dict[str, object] | None = service.handle(request)
+    return None if response is None else encode_message(response)
+
+
+def unix_sockets_supported() -> bool:
+    """Return whether this platform can serve on Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socketserver, "ThreadingUnixStreamServer")
+
+
+def serve_stdio(
+    service: TopmarkService,
+    *,
+    stdin: IO[bytes] | None = None,
+    stdout: IO[bytes] | None = None,
+) -> None:
+    """Answer requests read from `stdin` on `stdout` until EOF or `shutdown`.
+
+    Args:
+        service: Service answering the requests.
+        stdin: Request stream (default: the process's binary standard input).
+        stdout: Response stream (default: the process's binary standard output).
+    """
+    reader: IO[bytes] = stdin if stdin is not None else sys.stdin.buffer
+    writer: IO[bytes] = stdout if stdout is not None else sys.stdout.buffer
+    for line in reader:
+        response: bytes | None = handle_line(service, line)
+        if response is not None:
+            writer.write(response)
+            writer.flush()
+        if service.shutdown_requested:
+            break
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer the requests of one socket connection."""
+
+    service: TopmarkService  # bound per server in `serve_unix_socket()`
+
+    def handle(self) -> None:
+        """Answer requests until the client disconnects or asks for shutdown."""
+        for line in self.rfile:
+            response: bytes | None = handle_line(self.service, line)
+            if response is not None:
+                self.wfile.write(response)
+                self.wfile.flush()
+            if self.service.shutdown_requested:
+                # `shutdown()` blocks until `serve_forever()` returns: call it
+                # from another thread than the serving loop.
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+def _remove_stale_socket(path: Path) -> None:
+    """Remove a socket file left behind by a server that is no longer running.
+
+    Raises:
+        OSError: If another server is still accepting connections on `path`.
+    """
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        logger.debug("Removing stale server socket %s", path)
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise OSError(f"a TopMark server is already listening on {path}")
+
+
+def serve_unix_socket(
+    service: TopmarkService,
+    path: Path,
+    *,
+    ready: threading.Event | None = None,
+) -> None:
+    """Answer requests on a Unix socket at `path` until a `shutdown` request.
+
+    The socket's parent directory is created with owner-only permissions, and
+    the socket file is removed when the server stops.
+
+    Args:
+        service: Service answering the requests.
+        path: Socket path to listen on.
+        ready: Optional event set once the socket accepts connections.
+    """
+    # `ThreadingUnixStreamServer` only exists where `AF_UNIX` does, so it is
+    # used here rather than subclassed at import time.
+    handler_cls: type[_RequestHandler] = type(
+        "_BoundRequestHandler", (_RequestHandler,), {"service": service}
+    )
+
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _remove_stale_socket(path)
+    with socketserver.ThreadingUnixStreamServer(str(path), handler_cls) as server:
+        server.daemon_threads = True
+        try:
+            path.chmod(0o600)
+            logger.info("TopMark server listening on %s", path)
+            if ready is not None:
+                ready.set()
+            server.serve_forever()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
@@ -129,6 +129,7 @@ def _build_default_writer_toml() -> TomlTable:
     return {
         Toml.SECTION_WRITER: {
             Toml.KEY_STRATEGY: "atomic",
+            Toml.KEY_DURABILITY: "batched",
         },
     }
 
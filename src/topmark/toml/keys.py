@@ -80,6 +80,9 @@ class Toml:
     # [writer] File write strategy
     KEY_STRATEGY: Final[str] = "strategy"
 
+    # [writer] Directory durability of atomic writes
+    KEY_DURABILITY: Final[str] = "durability"
+
     # [policy] and [policy_by_type]
     SECTION_POLICY: Final[str] = "policy"
     SECTION_POLICY_BY_TYPE: Final[str] = "policy_by_type"
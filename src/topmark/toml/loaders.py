@@ -24,10 +24,19 @@ Responsibilities:
 This module does not deserialize layered config into
 [`MutableConfig`][topmark.config.model.MutableConfig] and does not resolve
 precedence across multiple sources.
+
+Long-lived processes (such as `topmark serve`) activate a
+[`TomlSourceCache`][topmark.toml.loaders.TomlSourceCache] so that repeated config
+discovery reuses split-parse results for files whose `stat()` identity
+(modification time, size, inode) is unchanged; edited files are re-parsed.
 """
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
 from typing import TYPE_CHECKING
 
 import tomlkit
@@ -43,6 +52,9 @@ from topmark.toml.schema import TomlValidationMode
 from topmark.toml.typing_guards import toml_table_from_mapping
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Generator
+    from contextvars import Token
     from pathlib import Path
 
     from topmark.core.logging import TopmarkLogger
@@ -51,6 +63,102 @@ if TYPE_CHECKING:
 
 logger: TopmarkLogger = get_logger(__name__)
 
+_StatKey = tuple[int, int, int]
+"""`(st_mtime_ns, st_size, st_ino)` identity of a cached TOML source file."""
+
+
+@dataclass(kw_only=True, slots=True)
+class TomlSourceCacheStats:
+    """Lookup counters of a [`TomlSourceCache`][topmark.toml.loaders.TomlSourceCache].
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that (re-)parsed the file, including invalidations.
+        invalidations: Misses caused by a changed `stat()` identity.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+@dataclass(kw_only=True, slots=True)
+class TomlSourceCache:
+    """Split-parse results of TOML source files, keyed by path and `stat()` identity.
+
+    While activated, [`load_topmark_toml_source`][topmark.toml.loaders.load_topmark_toml_source]
+    returns the cached result for a path whose modification time, size and
+    inode are unchanged, and re-parses (replacing the entry) otherwise. Files
+    that cannot be stat'ed bypass the cache.
+
+    Attributes:
+        stats: Hit/miss counters.
+    """
+
+    stats: TomlSourceCacheStats = field(default_factory=TomlSourceCacheStats)
+    _entries: dict[Path, tuple[_StatKey, ParsedTopmarkToml | None]] = field(
+        init=False,
+        repr=False,
+        default_factory=lambda: {},
+    )
+
+    def __len__(self) -> int:
+        """Return the number of cached TOML sources."""
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached entry (counters are kept)."""
+        self._entries.clear()
+
+    def load(self, path: Path) -> ParsedTopmarkToml | None:
+        """Return the split-parse result for `path`, parsing it only when changed.
+
+        Args:
+            path: Path to a TopMark TOML source file.
+
+        Returns:
+            The per-source split parse result, or `None` when the file cannot be
+            loaded or does not contain a valid TopMark TOML source table.
+        """
+        try:
+            st: os.stat_result = path.stat()
+        except OSError:
+            self.stats.misses += 1
+            return _load_topmark_toml_source_uncached(path)
+
+        key: _StatKey = (st.st_mtime_ns, st.st_size, st.st_ino)
+        entry: tuple[_StatKey, ParsedTopmarkToml | None] | None = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            self.stats.hits += 1
+            return entry[1]
+
+        self.stats.misses += 1
+        if entry is not None:
+            self.stats.invalidations += 1
+            logger.debug("TOML source changed on disk, re-parsing: %s", path)
+        parsed: ParsedTopmarkToml | None = _load_topmark_toml_source_uncached(path)
+        self._entries[path] = (key, parsed)
+        return parsed
+
+    @contextmanager
+    def activate(self) -> Generator[TomlSourceCache]:
+        """Serve [`load_topmark_toml_source`][topmark.toml.loaders.load_topmark_toml_source] from this cache.
+
+        Yields:
+            This cache, active for the current context until the block exits.
+        """  # noqa: E501 - cross-reference link cannot be wrapped
+        token: Token[TomlSourceCache | None] = _active_cache.set(self)
+        try:
+            yield self
+        finally:
+            _active_cache.reset(token)
+
+
+_active_cache: ContextVar[TomlSourceCache | None] = ContextVar(
+    "topmark_toml_source_cache",
+    default=None,
+)
+
 
 def _load_toml_table(path: Path) -> TomlTable | None:
     """Load one TOML document from disk as a plain-Python TOML table.
@@ -143,6 +251,9 @@ def load_topmark_toml_table(
 def load_topmark_toml_source(path: Path) -> ParsedTopmarkToml | None:
     """Load and split-parse one TopMark TOML source file.
 
+    When a [`TomlSourceCache`][topmark.toml.loaders.TomlSourceCache] is active,
+    unchanged files are served from it.
+
     Args:
         path: Path to a TopMark TOML source file.
 
@@ -150,6 +261,14 @@ def load_topmark_toml_source(path: Path) -> ParsedTopmarkToml | None:
         The per-source split parse result, or `None` when the file cannot be
         loaded or does not contain a valid TopMark TOML source table.
     """
+    cache: TomlSourceCache | None = _active_cache.get()
+    if cache is not None:
+        return cache.load(path)
+    return _load_topmark_toml_source_uncached(path)
+
+
+def _load_topmark_toml_source_uncached(path: Path) -> ParsedTopmarkToml | None:
+    """Load and split-parse one TopMark TOML source file from disk."""
     data: TomlTable | None = _load_toml_table(path)
     if data is None:
         return None
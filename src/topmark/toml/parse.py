@@ -31,6 +31,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from topmark.config.types import FileWriteStrategy
+from topmark.config.types import WriteDurability
 from topmark.runtime.writer_options import WriterOptions
 from topmark.toml.keys import Toml
 
@@ -149,21 +150,32 @@ def _parse_writer_options(writer_tbl: TomlTable | None) -> WriterOptions | None:
 
     Returns:
         Parsed writer options, or `None` when the table is absent or does not
-        contain a valid persisted writer preference.
+        contain a valid persisted writer preference. Invalid values of one key
+        do not discard valid values of the other.
     """
     if writer_tbl is None:
         return None
 
+    strategy: FileWriteStrategy | None = None
     strategy_value: object = writer_tbl.get(Toml.KEY_STRATEGY)
-    if not isinstance(strategy_value, str) or not strategy_value:
+    if isinstance(strategy_value, str) and strategy_value:
+        try:
+            strategy = FileWriteStrategy(strategy_value)
+        except ValueError:
+            strategy = None
+
+    durability: WriteDurability | None = None
+    durability_value: object = writer_tbl.get(Toml.KEY_DURABILITY)
+    if isinstance(durability_value, str) and durability_value:
+        try:
+            durability = WriteDurability(durability_value)
+        except ValueError:
+            durability = None
+
+    if strategy is None and durability is None:
         return None
 
-    try:
-        strategy: FileWriteStrategy = FileWriteStrategy(strategy_value)
-    except ValueError:
-        return None
-
-    return WriterOptions(file_write_strategy=strategy)
+    return WriterOptions(file_write_strategy=strategy, durability=durability)
 
 
 def _extract_layered_config_toml(data: TomlTable) -> TomlTable:
@@ -48,6 +48,7 @@ from typing import TypeAlias
 
 from topmark.core.logging import get_logger
 from topmark.diagnostic.model import MutableDiagnosticLog
+from topmark.runtime.writer_options import WriterOptions
 from topmark.toml.loaders import load_topmark_toml_source
 from topmark.utils.path import canonical_processing_path
 
@@ -55,9 +56,10 @@ if TYPE_CHECKING:
     from collections.abc import Iterable
 
     from topmark.config.resolution.synthetic import SyntheticConfigSource
+    from topmark.config.types import FileWriteStrategy
+    from topmark.config.types import WriteDurability
     from topmark.core.logging import TopmarkLogger
     from topmark.diagnostic.model import FrozenDiagnosticLog
-    from topmark.runtime.writer_options import WriterOptions
     from topmark.toml.parse import ParsedTopmarkToml
     from topmark.toml.validation import TomlValidationIssue
 
@@ -324,15 +326,22 @@ def _deduplicate_sources_by_identity(
 def _resolve_writer_options(
     sources: list[ResolvedTopmarkTomlSource],
 ) -> WriterOptions | None:
-    """Resolve writer options using highest-precedence non-`None` wins."""
-    resolved: WriterOptions | None = None
+    """Resolve writer options per key using highest-precedence non-`None` wins."""
+    strategy: FileWriteStrategy | None = None
+    durability: WriteDurability | None = None
     for source in sources:
         if source.parsed is None:
             continue
         writer_options: WriterOptions | None = source.parsed.writer_options
-        if writer_options is not None and writer_options.file_write_strategy is not None:
-            resolved = writer_options
-    return resolved
+        if writer_options is None:
+            continue
+        if writer_options.file_write_strategy is not None:
+            strategy = writer_options.file_write_strategy
+        if writer_options.durability is not None:
+            durability = writer_options.durability
+    if strategy is None and durability is None:
+        return None
+    return WriterOptions(file_write_strategy=strategy, durability=durability)
 
 
 def _resolve_strict(
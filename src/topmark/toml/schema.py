@@ -500,6 +500,7 @@ TOPMARK_TOML_SCHEMA: Final[TomlSchema] = TomlSchema(
             allowed_keys=frozenset(
                 {
                     Toml.KEY_STRATEGY,
+                    Toml.KEY_DURABILITY,
                 }
             ),
         ),
@@ -20,6 +20,7 @@ import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Final
 
 from topmark.core.logging import get_logger
 
@@ -31,6 +32,12 @@ if TYPE_CHECKING:
 
 logger: TopmarkLogger = get_logger(__name__)
 
+CACHEDIR_TAG_NAME: Final[str] = "CACHEDIR.TAG"
+"""File name marking a cache directory (https://bford.info/cachedir/)."""
+
+CACHEDIR_TAG_SIGNATURE: Final[str] = "Signature: 8a477f597d28d172789f06886806bc55"
+"""Header line that makes a `CACHEDIR.TAG` file valid."""
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class RebasedGlobPatterns:
@@ -164,3 +171,24 @@ def safe_unlink(path: Path | None) -> None:
             path.unlink()
         except OSError as e:
             logger.error("Failed to delete %s: %s", path, e)
+
+
+def is_cachedir_tag(path: Path) -> bool:
+    """Return whether `path` is a valid cache directory tag file.
+
+    A tag is valid when it starts with the
+    [`CACHEDIR_TAG_SIGNATURE`][topmark.utils.file.CACHEDIR_TAG_SIGNATURE] line;
+    backup tools and TopMark's file discovery skip the directory containing it.
+
+    Args:
+        path: Candidate `CACHEDIR.TAG` file.
+
+    Returns:
+        True if the file starts with the cache directory tag signature.
+    """
+    signature: bytes = CACHEDIR_TAG_SIGNATURE.encode("ascii")
+    try:
+        with path.open("rb") as fh:
+            return fh.read(len(signature)) == signature
+    except OSError:
+        return False
@@ -0,0 +1,303 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : source.py
+#   file_relpath : src/topmark/utils/source.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Single-read byte source shared by per-file ingestion consumers.
+
+A [`FileSource`][topmark.utils.source.FileSource] reads a file's bytes once, on
+first access, and serves every later consumer from the same buffer: resolver
+content matchers, the sniffer's bounded window, and the reader's text decode.
+Each file therefore costs one `open`/`fstat`/`read`/`close` sequence. Files at or
+above [`MMAP_THRESHOLD_BYTES`][topmark.utils.source.MMAP_THRESHOLD_BYTES] are
+memory-mapped instead of read, so a sniffer that rejects a large binary file only
+faults in the pages it inspects.
+
+Content matchers keep their `(path) -> bool` signature. While the resolver probes
+a file it activates that file's source; matchers then call
+[`read_path_prefix()`][topmark.utils.source.read_path_prefix], which serves the
+active buffer when it covers the requested path and falls back to a bounded disk
+read otherwise (e.g. when a matcher is invoked outside the pipeline).
+
+Content that never touched the filesystem (STDIN content mode) is wrapped with
+[`FileSource.from_bytes()`][topmark.utils.source.FileSource.from_bytes]: the same
+consumers see the same buffer, but no file is opened and `stat` stays `None`.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Final
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from contextvars import Token
+    from pathlib import Path
+
+MMAP_THRESHOLD_BYTES: Final[int] = 4 * 1024 * 1024
+"""Files of at least this size are memory-mapped rather than read into memory."""
+
+
+@dataclass(kw_only=True, slots=True)
+class SourceReadStats:
+    """I/O counters for one [`FileSource`][topmark.utils.source.FileSource].
+
+    Attributes:
+        opens: Number of times the file was opened.
+        reads: Number of `read(2)` calls issued (0 when the file was mapped).
+        maps: Number of `mmap(2)` calls issued.
+        bytes_loaded: Number of bytes made available to consumers.
+    """
+
+    opens: int = 0
+    reads: int = 0
+    maps: int = 0
+    bytes_loaded: int = 0
+
+
+class _MappedRawIO(io.RawIOBase):
+    """Minimal raw binary stream over a memory map, used for text decoding."""
+
+    def __init__(self, data: mmap.mmap) -> None:
+        super().__init__()
+        self._data: mmap.mmap = data
+        self._pos: int = 0
+
+    def readable(self) -> bool:
+        """Return True; the stream is read-only."""
+        return True
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        """Copy the next chunk of the mapping into `buffer`.
+
+        Args:
+            buffer: Writable destination buffer.
+
+        Returns:
+            Number of bytes copied; 0 at end of data.
+        """
+        chunk: bytes = self._data[self._pos : self._pos + len(buffer)]
+        size: int = len(chunk)
+        buffer[:size] = chunk
+        self._pos += size
+        return size
+
+
+_active_source: ContextVar[FileSource | None] = ContextVar(
+    "topmark_active_source",
+    default=None,
+)
+
+
+class FileSource:
+    """Lazily loaded, read-once byte buffer for one file.
+
+    The file is opened on the first call to [`data()`][.data] (directly or via
+    [`prefix()`][.prefix] / [`text_lines()`][.text_lines]). Load errors are not
+    cached, so a failing consumer sees the same `OSError` it would have seen from
+    its own `open()`.
+
+    Args:
+        path: File to read.
+        mmap_threshold: Minimum size in bytes for memory-mapping the file.
+
+    Attributes:
+        path: File to read.
+        stats: I/O counters for this source.
+        stat: `fstat` result taken on the open descriptor during the last load, or
+            `None` before the first successful load (always `None` for in-memory sources).
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_content",
+        "_data",
+        "_mmap_threshold",
+        "path",
+        "stat",
+        "stats",
+    )
+
+    def __init__(self, path: Path, *, mmap_threshold: int = MMAP_THRESHOLD_BYTES) -> None:
+        self.path: Path = path
+        self.stats: SourceReadStats = SourceReadStats()
+        self.stat: os.stat_result | None = None
+        self._mmap_threshold: int = mmap_threshold
+        self._data: bytes | mmap.mmap | None = None
+        self._content: bytes | None = None
+
+    @classmethod
+    def from_bytes(cls, path: Path, content: bytes) -> FileSource:
+        """Return a source that serves `content` without touching the filesystem.
+
+        `path` is the logical file identity (e.g. `--stdin-filename`); it is used for
+        matching in [`read_path_prefix()`][topmark.utils.source.read_path_prefix] but
+        never opened. Releasing the source keeps `content`, so it can be reloaded.
+
+        Args:
+            path: Logical path of the content.
+            content: The complete file content.
+
+        Returns:
+            An in-memory source for `content`.
+        """
+        source: FileSource = cls(path, mmap_threshold=0)
+        source._content = content
+        return source
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether this source serves caller-supplied bytes instead of a file."""
+        return self._content is not None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the file bytes are currently held by this source."""
+        return self._data is not None
+
+    def data(self) -> bytes | mmap.mmap:
+        """Return the full file bytes, loading them on first access.
+
+        Returns:
+            The file content as `bytes`, or a read-only memory map for large files.
+
+        Raises:
+            OSError: If the file cannot be opened, inspected, or read.
+        """
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    def prefix(self, limit: int) -> bytes:
+        """Return at most the first `limit` bytes of the file.
+
+        Args:
+            limit: Maximum number of bytes to return.
+
+        Returns:
+            The leading bytes of the file.
+        """
+        data: bytes | mmap.mmap = self.data()
+        if isinstance(data, bytes) and len(data) <= limit:
+            return data
+        return data[:limit]
+
+    def text_lines(self, end: int | None = None) -> list[str]:
+        """Decode the file as UTF-8 and split it into lines with their terminators.
+
+        Decoding uses `errors="replace"` and splits only on LF, CRLF, and CR,
+        matching `open(path, "r", encoding="utf-8", errors="replace", newline="")`.
+
+        Args:
+            end: Decode only the first `end` bytes (the whole file when `None`).
+                Callers pass an offset just after a line terminator so no line or
+                multi-byte sequence is split.
+
+        Returns:
+            Decoded lines, each retaining its original line terminator.
+        """
+        data: bytes | mmap.mmap = self.data()
+        raw: io.BufferedIOBase
+        if end is not None:
+            raw = io.BytesIO(data[:end])
+        elif isinstance(data, bytes):
+            raw = io.BytesIO(data)
+        else:
+            raw = io.BufferedReader(_MappedRawIO(data))
+        with io.TextIOWrapper(raw, encoding="utf-8", errors="replace", newline="") as text:
+            return list(text)
+
+    def release(self) -> None:
+        """Drop the loaded bytes (unmapping large files). Safe to call repeatedly."""
+        data: bytes | mmap.mmap | None = self._data
+        self._data = None
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+    @contextmanager
+    def activate(self) -> Generator[FileSource]:
+        """Serve [`read_path_prefix()`][topmark.utils.source.read_path_prefix] from this source.
+
+        Yields:
+            This source, active for the current context until the block exits.
+        """
+        token: Token[FileSource | None] = _active_source.set(self)
+        try:
+            yield self
+        finally:
+            _active_source.reset(token)
+
+    def _load(self) -> bytes | mmap.mmap:
+        """Open the file once and read (or map) its whole content."""
+        if self._content is not None:
+            self.stats.bytes_loaded += len(self._content)
+            return self._content
+        fd: int = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        self.stats.opens += 1
+        try:
+            st: os.stat_result = os.fstat(fd)
+            size: int = st.st_size
+            self.stat = st
+            if size >= self._mmap_threshold > 0:
+                mapped: mmap.mmap = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                self.stats.maps += 1
+                self.stats.bytes_loaded += len(mapped)
+                return mapped
+
+            # Ask for one byte more than the stat size: a short read that reaches
+            # the stat size then proves end-of-file without a second, empty read.
+            # Files that grew since the stat are drained in further reads.
+            chunks: list[bytes] = []
+            total: int = 0
+            while True:
+                request: int = size + 1 - total
+                if request <= 0:
+                    request = io.DEFAULT_BUFFER_SIZE
+                chunk: bytes = os.read(fd, request)
+                self.stats.reads += 1
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                total += len(chunk)
+                if len(chunk) < request and total >= size:
+                    break
+        finally:
+            os.close(fd)
+
+        data: bytes = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        self.stats.bytes_loaded += len(data)
+        return data
+
+
+def read_path_prefix(path: Path, limit: int) -> bytes:
+    """Return at most the first `limit` bytes of `path`.
+
+    Intended for content matchers: when the resolver has activated a
+    [`FileSource`][topmark.utils.source.FileSource] for `path`, the bytes come from
+    that shared buffer; otherwise the file is read directly with one bounded read.
+
+    Args:
+        path: File to read.
+        limit: Maximum number of bytes to return.
+
+    Returns:
+        The leading bytes of the file.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    source: FileSource | None = _active_source.get()
+    if source is not None and source.path == path:
+        return source.prefix(limit)
+    with path.open("rb") as fh:
+        return fh.read(limit)
@@ -0,0 +1,96 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_api_content.py
+#   file_relpath : tests/api/test_api_content.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""API tests for processing in-memory buffers via `content=`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from topmark import api
+from topmark.core.constants import TOPMARK_START_MARKER
+from topmark.core.errors import InvalidContentInputError
+from topmark.core.outcomes import Outcome
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CONFIG: dict[str, object] = {"header": {"fields": ["file"]}}
+
+
+def test_check_content_uses_the_logical_path_without_touching_disk(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A buffer is resolved by its logical path, which need not exist."""
+    monkeypatch.chdir(tmp_path)
+
+    result: api.RunResult = api.check(
+        ["pkg/module.py"],
+        content="print(1)\n",
+        config=CONFIG,
+        diff=True,
+    )
+
+    assert [(str(r.path), r.outcome) for r in result.files] == [
+        ("pkg/module.py", Outcome.WOULD_INSERT)
+    ]
+    assert result.files[0].diff is not None
+    assert "+#   file : module.py" in result.files[0].diff
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_apply_on_content_emits_the_updated_buffer(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Apply runs write the updated buffer to standard output, never to a file."""
+    monkeypatch.chdir(tmp_path)
+
+    result: api.RunResult = api.check(
+        ["module.py"],
+        content="print(1)\n",
+        config=CONFIG,
+        apply=True,
+    )
+
+    out: str = capsys.readouterr().out
+    assert result.written == 1
+    assert out.startswith(f"# {TOPMARK_START_MARKER}")
+    assert out.endswith("print(1)\n")
+    assert not (tmp_path / "module.py").exists()
+
+    stripped: api.RunResult = api.strip(["module.py"], content=out, config=CONFIG, apply=True)
+    assert stripped.written == 1
+    assert capsys.readouterr().out == "print(1)\n"
+
+
+def test_probe_content_reports_the_resolved_file_type(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Probe resolves the file type of a buffer from its logical path."""
+    monkeypatch.chdir(tmp_path)
+
+    result: api.ProbeRunResult = api.probe(["script.py"], content="x = 1\n", config=CONFIG)
+
+    assert [(r.status, r.selected_file_type) for r in result.files] == [("resolved", "python")]
+
+
+@pytest.mark.parametrize("paths", [[], ["a.py", "b.py"]], ids=("none", "two"))
+def test_content_requires_exactly_one_path(paths: list[str]) -> None:
+    """`content` names a single file, so zero or several paths are rejected."""
+    with pytest.raises(InvalidContentInputError) as excinfo:
+        api.check(paths, content="x = 1\n", config=CONFIG)
+
+    assert excinfo.value.path_count == len(paths)
@@ -948,6 +948,33 @@ def test_processing_ndjson_kinds_with_summary(tmp_path: Path, command: str) -> N
     assert "summary" in kinds_set
 
 
+@pytest.mark.parametrize("summary_mode", [False, True], ids=["detail", "summary"])
+def test_processing_ndjson_stream_closes_with_run_totals(
+    tmp_path: Path,
+    summary_mode: bool,
+) -> None:
+    """NDJSON `check` output ends with one `totals` record counting the processed files."""
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("print('hi')\n", encoding="utf-8")
+
+    result: Result = run_cli_in(
+        tmp_path,
+        [
+            CliCmd.CHECK,
+            CliOpt.OUTPUT_FORMAT,
+            OutputFormat.NDJSON.value,
+            *([CliOpt.RESULTS_SUMMARY_MODE] if summary_mode else []),
+            ".",
+        ],
+    )
+    assert_SUCCESS_or_WOULD_CHANGE(result)
+
+    records: list[dict[str, object]] = parse_ndjson_records(result.output)
+    assert record_kinds(records).count("totals") == 1
+    assert records[-1]["kind"] == "totals"
+    assert records[-1]["totals"] == {"count": 2}
+
+
 @pytest.mark.parametrize(
     "command",
     [
@@ -19,9 +19,9 @@ from __future__ import annotations
 
 import io
 import sys
+import tempfile
 from os import terminal_size
 from pathlib import Path
-from typing import NoReturn
 
 import click
 import pytest
@@ -76,57 +76,37 @@ def test_consume_stdin_list_mode_ignores_blank_and_comment_lines(
 
     assert result.mode is StdinMode.LIST
     assert result.paths == [Path("a.py"), Path("docs/index.md")]
-    assert result.temp_path is None
+    assert result.content is None
     assert result.errors == []
 
 
-def test_consume_stdin_content_mode_uses_filename_suffix(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Content mode should preserve a useful suffix for file-type resolution."""
+def test_consume_stdin_content_mode_keeps_content_in_memory(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Content mode should return the bytes under the logical filename, creating no file."""
     monkeypatch.setattr(sys, "stdin", io.StringIO("print('stdin')\n"))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
 
-    result: StdinResult = consume_stdin(expect="content", stdin_filename="example.py")
+    result: StdinResult = consume_stdin(expect="content", stdin_filename="pkg/example.py")
 
     assert result.mode is StdinMode.CONTENT
-    assert result.temp_path is not None
-    assert result.temp_path.suffix == ".py"
-    assert result.paths == [result.temp_path]
-    assert result.temp_path.read_text(encoding="utf-8") == "print('stdin')\n"
-    result.temp_path.unlink()
+    assert result.paths == [Path("pkg/example.py")]
+    assert result.content == b"print('stdin')\n"
+    assert list(tmp_path.iterdir()) == []
 
 
-def test_consume_stdin_content_mode_without_filename_uses_no_suffix(
+def test_consume_stdin_content_mode_without_filename_uses_default_name(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Forced content mode without a filename should still materialize STDIN."""
+    """Forced content mode without a filename should still capture STDIN."""
     monkeypatch.setattr(sys, "stdin", io.StringIO("plain text\n"))
 
     result: StdinResult = consume_stdin(expect="content")
 
     assert result.mode is StdinMode.CONTENT
-    assert result.temp_path is not None
-    assert result.temp_path.suffix == ""
-    assert result.paths == [result.temp_path]
-    assert result.temp_path.read_text(encoding="utf-8") == "plain text\n"
-    result.temp_path.unlink()
-
-
-def test_consume_stdin_content_mode_reports_tempfile_errors(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Tempfile failures should be reported as non-fatal STDIN errors."""
-
-    def raise_oserror(*_args: object, **_kwargs: object) -> NoReturn:
-        raise OSError("disk full")
-
-    monkeypatch.setattr(sys, "stdin", io.StringIO("print()\n"))
-    monkeypatch.setattr("topmark.cli.io.tempfile.NamedTemporaryFile", raise_oserror)
-
-    result: StdinResult = consume_stdin(expect="content", stdin_filename="example.py")
-
-    assert result.mode is StdinMode.NONE
-    assert result.paths == []
-    assert result.temp_path is None
-    assert result.errors == ["#ERROR: failed to create temp file for STDIN content: disk full"]
+    assert result.paths == [Path("stdin")]
+    assert result.content == b"plain text\n"
 
 
 def test_merge_cli_paths_with_stdin_respects_stdin_mode() -> None:
@@ -142,7 +122,7 @@ def test_merge_cli_paths_with_stdin_respects_stdin_mode() -> None:
     ]
     assert merge_cli_paths_with_stdin(
         ["cli.py"],
-        StdinResult(StdinMode.CONTENT, [Path("content.py")], Path("content.py"), []),
+        StdinResult(StdinMode.CONTENT, [Path("content.py")], b"content\n", []),
     ) == [Path("content.py")]
 
 
@@ -163,7 +143,7 @@ def test_plan_cli_inputs_allows_empty_paths_when_requested() -> None:
 
     assert not plan.stdin_mode
     assert plan.stdin_filename is None
-    assert plan.temp_path is None
+    assert plan.stdin_content is None
     assert plan.paths == []
     assert plan.include_patterns == []
     assert plan.exclude_patterns == []
@@ -265,7 +245,7 @@ def test_plan_cli_inputs_routes_include_and_exclude_patterns_from_stdin(
 
     assert not plan.stdin_mode
     assert plan.stdin_filename is None
-    assert plan.temp_path is None
+    assert plan.stdin_content is None
     assert plan.paths == ["src/topmark/__init__.py"]
     assert plan.include_patterns == ["docs/**", "src/**", "tests/**"]
     assert plan.exclude_patterns == []
@@ -86,7 +86,7 @@ def _empty_input_plan(
     return InputPlan(
         stdin_mode=stdin_mode,
         stdin_filename=stdin_filename,
-        temp_path=None,
+        stdin_content=None,
         paths=paths or [],
         files_from=files_from or [],
         include_from=include_from or [],
@@ -108,30 +108,27 @@ def _mutable_config_without_diagnostics() -> MutableConfig:
     return MutableConfig()
 
 
-def test_build_file_resolution_requires_temp_path_for_stdin_mode() -> None:
-    """Content-STDIN file resolution should fail fast without its temp path."""
+def test_build_file_resolution_requires_stdin_filename_for_stdin_mode() -> None:
+    """Content-STDIN file resolution should fail fast without its logical filename."""
     run_options = RunOptions(stdin_mode=True)
 
-    with pytest.raises(RuntimeError, match="temp_path should not be undefined"):
+    with pytest.raises(RuntimeError, match="stdin_filename should not be undefined"):
         build_file_resolution(
             run_options=run_options,
             config=None,  # pyright: ignore[reportArgumentType]
-            temp_path=None,
         )
 
 
-def test_build_file_resolution_selects_stdin_temp_path(tmp_path: Path) -> None:
-    """Content-STDIN file resolution should select only the staged temp path."""
-    temp_path: Path = tmp_path / "stdin.py"
-    run_options = RunOptions(stdin_mode=True)
+def test_build_file_resolution_selects_stdin_logical_path() -> None:
+    """Content-STDIN file resolution should select only the logical STDIN path."""
+    run_options = RunOptions(stdin_mode=True, stdin_filename="pkg/stdin.py")
 
     resolution: FileListResolution = build_file_resolution(
         run_options=run_options,
         config=None,  # pyright: ignore[reportArgumentType]
-        temp_path=temp_path,
     )
 
-    assert resolution.selected == (temp_path,)
+    assert resolution.selected == (Path("pkg/stdin.py"),)
     assert resolution.missing_literals == ()
     assert resolution.unmatched_patterns == ()
 
@@ -52,7 +52,14 @@ _OPTION_VALUES: dict[str, str | None] = {
     CliOpt.RENDER_DIFF: None,
     # --summary is a flag, takes no argv:
     CliOpt.RESULTS_SUMMARY_MODE: None,
+    CliOpt.PROGRESS: None,
+    CliOpt.PROFILE: None,
     CliOpt.REPORT: ReportScope.ALL,
+    CliOpt.RESULT_CACHE: None,
+    CliOpt.NO_RESULT_CACHE: None,
+    CliOpt.CLEAR_RESULT_CACHE: None,
+    CliOpt.CHANGED_SINCE: "HEAD",
+    CliOpt.STAGED: None,
     # Valid: "all", "add-only", "update-only":
     CliOpt.POLICY_HEADER_MUTATION_MODE: "update-only",
     # Valid: "reject", "remove-bom":
@@ -0,0 +1,84 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_git_selection.py
+#   file_relpath : tests/cli/test_git_selection.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""CLI tests for git-based candidate selection (`--changed-since` / `--staged`).
+
+Without positional paths, the files selected from git are the command inputs:
+the run covers every changed file in the repository instead of failing with a
+missing-arguments usage error.
+"""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.cli.conftest import assert_USAGE_ERROR
+from tests.cli.conftest import assert_WOULD_CHANGE
+from tests.cli.conftest import run_cli_in
+from tests.helpers.git import run_git
+from topmark.cli.keys import CliCmd
+from topmark.cli.keys import CliOpt
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import Result
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Return a repository with an unstaged edit and a staged new file, both unheadered."""
+    root: Path = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    run_git(root, "init", "-q")
+    (root / "edited.py").write_text("x = 1\n", encoding="utf-8")
+    (root / "untouched.py").write_text("y = 1\n", encoding="utf-8")
+    run_git(root, "add", "-A")
+    run_git(root, "commit", "-q", "-m", "initial")
+
+    (root / "edited.py").write_text("x = 2\n", encoding="utf-8")
+    (root / "staged.py").write_text("z = 1\n", encoding="utf-8")
+    run_git(root, "add", "staged.py")
+    return root
+
+
+@pytest.mark.parametrize(
+    ("selection", "expected"),
+    [
+        pytest.param([CliOpt.STAGED], {"staged.py"}, id="staged"),
+        pytest.param([CliOpt.CHANGED_SINCE, "HEAD"], {"edited.py", "staged.py"}, id="since"),
+    ],
+)
+def test_git_selection_without_paths_covers_the_whole_repository(
+    repo: Path,
+    selection: list[str],
+    expected: set[str],
+) -> None:
+    """Without PATHS, git-selected files anywhere in the repository are checked."""
+    result: Result = run_cli_in(repo / "pkg", [CliCmd.CHECK, *selection])
+
+    assert_WOULD_CHANGE(result)
+    for name in ("edited.py", "staged.py", "untouched.py"):
+        assert (name in result.output) is (name in expected), result.output
+
+
+@pytest.mark.parametrize("command", [CliCmd.CHECK, CliCmd.STRIP])
+def test_git_selection_without_paths_is_not_a_usage_error(repo: Path, command: str) -> None:
+    """`--staged` alone is a complete invocation; plain runs still require a path."""
+    staged: Result = run_cli_in(repo, [command, CliOpt.STAGED])
+    plain: Result = run_cli_in(repo, [command])
+
+    assert "No arguments provided" not in staged.output
+    assert_USAGE_ERROR(plain)
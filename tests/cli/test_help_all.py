@@ -70,6 +70,7 @@ PUBLIC_COMMAND_PATHS_WITH_HELP: Final[tuple[tuple[str, ...], ...]] = (
         CliCmd.REGISTRY,
         CliCmd.REGISTRY_BINDINGS,
     ),
+    (CliCmd.SERVE,),
     (CliCmd.VERSION,),
 )
 
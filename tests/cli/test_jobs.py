@@ -0,0 +1,88 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_jobs.py
+#   file_relpath : tests/cli/test_jobs.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""CLI tests for multi-process execution (`--jobs`).
+
+Running with several worker processes must not change what the user sees:
+machine output, exit codes, and applied edits stay identical to a sequential run.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.cli.conftest import CLICK_USAGE_ERROR_EXIT_CODE
+from tests.cli.conftest import assert_rich_output_contains
+from tests.cli.conftest import run_cli
+from tests.helpers.pipeline import make_python_files
+from topmark.cli.keys import CliCmd
+from topmark.cli.keys import CliOpt
+from topmark.core.constants import TOPMARK_START_MARKER
+from topmark.core.exit_codes import ExitCode
+from topmark.core.formats import OutputFormat
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import Result
+
+
+@pytest.mark.parametrize("command", [CliCmd.CHECK, CliCmd.STRIP, CliCmd.PROBE])
+def test_jobs_machine_output_matches_sequential_run(tmp_path: Path, command: str) -> None:
+    """`--jobs 2` should emit the same NDJSON records in the same order as `--jobs 1`."""
+    paths: list[str] = [str(p) for p in make_python_files(tmp_path, 5)]
+
+    def invoke(jobs: str) -> Result:
+        return run_cli(
+            [
+                command,
+                CliOpt.JOBS,
+                jobs,
+                CliOpt.OUTPUT_FORMAT,
+                OutputFormat.NDJSON.value,
+                *paths,
+            ],
+        )
+
+    sequential: Result = invoke("1")
+    parallel: Result = invoke("2")
+
+    assert parallel.exit_code == sequential.exit_code
+    assert parallel.output == sequential.output
+
+
+def test_jobs_apply_writes_every_file(tmp_path: Path) -> None:
+    """`check --apply --jobs 0` should insert headers in all selected files."""
+    paths: list[Path] = make_python_files(tmp_path, 4)
+
+    result: Result = run_cli(
+        [
+            CliCmd.CHECK,
+            CliOpt.APPLY_CHANGES,
+            CliOpt.JOBS,
+            "0",
+            *[str(p) for p in paths],
+        ],
+    )
+
+    assert result.exit_code == ExitCode.SUCCESS
+    assert all(TOPMARK_START_MARKER in p.read_text("utf-8") for p in paths)
+
+
+def test_jobs_rejects_negative_values(tmp_path: Path) -> None:
+    """Negative job counts are rejected by the parser."""
+    path: Path = make_python_files(tmp_path, 1)[0]
+
+    result: Result = run_cli([CliCmd.CHECK, CliOpt.JOBS, "-1", str(path)])
+
+    assert result.exit_code == CLICK_USAGE_ERROR_EXIT_CODE
+    assert_rich_output_contains(result.stderr, expected=f"Invalid value for '{CliOpt.JOBS}'")
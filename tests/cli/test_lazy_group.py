@@ -0,0 +1,93 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_lazy_group.py
+#   file_relpath : tests/cli/test_lazy_group.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Lazy command-group loading contract tests."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import click
+import pytest
+
+from topmark.cli.commands.version import version_command
+from topmark.cli.lazy_group import LazyRichGroup
+from topmark.cli.lazy_group import load_lazy_command
+from topmark.cli.main import ROOT_LAZY_SUBCOMMANDS
+from topmark.cli.main import cli
+
+
+def test_root_group_lists_every_lazy_subcommand() -> None:
+    """The root group should list lazily registered commands by name."""
+    ctx = click.Context(cli)
+
+    assert set(cli.list_commands(ctx)) >= set(ROOT_LAZY_SUBCOMMANDS)
+    assert cli.list_commands(ctx) == sorted(cli.list_commands(ctx))
+
+
+def test_get_command_resolves_and_caches_lazy_subcommand() -> None:
+    """Resolving a lazy name should import the command once and cache it."""
+    group = LazyRichGroup(
+        name="group",
+        lazy_subcommands={"ver": "topmark.cli.commands.version:version_command"},
+    )
+    ctx = click.Context(group)
+
+    assert group.list_commands(ctx) == ["ver"]
+    assert group.get_command(ctx, "ver") is version_command
+    assert group.commands["ver"] is version_command
+    assert group.get_command(ctx, "missing") is None
+
+
+def test_load_lazy_command_rejects_malformed_path() -> None:
+    """Import paths must use the `module:attribute` form."""
+    with pytest.raises(ValueError, match="Invalid lazy command import path"):
+        load_lazy_command("topmark.cli.commands.version")
+
+
+def test_load_lazy_command_rejects_non_command_attribute() -> None:
+    """A lazy path must resolve to a Click command."""
+    with pytest.raises(TypeError, match="expected a click.Command"):
+        load_lazy_command("topmark.cli.keys:CliCmd")
+
+
+def test_importing_cli_does_not_import_command_modules() -> None:
+    """Importing the root group must not import any subcommand module."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys; import topmark.cli.main; "
+                "assert not [m for m in sys.modules if m.startswith('topmark.cli.commands.')]; "
+                "assert 'topmark.cli.cmd_common' not in sys.modules"
+            ),
+        ],
+        check=True,
+    )
+
+
+def test_version_dispatch_does_not_import_pipeline_helpers() -> None:
+    """Resolving `topmark version` must not load pipeline-only CLI helpers."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, click; from topmark.cli.main import cli; "
+                "cli.get_command(click.Context(cli), 'version'); "
+                "assert 'topmark.cli.commands.version' in sys.modules; "
+                "assert 'topmark.cli.cmd_common' not in sys.modules; "
+                "assert 'topmark.cli.emitters.machine' not in sys.modules"
+            ),
+        ],
+        check=True,
+    )
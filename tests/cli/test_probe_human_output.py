@@ -540,21 +540,8 @@ def test_probe_markdown_output_ignores_text_quiet(tmp_path: Path) -> None:
 # --- Content-STDIN lifecycle ---
 
 
-def test_probe_content_stdin_success_cleans_temp_file(
-    tmp_path: Path,
-    monkeypatch: MonkeyPatch,
-) -> None:
-    """Successful content-STDIN probe processing should clean its temp file."""
-    unlinked_paths: list[Path] = []
-
-    def record_safe_unlink(path: Path | None) -> None:
-        if path is not None:
-            assert path.exists()
-            unlinked_paths.append(path)
-            path.unlink()
-
-    monkeypatch.setattr(probe_module, "safe_unlink", record_safe_unlink)
-
+def test_probe_content_stdin_resolves_logical_filename(tmp_path: Path) -> None:
+    """Content-STDIN probe resolves the in-memory content by its logical filename."""
     result: Result = run_cli_in(
         tmp_path,
         [CliCmd.PROBE, "-", CliOpt.STDIN_FILENAME, "stdin.py"],
@@ -562,5 +549,5 @@ def test_probe_content_stdin_success_cleans_temp_file(
     )
 
     assert_SUCCESS(result)
-    assert len(unlinked_paths) == 1
-    assert not unlinked_paths[0].exists()
+    assert "stdin.py" in result.output
+    assert list(tmp_path.iterdir()) == []
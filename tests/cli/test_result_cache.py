@@ -0,0 +1,105 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_result_cache.py
+#   file_relpath : tests/cli/test_result_cache.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""CLI tests for the opt-in persistent result cache (`--cache`, `--clear-cache`)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tests.cli.conftest import assert_SUCCESS
+from tests.cli.conftest import run_cli_in
+from tests.helpers.pipeline import make_python_files
+from topmark.cli.keys import CliCmd
+from topmark.cli.keys import CliOpt
+from topmark.core.formats import OutputFormat
+from topmark.pipeline.result_cache import DEFAULT_RESULT_CACHE_DIR
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import Result
+
+
+def _make_compliant_files(tmp_path: Path) -> list[str]:
+    """Create two files, insert their headers, and return their names."""
+    names: list[str] = [path.name for path in make_python_files(tmp_path, 2)]
+    assert_SUCCESS(run_cli_in(tmp_path, [CliCmd.CHECK, CliOpt.APPLY_CHANGES, *names]))
+    return names
+
+
+def test_check_cache_reports_hits_on_second_run(tmp_path: Path) -> None:
+    """The human summary should show cache statistics when `--cache` is used."""
+    names: list[str] = _make_compliant_files(tmp_path)
+
+    first: Result = run_cli_in(tmp_path, [CliCmd.CHECK, CliOpt.RESULT_CACHE, *names])
+    second: Result = run_cli_in(tmp_path, [CliCmd.CHECK, CliOpt.RESULT_CACHE, *names])
+
+    assert_SUCCESS(first)
+    assert_SUCCESS(second)
+    assert "result cache: 0 hit(s), 2 miss(es), 2 stored." in first.output
+    assert "result cache: 2 hit(s), 0 miss(es), 0 stored." in second.output
+    assert (tmp_path / DEFAULT_RESULT_CACHE_DIR).is_dir()
+
+
+def test_check_without_cache_does_not_create_cache_dir(tmp_path: Path) -> None:
+    """The cache is opt-in; default runs neither read nor write it."""
+    names: list[str] = _make_compliant_files(tmp_path)
+
+    result: Result = run_cli_in(tmp_path, [CliCmd.CHECK, *names])
+
+    assert_SUCCESS(result)
+    assert "result cache" not in result.output
+    assert not (tmp_path / DEFAULT_RESULT_CACHE_DIR).exists()
+
+
+def test_cached_machine_output_matches_uncached_run(tmp_path: Path) -> None:
+    """Cached results must serialize exactly like freshly computed results."""
+    names: list[str] = _make_compliant_files(tmp_path)
+    argv: list[str] = [CliCmd.CHECK, CliOpt.OUTPUT_FORMAT, OutputFormat.NDJSON.value, *names]
+
+    uncached: Result = run_cli_in(tmp_path, argv)
+    run_cli_in(tmp_path, [*argv, CliOpt.RESULT_CACHE])
+    cached: Result = run_cli_in(tmp_path, [*argv, CliOpt.RESULT_CACHE])
+
+    assert cached.exit_code == uncached.exit_code
+    assert cached.stdout == uncached.stdout
+
+
+def test_directory_runs_do_not_process_the_cache_dir(tmp_path: Path) -> None:
+    """A cached pass over `.` must not make the cache itself an input of later runs."""
+    names: list[str] = _make_compliant_files(tmp_path)
+    assert_SUCCESS(run_cli_in(tmp_path, [CliCmd.CHECK, CliOpt.RESULT_CACHE, "."]))
+    cache_dir: Path = tmp_path / DEFAULT_RESULT_CACHE_DIR
+    cache_files: dict[Path, bytes] = {
+        path: path.read_bytes() for path in cache_dir.rglob("*") if path.is_file()
+    }
+    assert cache_dir / ".gitignore" in cache_files
+
+    result: Result = run_cli_in(
+        tmp_path,
+        [CliCmd.CHECK, CliOpt.APPLY_CHANGES, CliOpt.OUTPUT_FORMAT, OutputFormat.NDJSON.value, "."],
+    )
+
+    assert_SUCCESS(result)
+    assert DEFAULT_RESULT_CACHE_DIR not in result.stdout
+    assert all(name in result.stdout for name in names)
+    assert {path: path.read_bytes() for path in cache_files} == cache_files
+
+
+def test_clear_cache_removes_cache_dir(tmp_path: Path) -> None:
+    """`--clear-cache` should drop previous entries before the run."""
+    names: list[str] = _make_compliant_files(tmp_path)
+    run_cli_in(tmp_path, [CliCmd.STRIP, CliOpt.RESULT_CACHE, *names])
+
+    result: Result = run_cli_in(tmp_path, [CliCmd.STRIP, CliOpt.CLEAR_RESULT_CACHE, *names])
+
+    assert not (tmp_path / DEFAULT_RESULT_CACHE_DIR).exists()
+    assert "result cache" not in result.output
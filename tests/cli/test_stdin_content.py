@@ -20,6 +20,7 @@ no filesystem target is written.
 
 from __future__ import annotations
 
+import tempfile
 import textwrap
 from typing import TYPE_CHECKING
 
@@ -31,8 +32,6 @@ from tests.cli.conftest import assert_SUCCESS
 from tests.cli.conftest import assert_WOULD_CHANGE
 from tests.cli.conftest import run_cli
 from tests.cli.conftest import run_cli_in
-from topmark.cli.commands import check as check_module
-from topmark.cli.commands import strip as strip_module
 from topmark.cli.keys import CliCmd
 from topmark.cli.keys import CliOpt
 from topmark.core.constants import TOPMARK_END_MARKER
@@ -180,105 +179,80 @@ def _headered_stdin_python_content() -> str:
 
 
 @pytest.mark.parametrize(
-    ("cmd", "module", "input_text", "apply", "expected_assertion", "expected_unlinks"),
+    ("cmd", "input_text", "apply", "expected_assertion"),
     [
         pytest.param(
             CliCmd.CHECK,
-            check_module,
             "print('clean')\n",
             False,
             assert_WOULD_CHANGE,
-            0,
             id="check-clean-dry-run",
         ),
         pytest.param(
             CliCmd.CHECK,
-            check_module,
             "print('clean')\n",
             True,
             assert_SUCCESS,
-            1,
             id="check-clean-apply",
         ),
         pytest.param(
             CliCmd.CHECK,
-            check_module,
             _headered_stdin_python_content(),
             False,
             assert_SUCCESS,
-            1,
             id="check-headered-dry-run",
         ),
         pytest.param(
             CliCmd.CHECK,
-            check_module,
             _headered_stdin_python_content(),
             True,
             assert_SUCCESS,
-            1,
             id="check-headered-apply",
         ),
         pytest.param(
             CliCmd.STRIP,
-            strip_module,
             "print('clean')\n",
             False,
             assert_SUCCESS,
-            1,
             id="strip-clean-dry-run",
         ),
         pytest.param(
             CliCmd.STRIP,
-            strip_module,
             "print('clean')\n",
             True,
             assert_SUCCESS,
-            1,
             id="strip-clean-apply",
         ),
         pytest.param(
             CliCmd.STRIP,
-            strip_module,
             _headered_stdin_python_content(),
             False,
             assert_WOULD_CHANGE,
-            0,
             id="strip-headered-dry-run",
         ),
         pytest.param(
             CliCmd.STRIP,
-            strip_module,
             _headered_stdin_python_content(),
             True,
             assert_SUCCESS,
-            1,
             id="strip-headered-apply",
         ),
     ],
 )
-def test_content_stdin_success_cleans_temp_file(
+def test_content_stdin_is_processed_without_temporary_files(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
     cmd: str,
-    module: object,
     input_text: str,
     apply: bool,
     expected_assertion: Callable[[Result], None],
-    expected_unlinks: int,
 ) -> None:
-    """Content-STDIN commands should clean temp files on successful completion paths."""
+    """Content-STDIN commands process the content in memory and create no files."""
     _write_stdin_content_config(tmp_path)
-    unlinked_paths: list[Path] = []
-
-    def record_safe_unlink(path: Path | None) -> None:
-        if path is not None:
-            assert path.exists()
-            unlinked_paths.append(path)
-            path.unlink()
-
-    # Patch safe_unlink on each command module, because each command imports it
-    # into its own module namespace.
-    monkeypatch.setattr(module, "safe_unlink", record_safe_unlink)
+    temp_dir: Path = tmp_path / "tmp"
+    temp_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(temp_dir))
+    before: set[Path] = set(tmp_path.rglob("*"))
 
     args: list[str] = [cmd, "-", CliOpt.STDIN_FILENAME, "stdin.py"]
     if apply:
@@ -291,6 +265,4 @@ def test_content_stdin_success_cleans_temp_file(
     )
 
     expected_assertion(result)
-    assert len(unlinked_paths) == expected_unlinks
-    for path in unlinked_paths:
-        assert not path.exists()
+    assert set(tmp_path.rglob("*")) == before
@@ -17,6 +17,7 @@ signaling that must not pollute payloads are emitted on STDERR.
 
 from __future__ import annotations
 
+import io
 from typing import TYPE_CHECKING
 
 import pytest
@@ -27,12 +28,17 @@ from tests.cli.conftest import run_cli
 from tests.cli.conftest import run_cli_in
 from tests.helpers.json import parse_json_object
 from tests.helpers.ndjson import parse_ndjson_records
+from topmark.cli.console.standard_console import StdConsole
 from topmark.cli.keys import CliCmd
 from topmark.cli.keys import CliOpt
+from topmark.cli.streaming import ProcessingProgressLine
+from topmark.cli.streaming import emit_human_stream_output
+from topmark.cli.streaming import format_processing_progress
 from topmark.cli.streaming import select_exit_code
 from topmark.core.constants import TOPMARK_START_MARKER
 from topmark.core.exit_codes import ExitCode
 from topmark.core.formats import OutputFormat
+from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -227,6 +233,130 @@ def test_human_diff_routes_report_to_stderr_and_diff_payload_to_stdout(tmp_path:
     assert "TopMark" in result.stderr
 
 
+def test_human_progress_flag_is_silent_without_a_terminal(tmp_path: Path) -> None:
+    """`--progress` must not alter either stream when STDERR is not a TTY."""
+    path: Path = tmp_path / "example.py"
+    path.write_text('print("hello")\n', encoding="utf-8")
+
+    plain: Result = run_cli_in(tmp_path, [CliCmd.CHECK, CliOpt.RENDER_DIFF, path.name])
+    with_progress: Result = run_cli_in(
+        tmp_path,
+        [CliCmd.CHECK, CliOpt.RENDER_DIFF, CliOpt.PROGRESS, path.name],
+    )
+
+    assert_SUCCESS_or_WOULD_CHANGE(with_progress)
+    assert with_progress.stdout == plain.stdout
+    assert with_progress.stderr == plain.stderr
+
+
+def test_emit_human_stream_output_terminates_each_written_stream_once(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Incremental fragments are written unterminated and closed by one newline."""
+    out = io.StringIO()
+    emit_human_stream_output(
+        [
+            PipelineCommandHumanOutput(stdout="diff-a", stderr="a.py\n"),
+            PipelineCommandHumanOutput(stdout="\n\ndiff-b", stderr=""),
+            PipelineCommandHumanOutput(stdout="", stderr="\nb.py\n"),
+        ],
+        console=StdConsole(out=out),
+        show_report=True,
+    )
+
+    assert capsys.readouterr().out == "diff-a\n\ndiff-b\n"
+    assert out.getvalue() == "a.py\n\nb.py\n\n"
+
+
+@pytest.mark.parametrize(
+    "output_format",
+    [
+        pytest.param(OutputFormat.TEXT, id="text"),
+        pytest.param(OutputFormat.MARKDOWN, id="markdown"),
+    ],
+)
+def test_human_diff_and_report_keep_line_boundaries_when_streams_are_merged(
+    tmp_path: Path,
+    output_format: OutputFormat,
+) -> None:
+    """Diff payload lines and report lines never share a line in merged output."""
+    (tmp_path / "plain.py").write_text("print(1)\n", encoding="utf-8")
+    (tmp_path / "nonl.py").write_text("print(2)", encoding="utf-8")
+
+    result: Result = run_cli_in(
+        tmp_path,
+        [
+            CliCmd.CHECK,
+            CliOpt.RENDER_DIFF,
+            CliOpt.OUTPUT_FORMAT,
+            output_format.value,
+            "plain.py",
+            "nonl.py",
+        ],
+    )
+
+    assert_SUCCESS_or_WOULD_CHANGE(result)
+    merged: list[str] = result.output.splitlines()
+    assert " print(1)" in merged
+    for line in merged:
+        if line.startswith((" print(", "+", "```")):
+            assert "would insert" not in line, line
+        if "```" in line:
+            assert line in ("```", "```diff"), line
+    assert result.output.endswith("\n")
+
+
+def test_emit_human_stream_output_skips_hidden_report(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A hidden report writes nothing, not even the closing newline."""
+    out = io.StringIO()
+    emit_human_stream_output(
+        [PipelineCommandHumanOutput(stdout="", stderr="a.py\n")],
+        console=StdConsole(out=out),
+        show_report=False,
+    )
+
+    assert capsys.readouterr().out == ""
+    assert out.getvalue() == ""
+
+
+@pytest.mark.parametrize(
+    ("done", "total", "elapsed", "expected"),
+    [
+        pytest.param(0, 40, 0.0, "[ 0/40] 0.0 files/s, ETA -:--", id="not-started"),
+        pytest.param(10, 40, 2.0, "[10/40] 5.0 files/s, ETA 0:06", id="running"),
+        pytest.param(40, 40, 8.0, "[40/40] 5.0 files/s, ETA 0:00", id="done"),
+        pytest.param(1, 1000, 1.0, "[   1/1000] 1.0 files/s, ETA 16:39", id="minutes"),
+    ],
+)
+def test_format_processing_progress(done: int, total: int, elapsed: float, expected: str) -> None:
+    """Progress text reports the counter, throughput, and remaining time."""
+    assert format_processing_progress(done=done, total=total, elapsed=elapsed) == expected
+
+
+def test_processing_progress_line_throttles_and_clears(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """The progress line is redrawn at most once per interval and erased on demand."""
+    now: list[float] = [0.0]
+    progress = ProcessingProgressLine(clock=lambda: now[0], min_interval=1.0)
+    progress.start(total=3)
+
+    now[0] = 0.5
+    progress.advance()
+    now[0] = 0.9
+    progress.advance()  # throttled
+    progress.clear()
+    progress.clear()  # already cleared
+    now[0] = 1.0
+    progress.advance()  # redrawn right after a clear
+
+    assert capsys.readouterr().err == (
+        "\r[1/3] 2.0 files/s, ETA 0:01\x1b[K\r\x1b[K\r[3/3] 3.0 files/s, ETA 0:00\x1b[K"
+    )
+
+
 def test_apply_stdin_content_routes_rewritten_file_to_stdout_and_report_to_stderr() -> None:
     """Apply mode for content-on-STDIN keeps rewritten content isolated on STDOUT."""
     result: Result = run_cli(
@@ -40,6 +40,7 @@ from topmark.config.policy import HeaderMutationMode
 from topmark.config.policy import MutablePolicy
 from topmark.config.resolution.bridge import resolve_toml_sources_and_build_mutable_config
 from topmark.config.resolution.layers import build_config_layers_from_resolved_toml_sources
+from topmark.config.resolution.merge import EffectiveConfigInterner
 from topmark.config.resolution.merge import build_effective_config_for_path
 from topmark.config.resolution.merge import merge_layers_globally
 from topmark.config.resolution.merge import select_applicable_layers
@@ -254,6 +255,57 @@ def test_build_effective_config_for_path_merges_only_applicable_layers(
     assert "file" not in sibling_cfg.field_values
 
 
+def test_effective_config_interner_shares_configs_per_layer_set(
+    tmp_path: Path,
+) -> None:
+    """Paths with the same applicable layers should share one merged config object."""
+    root: Path = tmp_path / "root"
+    child: Path = root / "pkg"
+    nested: Path = child / "sub"
+    sibling: Path = root / "docs"
+    nested.mkdir(parents=True)
+    sibling.mkdir(parents=True)
+
+    write_toml_document(
+        path=root / "pyproject.toml",
+        content="""
+            [tool.topmark.header]
+            fields = ["project", "license"]
+        """,
+    )
+    write_toml_document(
+        path=child / "topmark.toml",
+        content="""
+            [header]
+            fields = ["project", "file"]
+        """,
+    )
+
+    child_files: list[Path] = [child / "a.py", child / "b.py", nested / "c.py"]
+    sibling_files: list[Path] = [sibling / "guide.md", sibling / "intro.md"]
+    for path in (*child_files, *sibling_files):
+        path.write_text("x\n", encoding="utf-8")
+
+    resolved: ResolvedTopmarkTomlSources = resolve_topmark_toml_sources(input_paths=[child])
+    layers: list[ConfigLayer] = build_config_layers_from_resolved_toml_sources(resolved.sources)
+    interner: EffectiveConfigInterner = EffectiveConfigInterner(layers=layers)
+
+    child_cfgs: list[FrozenConfig] = [interner.config_for_path(p) for p in child_files]
+    sibling_cfgs: list[FrozenConfig] = [interner.config_for_path(p) for p in sibling_files]
+
+    assert all(cfg is child_cfgs[0] for cfg in child_cfgs)
+    assert all(cfg is sibling_cfgs[0] for cfg in sibling_cfgs)
+    assert child_cfgs[0] == build_effective_config_for_path(layers, child_files[0]).freeze()
+    assert sibling_cfgs[0] == build_effective_config_for_path(layers, sibling_files[0]).freeze()
+    assert child_cfgs[0].header_fields == ("project", "file")
+    assert sibling_cfgs[0].header_fields == ("project", "license")
+
+    assert interner.stats.lookups == 5
+    assert interner.stats.directories == 3
+    assert interner.stats.distinct_configs == 2
+    assert interner.stats.hits == 3
+
+
 def test_merge_layers_globally_empty_returns_defaults() -> None:
     """Merging an empty layer sequence should fall back to defaults."""
     draft: MutableConfig = merge_layers_globally(())
@@ -11,8 +11,9 @@
 """Developer-validation tests for benchmark-suite configuration.
 
 These tests verify that the repository-scale benchmark suite remains
-registered with the expected workload and pipeline modes without
-executing the benchmarks themselves.
+registered with the expected workload and pipeline modes, and exercise the
+benchmark helpers (comparator, monorepo generator, throughput phases) on
+tiny inputs instead of executing full benchmarks.
 """
 
 from __future__ import annotations
@@ -24,8 +25,11 @@ import pytest
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tools.perf.filetype_resolution_benchmark import ResolutionMeasurement
+    from tools.perf.monorepo_generator import MonorepoStats
     from tools.perf.pipeline_memory_baseline import RunMeasurement
     from tools.perf.pipeline_memory_baseline import Scenario
+    from tools.perf.repository_throughput_benchmark import ThroughputMeasurement
 
 
 def _repository_scenario(
@@ -128,3 +132,250 @@ def test_measurement_from_mapping_accepts_repository_fields() -> None:
     assert measurement.result_count == 250
     assert measurement.result_diff_bytes == 4096
     assert measurement.exit_code is None
+
+
+@pytest.mark.dev_validation
+def test_filetype_resolution_benchmark_restores_registry(
+    tmp_path: Path,
+) -> None:
+    """Resolution benchmark pads the registry temporarily and reports each size."""
+    from tools.perf import filetype_resolution_benchmark as resolution_benchmark
+    from topmark.registry.filetypes import FileTypeRegistry
+
+    before: tuple[str, ...] = FileTypeRegistry.qualified_keys()
+    measurements: list[ResolutionMeasurement] = resolution_benchmark.measure(
+        tmp_path,
+        padding=(0, 5),
+        rounds=1,
+    )
+
+    assert FileTypeRegistry.qualified_keys() == before
+    assert [m.synthetic_file_types for m in measurements] == [0, 5]
+    assert measurements[1].registered_file_types == measurements[0].registered_file_types + 5
+    assert all(m.indexed_ns_per_path > 0 and m.full_scan_ns_per_path > 0 for m in measurements)
+
+
+@pytest.mark.dev_validation
+def test_sniff_perf_scenario_exceeds_sniff_window(
+    tmp_path: Path,
+) -> None:
+    """Sniff throughput files are larger than the window the sniffer inspects."""
+    from tools.perf import pipeline_memory_baseline as baseline
+
+    assert baseline.SUITE_SCENARIOS["sniff"] == baseline.SNIFF_SCENARIOS
+    scenarios: list[Scenario] = baseline.build_scenarios(tmp_path, include_large=False)
+    scenario: Scenario = next(s for s in scenarios if s.name == "sniff_many_64kb")
+
+    assert scenario.file_count == baseline.SNIFF_FILE_COUNT
+    sizes: set[int] = {path.stat().st_size for path in scenario.path.rglob("*.py")}
+    assert min(sizes) > baseline.SNIFF_WINDOW_BYTES
+
+
+def _measurement_payload(
+    *,
+    scenario: str = "small_1kb_missing_header",
+    mode: str = "check",
+    elapsed_ms: float,
+    peak_bytes: int = 1_000_000,
+    rss_bytes: int | None = None,
+) -> dict[str, object]:
+    """Return a minimal single-file measurement payload for comparator tests."""
+    views: dict[str, int | bool] = {"image_lines": 0, "updated_lines": 0, "diff_bytes": 0}
+    return {
+        "scenario": scenario,
+        "mode": mode,
+        "file_size_bytes": 1024,
+        "elapsed_ns": int(elapsed_ms * 1_000_000),
+        "peak_tracemalloc_bytes": peak_bytes,
+        "final_tracemalloc_bytes": 0,
+        "max_observed_rss_bytes": rss_bytes,
+        "stdout_bytes": 0,
+        "input_file_count": 1,
+        "result_count": 1,
+        "result_diff_bytes": 0,
+        "status": {},
+        "views_before_prune": views,
+        "views_after_prune": views,
+        "steps": [],
+    }
+
+
+def _write_run(runs_dir: Path, run_id: str, payloads: list[dict[str, object]]) -> None:
+    """Write a preserved run directory like `pipeline_memory_baseline.py` does."""
+    import json
+
+    run_dir: Path = runs_dir / run_id
+    run_dir.mkdir(parents=True)
+    report: dict[str, object] = {"platform": "linux", "measurements": payloads}
+    (run_dir / "report.json").write_text(json.dumps(report), encoding="utf-8")
+    (run_dir / "manifest.json").write_text(json.dumps({"report": "report.json"}), encoding="utf-8")
+
+
+@pytest.mark.dev_validation
+def test_perf_compare_uses_medians_and_noise_allowance() -> None:
+    """Comparator reduces repeats to medians and widens budgets by the sample spread."""
+    from tools.perf import pipeline_memory_baseline as baseline
+    from tools.perf import pipeline_perf_compare as compare
+
+    def _samples(*elapsed_ms: float) -> list[RunMeasurement]:
+        return [
+            baseline.measurement_from_mapping(_measurement_payload(elapsed_ms=ms))
+            for ms in elapsed_ms
+        ]
+
+    steady = compare.compare_metric(
+        scenario="s",
+        mode="m",
+        metric="elapsed",
+        baseline=_samples(100, 100, 100),
+        candidate=_samples(100, 130, 500),
+        budget_pct=15.0,
+    )
+    assert (steady.baseline_median, steady.candidate_median) == (100_000_000, 130_000_000)
+    assert steady.delta_pct == pytest.approx(30.0)
+    # The outlier widens the allowance beyond the 30% delta.
+    assert steady.noise_pct == pytest.approx(400 / 130 / 2 * 100)
+    assert steady.status == "ok"
+
+    regressed = compare.compare_metric(
+        scenario="s",
+        mode="m",
+        metric="elapsed",
+        baseline=_samples(100, 101, 99),
+        candidate=_samples(130, 131, 129),
+        budget_pct=15.0,
+    )
+    assert regressed.status == "regressed"
+
+    below_floor = compare.compare_metric(
+        scenario="s",
+        mode="m",
+        metric="elapsed",
+        baseline=_samples(1),
+        candidate=_samples(2),
+        budget_pct=15.0,
+    )
+    assert below_floor.delta_pct == pytest.approx(100.0)
+    assert below_floor.status == "ok"
+
+    no_rss = compare.compare_metric(
+        scenario="s",
+        mode="m",
+        metric="max_rss",
+        baseline=_samples(1),
+        candidate=_samples(1),
+        budget_pct=10.0,
+    )
+    assert no_rss.status == "unavailable"
+
+
+@pytest.mark.dev_validation
+def test_perf_compare_matches_pairs_and_enforces_budgets(
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Comparator matches scenario/mode pairs across runs and fails only with --enforce."""
+    from tools.perf import pipeline_perf_compare as compare
+
+    _write_run(
+        tmp_path,
+        "base",
+        [
+            _measurement_payload(elapsed_ms=100),
+            _measurement_payload(mode="strip", elapsed_ms=100),
+        ],
+    )
+    _write_run(
+        tmp_path,
+        "cand",
+        [
+            _measurement_payload(elapsed_ms=100, peak_bytes=2_000_000),
+            _measurement_payload(mode="check_diff", elapsed_ms=100),
+        ],
+    )
+
+    comparison = compare.compare_runs(
+        [compare.load_run("base", runs_dir=tmp_path)],
+        [compare.load_run("cand", runs_dir=tmp_path)],
+    )
+    assert comparison.only_in_baseline == ["small_1kb_missing_header/strip"]
+    assert comparison.only_in_candidate == ["small_1kb_missing_header/check_diff"]
+    assert [(item.metric, item.status) for item in comparison.regressions] == [
+        ("peak_traced", "regressed")
+    ]
+
+    args: list[str] = ["--runs-dir", str(tmp_path), "--baseline", "base", "--candidate", "cand"]
+    assert compare.main(args) == 0
+    assert compare.main([*args, "--enforce"]) == 1
+    assert compare.main([*args, "--enforce", "--budget", "peak_traced=150"]) == 0
+    captured = capsys.readouterr()
+    assert "| small_1kb_missing_header | check | peak_traced |" in captured.out
+    assert "peak_traced +100.0% exceeds allowed 5.0%" in captured.err
+
+
+@pytest.mark.dev_validation
+def test_monorepo_generator_is_deterministic_and_matches_discovery(
+    tmp_path: Path,
+) -> None:
+    """Generated trees are reproducible, and discovery selects exactly the content files."""
+    from tools.perf import monorepo_generator as generator
+    from tools.perf import repository_throughput_benchmark as throughput
+
+    spec = generator.MonorepoSpec(files=120, depth=2, fanout=3, files_per_dir=10, file_types=4)
+    first: MonorepoStats = generator.generate_monorepo(tmp_path / "a", spec)
+    second: MonorepoStats = generator.generate_monorepo(tmp_path / "b", spec)
+
+    def _snapshot(root: Path) -> dict[str, bytes]:
+        return {
+            path.relative_to(root).as_posix(): path.read_bytes()
+            for path in sorted(root.rglob("*"))
+            if path.is_file()
+        }
+
+    assert _snapshot(first.root) == _snapshot(second.root)
+    assert first.selected_files + first.excluded_files == 120
+    assert sum(first.headers.values()) == first.selected_files
+    assert first.config_layers > 0
+    assert len(first.file_types) == 4
+
+    discovered = throughput.discover(first.root)
+
+    assert len(discovered.file_list) == first.selected_files
+    assert all(generator.EXCLUDED_DIR_NAME not in path.parts for path in discovered.file_list)
+    assert sum(path.stat().st_size for path in discovered.file_list) == first.selected_bytes
+
+    # A run anchored inside the tree also loads the nested layers above it,
+    # which restate root values and leave the rendered header unchanged.
+    package: Path = first.root / "d00" / "d00"
+    nested = throughput.discover(package)
+    assert nested.config_layers == discovered.config_layers + 2
+    assert nested.file_list
+    assert all(path.is_relative_to(package) for path in nested.file_list)
+    assert {cfg.field_values.get("project") for cfg in nested.path_configs.values()} == {
+        generator.PROJECT_FIELD
+    }
+
+
+@pytest.mark.dev_validation
+def test_repository_throughput_phases_report_outcomes(
+    tmp_path: Path,
+) -> None:
+    """Throughput phases process every discovered file and apply rewrites stale headers."""
+    from tools.perf import monorepo_generator as generator
+    from tools.perf import repository_throughput_benchmark as throughput
+
+    spec = generator.MonorepoSpec(files=40, depth=1, fanout=2, file_types=3, layer_depth=1)
+    stats, measurements = throughput.measure_tree(
+        spec,
+        work_dir=tmp_path,
+        jobs=[1],
+        phases=throughput.PHASES,
+        repeat=1,
+    )
+
+    by_phase: dict[str, ThroughputMeasurement] = {m.phase: m for m in measurements}
+    assert list(by_phase) == list(throughput.PHASES)
+    assert {m.files for m in measurements} == {stats.selected_files}
+    assert by_phase["check"].written == 0
+    assert by_phase["check_apply"].written == stats.headers["outdated"] + stats.headers["missing"]
+    assert all(m.files_per_s > 0 and m.mb_per_s > 0 for m in measurements)
@@ -26,6 +26,7 @@ from topmark.filetypes.instances import (
     _iter_plugin_filetypes,  # pyright: ignore[reportPrivateUsage]
 )
 from topmark.filetypes.instances import get_base_file_type_registry
+from topmark.filetypes.instances import get_plugin_entry_points
 from topmark.registry.filetypes import FileTypeRegistry
 
 if TYPE_CHECKING:
@@ -63,6 +64,7 @@ def test_plugins_are_discovered(monkeypatch: pytest.MonkeyPatch) -> None:
         lambda: SimpleNamespace(select=_select),
     )
 
+    get_plugin_entry_points.cache_clear()
     get_base_file_type_registry.cache_clear()
 
     # Also clear the composed/effective registry cache so it re-composes from the
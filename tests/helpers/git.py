@@ -0,0 +1,46 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : git.py
+#   file_relpath : tests/helpers/git.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Shared helpers for tests that drive a local git repository.
+
+Tests that use these helpers should skip themselves when `git` is not on `PATH`.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def run_git(repo: Path, *args: str) -> None:
+    """Run a git command in `repo` with a fixed identity.
+
+    Args:
+        repo: Working directory of the command.
+        *args: Git subcommand and its arguments.
+    """
+    subprocess.run(  # noqa: S603 - fixed argv, no shell
+        [  # noqa: S607 - git is looked up on PATH like in production
+            "git",
+            "-c",
+            "user.name=TopMark Tests",
+            "-c",
+            "user.email=tests@example.invalid",
+            "-c",
+            "commit.gpgsign=false",
+            *args,
+        ],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
@@ -14,9 +14,10 @@ This module contains reusable utilities for tests that exercise TopMark's
 step-based processing pipeline directly, without routing through the CLI or
 public API layers.
 
-It provides three main groups of helpers:
+It provides four main groups of helpers:
     - pipeline/context bootstrap helpers
     - step-runner and flow helpers for common step chains
+    - engine helpers that run the `check` pipeline over generated files
     - block-signature/materialization helpers for robust assertions
 
 The goal is to keep pipeline tests concise while still using the same
@@ -25,6 +26,7 @@ The goal is to keep pipeline tests concise while still using the same
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -32,16 +34,19 @@ from typing_extensions import NotRequired
 from typing_extensions import Required
 from typing_extensions import TypedDict
 
+from tests.helpers.config import make_frozen_config
 from tests.helpers.registry import resolve_processor_for_path
 from topmark.config.policy import PolicyRegistry
 from topmark.config.policy import make_policy_registry
 from topmark.core.constants import STANDARD_NEWLINES
 from topmark.core.formats import OutputFormat
+from topmark.pipeline import engine
 from topmark.pipeline.context.model import ProcessingContext
 from topmark.pipeline.pipelines import CHECK_PATCH_PIPELINE
 from topmark.pipeline.pipelines import CHECK_SUMMMARY_PIPELINE
 from topmark.pipeline.pipelines import PipelineDefinition
 from topmark.pipeline.pipelines import PipelineSelection
+from topmark.pipeline.pipelines import select_pipeline
 from topmark.pipeline.status import ContentStatus
 from topmark.pipeline.status import FsStatus
 from topmark.pipeline.status import ResolveStatus
@@ -65,7 +70,10 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from topmark.config.model import FrozenConfig
+    from topmark.config.types import FileWriteStrategy
+    from topmark.config.types import WriteDurability
     from topmark.pipeline.protocols import Step
+    from topmark.pipeline.result import ProcessingResult
     from topmark.processors.base import HeaderProcessor
 
 TEST_NOOP_PIPELINE_DEFINITION: PipelineDefinition = PipelineDefinition(
@@ -178,6 +186,80 @@ def run_writer(ctx: ProcessingContext) -> ProcessingContext:
     return WriterStep()(ctx)
 
 
+# ---- Engine helpers ----
+
+
+def make_python_files(root: Path, count: int) -> list[Path]:
+    """Create `count` header-less Python modules under `root`.
+
+    Module `module_<index>.py` contains `print(<index>)`, so every file has
+    distinct content. `root` is created if needed.
+
+    Args:
+        root: Directory to create the files in.
+        count: Number of files to create.
+
+    Returns:
+        The created paths, in index order.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for index in range(count):
+        path: Path = root / f"module_{index}.py"
+        path.write_text(f"print({index})\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def run_check_for_files(
+    file_list: Sequence[Path],
+    *,
+    apply: bool = False,
+    diff: bool = False,
+    config: FrozenConfig | None = None,
+    jobs: int = 1,
+    result_cache_dir: Path | None = None,
+    file_write_strategy: FileWriteStrategy | None = None,
+    write_durability: WriteDurability | None = None,
+) -> tuple[list[ProcessingResult], engine.PipelineExecutionState]:
+    """Run the `check` pipeline over `file_list` through the engine.
+
+    Args:
+        file_list: Files to process, in order.
+        apply: Whether to write the changes.
+        diff: Whether to retain unified diffs.
+        config: Run configuration; defaults to a config rendering only the `file` field.
+        jobs: Number of worker processes.
+        result_cache_dir: Result cache directory, or `None` to run uncached.
+        file_write_strategy: Write strategy for applied changes.
+        write_durability: Directory sync mode for atomic writes.
+
+    Returns:
+        The results in input order and the engine's execution state.
+    """
+    pipeline: PipelineSelection = select_pipeline("check", apply=apply, diff=diff)
+    run_options: RunOptions = replace(
+        RunOptions.from_pipeline_selection(
+            pipeline,
+            file_write_strategy=file_write_strategy,
+            jobs=jobs,
+            result_cache_dir=result_cache_dir,
+        ),
+        write_durability=write_durability,
+    )
+    state: engine.PipelineExecutionState = engine.PipelineExecutionState()
+    results: list[ProcessingResult] = list(
+        engine.iter_results_for_files(
+            run_options=run_options,
+            config=config if config is not None else make_frozen_config(header_fields=["file"]),
+            pipeline=pipeline,
+            file_list=list(file_list),
+            state=state,
+        ),
+    )
+    return results, state
+
+
 # ---- Context/bootstrap helpers ----
 
 
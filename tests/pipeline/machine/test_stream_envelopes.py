@@ -31,16 +31,19 @@ from topmark.pipeline.machine.envelopes import iter_processing_results_stream_nd
 from topmark.pipeline.machine.streaming import MachineProcessingResultEvent
 from topmark.pipeline.machine.streaming import MachineRunCompletedEvent
 from topmark.pipeline.machine.streaming import MachineRunStartedEvent
+from topmark.pipeline.machine.streaming import iter_machine_processing_stream
 from topmark.pipeline.result import ProcessingResult
 from topmark.toml.resolution import ResolvedTopmarkTomlSources
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
     from typing import TypeAlias
 
     from topmark.config.model import FrozenConfig
     from topmark.core.machine.schemas import MetaPayload
     from topmark.pipeline.context.model import ProcessingContext
+    from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
 
     SerializerContext: TypeAlias = tuple[
         MetaPayload,
@@ -1033,3 +1036,103 @@ def test_probe_ndjson_stream_adapter_rejects_empty_stream() -> None:
                 events=(),
             )
         )
+
+
+@pytest.mark.parametrize("summary_mode", [False, True])
+def test_processing_ndjson_stream_ends_with_run_totals(
+    tmp_path: Path,
+    summary_mode: bool,
+) -> None:
+    """Processing NDJSON closes with one `totals` record counting the streamed results."""
+    meta, config, resolved_toml_sources = _serializer_context()
+    result: ProcessingResult = _processing_result(tmp_path, config)
+
+    records: list[dict[str, object]] = list(
+        iter_processing_results_stream_ndjson_records(
+            meta=meta,
+            config=config,
+            resolved_toml=resolved_toml_sources,
+            events=iter_machine_processing_stream(
+                iter((result, result)), command="check", selected_count=2
+            ),
+            summary_mode=summary_mode,
+        )
+    )
+
+    kinds: list[object] = [record["kind"] for record in records]
+    assert kinds.count("totals") == 1
+    assert records[-1] == {"kind": "totals", "meta": meta, "totals": {"count": 2}}
+
+
+def test_probe_ndjson_stream_ends_with_run_totals() -> None:
+    """Probe NDJSON closes with a `totals` record even when nothing was probed."""
+    meta, config, resolved_toml_sources = _serializer_context()
+
+    records: list[dict[str, object]] = list(
+        iter_probe_results_stream_ndjson_records(
+            meta=meta,
+            config=config,
+            resolved_toml=resolved_toml_sources,
+            events=iter_machine_processing_stream((), command="probe"),
+        )
+    )
+
+    assert records[-1] == {"kind": "totals", "meta": meta, "totals": {"count": 0}}
+
+
+def test_processing_ndjson_records_stream_before_results_are_exhausted(
+    tmp_path: Path,
+) -> None:
+    """Each result record is yielded before the producer computes the next result."""
+    meta, config, resolved_toml_sources = _serializer_context()
+    result: ProcessingResult = _processing_result(tmp_path, config)
+    produced: list[int] = []
+
+    def _results() -> Iterator[ProcessingResult]:
+        for index in range(3):
+            produced.append(index)
+            yield result
+
+    records: Iterator[dict[str, object]] = iter_processing_results_stream_ndjson_records(
+        meta=meta,
+        config=config,
+        resolved_toml=resolved_toml_sources,
+        events=iter_machine_processing_stream(_results(), command="check", selected_count=3),
+        summary_mode=False,
+    )
+
+    kinds: list[object] = []
+    for record in records:
+        kinds.append(record["kind"])
+        if record["kind"] == "result":
+            # The record for result N is available while only N + 1 results exist.
+            assert len(produced) == kinds.count("result")
+    assert kinds.count("result") == 3
+
+
+def test_machine_processing_stream_wraps_iterators_in_run_lifecycle(tmp_path: Path) -> None:
+    """The lazy stream adapter frames iterator results with run-start and run-completed."""
+    _meta, config, _resolved_toml_sources = _serializer_context()
+    result: ProcessingResult = _processing_result(tmp_path, config)
+
+    events: list[MachineProcessingStreamEvent] = list(
+        iter_machine_processing_stream(iter((result, result)), command="strip", selected_count=2)
+    )
+
+    started: MachineProcessingStreamEvent = events[0]
+    completed: MachineProcessingStreamEvent = events[-1]
+    assert isinstance(started, MachineRunStartedEvent)
+    assert (started.selected_count, started.paths) == (2, ())
+    assert isinstance(completed, MachineRunCompletedEvent)
+    assert [
+        event.index for event in events[1:-1] if isinstance(event, MachineProcessingResultEvent)
+    ] == [0, 1]
+
+
+def test_machine_processing_stream_requires_count_for_iterators(tmp_path: Path) -> None:
+    """Streaming from an iterator needs the selected count from file-list resolution."""
+    _meta, config, _resolved_toml_sources = _serializer_context()
+    result: ProcessingResult = _processing_result(tmp_path, config)
+
+    with pytest.raises(TypeError, match="selected_count is required"):
+        next(iter_machine_processing_stream(iter((result,)), command="check"))
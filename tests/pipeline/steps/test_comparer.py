@@ -302,37 +302,68 @@ def test_comparer_accepts_zero_width_insertion_at_image_boundary(tmp_path: Path)
     assert ctx.status.comparison is ComparisonStatus.CHANGED
 
 
-@pytest.mark.parametrize(
-    "edits",
-    [
-        (),
-        (
+def test_comparer_empty_edits_fall_back_to_full_image_comparison(
+    tmp_path: Path,
+) -> None:
+    """An empty edit tuple is not authoritative for the fast path."""
+    ctx: ProcessingContext = _make_comparer_context(
+        tmp_path / "edit-count.py",
+        image_lines=["same\n"],
+    )
+    ctx.views.updated = UpdatedView(lines=["same\n"])
+    ctx.views.edit = EditView(edits=())
+
+    ComparerStep()(ctx)
+
+    assert ctx.status.comparison is ComparisonStatus.UNCHANGED
+
+
+def test_comparer_multiple_ordered_edits_prove_change(
+    tmp_path: Path,
+) -> None:
+    """Several ordered, in-bounds edits are authoritative like a single edit."""
+    ctx: ProcessingContext = _make_comparer_context(
+        tmp_path / "multi-edit.py",
+        image_lines=["\ufeffhead\n", "body\n"],
+    )
+    ctx.views.updated = UpdatedView(lines=["head\n", "body\n", "added\n"])
+    ctx.views.edit = EditView(
+        edits=(
             PlannedEdit(
                 kind=PlanEditKind.REPLACE,
                 old_start=0,
                 old_end=1,
-                new_lines=("same\n",),
+                new_lines=("head\n",),
             ),
             PlannedEdit(
                 kind=PlanEditKind.INSERT,
-                old_start=1,
-                old_end=1,
-                new_lines=("extra\n",),
+                old_start=2,
+                old_end=2,
+                new_lines=("added\n",),
             ),
-        ),
-    ],
-)
-def test_comparer_empty_or_multiple_edits_fall_back_to_full_image_comparison(
+        )
+    )
+
+    ComparerStep()(ctx)
+
+    assert ctx.status.comparison is ComparisonStatus.CHANGED
+
+
+def test_comparer_overlapping_edits_fall_back_to_full_image_comparison(
     tmp_path: Path,
-    edits: tuple[PlannedEdit, ...],
 ) -> None:
-    """Only exactly one structured edit is authoritative for the fast path."""
+    """Out-of-order edit metadata should not bypass full-image comparison."""
     ctx: ProcessingContext = _make_comparer_context(
-        tmp_path / "edit-count.py",
-        image_lines=["same\n"],
+        tmp_path / "overlap.py",
+        image_lines=["same\n", "body\n"],
+    )
+    ctx.views.updated = UpdatedView(lines=["same\n", "body\n"])
+    ctx.views.edit = EditView(
+        edits=(
+            PlannedEdit(kind=PlanEditKind.REMOVE, old_start=1, old_end=2, new_lines=()),
+            PlannedEdit(kind=PlanEditKind.REMOVE, old_start=0, old_end=1, new_lines=()),
+        )
     )
-    ctx.views.updated = UpdatedView(lines=["same\n"])
-    ctx.views.edit = EditView(edits=edits)
 
     ComparerStep()(ctx)
 
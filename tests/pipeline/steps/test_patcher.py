@@ -16,6 +16,7 @@ updated-image fallback, status/hint semantics, and raw newline preservation.
 
 from __future__ import annotations
 
+import difflib
 import logging
 from typing import TYPE_CHECKING
 
@@ -592,16 +593,9 @@ def test_patcher_falls_back_for_mismatching_structured_edit(
     assert "different" not in diff_text
 
 
-def test_patcher_falls_back_for_multiple_structured_edits(
-    tmp_path: Path,
-) -> None:
-    """Multiple edits should use the full updated image because the fast path is contiguous."""
-    ctx: ProcessingContext = _make_patcher_context(
-        tmp_path / "multiple_edits.py",
-        image_lines=["old one\n", "body\n", "old two\n"],
-        updated_lines=["new one\n", "body\n", "new two\n"],
-    )
-    ctx.views.edit = EditView(
+def _two_separate_edits() -> EditView:
+    """Return two edits far enough apart to render as separate hunks."""
+    return EditView(
         edits=(
             PlannedEdit(
                 kind=PlanEditKind.REPLACE,
@@ -611,22 +605,61 @@ def test_patcher_falls_back_for_multiple_structured_edits(
             ),
             PlannedEdit(
                 kind=PlanEditKind.REPLACE,
-                old_start=2,
-                old_end=3,
+                old_start=9,
+                old_end=10,
                 new_lines=("new two\n",),
             ),
         )
     )
 
+
+def test_patcher_renders_multiple_structured_edits_as_separate_hunks(
+    tmp_path: Path,
+) -> None:
+    """Multiple ordered edits should render directly, without an updated image."""
+    body: list[str] = [f"body {i}\n" for i in range(8)]
+    ctx: ProcessingContext = _make_patcher_context(
+        tmp_path / "multiple_edits.py",
+        image_lines=["old one\n", *body, "old two\n"],
+        updated_lines=None,
+    )
+    ctx.views.edit = _two_separate_edits()
+
     ctx = run_patcher(ctx)
 
     assert ctx.status.patch is PatchStatus.GENERATED
     assert ctx.views.diff is not None
     assert ctx.views.diff.text is not None
-    assert "-old one\n" in ctx.views.diff.text
-    assert "+new one\n" in ctx.views.diff.text
-    assert "-old two\n" in ctx.views.diff.text
-    assert "+new two\n" in ctx.views.diff.text
+    expected: list[str] = list(
+        difflib.unified_diff(
+            ["old one\n", *body, "old two\n"],
+            ["new one\n", *body, "new two\n"],
+            n=3,
+        )
+    )
+    # Compare hunks only; the file label lines carry paths and timestamps.
+    assert ctx.views.diff.text.splitlines(keepends=True)[2:] == expected[2:]
+    assert ctx.views.diff.text.count("@@ -") == 2
+
+
+def test_patcher_falls_back_when_multi_edit_window_mismatches_updated_image(
+    tmp_path: Path,
+) -> None:
+    """Edits that disagree with the updated image inside a diff window use difflib."""
+    body: list[str] = [f"body {i}\n" for i in range(8)]
+    ctx: ProcessingContext = _make_patcher_context(
+        tmp_path / "multiple_edits_mismatch.py",
+        image_lines=["old one\n", *body, "old two\n"],
+        updated_lines=["new one\n", *body, "other two\n"],
+    )
+    ctx.views.edit = _two_separate_edits()
+
+    ctx = run_patcher(ctx)
+
+    assert ctx.views.diff is not None
+    assert ctx.views.diff.text is not None
+    assert "+other two\n" in ctx.views.diff.text
+    assert "+new two\n" not in ctx.views.diff.text
 
 
 def test_patcher_falls_back_when_structured_shadow_diff_is_unavailable(
@@ -736,7 +769,7 @@ def test_patcher_falls_back_when_structured_renderer_returns_no_patch(
     def _render_no_patch(
         *,
         original_lines: Sequence[str],
-        edit: PlannedEdit,
+        edits: Sequence[PlannedEdit],
         fromfile: str,
         tofile: str,
         fromfiledate: str,
@@ -750,7 +783,7 @@ def test_patcher_falls_back_when_structured_renderer_returns_no_patch(
             None: Always returns ``None`` to simulate a structured renderer that
             declines to render the supplied edit.
         """
-        del original_lines, edit, fromfile, tofile, fromfiledate, tofiledate, lineterm, context
+        del original_lines, edits, fromfile, tofile, fromfiledate, tofiledate, lineterm, context
         return None
 
     monkeypatch.setattr(
@@ -44,6 +44,8 @@ from topmark.config.policy import make_policy_registry
 from topmark.core.constants import TOPMARK_END_MARKER
 from topmark.core.constants import TOPMARK_START_MARKER
 from topmark.diagnostic.model import DiagnosticLevel
+from topmark.filetypes.detectors.jsonc import looks_like_jsonc
+from topmark.filetypes.model import ContentGate
 from topmark.filetypes.model import InsertCapability
 from topmark.filetypes.model import InsertCheckResult
 from topmark.pipeline.hints import Axis
@@ -55,8 +57,11 @@ from topmark.pipeline.status import ResolveStatus
 from topmark.pipeline.steps.reader import ReaderStep
 from topmark.pipeline.steps.reader import _newline_histogram  # pyright: ignore[reportPrivateUsage]
 from topmark.processors.base import HeaderProcessor
+from topmark.utils.source import FileSource
 
 if TYPE_CHECKING:
+    from typing import IO
+    from typing import Any
     from typing import NoReturn
 
     from tests.conftest import EffectiveRegistries
@@ -920,11 +925,11 @@ def test_reader_maps_open_failure_to_terminal_unreadable(
     file.write_text("body\n", encoding="utf-8")
     ctx: ProcessingContext = _resolved_context(file, effective_registries)
 
-    def _fail_open(path: Path, *args: object, **kwargs: object) -> NoReturn:
-        del path, args, kwargs
+    def _fail_load(source: FileSource) -> NoReturn:
+        del source
         raise OSError("read failure at test boundary")
 
-    monkeypatch.setattr(Path, "open", _fail_open)
+    monkeypatch.setattr(FileSource, "_load", _fail_load)
     ctx = run_reader(ctx)
 
     assert ctx.status.content == ContentStatus.UNREADABLE
@@ -941,3 +946,43 @@ def test_reader_maps_open_failure_to_terminal_unreadable(
         cluster=Cluster.SKIPPED,
         message="cannot read content",
     )
+
+
+def test_resolver_probe_sniffer_and_reader_share_one_file_read(
+    tmp_path: Path,
+    effective_registries: EffectiveRegistries,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Content probing, sniffing and reading a JSONC file open it exactly once."""
+    file: Path = tmp_path / "settings.json"
+    file.write_text('{\n  // comment\n  "a": 1\n}\n', encoding="utf-8")
+    file_type = make_file_type(
+        local_key="jsonc",
+        extensions=[".json"],
+        content_matcher=looks_like_jsonc,
+        content_gate=ContentGate.IF_EXTENSION,
+    )
+    original_open = Path.open
+
+    def _guarded_open(path: Path, *args: object, **kwargs: object) -> IO[Any]:
+        if path == file:
+            raise AssertionError(f"unexpected extra open of {path}")
+        return original_open(path, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(Path, "open", _guarded_open)
+    with effective_registries(
+        {file_type.local_key: file_type},
+        {file_type.local_key: HeaderProcessor()},
+    ):
+        ctx: ProcessingContext = make_pipeline_context(
+            file,
+            mutable_config_from_defaults().freeze(),
+        )
+        ctx = run_reader(run_sniffer(run_resolver(ctx)))
+
+    assert ctx.file_type is file_type
+    assert ctx.status.content == ContentStatus.OK
+    assert materialize_image_lines(ctx)[1] == "  // comment\n"
+    assert ctx.source is not None
+    assert (ctx.source.stats.opens, ctx.source.stats.reads) == (1, 1)
+    assert ctx.source.is_loaded is False
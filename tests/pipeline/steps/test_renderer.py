@@ -36,6 +36,7 @@ from topmark.pipeline.views import ViewSlot
 from topmark.processors.base import HeaderProcessor
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from collections.abc import Mapping
     from pathlib import Path
 
@@ -65,6 +66,7 @@ class RecordingProcessor(HeaderProcessor):
     def __init__(self) -> None:
         super().__init__()
         self.calls: list[RenderCall] = []
+        self.static_fields: list[frozenset[str] | None] = []
         self.soft_overflow_field: str | None = None
 
     def render_header_lines(
@@ -79,8 +81,10 @@ class RecordingProcessor(HeaderProcessor):
         line_indent_override: str | None = None,
         header_indent_override: str | None = None,
         soft_overflow_fields: set[str] | None = None,
+        static_fields: Collection[str] | None = None,
     ) -> list[str]:
         """Record the orchestration arguments and return fixed rendered lines."""
+        self.static_fields.append(None if static_fields is None else frozenset(static_fields))
         assert block_prefix_override is None
         assert block_suffix_override is None
         assert line_prefix_override is None
@@ -115,10 +119,13 @@ def _renderer_config(
     allow_empty_header: bool = False,
     max_header_line_length: int | None = None,
     wrap_fields: list[str] | None = None,
+    field_values: dict[str, str] | None = None,
 ) -> FrozenConfig:
     """Return a coherent effective config with explicit renderer inputs."""
     config: MutableConfig = mutable_config_from_defaults()
     config.header_fields = header_fields
+    if field_values is not None:
+        config.field_values = field_values
     config.policy.render_empty_header_when_no_fields = allow_empty_header
     config.max_header_line_length = max_header_line_length
     if wrap_fields is not None:
@@ -188,6 +195,24 @@ def test_renderer_passes_selected_fields_config_and_newline_to_processor(tmp_pat
     assert ctx.diagnostic_hints.items == []
 
 
+def test_renderer_marks_configured_field_values_as_static(tmp_path: Path) -> None:
+    """Fields set in `[fields]` are the ones the processor may cache across files."""
+    cfg: FrozenConfig = _renderer_config(
+        header_fields=["project", "file"],
+        field_values={"project": "TopMark", "license": "MIT"},
+    )
+    ctx, processor = _renderer_context(
+        tmp_path / "source.py",
+        cfg,
+        generation=GenerationStatus.GENERATED,
+        selected={"project": "TopMark", "file": "source.py"},
+    )
+
+    run_renderer(ctx)
+
+    assert processor.static_fields == [frozenset({"project", "license"})]
+
+
 def test_renderer_reports_one_nonfailing_soft_width_hint_per_field(
     tmp_path: Path,
 ) -> None:
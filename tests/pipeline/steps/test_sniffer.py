@@ -23,6 +23,7 @@ context and can short-circuit with a terminal filesystem status.
 
 from __future__ import annotations
 
+import random
 from datetime import timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -176,6 +177,41 @@ def test_count_newlines_commits_unpaired_carried_cr(
     assert carry_cr is False
 
 
+def _count_newlines_bytewise(buf: bytes) -> _NLCounts:
+    """Reference newline counter walking a complete buffer one byte at a time."""
+    lf = crlf = cr = 0
+    i: int = 0
+    while i < len(buf):
+        if buf[i : i + 2] == b"\r\n":
+            crlf += 1
+            i += 2
+            continue
+        if buf[i : i + 1] == b"\n":
+            lf += 1
+        elif buf[i : i + 1] == b"\r":
+            cr += 1
+        i += 1
+    return _NLCounts(lf=lf, crlf=crlf, cr=cr)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_count_newlines_matches_bytewise_scan_for_any_chunking(seed: int) -> None:
+    """Bulk counting with CR carry equals a byte-wise scan for arbitrary chunk splits."""
+    rng: random.Random = random.Random(seed)  # noqa: S311 - deterministic test data
+    buf: bytes = bytes(rng.choice(b"ab\r\n") for _ in range(rng.randint(0, 200)))
+    cuts: list[int] = sorted(rng.sample(range(len(buf) + 1), k=min(4, len(buf) + 1)))
+
+    lf = crlf = cr = 0
+    carry_cr: bool = False
+    for start, end in zip([0, *cuts], [*cuts, len(buf)], strict=True):
+        counts, carry_cr = _count_newlines(buf[start:end], carry_cr=carry_cr)
+        lf, crlf, cr = lf + counts.lf, crlf + counts.crlf, cr + counts.cr
+    if carry_cr:
+        cr += 1
+
+    assert _NLCounts(lf=lf, crlf=crlf, cr=cr) == _count_newlines_bytewise(buf)
+
+
 def test_sniffer_commits_trailing_cr_at_end_of_stream(
     tmp_path: Path,
     effective_registries: EffectiveRegistries,
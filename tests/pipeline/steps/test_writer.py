@@ -24,6 +24,7 @@ from topmark.config.io.deserializers import mutable_config_from_defaults
 from topmark.config.policy import HeaderMutationMode
 from topmark.config.types import FileWriteStrategy
 from topmark.config.types import OutputTarget
+from topmark.config.types import WriteDurability
 from topmark.diagnostic.model import DiagnosticLevel
 from topmark.pipeline.context.model import HaltState
 from topmark.pipeline.hints import Axis
@@ -64,6 +65,7 @@ def _make_writer_context(
     plan_status: PlanStatus = PlanStatus.REPLACED,
     output_target: OutputTarget = OutputTarget.FILE,
     file_write_strategy: FileWriteStrategy | None = FileWriteStrategy.ATOMIC,
+    write_durability: WriteDurability | None = None,
 ) -> ProcessingContext:
     """Create a minimal post-planner context for writer step tests."""
     cfg: FrozenConfig = mutable_config_from_defaults().freeze()
@@ -72,6 +74,7 @@ def _make_writer_context(
         apply_changes=apply_changes,
         output_target=output_target,
         file_write_strategy=file_write_strategy,
+        write_durability=write_durability,
     )
     ctx.status.fs = FsStatus.OK
     ctx.status.resolve = ResolveStatus.RESOLVED
@@ -323,7 +326,11 @@ def test_writer_atomic_permission_and_directory_fsync_failures_are_best_effort(
     path.write_text("original\n", encoding="utf-8")
     # Establish a distinctive mode that the path-based fallback must preserve.
     path.chmod(0o640)
-    ctx: ProcessingContext = _make_writer_context(path, updated_lines=["updated\n"])
+    ctx: ProcessingContext = _make_writer_context(
+        path,
+        updated_lines=["updated\n"],
+        write_durability=WriteDurability.PER_FILE,
+    )
 
     def fail_fchmod(fd: int, mode: int) -> NoReturn:
         raise OSError(f"fchmod unavailable for {fd} at {mode:o}")
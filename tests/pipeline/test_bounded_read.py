@@ -0,0 +1,242 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_bounded_read.py
+#   file_relpath : tests/pipeline/test_bounded_read.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Tests for the reader's bounded (header-region-only) read mode.
+
+Bounded mode must be an invisible optimization: every test compares a bounded run
+against a full read of the same bytes at the same path, or checks that the reader
+falls back to a full read when the head cannot hold every header decision.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers.pipeline import make_pipeline_context
+from tests.helpers.pipeline import run_steps
+from topmark.config.io.deserializers import mutable_config_from_defaults
+from topmark.config.types import FileWriteStrategy
+from topmark.core.constants import TOPMARK_START_MARKER
+from topmark.pipeline import views
+from topmark.pipeline.pipelines import CHECK_APPLY_PIPELINE
+from topmark.pipeline.pipelines import CHECK_PATCH_PIPELINE
+from topmark.pipeline.pipelines import SCAN_PIPELINE
+from topmark.pipeline.pipelines import STRIP_APPLY_PIPELINE
+from topmark.pipeline.pipelines import STRIP_PATCH_PIPELINE
+from topmark.pipeline.status import WriteStatus
+from topmark.pipeline.steps import reader
+from topmark.pipeline.steps.writer import WriterStep
+from topmark.pipeline.views import BoundedFileImageView
+from topmark.pipeline.views import ListFileImageView
+from topmark.runtime.model import RunOptions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from topmark.pipeline.context.model import ProcessingContext
+    from topmark.pipeline.protocols import Step
+    from topmark.pipeline.views import FileImageView
+
+FULL_READ: int = 1 << 62
+BOUNDED_READ: int = 1
+
+
+def _large_python_source(*, newline: str = "\n", final_newline: bool = True) -> bytes:
+    """Return a Python module comfortably larger than the bounded-read head."""
+    lines: list[str] = ["#!/usr/bin/env python3", '"""Generated module."""']
+    lines += [f"value_{i:05d} = {i}  # padding to widen the line" for i in range(6000)]
+    text: str = newline.join(lines) + (newline if final_newline else "")
+    return text.encode("utf-8")
+
+
+def _run(
+    path: Path,
+    pipeline: tuple[Step[ProcessingContext], ...],
+    *,
+    apply: bool = False,
+    strategy: FileWriteStrategy = FileWriteStrategy.ATOMIC,
+) -> ProcessingContext:
+    """Run `pipeline` over `path` with default configuration."""
+    ctx: ProcessingContext = make_pipeline_context(path, mutable_config_from_defaults().freeze())
+    ctx.run_options = RunOptions(apply_changes=apply, file_write_strategy=strategy)
+    return run_steps(ctx, pipeline)
+
+
+def _diff_body(ctx: ProcessingContext) -> list[str]:
+    """Return diff lines without the timestamped file labels."""
+    text: str = ctx.views.diff.text if ctx.views.diff and ctx.views.diff.text else ""
+    return [line for line in text.splitlines() if not line.startswith(("---", "+++"))]
+
+
+def _outcomes(
+    path: Path,
+    original: bytes,
+    *,
+    strategy: FileWriteStrategy,
+) -> tuple[list[str], bytes, list[str], bytes]:
+    """Return insert diff, inserted bytes, strip diff, and stripped bytes for `original`."""
+    path.write_bytes(original)
+    insert_diff: list[str] = _diff_body(_run(path, CHECK_PATCH_PIPELINE))
+    assert _run(path, CHECK_APPLY_PIPELINE, apply=True, strategy=strategy).status.write is (
+        WriteStatus.WRITTEN
+    )
+    inserted: bytes = path.read_bytes()
+    strip_diff: list[str] = _diff_body(_run(path, STRIP_PATCH_PIPELINE))
+    assert _run(path, STRIP_APPLY_PIPELINE, apply=True, strategy=strategy).status.write is (
+        WriteStatus.WRITTEN
+    )
+    return insert_diff, inserted, strip_diff, path.read_bytes()
+
+
+def test_large_file_keeps_only_header_region_in_memory(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """A bounded image reports whole-file facts while holding only its head."""
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", BOUNDED_READ)
+    path: Path = tmp_path / "big.py"
+    data: bytes = _large_python_source(newline="\r\n", final_newline=False)
+    path.write_bytes(data)
+
+    ctx: ProcessingContext = _run(path, SCAN_PIPELINE)
+
+    image: FileImageView | None = ctx.views.image
+    assert isinstance(image, BoundedFileImageView)
+    head, tail = image.split()
+    assert sum(len(line.encode("utf-8")) for line in head) < len(data) // 2
+    expected: list[str] = data.decode("utf-8").splitlines(keepends=True)
+    assert ctx.image_line_count() == len(expected) == len(head) + len(tail)
+    assert ctx.materialize_image_lines() == expected
+    assert ctx.newline_hist == {"\r\n": len(expected) - 1}
+    assert ctx.ends_with_newline is False
+
+
+@pytest.mark.parametrize(
+    ("newline", "final_newline"),
+    (("\n", True), ("\r\n", True), ("\r", True), ("\n", False)),
+    ids=("lf", "crlf", "cr", "no-final-newline"),
+)
+@pytest.mark.parametrize(
+    "strategy",
+    (FileWriteStrategy.ATOMIC, FileWriteStrategy.INPLACE),
+    ids=("atomic", "inplace"),
+)
+def test_bounded_read_matches_full_read(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    newline: str,
+    final_newline: bool,
+    strategy: FileWriteStrategy,
+) -> None:
+    """Insert and strip produce identical diffs and bytes in bounded and full mode."""
+    path: Path = tmp_path / "big.py"
+    original: bytes = _large_python_source(newline=newline, final_newline=final_newline)
+
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", FULL_READ)
+    full = _outcomes(path, original, strategy=strategy)
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", BOUNDED_READ)
+    bounded = _outcomes(path, original, strategy=strategy)
+
+    assert full[0] and full[2]
+    assert bounded == full
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    (FileWriteStrategy.ATOMIC, FileWriteStrategy.INPLACE),
+    ids=("atomic", "inplace"),
+)
+def test_invalid_utf8_tail_is_written_alike_above_and_below_the_thresholds(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    strategy: FileWriteStrategy,
+) -> None:
+    """Undecodable tail bytes are handled as in a small file, whatever the file size."""
+    path: Path = tmp_path / "big.py"
+    original: bytes = _large_python_source() + b"# caf\xe9 \xff\n" + _large_python_source()
+
+    outcomes: list[tuple[list[str], bytes, list[str], bytes]] = []
+    for read_min_bytes, tail_min_bytes in (
+        (FULL_READ, FULL_READ),  # small file: full read, tail re-encoded
+        (FULL_READ, 1024),  # tail large enough to be copied from disk
+        (BOUNDED_READ, 1024),  # large file: bounded read and copied tail
+    ):
+        monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", read_min_bytes)
+        monkeypatch.setattr(views, "SOURCE_TAIL_MIN_BYTES", tail_min_bytes)
+        outcomes.append(_outcomes(path, original, strategy=strategy))
+
+    small = outcomes[0]
+    assert small[0] and small[2]
+    assert "caf\ufffd".encode() in small[1]
+    assert outcomes == [small] * len(outcomes)
+
+
+@pytest.mark.parametrize(
+    ("name", "data"),
+    (
+        (
+            "marker_in_tail.py",
+            _large_python_source() + f"NOTE = '{TOPMARK_START_MARKER}'\n".encode(),
+        ),
+        ("bom.py", b"\xef\xbb\xbf# module\n" + _large_python_source()),
+        ("doc.xml", b"<root>\n" + b"  <item>value</item>\n" * 8000 + b"</root>\n"),
+        ("latin1_tail.py", _large_python_source() + b"# caf\xe9\n"),
+    ),
+    ids=("marker-in-tail", "leading-bom", "xml-requires-full-image", "invalid-utf8-tail"),
+)
+def test_bounded_read_falls_back_to_full_read(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    name: str,
+    data: bytes,
+) -> None:
+    """The reader loads the full image whenever the head could miss a header decision."""
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", BOUNDED_READ)
+    path: Path = tmp_path / name
+    path.write_bytes(data)
+
+    ctx: ProcessingContext = _run(path, SCAN_PIPELINE)
+
+    assert isinstance(ctx.views.image, ListFileImageView)
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    (FileWriteStrategy.ATOMIC, FileWriteStrategy.INPLACE),
+    ids=("atomic", "inplace"),
+)
+def test_writer_refuses_tail_changed_since_read(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    strategy: FileWriteStrategy,
+) -> None:
+    """A file modified after the bounded read is left intact and the write fails."""
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", BOUNDED_READ)
+    path: Path = tmp_path / "big.py"
+    path.write_bytes(_large_python_source())
+    ctx: ProcessingContext = _run(
+        path,
+        CHECK_APPLY_PIPELINE[:-1],
+        apply=True,
+        strategy=strategy,
+    )
+    assert isinstance(ctx.views.image, BoundedFileImageView)
+
+    modified: bytes = _large_python_source() + b"appended = True\n"
+    path.write_bytes(modified)
+    WriterStep()(ctx)
+
+    assert ctx.status.write is WriteStatus.FAILED
+    assert path.read_bytes() == modified
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["big.py"]
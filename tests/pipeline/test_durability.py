@@ -0,0 +1,113 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_durability.py
+#   file_relpath : tests/pipeline/test_durability.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Contract tests for batched directory durability (the engine's commit phase).
+
+Atomic writes rename into their directory; with batched durability the engine
+syncs every touched directory once after the run instead of once per file.
+"""
+
+from __future__ import annotations
+
+import os
+import stat
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers.pipeline import make_python_files
+from tests.helpers.pipeline import run_check_for_files
+from topmark.config.types import FileWriteStrategy
+from topmark.config.types import WriteDurability
+from topmark.pipeline.status import WriteStatus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "O_DIRECTORY"),
+    reason="directory fsync is POSIX-only",
+)
+
+
+def _make_tree(root: Path) -> list[Path]:
+    """Create four files in one directory and two in another."""
+    return make_python_files(root / "a", 4) + make_python_files(root / "b", 2)
+
+
+def _count_directory_fsyncs(monkeypatch: MonkeyPatch) -> list[int]:
+    """Wrap `os.fsync` and return a list that grows by one per directory sync."""
+    synced: list[int] = []
+    real_fsync = os.fsync
+
+    def fsync(fd: int) -> None:
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    return synced
+
+
+@pytest.mark.parametrize("jobs", [1, 2], ids=("sequential", "parallel"))
+def test_batched_durability_syncs_each_directory_once(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    jobs: int,
+) -> None:
+    """The commit phase syncs each touched directory once and reports its cost."""
+    synced: list[int] = _count_directory_fsyncs(monkeypatch)
+
+    results, state = run_check_for_files(_make_tree(tmp_path), apply=True, jobs=jobs)
+
+    assert [r.status.write for r in results] == [WriteStatus.WRITTEN] * 6
+    assert len(synced) == 2
+    assert state.commit is not None
+    assert (state.commit.files, state.commit.directories, state.commit.synced) == (6, 2, 2)
+    assert state.commit.elapsed_ns >= 0
+
+
+def test_per_file_durability_syncs_after_every_write(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """`PER_FILE` keeps the directory sync in the writer and skips the commit phase."""
+    synced: list[int] = _count_directory_fsyncs(monkeypatch)
+
+    results, state = run_check_for_files(
+        _make_tree(tmp_path),
+        apply=True,
+        write_durability=WriteDurability.PER_FILE,
+    )
+
+    assert all(r.status.write is WriteStatus.WRITTEN for r in results)
+    assert len(synced) == 6
+    assert state.commit is None
+
+
+def test_inplace_writes_have_no_commit_phase(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """In-place writes never rename, so no directory is synced."""
+    synced: list[int] = _count_directory_fsyncs(monkeypatch)
+
+    results, state = run_check_for_files(
+        _make_tree(tmp_path),
+        apply=True,
+        file_write_strategy=FileWriteStrategy.INPLACE,
+    )
+
+    assert all(r.status.write is WriteStatus.WRITTEN for r in results)
+    assert synced == []
+    assert state.commit is None
@@ -70,7 +70,9 @@ def test_iter_steps_for_files_passes_ordered_contexts_and_runtime_options_to_run
         *,
         prune_views: bool = True,
         keep_diff_view: bool = False,
+        **kwargs: object,
     ) -> ProcessingContext:
+        del kwargs
         calls.append((ctx.path, steps, prune_views, keep_diff_view))
         return ctx
 
@@ -118,8 +120,9 @@ def test_iter_steps_for_files_preserves_first_known_error_and_continues(
         *,
         prune_views: bool = True,
         keep_diff_view: bool = False,
+        **kwargs: object,
     ) -> ProcessingContext:
-        del steps, prune_views, keep_diff_view
+        del steps, prune_views, keep_diff_view, kwargs
         attempted_paths.append(ctx.path)
         if ctx.path == denied:
             raise PermissionError(ctx.path)
@@ -161,8 +164,9 @@ def test_iter_steps_for_files_maps_unexpected_failure_and_continues(
         *,
         prune_views: bool = True,
         keep_diff_view: bool = False,
+        **kwargs: object,
     ) -> ProcessingContext:
-        del steps, prune_views, keep_diff_view
+        del steps, prune_views, keep_diff_view, kwargs
         if ctx.path == broken:
             raise RuntimeError("runner failed")
         return ctx
@@ -200,8 +204,9 @@ def test_run_steps_for_files_maps_directory_error_and_materializes_later_context
         *,
         prune_views: bool = True,
         keep_diff_view: bool = False,
+        **kwargs: object,
     ) -> ProcessingContext:
-        del steps, prune_views, keep_diff_view
+        del steps, prune_views, keep_diff_view, kwargs
         if ctx.path == directory:
             raise IsADirectoryError(ctx.path)
         return ctx
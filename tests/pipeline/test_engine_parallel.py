@@ -0,0 +1,72 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_engine_parallel.py
+#   file_relpath : tests/pipeline/test_engine_parallel.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Contract tests for process-pool execution in `iter_results_for_files()`.
+
+Parallel execution must be observationally equivalent to the sequential engine:
+same result order, same per-file outcomes, same first engine-level exit code,
+and the same hard-link duplicate guard.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers.pipeline import make_python_files
+from tests.helpers.pipeline import run_check_for_files
+from topmark.pipeline import engine
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_iter_results_for_files_parallel_matches_sequential(tmp_path: Path) -> None:
+    """A process-pool run should yield the same ordered results as a sequential run."""
+    file_list: list[Path] = make_python_files(tmp_path, 6)
+
+    missing: Path = tmp_path / "missing.py"
+    file_list.insert(2, missing)
+
+    if hasattr(os, "link"):
+        linked: Path = tmp_path / "linked.py"
+        os.link(file_list[0], linked)
+        file_list.append(linked)
+
+    sequential, sequential_state = run_check_for_files(file_list, diff=True, jobs=1)
+    parallel, parallel_state = run_check_for_files(file_list, diff=True, jobs=2)
+
+    assert [r.path for r in parallel] == [r.path for r in sequential]
+    assert [r.status for r in parallel] == [r.status for r in sequential]
+    assert [r.outcome for r in parallel] == [r.outcome for r in sequential]
+    assert [r.detail for r in parallel] == [r.detail for r in sequential]
+    assert parallel_state.exit_code is sequential_state.exit_code
+
+
+@pytest.mark.parametrize(
+    ("jobs", "expected"),
+    [
+        (1, 1),
+        (3, 3),
+        (-2, 1),
+    ],
+)
+def test_resolve_job_count_clamps_explicit_values(jobs: int, expected: int) -> None:
+    """Explicit job counts should be used as-is and clamped to at least one worker."""
+    assert engine.resolve_job_count(jobs) == expected
+
+
+def test_resolve_job_count_zero_uses_cpu_count(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`jobs=0` should select one worker per available CPU."""
+    monkeypatch.setattr(engine.os, "cpu_count", lambda: 5)
+
+    assert engine.resolve_job_count(0) == 5
@@ -47,6 +47,7 @@ def _fake_runner_run(
     *,
     prune_views: bool = True,
     keep_diff_view: bool = False,
+    **kwargs: object,
 ) -> object:
     """Faked no-op runner.run()."""
     return ctx
@@ -127,6 +128,63 @@ def test_run_steps_for_files_uses_path_specific_configs_when_provided(
     assert bootstrap_calls[1][3] == {"header_fields": ("license",)}
 
 
+def test_run_steps_for_files_builds_one_policy_registry_per_shared_path_config(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Paths mapped to the same config object should share one policy registry."""
+    paths: list[Path] = [tmp_path / f"{name}.py" for name in ("a", "b", "c")]
+    for path in paths:
+        path.write_text("print('x')\n", encoding="utf-8")
+
+    shared_cfg: FrozenConfig = make_frozen_config(header_fields=["project"])
+    cfg_a: FrozenConfig = make_frozen_config(header_fields=["file"])
+    cfg_b: FrozenConfig = make_frozen_config(header_fields=["license"])
+    path_configs: dict[Path, FrozenConfig] = {
+        paths[0]: cfg_a,
+        paths[1]: cfg_b,
+        paths[2]: cfg_a,
+    }
+
+    registries: list[object] = []
+    policy_calls: list[FrozenConfig] = []
+
+    class FakeProcessingContext:
+        """Minimal stand-in exposing the bootstrap contract used by the engine."""
+
+        @classmethod
+        def bootstrap(
+            cls,
+            *,
+            path: Path,
+            config: FrozenConfig,
+            run_options: RunOptions,
+            policy_registry_override: PolicyRegistry | None = None,
+        ) -> SimpleNamespace:
+            registries.append(policy_registry_override)
+            return SimpleNamespace(path=path, config=config, run_options=run_options)
+
+    def fake_make_policy_registry(config: FrozenConfig) -> object:
+        policy_calls.append(config)
+        return object()
+
+    monkeypatch.setattr(engine, "ProcessingContext", FakeProcessingContext)
+    monkeypatch.setattr(engine, "make_policy_registry", fake_make_policy_registry)
+    monkeypatch.setattr(engine.runner, "run", _fake_runner_run)
+
+    engine.run_steps_for_files(
+        run_options=RunOptions(apply_changes=False),
+        config=shared_cfg,
+        path_configs=path_configs,
+        pipeline=TEST_NOOP_PIPELINE_SELECTION,
+        file_list=paths,
+    )
+
+    assert policy_calls == [cfg_a, cfg_b]
+    assert registries[0] is registries[2]
+    assert registries[0] is not registries[1]
+
+
 def test_run_steps_for_files_falls_back_to_shared_config_without_path_configs(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
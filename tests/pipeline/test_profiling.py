@@ -0,0 +1,164 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_profiling.py
+#   file_relpath : tests/pipeline/test_profiling.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Tests for opt-in per-step pipeline profiling."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers.pipeline import make_pipeline_context
+from topmark.config.io.deserializers import mutable_config_from_defaults
+from topmark.core.machine.payloads import build_meta_payload
+from topmark.pipeline import runner
+from topmark.pipeline.machine.envelopes import build_processing_results_stream_json_envelope
+from topmark.pipeline.machine.envelopes import iter_processing_results_stream_ndjson_records
+from topmark.pipeline.machine.streaming import iter_machine_processing_stream
+from topmark.pipeline.pipelines import CHECK_SUMMMARY_PIPELINE
+from topmark.pipeline.profiling import PipelineProfiler
+from topmark.pipeline.profiling import StepProfile
+from topmark.pipeline.profiling import percentile
+from topmark.pipeline.result import ProcessingResult
+from topmark.pipeline.step_timing import StepTiming
+from topmark.toml.resolution import ResolvedTopmarkTomlSources
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from topmark.config.model import FrozenConfig
+    from topmark.pipeline.context.model import ProcessingContext
+
+
+def _run_check(tmp_path: Path, *, profile: bool) -> ProcessingContext:
+    """Run the check summary pipeline for a small Python file."""
+    path: Path = tmp_path / "sample.py"
+    path.write_text("print('hello')\n", encoding="utf-8")
+    cfg: FrozenConfig = mutable_config_from_defaults().freeze()
+    ctx: ProcessingContext = make_pipeline_context(path=path, cfg=cfg)
+    return runner.run(ctx, CHECK_SUMMMARY_PIPELINE, profile=profile)
+
+
+def _timed_result(
+    result: ProcessingResult,
+    *,
+    path: str,
+    walls: dict[str, float],
+) -> ProcessingResult:
+    """Return `result` for `path` with synthetic per-step wall times."""
+    return replace(
+        result,
+        display_path=path,
+        step_timings=tuple(
+            StepTiming(
+                step=step,
+                wall_seconds=wall,
+                cpu_seconds=wall / 2,
+                bytes_read=10,
+                bytes_written=0,
+            )
+            for step, wall in walls.items()
+        ),
+    )
+
+
+def test_runner_records_one_timing_per_executed_step(tmp_path: Path) -> None:
+    """Profiled runs time every executed step and snapshot the timings."""
+    ctx: ProcessingContext = _run_check(tmp_path, profile=True)
+
+    assert [timing.step for timing in ctx.step_timings] == [step.name for step in ctx.steps]
+    assert all(timing.wall_seconds >= 0 and timing.cpu_seconds >= 0 for timing in ctx.step_timings)
+    assert sum(timing.bytes_read for timing in ctx.step_timings) == len("print('hello')\n")
+    assert ProcessingResult.from_context(ctx).step_timings == tuple(ctx.step_timings)
+
+
+def test_runner_records_nothing_without_profile(tmp_path: Path) -> None:
+    """Profiling is opt-in."""
+    ctx: ProcessingContext = _run_check(tmp_path, profile=False)
+
+    assert ctx.step_timings == []
+    assert ProcessingResult.from_context(ctx).step_timings == ()
+
+
+@pytest.mark.parametrize(
+    ("fraction", "expected"),
+    [(0.0, 1.0), (0.5, 5.0), (0.95, 10.0), (1.0, 10.0)],
+)
+def test_percentile_uses_nearest_rank(fraction: float, expected: float) -> None:
+    """Percentiles pick an observed value by nearest rank."""
+    values: list[float] = [float(value) for value in range(1, 11)]
+
+    assert percentile(values, fraction) == expected
+    assert percentile([], fraction) == 0.0
+
+
+def test_profiler_aggregates_steps_and_keeps_slowest_files(tmp_path: Path) -> None:
+    """The profiler reports per-step percentiles, totals, and the top-N files."""
+    base: ProcessingResult = ProcessingResult.from_context(_run_check(tmp_path, profile=False))
+    profiler = PipelineProfiler(top_n=2)
+    for index, wall in enumerate([0.4, 0.1, 0.3, 0.2]):
+        profiler.add(
+            _timed_result(base, path=f"f{index}.py", walls={"reader": wall, "scanner": 0.05})
+        )
+    profiler.add(base)  # results without timings are ignored
+
+    reader, scanner = profiler.profiles()
+
+    assert isinstance(reader, StepProfile)
+    assert (reader.step, reader.files) == ("reader", 4)
+    assert reader.wall_total == pytest.approx(1.0)
+    assert (reader.wall_p50, reader.wall_p95, reader.wall_max) == (0.2, 0.4, 0.4)
+    assert reader.cpu_total == pytest.approx(0.5)
+    assert reader.bytes_read == 40
+    assert reader.alloc_bytes is None
+    assert [(item.path, item.wall_seconds) for item in reader.slowest] == [
+        ("f0.py", 0.4),
+        ("f2.py", 0.3),
+    ]
+    # Ties keep the earliest files.
+    assert [item.path for item in scanner.slowest] == ["f0.py", "f1.py"]
+
+
+def test_machine_output_includes_profile_rows_only_when_requested(tmp_path: Path) -> None:
+    """JSON adds a `profile` list and NDJSON trailing `profile` records."""
+    result: ProcessingResult = ProcessingResult.from_context(_run_check(tmp_path, profile=True))
+    config: FrozenConfig = mutable_config_from_defaults().freeze()
+    resolved_toml = ResolvedTopmarkTomlSources(sources=[], writer_options=None, strict=False)
+
+    def _build(*, profile: bool) -> dict[str, object]:
+        return build_processing_results_stream_json_envelope(
+            meta=build_meta_payload(),
+            config=config,
+            resolved_toml=resolved_toml,
+            events=iter_machine_processing_stream([result], command="check"),
+            summary_mode=True,
+            profile=profile,
+        )
+
+    assert "profile" not in _build(profile=False)
+    rows = _build(profile=True)["profile"]
+    assert isinstance(rows, list)
+    assert [row["step"] for row in rows] == list(result.steps)  # pyright: ignore[reportUnknownVariableType]
+
+    records: list[dict[str, object]] = list(
+        iter_processing_results_stream_ndjson_records(
+            meta=build_meta_payload(),
+            config=config,
+            resolved_toml=resolved_toml,
+            events=iter_machine_processing_stream([result], command="check"),
+            summary_mode=False,
+            profile=True,
+        )
+    )
+    kinds: list[object] = [record["kind"] for record in records]
+    assert kinds[-len(result.steps) - 1 :] == ["profile"] * len(result.steps) + ["totals"]
+    assert kinds.index("profile") > kinds.index("result")
@@ -8,7 +8,7 @@
 #
 # topmark:header:end
 
-"""Tests for the batch processing-context reduction boundary."""
+"""Tests for the processing-context reduction and summary-fold boundaries."""
 
 from __future__ import annotations
 
@@ -18,7 +18,9 @@ from tests.helpers.pipeline import make_context_from_text
 from topmark.config.io.deserializers import mutable_config_from_defaults
 from topmark.core.exit_codes import ExitCode
 from topmark.pipeline.engine import exit_code_from_pipeline_results
+from topmark.pipeline.outcomes import collect_outcome_reason_counts
 from topmark.pipeline.reduction import ProcessingReduction
+from topmark.pipeline.reduction import ProcessingSummary
 from topmark.pipeline.reduction import iter_processing_results
 from topmark.pipeline.reduction import reduce_processing_contexts
 from topmark.pipeline.status import ContentStatus
@@ -170,3 +172,34 @@ def test_iter_processing_results_reduces_and_releases_one_context_at_a_time(
     assert second_result.detail.diff_text == "--- second\n+++ second\n"
     assert second.views.diff is not None
     assert second.views.diff.text is None
+
+
+def test_processing_summary_matches_batch_outcome_counts(
+    tmp_path: Path,
+) -> None:
+    """Folding results one at a time should match counting the whole batch."""
+    missing: ProcessingContext = _make_reduction_context(tmp_path, "missing.py")
+    missing.status.fs = FsStatus.NOT_FOUND
+
+    written: ProcessingContext = _make_reduction_context(tmp_path, "written.py")
+    written.status.write = WriteStatus.WRITTEN
+    written.diagnostics.add_warning("rewritten")
+
+    failed: ProcessingContext = _make_reduction_context(tmp_path, "failed.py")
+    failed.status.write = WriteStatus.FAILED
+    failed.diagnostics.add_error("disk full")
+    failed.diagnostics.add_info("retry later")
+
+    results: tuple[ProcessingResult, ...] = reduce_processing_contexts(
+        [missing, written, failed]
+    ).results
+
+    summary = ProcessingSummary()
+    for result in results:
+        summary.add(result)
+
+    assert summary.file_count == 3
+    assert summary.written == 1
+    assert summary.failed == 1
+    assert summary.diagnostic_counts == {"info": 1, "warning": 1, "error": 1}
+    assert summary.outcome_reason_rows() == collect_outcome_reason_counts(results)
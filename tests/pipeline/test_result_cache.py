@@ -0,0 +1,144 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_result_cache.py
+#   file_relpath : tests/pipeline/test_result_cache.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Contract tests for the persistent result cache used by `iter_results_for_files()`.
+
+The cache may only ever replay `UNCHANGED` results, and only while the file
+content and every result-relevant run input are identical to the stored run.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from tests.helpers.config import make_frozen_config
+from tests.helpers.pipeline import make_python_files
+from tests.helpers.pipeline import run_check_for_files
+from topmark.pipeline.result_cache import clear_result_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from topmark.config.model import FrozenConfig
+    from topmark.pipeline.result import ProcessingResult
+    from topmark.pipeline.result_cache import ResultCacheStats
+
+
+def _run_check(
+    file_list: list[Path],
+    *,
+    cache_dir: Path,
+    config: FrozenConfig,
+) -> tuple[list[ProcessingResult], ResultCacheStats]:
+    """Run the dry-run check pipeline with the result cache enabled."""
+    results, state = run_check_for_files(file_list, config=config, result_cache_dir=cache_dir)
+    assert state.result_cache is not None
+    return results, state.result_cache
+
+
+def _make_compliant_files(tmp_path: Path, config: FrozenConfig, count: int) -> list[Path]:
+    """Create `count` files and insert their headers so they are up to date."""
+    paths: list[Path] = make_python_files(tmp_path, count)
+    run_check_for_files(paths, apply=True, config=config)
+    return paths
+
+
+def test_result_cache_replays_unchanged_results(tmp_path: Path) -> None:
+    """A second identical run should be served from the cache with equal results."""
+    config: FrozenConfig = make_frozen_config(header_fields=["file"])
+    paths: list[Path] = _make_compliant_files(tmp_path, config, 3)
+    cache_dir: Path = tmp_path / ".topmark_cache"
+
+    first, first_stats = _run_check(paths, cache_dir=cache_dir, config=config)
+    second, second_stats = _run_check(paths, cache_dir=cache_dir, config=config)
+
+    assert (first_stats.hits, first_stats.misses, first_stats.stored) == (0, 3, 3)
+    assert (second_stats.hits, second_stats.misses, second_stats.stored) == (3, 0, 0)
+    assert second == first
+    assert (cache_dir / "CACHEDIR.TAG").is_file()
+
+
+def test_result_cache_touch_hits_but_content_change_misses(tmp_path: Path) -> None:
+    """Metadata-only changes fall back to the content digest; edits invalidate."""
+    config: FrozenConfig = make_frozen_config(header_fields=["file"])
+    touched, edited = _make_compliant_files(tmp_path, config, 2)
+    cache_dir: Path = tmp_path / ".topmark_cache"
+    _run_check([touched, edited], cache_dir=cache_dir, config=config)
+
+    stat_info: os.stat_result = touched.stat()
+    os.utime(touched, ns=(stat_info.st_atime_ns, stat_info.st_mtime_ns + 1_000_000_000))
+    edited.write_text(edited.read_text(encoding="utf-8") + "x = 1\n", encoding="utf-8")
+
+    _, stats = _run_check([touched, edited], cache_dir=cache_dir, config=config)
+
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_result_cache_misses_when_config_changes(tmp_path: Path) -> None:
+    """Changing result-relevant configuration must invalidate every entry."""
+    config: FrozenConfig = make_frozen_config(header_fields=["file"])
+    paths: list[Path] = _make_compliant_files(tmp_path, config, 2)
+    cache_dir: Path = tmp_path / ".topmark_cache"
+    _run_check(paths, cache_dir=cache_dir, config=config)
+
+    other: FrozenConfig = replace(config, align_fields=not config.align_fields)
+    _, stats = _run_check(paths, cache_dir=cache_dir, config=other)
+
+    assert stats.hits == 0
+
+
+def test_result_cache_never_stores_pending_changes(tmp_path: Path) -> None:
+    """Files that would change are reprocessed on every run."""
+    path: Path = tmp_path / "no_header.py"
+    path.write_text("print('x')\n", encoding="utf-8")
+    config: FrozenConfig = make_frozen_config(header_fields=["file"])
+    cache_dir: Path = tmp_path / ".topmark_cache"
+
+    _, first_stats = _run_check([path], cache_dir=cache_dir, config=config)
+    _, second_stats = _run_check([path], cache_dir=cache_dir, config=config)
+
+    assert first_stats.stored == 0
+    assert (second_stats.hits, second_stats.misses) == (0, 1)
+
+
+def test_result_cache_skips_hard_linked_paths(tmp_path: Path) -> None:
+    """Hard-linked selections always run so the hard-link guard stays authoritative."""
+    config: FrozenConfig = make_frozen_config(header_fields=["file"])
+    (original,) = _make_compliant_files(tmp_path, config, 1)
+    cache_dir: Path = tmp_path / ".topmark_cache"
+    _run_check([original], cache_dir=cache_dir, config=config)
+
+    linked: Path = tmp_path / "linked.py"
+    os.link(original, linked)
+    results, stats = _run_check([original, linked], cache_dir=cache_dir, config=config)
+
+    assert stats.hits == 0
+    assert [r.path for r in results] == [original, linked]
+    assert all(r.status.fs.name == "HARD_LINK_DUPLICATE" for r in results)
+
+
+def test_clear_result_cache_requires_cachedir_tag(tmp_path: Path) -> None:
+    """Only directories tagged as TopMark caches are deleted."""
+    untagged: Path = tmp_path / "not-a-cache"
+    untagged.mkdir()
+    (untagged / "keep.txt").write_text("data\n", encoding="utf-8")
+
+    assert clear_result_cache(untagged) is False
+    assert (untagged / "keep.txt").is_file()
+
+    config: FrozenConfig = make_frozen_config(header_fields=["file"])
+    paths: list[Path] = _make_compliant_files(tmp_path, config, 1)
+    cache_dir: Path = tmp_path / ".topmark_cache"
+    _run_check(paths, cache_dir=cache_dir, config=config)
+
+    assert clear_result_cache(cache_dir) is True
+    assert not cache_dir.exists()
@@ -13,6 +13,7 @@
 from __future__ import annotations
 
 import difflib
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -21,6 +22,9 @@ from topmark.pipeline.views import PlanEditKind
 from topmark.pipeline.views import PlannedEdit
 from topmark.pipeline.views import infer_single_planned_edit
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 def _assert_structured_diff_matches_difflib(
     *,
@@ -39,7 +43,7 @@ def _assert_structured_diff_matches_difflib(
 
     structured_lines: list[str] | None = render_structured_unified_diff(
         original_lines=original_lines,
-        edit=edit,
+        edits=(edit,),
         fromfile="sample.py (current)",
         tofile="sample.py (updated)",
         fromfiledate="old-date",
@@ -165,7 +169,7 @@ def test_structured_unified_diff_rejects_invalid_edit_ranges(
     """Invalid edit ranges should not produce structured diffs."""
     diff_lines: list[str] | None = render_structured_unified_diff(
         original_lines=["body\n"],
-        edit=edit,
+        edits=(edit,),
         fromfile="sample.py (current)",
         tofile="sample.py (updated)",
         fromfiledate="old-date",
@@ -181,11 +185,13 @@ def test_structured_unified_diff_rejects_negative_context() -> None:
     """Negative context windows should not produce structured diffs."""
     diff_lines: list[str] | None = render_structured_unified_diff(
         original_lines=["body\n"],
-        edit=PlannedEdit(
-            kind=PlanEditKind.INSERT,
-            old_start=0,
-            old_end=0,
-            new_lines=("header\n",),
+        edits=(
+            PlannedEdit(
+                kind=PlanEditKind.INSERT,
+                old_start=0,
+                old_end=0,
+                new_lines=("header\n",),
+            ),
         ),
         fromfile="sample.py (current)",
         tofile="sample.py (updated)",
@@ -202,11 +208,13 @@ def test_structured_unified_diff_returns_empty_diff_for_noop_edit() -> None:
     """A zero-length edit without replacement lines should produce no diff."""
     diff_lines: list[str] | None = render_structured_unified_diff(
         original_lines=["body\n"],
-        edit=PlannedEdit(
-            kind=PlanEditKind.INSERT,
-            old_start=0,
-            old_end=0,
-            new_lines=(),
+        edits=(
+            PlannedEdit(
+                kind=PlanEditKind.INSERT,
+                old_start=0,
+                old_end=0,
+                new_lines=(),
+            ),
         ),
         fromfile="sample.py (current)",
         tofile="sample.py (updated)",
@@ -219,6 +227,121 @@ def test_structured_unified_diff_returns_empty_diff_for_noop_edit() -> None:
     assert diff_lines == []
 
 
+def _apply_edits(original_lines: list[str], edits: tuple[PlannedEdit, ...]) -> list[str]:
+    """Apply ordered edits to a copy of `original_lines` (test oracle)."""
+    updated: list[str] = list(original_lines)
+    for edit in reversed(edits):
+        updated[edit.old_start : edit.old_end] = edit.new_lines
+    return updated
+
+
+@pytest.mark.parametrize(
+    "gap",
+    [
+        pytest.param(0, id="adjacent"),
+        pytest.param(6, id="shared-hunk"),
+        pytest.param(7, id="separate-hunks"),
+        pytest.param(40, id="far-apart"),
+    ],
+)
+def test_structured_unified_diff_matches_difflib_for_multiple_edits(gap: int) -> None:
+    """Multi-edit diffs should group hunks and number ranges exactly like `difflib`."""
+    original_lines: list[str] = [
+        "\ufeff#!/bin/sh\n",
+        *[f"body {i}\n" for i in range(gap)],
+        "old header\n",
+        *[f"tail {i}\n" for i in range(10)],
+    ]
+    edits: tuple[PlannedEdit, ...] = (
+        PlannedEdit(
+            kind=PlanEditKind.REPLACE,
+            old_start=0,
+            old_end=1,
+            new_lines=("#!/bin/sh\n",),
+        ),
+        PlannedEdit(
+            kind=PlanEditKind.REPLACE,
+            old_start=1 + gap,
+            old_end=2 + gap,
+            new_lines=("new header\n", "second line\n"),
+        ),
+    )
+
+    structured_lines: list[str] | None = render_structured_unified_diff(
+        original_lines=original_lines,
+        edits=edits,
+        fromfile="a",
+        tofile="b",
+        fromfiledate="old-date",
+        tofiledate="new-date",
+        lineterm="\n",
+        context=3,
+    )
+    difflib_lines: list[str] = list(
+        difflib.unified_diff(
+            original_lines,
+            _apply_edits(original_lines, edits),
+            fromfile="a",
+            tofile="b",
+            fromfiledate="old-date",
+            tofiledate="new-date",
+            lineterm="\n",
+            n=3,
+        )
+    )
+
+    assert structured_lines == difflib_lines
+
+
+def test_structured_unified_diff_rejects_overlapping_edits() -> None:
+    """Edits that overlap or are out of order should not produce structured diffs."""
+    diff_lines: list[str] | None = render_structured_unified_diff(
+        original_lines=["a\n", "b\n", "c\n"],
+        edits=(
+            PlannedEdit(kind=PlanEditKind.REMOVE, old_start=1, old_end=3, new_lines=()),
+            PlannedEdit(kind=PlanEditKind.REMOVE, old_start=0, old_end=2, new_lines=()),
+        ),
+        fromfile="a",
+        tofile="b",
+        fromfiledate="old-date",
+        tofiledate="new-date",
+        lineterm="\n",
+        context=3,
+    )
+
+    assert diff_lines is None
+
+
+def test_structured_unified_diff_reads_only_context_windows() -> None:
+    """Rendering should never index lines outside the edit and its context."""
+
+    class _GuardedLines(list[str]):
+        def __iter__(self) -> Iterator[str]:
+            raise AssertionError("the whole image must not be iterated")
+
+    original_lines = _GuardedLines(f"line {i}\n" for i in range(10_000))
+    diff_lines: list[str] | None = render_structured_unified_diff(
+        original_lines=original_lines,
+        edits=(
+            PlannedEdit(
+                kind=PlanEditKind.INSERT,
+                old_start=0,
+                old_end=0,
+                new_lines=("header\n",),
+            ),
+        ),
+        fromfile="a",
+        tofile="b",
+        fromfiledate="old-date",
+        tofiledate="new-date",
+        lineterm="\n",
+        context=3,
+    )
+
+    assert diff_lines is not None
+    assert len(diff_lines) == 3 + 1 + 3
+
+
 def test_infer_single_planned_edit_returns_none_for_identical_images() -> None:
     """Identical images should not infer a planned edit."""
     edit: PlannedEdit | None = infer_single_planned_edit(
@@ -0,0 +1,199 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_tail_splice.py
+#   file_relpath : tests/pipeline/test_tail_splice.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Tests for copying the untouched source tail in the file sinks.
+
+Copying the tail must be an invisible optimization: every test compares the bytes
+written with a tail copy against the bytes written by encoding every updated line.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tests.helpers.pipeline import make_pipeline_context
+from tests.helpers.pipeline import run_steps
+from topmark.config.io.deserializers import mutable_config_from_defaults
+from topmark.config.types import FileWriteStrategy
+from topmark.pipeline import views
+from topmark.pipeline.pipelines import CHECK_APPLY_PIPELINE
+from topmark.pipeline.pipelines import STRIP_APPLY_PIPELINE
+from topmark.pipeline.status import WriteStatus
+from topmark.pipeline.steps import reader
+from topmark.pipeline.steps.writer import WriterStep
+from topmark.runtime.model import RunOptions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from topmark.pipeline.context.model import ProcessingContext
+    from topmark.pipeline.context.model import WriteStats
+    from topmark.pipeline.protocols import Step
+
+NEVER: int = 1 << 62
+
+
+def _python_source(*, newline: str = "\n") -> bytes:
+    """Return a Python module whose tail is far larger than the copy threshold."""
+    lines: list[str] = ["#!/usr/bin/env python3", '"""Generated module."""']
+    lines += [f"value_{i:05d} = {i}  # padding to widen the line" for i in range(6000)]
+    return (newline.join(lines) + newline).encode("utf-8")
+
+
+def _apply(
+    path: Path,
+    pipeline: tuple[Step[ProcessingContext], ...],
+    *,
+    strategy: FileWriteStrategy,
+) -> WriteStats:
+    """Run an apply `pipeline` over `path` and return the writer's byte counters."""
+    ctx: ProcessingContext = make_pipeline_context(path, mutable_config_from_defaults().freeze())
+    ctx.run_options = RunOptions(apply_changes=True, file_write_strategy=strategy)
+    ctx = run_steps(ctx, pipeline)
+    assert ctx.status.write is WriteStatus.WRITTEN
+    assert ctx.write_stats is not None
+    assert ctx.write_stats.bytes_written == path.stat().st_size
+    return ctx.write_stats
+
+
+def _round_trip(
+    path: Path,
+    original: bytes,
+    *,
+    strategy: FileWriteStrategy,
+) -> tuple[bytes, bytes, int]:
+    """Insert then strip a header; return both results and the total bytes copied."""
+    path.write_bytes(original)
+    inserted: WriteStats = _apply(path, CHECK_APPLY_PIPELINE, strategy=strategy)
+    with_header: bytes = path.read_bytes()
+    stripped: WriteStats = _apply(path, STRIP_APPLY_PIPELINE, strategy=strategy)
+    return with_header, path.read_bytes(), inserted.bytes_copied + stripped.bytes_copied
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"), ids=("lf", "crlf"))
+@pytest.mark.parametrize("bounded", (False, True), ids=("full-image", "bounded-image"))
+@pytest.mark.parametrize(
+    "strategy",
+    (FileWriteStrategy.ATOMIC, FileWriteStrategy.INPLACE),
+    ids=("atomic", "inplace"),
+)
+def test_tail_copy_matches_encoded_write(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    newline: str,
+    bounded: bool,
+    strategy: FileWriteStrategy,
+) -> None:
+    """Insert and strip write identical bytes with and without copying the tail."""
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", 1 if bounded else NEVER)
+    path: Path = tmp_path / "big.py"
+    original: bytes = _python_source(newline=newline)
+
+    monkeypatch.setattr(views, "SOURCE_TAIL_MIN_BYTES", NEVER)
+    encoded = _round_trip(path, original, strategy=strategy)
+    monkeypatch.setattr(views, "SOURCE_TAIL_MIN_BYTES", 1024)
+    copied = _round_trip(path, original, strategy=strategy)
+
+    assert encoded[2] == 0
+    assert copied[2] > len(original)
+    assert copied[:2] == encoded[:2]
+
+
+@pytest.mark.parametrize(
+    "missing",
+    (("copy_file_range",), ("copy_file_range", "sendfile")),
+    ids=("sendfile", "buffered"),
+)
+def test_tail_copy_falls_back_to_portable_primitives(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    missing: tuple[str, ...],
+) -> None:
+    """Without the kernel copy primitives the tail is still copied verbatim."""
+    monkeypatch.setattr(views, "SOURCE_TAIL_MIN_BYTES", 1024)
+    for name in missing:
+        monkeypatch.delattr(os, name, raising=False)
+    path: Path = tmp_path / "big.py"
+    original: bytes = _python_source()
+
+    with_header, stripped, bytes_copied = _round_trip(
+        path, original, strategy=FileWriteStrategy.ATOMIC
+    )
+
+    body: bytes = original[original.index(b"value_00000") :]
+    assert bytes_copied > len(original)
+    assert with_header.endswith(body)
+    assert stripped.endswith(body)
+    assert len(stripped) < len(with_header)
+
+
+@pytest.mark.parametrize(
+    "stalled",
+    (("copy_file_range",), ("copy_file_range", "sendfile")),
+    ids=("sendfile", "buffered"),
+)
+def test_tail_copy_resumes_when_a_primitive_stops_short(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    stalled: tuple[str, ...],
+) -> None:
+    """A kernel primitive that copies nothing hands the rest to the next mechanism."""
+    monkeypatch.setattr(views, "SOURCE_TAIL_MIN_BYTES", 1024)
+
+    def _copy_nothing(*args: int) -> int:
+        del args
+        return 0
+
+    for name in stalled:
+        if hasattr(os, name):
+            monkeypatch.setattr(os, name, _copy_nothing)
+    path: Path = tmp_path / "big.py"
+    original: bytes = _python_source()
+
+    with_header, stripped, bytes_copied = _round_trip(
+        path, original, strategy=FileWriteStrategy.ATOMIC
+    )
+
+    body: bytes = original[original.index(b"value_00000") :]
+    assert bytes_copied > len(original)
+    assert with_header.endswith(body)
+    assert stripped.endswith(body)
+    assert len(stripped) < len(with_header)
+
+
+def test_changed_source_is_encoded_instead_of_copied(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """A source modified after planning is not spliced; the planned image is written."""
+    monkeypatch.setattr(views, "SOURCE_TAIL_MIN_BYTES", 1024)
+    monkeypatch.setattr(reader, "_BOUNDED_READ_MIN_BYTES", NEVER)
+    path: Path = tmp_path / "big.py"
+    original: bytes = _python_source()
+    path.write_bytes(original)
+    ctx: ProcessingContext = make_pipeline_context(path, mutable_config_from_defaults().freeze())
+    ctx.run_options = RunOptions(apply_changes=True)
+    ctx = run_steps(ctx, CHECK_APPLY_PIPELINE[:-1])
+    assert ctx.views.updated is not None
+    assert ctx.views.updated.source_tail is not None
+    planned: list[str] = ctx.materialize_updated_lines()
+
+    path.write_bytes(original.replace(b"value_05999", b"VALUE_05999"))
+    WriterStep()(ctx)
+
+    assert ctx.status.write is WriteStatus.WRITTEN
+    assert ctx.write_stats is not None
+    assert ctx.write_stats.bytes_copied == 0
+    assert path.read_bytes() == "".join(planned).encode("utf-8")
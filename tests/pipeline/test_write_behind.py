@@ -0,0 +1,122 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_write_behind.py
+#   file_relpath : tests/pipeline/test_write_behind.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Contract tests for write-behind in sequential apply runs.
+
+The writer step runs on background threads, but contexts must still be yielded
+in input order with a final `WriteStatus`, and writes in flight stay bounded.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from tests.helpers.pipeline import make_python_files
+from tests.helpers.pipeline import run_check_for_files
+from topmark.core.exit_codes import ExitCode
+from topmark.pipeline import engine
+from topmark.pipeline.status import WriteStatus
+from topmark.pipeline.steps.writer import AtomicFileSink
+from topmark.pipeline.steps.writer import WriteResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.monkeypatch import MonkeyPatch
+
+    from topmark.pipeline.context.model import ProcessingContext
+
+WAIT_SECONDS: float = 10.0
+
+
+def test_writes_overlap_with_processing_of_later_files(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """The first write blocks until the engine has started processing the next file."""
+    files: list[Path] = make_python_files(tmp_path, 3)
+    second_started = threading.Event()
+    writer_threads: list[str] = []
+    real_write = AtomicFileSink.write
+    real_run_file = engine._run_file  # pyright: ignore[reportPrivateUsage]
+
+    def run_file(**kwargs: object) -> ProcessingContext:
+        if kwargs["path"] == files[1]:
+            second_started.set()
+        return real_run_file(**kwargs)  # pyright: ignore[reportArgumentType]
+
+    def write(self: AtomicFileSink, *, ctx: ProcessingContext) -> WriteResult:
+        writer_threads.append(threading.current_thread().name)
+        if ctx.path == files[0]:
+            assert second_started.wait(WAIT_SECONDS)
+        return real_write(self, ctx=ctx)
+
+    monkeypatch.setattr(engine, "_run_file", run_file)
+    monkeypatch.setattr(AtomicFileSink, "write", write)
+
+    results, state = run_check_for_files(files, apply=True)
+
+    # Each write is resolved before its context is reduced to a result.
+    assert [result.path for result in results] == files
+    assert all(result.status.write is WriteStatus.WRITTEN for result in results)
+    assert all(name.startswith("topmark-writer") for name in writer_threads)
+    assert state.exit_code is None
+    assert all(path.read_text(encoding="utf-8").startswith("#") for path in files)
+
+
+def test_bytes_in_flight_budget_bounds_concurrent_writes(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """A budget smaller than one file keeps at most one write in flight."""
+    monkeypatch.setattr(engine, "_WRITE_BEHIND_MAX_BYTES", 1)
+    lock = threading.Lock()
+    in_flight: list[int] = [0]
+    peak: list[int] = [0]
+    real_write = AtomicFileSink.write
+
+    def write(self: AtomicFileSink, *, ctx: ProcessingContext) -> WriteResult:
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        try:
+            return real_write(self, ctx=ctx)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    monkeypatch.setattr(AtomicFileSink, "write", write)
+
+    results, _ = run_check_for_files(make_python_files(tmp_path, 8), apply=True)
+
+    assert len(results) == 8
+    assert peak[0] == 1
+
+
+def test_background_write_failure_is_isolated_per_file(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """An unexpected writer error skips that file and records a pipeline error."""
+    files: list[Path] = make_python_files(tmp_path, 3)
+    real_write = AtomicFileSink.write
+
+    def write(self: AtomicFileSink, *, ctx: ProcessingContext) -> WriteResult:
+        if ctx.path == files[1]:
+            raise RuntimeError("sink exploded")
+        return real_write(self, ctx=ctx)
+
+    monkeypatch.setattr(AtomicFileSink, "write", write)
+
+    results, state = run_check_for_files(files, apply=True)
+
+    assert [result.path for result in results] == [files[0], files[2]]
+    assert state.exit_code is ExitCode.PIPELINE_ERROR
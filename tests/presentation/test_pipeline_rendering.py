@@ -35,6 +35,7 @@ from topmark.pipeline.machine.streaming import MachineProcessingResultEvent
 from topmark.pipeline.machine.streaming import iter_machine_processing_stream
 from topmark.pipeline.reduction import reduce_processing_contexts
 from topmark.pipeline.reporting import ReportScope
+from topmark.pipeline.reporting import filter_results_for_report
 from topmark.pipeline.reporting import would_add_or_update_result
 from topmark.pipeline.status import ComparisonStatus
 from topmark.pipeline.status import ContentStatus
@@ -50,6 +51,7 @@ from topmark.presentation.markdown.paths import render_path_display_markdown
 from topmark.presentation.markdown.pipeline import render_pipeline_apply_summary_markdown
 from topmark.presentation.markdown.pipeline import render_pipeline_diffs_markdown
 from topmark.presentation.markdown.pipeline import render_pipeline_output_markdown
+from topmark.presentation.output.pipeline import iter_pipeline_command_human_stream_output
 from topmark.presentation.output.pipeline import render_pipeline_command_human_output
 from topmark.presentation.output.pipeline import render_pipeline_command_human_stream_output
 from topmark.presentation.output.pipeline import render_probe_command_human_stream_output
@@ -65,6 +67,7 @@ from topmark.presentation.text.pipeline import render_pipeline_output_text
 from topmark.runtime.model import RunOptions
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from collections.abc import Sequence
     from pathlib import Path
 
@@ -73,6 +76,7 @@ if TYPE_CHECKING:
     from topmark.pipeline.kinds import PipelineKindLiteral
     from topmark.pipeline.machine.streaming import MachineProcessingStreamEvent
     from topmark.pipeline.reduction import ProcessingReduction
+    from topmark.pipeline.reporting import ReportFilterResult
     from topmark.pipeline.result import ProcessingResult
     from topmark.presentation.shared.pipeline import PipelineCommandHumanOutput
     from topmark.presentation.shared.pipeline import PipelineFileSummary
@@ -1582,3 +1586,94 @@ def test_render_pipeline_command_human_stream_output_rejects_missing_start(
             fmt=OutputFormat.TEXT,
             would_change=would_add_or_update_result,
         )
+
+
+@pytest.mark.parametrize("fmt", [OutputFormat.TEXT, OutputFormat.MARKDOWN])
+@pytest.mark.parametrize("report_scope", [ReportScope.ACTIONABLE, ReportScope.ALL])
+@pytest.mark.parametrize("verbosity_level", [0, 1])
+def test_iter_pipeline_command_human_stream_output_concatenates_to_batch_output(
+    tmp_path: Path,
+    fmt: OutputFormat,
+    report_scope: ReportScope,
+    verbosity_level: int,
+) -> None:
+    """Incremental fragments should add up to the batch-rendered streams."""
+    changed_ctxs: list[ProcessingContext] = [
+        _make_context(tmp_path / f"changed-{idx}.py") for idx in range(3)
+    ]
+    for ctx in changed_ctxs:
+        _add_diff(ctx)
+    unchanged_ctx: ProcessingContext = _make_context(tmp_path / "unchanged.py")
+    unchanged_ctx.status.header = HeaderStatus.DETECTED
+    unchanged_ctx.status.comparison = ComparisonStatus.UNCHANGED
+    unchanged_ctx.status.plan = PlanStatus.SKIPPED
+    unsupported_ctx: ProcessingContext = _make_context(tmp_path / "unsupported.bin")
+    unsupported_ctx.status.resolve = ResolveStatus.UNSUPPORTED
+
+    reduction: ProcessingReduction = reduce_processing_contexts(
+        [changed_ctxs[0], unchanged_ctx, changed_ctxs[1], unsupported_ctx, changed_ctxs[2]]
+    )
+    options: PipelineHumanPresentationOptions = _make_presentation_options(
+        verbosity_level=verbosity_level,
+        report_scope=report_scope,
+        show_diffs=True,
+    )
+    fragments: list[PipelineCommandHumanOutput] = list(
+        iter_pipeline_command_human_stream_output(
+            options=options,
+            events=iter_machine_processing_stream(reduction.results, command="check"),
+            fmt=fmt,
+            would_change=would_add_or_update_result,
+        )
+    )
+
+    filtered: ReportFilterResult[ProcessingResult] = filter_results_for_report(
+        reduction.results,
+        report_scope=report_scope,
+        would_change=would_add_or_update_result,
+    )
+    batch_output: PipelineCommandHumanOutput = render_pipeline_command_human_output(
+        report=_make_report(
+            view_results=filtered.view_results,
+            file_list_total=len(reduction.results),
+            verbosity_level=verbosity_level,
+            report_scope=report_scope,
+            unsupported_count=filtered.unsupported_count_all,
+            show_diffs=True,
+        ),
+        results=reduction.results,
+        fmt=fmt,
+    )
+
+    assert len(fragments) > 2
+    assert "".join(fragment.stdout for fragment in fragments) == batch_output.stdout
+    assert "".join(fragment.stderr for fragment in fragments) == batch_output.stderr
+
+
+def test_iter_pipeline_command_human_stream_output_yields_before_stream_ends(
+    tmp_path: Path,
+) -> None:
+    """The first file's section should be emitted before later results are produced."""
+    first_ctx: ProcessingContext = _make_context(tmp_path / "a.py")
+    _add_diff(first_ctx)
+    reduction: ProcessingReduction = reduce_processing_contexts([first_ctx])
+    produced: list[str] = []
+
+    def _results() -> Iterator[ProcessingResult]:
+        produced.append("a.py")
+        yield reduction.results[0]
+        produced.append("later")
+        raise AssertionError("the consumer should not have pulled a second result")
+
+    fragments: Iterator[PipelineCommandHumanOutput] = iter_pipeline_command_human_stream_output(
+        options=_make_presentation_options(show_diffs=True),
+        events=iter_machine_processing_stream(_results(), command="check", selected_count=2),
+        fmt=OutputFormat.TEXT,
+        would_change=would_add_or_update_result,
+    )
+
+    first: PipelineCommandHumanOutput = next(fragments)
+
+    assert produced == ["a.py"]
+    assert "+new" in first.stdout
+    assert "a.py" in first.stderr
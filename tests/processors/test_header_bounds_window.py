@@ -0,0 +1,279 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_header_bounds_window.py
+#   file_relpath : tests/processors/test_header_bounds_window.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Anchor-window header bounds detection contracts.
+
+`HeaderProcessor.get_header_bounds()` scans a window past the insertion anchor
+line by line and sweeps the rest of the file only when a whole-buffer search
+finds a marker there. These tests compare it with a whole-file reference scan
+(the previous algorithm) for every window size, including windows that end
+before, inside, and after the header.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+import pytest
+from hypothesis import given
+from hypothesis import settings
+from hypothesis import strategies as st
+
+from tests.helpers.registry import resolve_processor_for_path
+from topmark.core.constants import TOPMARK_END_MARKER
+from topmark.core.constants import TOPMARK_START_MARKER
+from topmark.pipeline.policy_whitespace import is_pure_spacer
+from topmark.processors.base import NO_LINE_ANCHOR
+from topmark.processors.types import BoundsKind
+from topmark.processors.types import HeaderBounds
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.tmpdir import TempPathFactory
+
+    from topmark.filetypes.policy import FileTypeHeaderPolicy
+    from topmark.processors.base import HeaderProcessor
+
+
+# Sample file per processor family; XML-like processors use a char-offset anchor.
+SAMPLE_FILES: dict[str, str] = {
+    "script.py": "print(1)\n",
+    "module.js": "let x = 1;\n",
+    "source.c": "int x;\n",
+    "document.xml": '<?xml version="1.0"?>\n<root/>\n',
+    "page.html": "<html></html>\n",
+}
+
+
+@pytest.fixture(scope="module")
+def processors(tmp_path_factory: TempPathFactory) -> dict[str, HeaderProcessor]:
+    """Return a bound registry processor per sample file name."""
+    root: Path = tmp_path_factory.mktemp("bounds-window")
+    resolved: dict[str, HeaderProcessor] = {}
+    for name, content in SAMPLE_FILES.items():
+        path: Path = root / name
+        path.write_text(content, encoding="utf-8")
+        processor: HeaderProcessor | None = resolve_processor_for_path(path)
+        assert processor is not None
+        resolved[name] = processor
+    return resolved
+
+
+def _line_pool(processor: HeaderProcessor) -> list[str]:
+    """Return plausible lines for `processor`, including stray and malformed markers."""
+    lp: str = processor.line_prefix
+    ls: str = f" {processor.line_suffix}" if processor.line_suffix else ""
+    pool: list[str] = [
+        "value = 1\n",
+        "\n",
+        "   \n",
+        "#!/usr/bin/env python\n",
+        "# -*- coding: utf-8 -*-\n",
+        '<?xml version="1.0"?>\n',
+        "<!DOCTYPE root>\n",
+        "<root/>\n",
+        f"{lp} {TOPMARK_START_MARKER}{ls}\n",
+        f"{lp} {TOPMARK_END_MARKER}{ls}\n",
+        f"{lp}   project : TopMark{ls}\n",
+        f"{lp}{ls}\n",
+        f"    {lp} {TOPMARK_START_MARKER}{ls}\n",
+        f"{TOPMARK_START_MARKER}\n",
+        f"{TOPMARK_END_MARKER}\n",
+        f"see {TOPMARK_START_MARKER} in the docs\n",
+        f"{lp} {TOPMARK_START_MARKER} {TOPMARK_END_MARKER}{ls}\n",
+    ]
+    if processor.block_prefix:
+        pool.append(f"{processor.block_prefix}\n")
+    if processor.block_suffix:
+        pool.append(f"{processor.block_suffix}\n")
+    return pool
+
+
+def _reference_line_spans(processor: HeaderProcessor, lines: list[str]) -> list[tuple[int, int]]:
+    """Whole-file directive pairing for line-comment processors."""
+    results: list[tuple[int, int]] = []
+    i: int = 0
+    while i < len(lines):
+        if processor.line_has_directive(lines[i], TOPMARK_START_MARKER):
+            j: int = i + 1
+            while j < len(lines) and not processor.line_has_directive(lines[j], TOPMARK_END_MARKER):
+                j += 1
+            if j < len(lines):
+                results.append((i, j))
+                i = j + 1
+                continue
+        i += 1
+    return results
+
+
+def _reference_block_spans(processor: HeaderProcessor, lines: list[str]) -> list[tuple[int, int]]:
+    """Whole-file directive pairing, widened to tight block-comment wrappers."""
+    policy: FileTypeHeaderPolicy | None = (
+        processor.file_type.header_policy if processor.file_type else None
+    )
+    results: list[tuple[int, int]] = []
+    n: int = len(lines)
+    i: int = 0
+    while i < n:
+        if not processor.line_has_directive(lines[i], TOPMARK_START_MARKER):
+            i += 1
+            continue
+        j: int = i + 1
+        while j < n and not processor.line_has_directive(lines[j], TOPMARK_END_MARKER):
+            j += 1
+        if j >= n:
+            break
+        k: int = i - 1
+        while k >= 0 and is_pure_spacer(lines[k], policy):
+            k -= 1
+        block_start: int | None = (
+            k if k >= 0 and lines[k].rstrip("\r\n").strip(" \t") == processor.block_prefix else None
+        )
+        k = j + 1
+        while k < n and is_pure_spacer(lines[k], policy):
+            k += 1
+        block_end: int | None = (
+            k if k < n and lines[k].rstrip("\r\n").strip(" \t") == processor.block_suffix else None
+        )
+        if block_start is not None and block_end is not None:
+            results.append((block_start, block_end))
+        else:
+            results.append((i, j))
+        i = j + 1
+    return results
+
+
+def _reference_bounds(processor: HeaderProcessor, lines: list[str]) -> HeaderBounds:
+    """Classify `lines` by sweeping every line, as before anchor-window detection."""
+    if not lines:
+        return HeaderBounds(kind=BoundsKind.NONE)
+
+    open_start: int | None = None
+    first_start: int | None = None
+    first_end: int | None = None
+    for idx, line in enumerate(lines):
+        if TOPMARK_START_MARKER in line and first_start is None:
+            first_start = idx
+        if TOPMARK_END_MARKER in line and first_end is None:
+            first_end = idx
+    if first_end is not None and first_start is None:
+        return HeaderBounds(
+            kind=BoundsKind.MALFORMED,
+            end=first_end + 1,
+            reason="end marker without preceding start",
+        )
+    if first_start is not None and first_end is None:
+        return HeaderBounds(
+            kind=BoundsKind.MALFORMED,
+            start=first_start,
+            reason="start marker without matching end",
+        )
+    if first_start is not None and first_end is not None and first_end < first_start:
+        return HeaderBounds(
+            kind=BoundsKind.MALFORMED,
+            start=first_end,
+            end=first_start + 1,
+            reason="end marker before start marker",
+        )
+    for idx, line in enumerate(lines):
+        has_start: bool = TOPMARK_START_MARKER in line
+        has_end: bool = TOPMARK_END_MARKER in line
+        if has_start and has_end:
+            return HeaderBounds(
+                kind=BoundsKind.MALFORMED,
+                start=idx,
+                end=idx + 1,
+                reason="start and end marker on the same line",
+            )
+        if has_start:
+            if open_start is not None:
+                return HeaderBounds(
+                    kind=BoundsKind.MALFORMED,
+                    start=open_start,
+                    end=idx + 1,
+                    reason="start marker before previous header ended",
+                )
+            open_start = idx
+        if has_end:
+            if open_start is None:
+                return HeaderBounds(
+                    kind=BoundsKind.MALFORMED,
+                    end=idx + 1,
+                    reason="end marker without preceding start",
+                )
+            open_start = None
+    if open_start is not None:
+        return HeaderBounds(
+            kind=BoundsKind.MALFORMED,
+            start=open_start,
+            reason="start marker without matching end",
+        )
+
+    anchor_idx: int = processor.compute_insertion_anchor(lines)
+    if anchor_idx == NO_LINE_ANCHOR:
+        text: str = "".join(lines)
+        char_off: int | None = processor.get_header_insertion_char_offset(text)
+        anchor_idx = text[:char_off].count("\n") if char_off is not None else 0
+
+    spans: list[tuple[int, int]] = (
+        _reference_block_spans(processor, lines)
+        if processor.block_prefix and processor.block_suffix
+        else _reference_line_spans(processor, lines)
+    )
+    for start, end in spans:
+        if processor.validate_header_location(
+            lines, header_start_idx=start, header_end_idx=end, anchor_idx=anchor_idx
+        ):
+            return HeaderBounds(kind=BoundsKind.SPAN, start=start, end=end + 1)
+    return HeaderBounds(kind=BoundsKind.NONE)
+
+
+@settings(deadline=None, max_examples=300)
+@given(data=st.data())
+def test_windowed_bounds_match_whole_file_scan(
+    processors: dict[str, HeaderProcessor],
+    data: st.DataObject,
+) -> None:
+    """Every window size yields the whole-file MALFORMED/SPAN/NONE classification."""
+    name: str = data.draw(st.sampled_from(sorted(processors)), label="file")
+    processor: HeaderProcessor = copy.copy(processors[name])
+    processor.bounds_scan_window = data.draw(st.integers(min_value=0, max_value=8), label="window")
+    lines: list[str] = data.draw(
+        st.lists(st.sampled_from(_line_pool(processor)), max_size=30), label="lines"
+    )
+
+    expected: HeaderBounds = _reference_bounds(processor, lines)
+
+    assert processor.get_header_bounds(lines=lines, newline_style="\n") == expected
+    assert processor.get_header_bounds(lines=iter(lines), newline_style="\n") == expected
+
+
+def test_stray_marker_beyond_the_window_is_still_malformed(
+    processors: dict[str, HeaderProcessor],
+) -> None:
+    """A marker far past the scan window is found by the whole-buffer fallback."""
+    processor: HeaderProcessor = processors["script.py"]
+    lines: list[str] = [
+        f"# {TOPMARK_START_MARKER}\n",
+        f"# {TOPMARK_END_MARKER}\n",
+        *(["value = 1\n"] * (processor.bounds_scan_window + 100)),
+        f"# {TOPMARK_END_MARKER}\n",
+    ]
+
+    bounds: HeaderBounds = processor.get_header_bounds(lines=lines, newline_style="\n")
+
+    assert (bounds.kind, bounds.start, bounds.end, bounds.reason) == (
+        BoundsKind.MALFORMED,
+        None,
+        len(lines),
+        "end marker without preceding start",
+    )
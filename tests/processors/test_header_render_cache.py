@@ -0,0 +1,196 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_header_render_cache.py
+#   file_relpath : tests/processors/test_header_render_cache.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Template-cached header rendering contracts.
+
+`HeaderProcessor.render_header_lines()` caches the preamble, postamble, and the
+encoded lines of static fields. These tests check that a warm cache renders
+exactly what an uncached render produces, and that static fields are encoded
+only once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from hypothesis import given
+from hypothesis import settings
+from hypothesis import strategies as st
+
+from topmark.processors.builtins.cblock import CBlockHeaderProcessor
+from topmark.processors.builtins.markdown import MarkdownHeaderProcessor
+from topmark.processors.builtins.pound import PoundHeaderProcessor
+from topmark.processors.builtins.slash import SlashHeaderProcessor
+from topmark.processors.builtins.xml import XmlHeaderProcessor
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from topmark.processors.base import HeaderProcessor
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Config:
+    header_fields: tuple[str, ...]
+    align_fields: bool
+    max_header_line_length: int | None = None
+    wrap_fields: tuple[str, ...] = ()
+
+
+class _CountingProcessor(PoundHeaderProcessor):
+    """Pound processor that records which fields it encodes."""
+
+    namespace = "tests"
+    local_key = "render-cache-counting"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.encoded: list[str] = []
+
+    def _encode_field_lines(
+        self,
+        *,
+        field_name: str,
+        field_value: str,
+        width: int,
+        max_line_length: int | None = None,
+        measure_line: Callable[[str, bool], int] | None = None,
+    ) -> list[str]:
+        self.encoded.append(field_name)
+        return super()._encode_field_lines(
+            field_name=field_name,
+            field_value=field_value,
+            width=width,
+            max_line_length=max_line_length,
+            measure_line=measure_line,
+        )
+
+
+PROCESSOR_FACTORIES: tuple[Callable[[], HeaderProcessor], ...] = (
+    PoundHeaderProcessor,
+    SlashHeaderProcessor,
+    CBlockHeaderProcessor,
+    MarkdownHeaderProcessor,
+    XmlHeaderProcessor,
+)
+
+STATIC_FIELDS: tuple[str, ...] = ("project", "license", "copyright")
+DYNAMIC_FIELDS: tuple[str, ...] = ("file", "file_relpath")
+
+# Printable text plus spaces and semantic newlines, so values exercise ordinary,
+# exact, literal, and folded encodings.
+FIELD_TEXT: st.SearchStrategy[str] = st.text(
+    alphabet=st.one_of(
+        st.characters(blacklist_categories=("Cs", "Cc")),
+        st.sampled_from(" \n"),
+    ),
+    max_size=60,
+)
+
+
+# Per-file inputs: path-derived values (a missing key changes the alignment
+# width), newline style, and pre-prefix indentation.
+PER_FILE: st.SearchStrategy[tuple[dict[str, str], str, str | None]] = st.tuples(
+    st.dictionaries(keys=st.sampled_from(DYNAMIC_FIELDS), values=FIELD_TEXT),
+    st.sampled_from(("\n", "\r\n", "\r")),
+    st.sampled_from((None, "", "    ")),
+)
+
+
+@settings(deadline=None)
+@given(
+    factory=st.sampled_from(PROCESSOR_FACTORIES),
+    align_fields=st.booleans(),
+    max_header_line_length=st.none() | st.integers(min_value=10, max_value=80),
+    wrap_fields=st.lists(st.sampled_from(STATIC_FIELDS + DYNAMIC_FIELDS), unique=True),
+    static_values=st.fixed_dictionaries(dict.fromkeys(STATIC_FIELDS, FIELD_TEXT)),
+    per_file=st.lists(PER_FILE, min_size=1, max_size=6),
+)
+def test_cached_render_matches_uncached_render(
+    factory: Callable[[], HeaderProcessor],
+    align_fields: bool,
+    max_header_line_length: int | None,
+    wrap_fields: list[str],
+    static_values: dict[str, str],
+    per_file: list[tuple[dict[str, str], str, str | None]],
+) -> None:
+    """A warm render cache yields the same lines and overflow fields as a fresh processor."""
+    config = _Config(
+        header_fields=(*STATIC_FIELDS, *DYNAMIC_FIELDS),
+        align_fields=align_fields,
+        max_header_line_length=max_header_line_length,
+        wrap_fields=tuple(wrap_fields),
+    )
+    cached: HeaderProcessor = factory()
+
+    for dynamic_values, newline_style, header_indent_override in per_file:
+        header_values: dict[str, str] = {**static_values, **dynamic_values}
+        cached_overflow: set[str] = set()
+        uncached_overflow: set[str] = set()
+
+        cached_lines: list[str] = cached.render_header_lines(
+            header_values,
+            config,
+            newline_style,
+            header_indent_override=header_indent_override,
+            soft_overflow_fields=cached_overflow,
+            static_fields=STATIC_FIELDS,
+        )
+        uncached_lines: list[str] = factory().render_header_lines(
+            header_values,
+            config,
+            newline_style,
+            header_indent_override=header_indent_override,
+            soft_overflow_fields=uncached_overflow,
+        )
+
+        assert cached_lines == uncached_lines
+        assert cached_overflow == uncached_overflow
+
+
+def test_static_fields_are_encoded_once_per_render_settings() -> None:
+    """Only path-derived fields are re-encoded once the static lines are cached."""
+    config = _Config(header_fields=("project", "file"), align_fields=True)
+    processor = _CountingProcessor()
+
+    for name in ("a.py", "b.py", "c.py"):
+        processor.render_header_lines(
+            {"project": "TopMark", "file": name},
+            config,
+            "\n",
+            static_fields=("project",),
+        )
+    assert processor.encoded == ["project", "file", "file", "file"]
+
+    # A different newline style is a different template.
+    processor.render_header_lines(
+        {"project": "TopMark", "file": "d.py"},
+        config,
+        "\r\n",
+        static_fields=("project",),
+    )
+    assert processor.encoded[-2:] == ["project", "file"]
+
+
+def test_changed_static_value_is_not_served_from_cache() -> None:
+    """Cached static lines are keyed by value, so a different value renders afresh."""
+    config = _Config(header_fields=("project",), align_fields=False)
+    processor = PoundHeaderProcessor()
+
+    first: list[str] = processor.render_header_lines(
+        {"project": "One"}, config, "\n", static_fields=("project",)
+    )
+    second: list[str] = processor.render_header_lines(
+        {"project": "Two"}, config, "\n", static_fields=("project",)
+    )
+
+    assert "#   project: One\n" in first
+    assert "#   project: Two\n" in second
@@ -0,0 +1,157 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_snapshot.py
+#   file_relpath : tests/registry/test_snapshot.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Registry snapshot tests: opt-in, round-trip, staleness, and equivalence."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from topmark.filetypes.instances import discover_plugin_entry_points
+from topmark.filetypes.instances import get_base_file_type_registry
+from topmark.filetypes.instances import get_plugin_entry_points
+from topmark.processors.instances import build_registry_snapshot
+from topmark.processors.instances import get_base_processor_binding_registry
+from topmark.registry.snapshot import REGISTRY_SNAPSHOT_ENV
+from topmark.registry.snapshot import RegistrySnapshot
+from topmark.registry.snapshot import clear_registry_snapshot_cache
+from topmark.registry.snapshot import get_registry_snapshot
+from topmark.registry.snapshot import load_registry_snapshot
+from topmark.registry.snapshot import write_registry_snapshot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from importlib.metadata import EntryPoint
+    from pathlib import Path
+
+
+@pytest.fixture(autouse=True)
+def _fresh_base_registries() -> Iterator[None]:
+    """Start and end every test with empty base-registry and snapshot caches."""
+
+    def _clear() -> None:
+        clear_registry_snapshot_cache()
+        get_plugin_entry_points.cache_clear()
+        get_base_file_type_registry.cache_clear()
+        get_base_processor_binding_registry.cache_clear()
+
+    _clear()
+    yield
+    _clear()
+
+
+def test_snapshot_is_disabled_without_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Snapshots are opt-in through the environment."""
+    monkeypatch.delenv(REGISTRY_SNAPSHOT_ENV, raising=False)
+
+    assert get_registry_snapshot() is None
+
+
+def test_snapshot_round_trips_through_json(tmp_path: Path) -> None:
+    """A written snapshot loads back unchanged in the same environment."""
+    snapshot: RegistrySnapshot = build_registry_snapshot()
+    path: Path = tmp_path / "registry.json"
+
+    assert write_registry_snapshot(snapshot, path)
+    assert load_registry_snapshot(path) == snapshot
+
+
+def test_stale_or_corrupt_snapshot_is_ignored(tmp_path: Path) -> None:
+    """Fingerprint mismatches and unreadable files are treated as misses."""
+    path: Path = tmp_path / "registry.json"
+    data: dict[str, object] = build_registry_snapshot().to_dict()
+    data["fingerprint"] = "stale"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert load_registry_snapshot(path) is None
+
+    path.write_text("{not json", encoding="utf-8")
+    assert load_registry_snapshot(path) is None
+
+    path.write_text(json.dumps({"schema_version": 0}), encoding="utf-8")
+    assert load_registry_snapshot(path) is None
+
+
+def test_stale_snapshot_is_rebuilt_and_rewritten(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A stale file is ignored and rewritten by the binding registry build."""
+    path: Path = tmp_path / "cache" / "registry.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps({"schema_version": 1, "fingerprint": "stale"}), encoding="utf-8")
+    monkeypatch.setenv(REGISTRY_SNAPSHOT_ENV, str(path))
+
+    assert get_registry_snapshot() is None
+    bindings: dict[str, str] = get_base_processor_binding_registry()
+
+    snapshot: RegistrySnapshot | None = get_registry_snapshot()
+    assert snapshot is not None
+    assert dict(snapshot.bindings) == bindings
+    assert load_registry_snapshot(path) == snapshot
+
+
+def test_snapshot_backed_base_registries_match_scanned_ones(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Base registries are identical with and without a snapshot."""
+    monkeypatch.delenv(REGISTRY_SNAPSHOT_ENV, raising=False)
+    scanned_filetypes: list[str] = sorted(get_base_file_type_registry())
+    scanned_bindings: dict[str, str] = dict(get_base_processor_binding_registry())
+
+    monkeypatch.setenv(REGISTRY_SNAPSHOT_ENV, str(tmp_path / "registry.json"))
+    for _ in range(2):  # first run writes the snapshot, second run loads it
+        clear_registry_snapshot_cache()
+        get_plugin_entry_points.cache_clear()
+        get_base_file_type_registry.cache_clear()
+        get_base_processor_binding_registry.cache_clear()
+
+        assert get_base_processor_binding_registry() == scanned_bindings
+        assert sorted(get_base_file_type_registry()) == scanned_filetypes
+
+    assert (tmp_path / "registry.json").is_file()
+
+
+def test_snapshot_entry_points_skip_environment_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A loaded snapshot serves entry points without calling `entry_points()`."""
+    path: Path = tmp_path / "registry.json"
+    assert write_registry_snapshot(build_registry_snapshot(), path)
+    get_plugin_entry_points.cache_clear()
+    get_base_file_type_registry.cache_clear()
+    monkeypatch.setenv(REGISTRY_SNAPSHOT_ENV, str(path))
+
+    def _fail() -> None:
+        raise AssertionError("entry_points() must not be called")
+
+    monkeypatch.setattr("topmark.filetypes.instances.entry_points", _fail)
+
+    assert get_base_file_type_registry()
+
+
+def test_cold_start_scans_entry_points_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Building both base registries and writing the snapshot scans once."""
+    monkeypatch.setenv(REGISTRY_SNAPSHOT_ENV, str(tmp_path / "registry.json"))
+    calls: list[None] = []
+
+    def _counting_scan() -> tuple[EntryPoint, ...]:
+        calls.append(None)
+        return discover_plugin_entry_points()
+
+    monkeypatch.setattr("topmark.filetypes.instances.discover_plugin_entry_points", _counting_scan)
+
+    assert get_base_file_type_registry()
+    assert get_base_processor_binding_registry()
+    assert (tmp_path / "registry.json").is_file()
+    assert len(calls) == 1
@@ -0,0 +1,116 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_git_changed_files.py
+#   file_relpath : tests/resolution/files/test_git_changed_files.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Git-based incremental selection tests (`--changed-since` / `--staged`)."""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import pytest
+
+import topmark.resolution.files as file_resolver_mod
+from tests.helpers.config import make_frozen_config
+from tests.helpers.git import run_git
+from tests.resolution.files._helpers import write
+from topmark.config.types import PatternGroup
+from topmark.core.errors import GitSelectionError
+from topmark.resolution.git import git_changed_files
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from topmark.config.model import FrozenConfig
+    from topmark.resolution.files import FileListResolution
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Return a git repository with one commit of three files."""
+    root: Path = tmp_path / "repo"
+    root.mkdir()
+    run_git(root, "init", "-q")
+    write(root / "src" / "a.py", "a = 1\n")
+    write(root / "src" / "b.py", "b = 1\n")
+    write(root / "docs" / "c.md", "# c\n")
+    run_git(root, "add", "-A")
+    run_git(root, "commit", "-q", "-m", "initial")
+    return root
+
+
+def test_changed_since_reports_committed_and_uncommitted_changes(repo: Path) -> None:
+    """Changes since a revision include later commits and work-tree edits, not deletions."""
+    write(repo / "src" / "a.py", "a = 2\n")
+    run_git(repo, "commit", "-q", "-am", "edit a")
+    write(repo / "docs" / "c.md", "# changed\n")
+    (repo / "src" / "b.py").unlink()
+    write(repo / "src" / "untracked.py", "u = 1\n")
+
+    changed: tuple[Path, ...] = git_changed_files(cwd=repo / "src", since="HEAD~1")
+
+    top: Path = repo.resolve()
+    assert changed == (top / "docs" / "c.md", top / "src" / "a.py")
+
+
+def test_staged_reports_only_index_changes(repo: Path) -> None:
+    """`staged` compares the index with HEAD and ignores unstaged edits."""
+    write(repo / "src" / "a.py", "a = 2\n")
+    write(repo / "src" / "new.py", "n = 1\n")
+    run_git(repo, "add", "src/new.py")
+
+    changed: tuple[Path, ...] = git_changed_files(cwd=repo, staged=True)
+
+    assert changed == (repo.resolve() / "src" / "new.py",)
+
+
+@pytest.mark.parametrize("revision", ["no-such-revision", "--output=/tmp/x"])
+def test_bad_revision_raises_git_selection_error(repo: Path, revision: str) -> None:
+    """Unknown revisions (including option-like ones) surface as GitSelectionError."""
+    with pytest.raises(GitSelectionError):
+        git_changed_files(cwd=repo, since=revision)
+
+
+def test_outside_repository_raises_git_selection_error(tmp_path: Path) -> None:
+    """Selecting changed files outside a git work tree fails with GitSelectionError."""
+    outside: Path = tmp_path / "plain"
+    outside.mkdir()
+    with pytest.raises(GitSelectionError):
+        git_changed_files(cwd=outside, staged=True)
+
+
+def test_changed_files_are_restricted_by_inputs_and_filters(
+    repo: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changed files replace input expansion; inputs restrict them and filters still apply."""
+    write(repo / "src" / "a.py", "a = 2\n")
+    write(repo / "src" / "b.py", "b = 2\n")
+    write(repo / "docs" / "c.md", "# changed\n")
+    monkeypatch.chdir(repo)
+    changed: tuple[Path, ...] = git_changed_files(cwd=repo, since="HEAD")
+
+    cfg: FrozenConfig = make_frozen_config(
+        files=["src"],
+        exclude_pattern_groups=[PatternGroup(patterns=("src/b.py",), base=repo.resolve())],
+    )
+    resolution: FileListResolution = file_resolver_mod.resolve_file_list_with_diagnostics(
+        cfg,
+        changed_files=changed,
+    )
+    assert [p.name for p in resolution.selected] == ["a.py"]
+
+    all_inputs: FileListResolution = file_resolver_mod.resolve_file_list_with_diagnostics(
+        make_frozen_config(),
+        changed_files=changed,
+    )
+    assert sorted(p.name for p in all_inputs.selected) == ["a.py", "b.py", "c.md"]
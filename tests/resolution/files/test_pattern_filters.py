@@ -12,15 +12,19 @@
 
 from __future__ import annotations
 
+import os
+from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 
+import topmark.resolution.files as file_resolver_mod
 from tests.helpers.config import make_frozen_config
 from tests.resolution.files._helpers import resolve_selected
 from tests.resolution.files._helpers import write
 from topmark.config.types import PatternGroup
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable
 
     import pytest
 
@@ -457,3 +461,68 @@ def test_excluded_root_directory_prunes_traversal(
 
     rel: list[str] = [p.as_posix() for p in resolve_selected(cfg)]
     assert rel == ["kept/b.py"]
+
+
+def test_directory_walk_prunes_excluded_dirs_and_canonicalizes_only_roots(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Excluded subtrees are never scanned and walked files reuse the root's identity."""
+    write(tmp_path / "pkg" / "a.py", "x")
+    write(tmp_path / "pkg" / "sub" / "b.py", "x")
+    write(tmp_path / "pkg" / "__pycache__" / "a.cpython.pyc", "x")
+
+    walk_root: Path = (tmp_path / "pkg").resolve()
+    scanned: list[str] = []
+    real_scandir: Callable[[Path], Any] = os.scandir
+    canonicalized: list[Path] = []
+    real_canonical: Callable[[Path], Path] = file_resolver_mod.canonical_processing_path
+
+    def _scandir(path: Path) -> Any:  # noqa: ANN401 - scandir iterator type is private
+        # `os.scandir` is patched globally and `Path.iterdir()` uses it on Python 3.13+,
+        # so only record scans of the walked tree, not those made by canonicalization.
+        scanned_path: Path = Path(path).resolve()
+        if scanned_path.is_relative_to(walk_root):
+            scanned.append(scanned_path.name)
+        return real_scandir(path)
+
+    def _canonical(path: Path) -> Path:
+        canonicalized.append(path)
+        return real_canonical(path)
+
+    with monkeypatch.context() as m:
+        m.chdir(tmp_path)
+        m.setattr(file_resolver_mod.os, "scandir", _scandir)
+        m.setattr(file_resolver_mod, "canonical_processing_path", _canonical)
+        cfg: FrozenConfig = make_frozen_config(
+            files=["pkg"],
+            exclude_pattern_groups=[
+                PatternGroup(
+                    patterns=("__pycache__/",),
+                    base=tmp_path.resolve(),
+                ),
+            ],
+        )
+        rel: list[str] = sorted(p.as_posix() for p in resolve_selected(cfg))
+
+    assert rel == ["pkg/a.py", "pkg/sub/b.py"]
+    assert sorted(scanned) == ["pkg", "sub"]
+    assert canonicalized == [Path("pkg")]
+
+
+def test_directory_walk_skips_directories_with_a_valid_cachedir_tag(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A valid `CACHEDIR.TAG` drops its directory; an invalid one is an ordinary file."""
+    write(tmp_path / "a.py", "x")
+    write(tmp_path / "cache" / "CACHEDIR.TAG", "Signature: 8a477f597d28d172789f06886806bc55\n")
+    write(tmp_path / "cache" / "entry.py", "x")
+    write(tmp_path / "cache" / "nested" / "entry.py", "x")
+    write(tmp_path / "notcache" / "CACHEDIR.TAG", "Signature: not a cache directory\n")
+    write(tmp_path / "notcache" / "b.py", "x")
+
+    with monkeypatch.context() as m:
+        m.chdir(tmp_path)
+        cfg: FrozenConfig = make_frozen_config(files=["."])
+        rel: list[str] = sorted(p.as_posix() for p in resolve_selected(cfg))
+
+    assert rel == ["a.py", "notcache/CACHEDIR.TAG", "notcache/b.py"]
@@ -20,9 +20,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 from tests.helpers.registry import make_file_type
 from topmark.filetypes.model import ContentGate
 from topmark.processors.base import HeaderProcessor
+from topmark.resolution import filetypes as filetypes_mod
 from topmark.resolution.filetypes import candidate_order_key
 from topmark.resolution.filetypes import get_file_type_candidates_for_path
 from topmark.resolution.filetypes import probe_resolution_for_path
@@ -185,3 +188,112 @@ def test_candidate_order_prefers_filename_then_deterministic_identifier_ties(
         earlier_ft.qualified_key,
         later_ft.qualified_key,
     ]
+
+
+def _full_scan_positions(
+    index: filetypes_mod._FileTypeMatchIndex,  # pyright: ignore[reportPrivateUsage]
+    base_name: str,
+    path_str: str,
+) -> list[int]:
+    """Return every registry position, disabling the match-index pre-filter."""
+    del base_name, path_str
+    return list(range(len(index.file_types)))
+
+
+@pytest.mark.parametrize(
+    "relpath",
+    [
+        "pkg/module.py",
+        "types/index.d.ts",
+        "Dockerfile",
+        "Dockerfile.dev",
+        "Makefile",
+        "requirements-dev.txt",
+        "constraints.txt",
+        ".env",
+        ".env.local",
+        ".vscode/settings.json",
+        "nested/.vscode/extensions.json",
+        "config/settings.json",
+        "pyproject.toml",
+        "README.md",
+        "LICENSE",
+        "no_extension",
+        "archive.tar.gz",
+    ],
+)
+def test_match_index_preserves_full_scan_resolution(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    relpath: str,
+) -> None:
+    """The match index should produce the same probe result as scanning every file type."""
+    file: Path = tmp_path / relpath
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text("// comment\n{}\n", encoding="utf-8")
+
+    indexed: ResolutionProbeResult = probe_resolution_for_path(file)
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            filetypes_mod._FileTypeMatchIndex,  # pyright: ignore[reportPrivateUsage]
+            "candidate_positions",
+            _full_scan_positions,
+        )
+        scanned: ResolutionProbeResult = probe_resolution_for_path(file)
+
+    assert indexed == scanned
+
+
+@pytest.mark.parametrize(
+    ("basename", "expected"),
+    [
+        ("abab", "echo"),
+        ("SHOUT.TXT", "shout"),
+        ("beta.x", "alternative"),
+        ("thing.gen", "generated"),
+        ("plain.cfg", "plain"),
+        ("other.cfg", None),
+    ],
+)
+def test_match_index_covers_every_pattern_shape(
+    tmp_path: Path,
+    effective_registries: EffectiveRegistries,
+    basename: str,
+    expected: str | None,
+) -> None:
+    """Prefixed, prefix-less, alternating, flagged, and back-referencing patterns all match."""
+    file: Path = tmp_path / basename
+    file.write_text("x\n", encoding="utf-8")
+
+    filetypes: dict[str, FileType] = {
+        "echo": make_file_type(local_key="echo", patterns=[r"(ab)\1"]),
+        "shout": make_file_type(local_key="shout", patterns=[r"(?i)shout\.txt"]),
+        "alternative": make_file_type(local_key="alternative", patterns=[r"alpha|beta\.x"]),
+        "generated": make_file_type(local_key="generated", patterns=[r".*\.gen"]),
+        "plain": make_file_type(local_key="plain", patterns=[r"plain\..*"]),
+    }
+
+    with effective_registries(filetypes, {}):
+        candidates: list[FileTypeCandidate] = get_file_type_candidates_for_path(file)
+
+    assert [c.local_key for c in candidates] == ([] if expected is None else [expected])
+
+
+def test_match_index_is_rebuilt_when_registry_changes(
+    tmp_path: Path,
+    effective_registries: EffectiveRegistries,
+) -> None:
+    """A new registry snapshot should never be resolved against a stale index."""
+    file: Path = tmp_path / "example.first"
+    file.write_text("x\n", encoding="utf-8")
+
+    first_ft: FileType = make_file_type(local_key="first", extensions=[".first"])
+    second_ft: FileType = make_file_type(local_key="second", extensions=[".second"])
+
+    with effective_registries({"first": first_ft}, {}):
+        first_candidates: list[FileTypeCandidate] = get_file_type_candidates_for_path(file)
+    with effective_registries({"second": second_ft}, {}):
+        second_candidates: list[FileTypeCandidate] = get_file_type_candidates_for_path(file)
+
+    assert [c.file_type.qualified_key for c in first_candidates] == [first_ft.qualified_key]
+    assert second_candidates == []
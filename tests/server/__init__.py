@@ -0,0 +1,13 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : __init__.py
+#   file_relpath : tests/server/__init__.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Server, transport, and client tests for topmark.server."""
+
+from __future__ import annotations
@@ -0,0 +1,168 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_service.py
+#   file_relpath : tests/server/test_service.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Contract tests for JSON-RPC request dispatch in `TopmarkService`."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from topmark.server.protocol import INVALID_PARAMS
+from topmark.server.protocol import INVALID_REQUEST
+from topmark.server.protocol import METHOD_NOT_FOUND
+from topmark.server.protocol import make_request
+from topmark.server.service import TopmarkService
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _call(service: TopmarkService, method: str, **params: object) -> dict[str, object]:
+    """Send one request and return the response object."""
+    response: dict[str, object] | None = service.handle(make_request(method, params, request_id=1))
+    assert response is not None
+    return response
+
+
+def _project(root: Path) -> Path:
+    """Create a project with a config file and one Python file without a header."""
+    (root / "topmark.toml").write_text('[header]\nfields = ["file"]\n', encoding="utf-8")
+    (root / "module.py").write_text("print(1)\n", encoding="utf-8")
+    return root
+
+
+def test_check_paths_in_the_requested_working_directory(tmp_path: Path) -> None:
+    """Relative paths and config discovery are resolved against the request's `cwd`."""
+    project: Path = _project(tmp_path)
+    before: str = os.getcwd()  # noqa: PTH109 - compared as a plain string
+
+    response: dict[str, object] = _call(
+        TopmarkService(), "check", paths=["module.py"], cwd=str(project)
+    )
+
+    assert os.getcwd() == before  # noqa: PTH109 - compared as a plain string
+    assert response["result"] == {
+        "result": {
+            "files": [
+                {
+                    "path": "module.py",
+                    "outcome": "would insert",
+                    "diff": None,
+                    "bucket_key": "would insert",
+                    "bucket_label": "header missing, changes found",
+                }
+            ],
+            "summary": {"would insert": 1},
+            "had_errors": False,
+            "skipped": 0,
+            "written": 0,
+            "failed": 0,
+            "bucket_summary": {"would insert": 1},
+            "diagnostics": {},
+            "diagnostic_totals": {"info": 0, "warning": 0, "error": 0, "total": 0},
+            "diagnostic_totals_all": {"info": 0, "warning": 0, "error": 0, "total": 0},
+        },
+        "content": None,
+    }
+
+
+def test_apply_on_a_buffer_returns_the_updated_content(tmp_path: Path) -> None:
+    """Buffer output is returned in the response instead of leaking to stdout."""
+    project: Path = _project(tmp_path)
+
+    response: dict[str, object] = _call(
+        TopmarkService(),
+        "check",
+        paths=["module.py"],
+        content="x = 1\n",
+        apply=True,
+        cwd=str(project),
+    )
+
+    result = response["result"]
+    assert isinstance(result, dict)
+    assert result["content"] == (
+        "# topmark:header:start\n#\n#   file : module.py\n#\n# topmark:header:end\n\nx = 1\n"
+    )
+    assert (project / "module.py").read_text(encoding="utf-8") == "print(1)\n"
+
+
+def test_config_edits_are_picked_up_between_requests(tmp_path: Path) -> None:
+    """Unchanged config files are served from the cache; edited files are re-parsed."""
+    project: Path = _project(tmp_path)
+    service = TopmarkService()
+
+    _call(service, "probe", paths=["module.py"], cwd=str(project))
+    _call(service, "probe", paths=["module.py"], cwd=str(project))
+    config: Path = project / "topmark.toml"
+    config.write_text('[header]\nfields = ["file", "project"]\n', encoding="utf-8")
+    os.utime(config, ns=(0, 0))
+    _call(service, "probe", paths=["module.py"], cwd=str(project))
+
+    assert service.toml_cache.stats.invalidations == 1
+    assert service.toml_cache.stats.hits > 0
+    assert len(service.toml_cache) >= 1
+
+
+@pytest.mark.parametrize(
+    ("request_obj", "code"),
+    [
+        ([], INVALID_REQUEST),
+        ({"jsonrpc": "1.0", "id": 1, "method": "ping"}, INVALID_REQUEST),
+        ({"jsonrpc": "2.0", "id": 1, "method": "ping", "params": []}, INVALID_PARAMS),
+        ({"jsonrpc": "2.0", "id": 1, "method": "format"}, METHOD_NOT_FOUND),
+        ({"jsonrpc": "2.0", "id": 1, "method": "check", "params": {}}, INVALID_PARAMS),
+        ({"jsonrpc": "2.0", "id": 1, "method": "check", "params": {"paths": "a"}}, INVALID_PARAMS),
+        (
+            {"jsonrpc": "2.0", "id": 1, "method": "check", "params": {"paths": [], "x": 1}},
+            INVALID_PARAMS,
+        ),
+        (
+            {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "check",
+                "params": {"paths": ["a.py", "b.py"], "content": ""},
+            },
+            INVALID_PARAMS,
+        ),
+    ],
+    ids=(
+        "not-an-object",
+        "wrong-version",
+        "positional-params",
+        "unknown-method",
+        "missing-paths",
+        "paths-not-a-list",
+        "unknown-param",
+        "content-with-two-paths",
+    ),
+)
+def test_invalid_requests_get_error_responses(request_obj: object, code: int) -> None:
+    """Malformed requests are answered with the matching JSON-RPC error code."""
+    response: dict[str, object] | None = TopmarkService().handle(request_obj)
+
+    assert response is not None
+    error = response["error"]
+    assert isinstance(error, dict)
+    assert error["code"] == code
+
+
+def test_notifications_and_shutdown() -> None:
+    """Requests without an id get no response; `shutdown` flags the service."""
+    service = TopmarkService()
+
+    assert service.handle({"jsonrpc": "2.0", "method": "ping"}) is None
+    assert _call(service, "shutdown")["result"] is True
+    assert service.shutdown_requested
+    assert service.requests == 2
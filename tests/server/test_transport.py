@@ -0,0 +1,141 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_transport.py
+#   file_relpath : tests/server/test_transport.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Socket and stdio round trips, and the client's in-process fallback."""
+
+from __future__ import annotations
+
+import io
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from topmark.core.errors import ServerRequestError
+from topmark.core.errors import ServerUnavailableError
+from topmark.server.client import TopmarkClient
+from topmark.server.protocol import INVALID_PARAMS
+from topmark.server.protocol import PARSE_ERROR
+from topmark.server.service import TopmarkService
+from topmark.server.transport import serve_stdio
+from topmark.server.transport import serve_unix_socket
+from topmark.server.transport import unix_sockets_supported
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+WAIT_SECONDS: float = 10.0
+
+requires_unix_sockets = pytest.mark.skipif(
+    not unix_sockets_supported(),
+    reason="Unix domain sockets are not available",
+)
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """Return a short socket path (`AF_UNIX` paths are limited to ~100 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="tm-") as directory:
+        yield Path(directory) / "server" / "topmark.sock"
+
+
+def _project(root: Path) -> Path:
+    """Create a project with a config file and one Python file without a header."""
+    (root / "topmark.toml").write_text('[header]\nfields = ["file"]\n', encoding="utf-8")
+    (root / "module.py").write_text("print(1)\n", encoding="utf-8")
+    return root
+
+
+@requires_unix_sockets
+def test_socket_round_trip_and_shutdown(
+    tmp_path: Path,
+    socket_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A client talks to a socket server until `shutdown` removes the socket."""
+    monkeypatch.chdir(_project(tmp_path))
+    ready = threading.Event()
+    server = threading.Thread(
+        target=serve_unix_socket,
+        args=(TopmarkService(), socket_path),
+        kwargs={"ready": ready},
+        daemon=True,
+    )
+    server.start()
+    assert ready.wait(WAIT_SECONDS)
+    client = TopmarkClient(socket_path, fallback=False, timeout=WAIT_SECONDS)
+
+    checked: dict[str, object] = client.check(["module.py"], content="x = 1\n", apply=True)
+    assert not client.used_fallback
+    assert checked["content"] == (
+        "# topmark:header:start\n#\n#   file : module.py\n#\n# topmark:header:end\n\nx = 1\n"
+    )
+    with pytest.raises(ServerRequestError) as excinfo:
+        client.check(["a.py", "b.py"], content="")
+    assert excinfo.value.code == INVALID_PARAMS
+    assert client.ping()["requests"] == 3
+
+    client.shutdown()
+    server.join(WAIT_SECONDS)
+    assert not server.is_alive()
+    assert not socket_path.exists()
+    assert (socket_path.parent.stat().st_mode & 0o777) == 0o700
+
+
+def test_client_falls_back_to_in_process_execution(
+    tmp_path: Path,
+    socket_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without a server, the client answers in-process with the same result shape."""
+    monkeypatch.chdir(_project(tmp_path))
+    client = TopmarkClient(socket_path)
+
+    probed: dict[str, object] = client.probe(["module.py"])
+
+    assert client.used_fallback
+    result = probed["result"]
+    assert isinstance(result, dict)
+    assert result["summary"] == {"resolved": 1}
+
+
+def test_client_without_fallback_reports_an_unavailable_server(socket_path: Path) -> None:
+    """Fallback can be disabled to detect a missing server."""
+    with pytest.raises(ServerUnavailableError):
+        TopmarkClient(socket_path, fallback=False).ping()
+
+
+def test_stdio_loop_answers_each_line_until_shutdown() -> None:
+    """The stdio transport answers request lines in order and stops at `shutdown`."""
+    requests: bytes = b"".join(
+        (
+            b'{"jsonrpc":"2.0","id":1,"method":"ping"}\n',
+            b"\n",
+            b"not json\n",
+            b'{"jsonrpc":"2.0","method":"ping"}\n',
+            b'{"jsonrpc":"2.0","id":2,"method":"shutdown"}\n',
+            b'{"jsonrpc":"2.0","id":3,"method":"ping"}\n',
+        )
+    )
+    stdout = io.BytesIO()
+
+    serve_stdio(TopmarkService(), stdin=io.BytesIO(requests), stdout=stdout)
+
+    responses: list[dict[str, object]] = [
+        json.loads(line) for line in stdout.getvalue().splitlines()
+    ]
+    assert [response.get("id") for response in responses] == [1, None, 2]
+    error = responses[1]["error"]
+    assert isinstance(error, dict)
+    assert error["code"] == PARSE_ERROR
+    assert responses[2]["result"] is True
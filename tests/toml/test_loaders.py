@@ -227,3 +227,25 @@ def test_loader_validates_in_input_mode_and_preserves_issue_tuple(
     assert parsed is not None
     assert calls == [(source, TomlValidationMode.INPUT)]
     assert parsed.validation_issues is expected
+
+
+def test_active_cache_reuses_unchanged_sources_and_reparses_edits(tmp_path: Path) -> None:
+    """An active `TomlSourceCache` parses a file once until its stat identity changes."""
+    path: Path = tmp_path / "topmark.toml"
+    path.write_text('[fields]\nauthor = "A"\n', encoding="utf-8")
+    cache = loaders.TomlSourceCache()
+
+    with cache.activate():
+        first: ParsedTopmarkToml | None = load_topmark_toml_source(path)
+        again: ParsedTopmarkToml | None = load_topmark_toml_source(path)
+        path.write_text('[fields]\nauthor = "Bee"\n', encoding="utf-8")
+        edited: ParsedTopmarkToml | None = load_topmark_toml_source(path)
+    uncached: ParsedTopmarkToml | None = load_topmark_toml_source(path)
+
+    assert first is not None
+    assert again is first
+    assert edited is not None
+    assert edited.toml_fragment == {Toml.SECTION_FIELDS: {"author": "Bee"}}
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.invalidations) == (1, 2, 1)
+    assert uncached is not edited
+    assert len(cache) == 1
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 import pytest
 
 from topmark.config.types import FileWriteStrategy
+from topmark.config.types import WriteDurability
 from topmark.diagnostic.model import DiagnosticLevel
 from topmark.toml.keys import Toml
 from topmark.toml.parse import parse_topmark_toml_table
@@ -100,6 +101,25 @@ def test_invalid_persisted_writer_strategy_produces_no_override(
     assert parsed.toml_fragment == source
 
 
+@pytest.mark.parametrize("durability", list(WriteDurability))
+def test_persisted_writer_durability_is_parsed_independently_of_strategy(
+    durability: WriteDurability,
+) -> None:
+    """A valid durability survives an unknown strategy in the same `[writer]` table."""
+    source: TomlTable = {
+        Toml.SECTION_WRITER: {
+            Toml.KEY_STRATEGY: "unknown",
+            Toml.KEY_DURABILITY: durability.value,
+        }
+    }
+
+    parsed: ParsedTopmarkToml = parse_topmark_toml_table(source, validation_issues=())
+
+    assert parsed.writer_options is not None
+    assert parsed.writer_options.file_write_strategy is None
+    assert parsed.writer_options.durability is durability
+
+
 @pytest.mark.parametrize("writer", ["atomic", ["atomic"]])
 def test_malformed_writer_table_is_ignored(writer: TomlValue) -> None:
     """Schema-owned writer shape failures are not promoted by the parser."""
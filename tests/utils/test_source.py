@@ -0,0 +1,139 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : test_source.py
+#   file_relpath : tests/utils/test_source.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Unit tests for the shared single-read file source."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from topmark.utils.source import FileSource
+from topmark.utils.source import read_path_prefix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import NoReturn
+
+# Separators that `str.splitlines()` honours but text-mode file iteration does not,
+# plus CR, CRLF, LF and one invalid UTF-8 byte.
+_TRICKY_BYTES: bytes = (
+    b"\xef\xbb\xbfa\x0bb\x0cc\x1cd\r\ne\xc2\x85f\xe2\x80\xa8g\rh\xffi\ntail without newline"
+)
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1], ids=["read", "mmap"])
+def test_text_lines_matches_text_mode_file_iteration(tmp_path: Path, mmap_threshold: int) -> None:
+    """Decoded lines match `open(..., errors="replace", newline="")` for both load paths."""
+    path: Path = tmp_path / "tricky.txt"
+    path.write_bytes(_TRICKY_BYTES)
+    with path.open("r", encoding="utf-8", errors="replace", newline="") as fh:
+        expected: list[str] = list(fh)
+
+    source = FileSource(path, mmap_threshold=mmap_threshold)
+
+    assert source.text_lines() == expected
+    assert source.prefix(4) == _TRICKY_BYTES[:4]
+    assert source.stats.opens == 1
+    assert source.stats.maps == (1 if mmap_threshold else 0)
+    assert source.stats.bytes_loaded == len(_TRICKY_BYTES)
+    source.release()
+    assert source.is_loaded is False
+
+
+def test_small_file_costs_one_open_and_one_read(tmp_path: Path) -> None:
+    """A file is opened and read once, however many consumers share the source."""
+    path: Path = tmp_path / "small.txt"
+    path.write_bytes(b"x" * 10_000)
+
+    source = FileSource(path)
+    assert source.stats.opens == 0
+
+    assert source.prefix(16) == b"x" * 16
+    assert len(source.text_lines()[0]) == 10_000
+    assert source.prefix(1_000_000) == b"x" * 10_000
+
+    assert (source.stats.opens, source.stats.reads, source.stats.maps) == (1, 1, 0)
+
+
+def test_empty_file_loads_without_mapping(tmp_path: Path) -> None:
+    """Zero-length files are read (never mapped) and decode to no lines."""
+    path: Path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    source = FileSource(path, mmap_threshold=1)
+
+    assert source.text_lines() == []
+    assert (source.stats.opens, source.stats.reads, source.stats.maps) == (1, 1, 0)
+
+
+def test_release_reloads_on_next_access(tmp_path: Path) -> None:
+    """Released sources reload lazily and keep accumulating I/O counters."""
+    path: Path = tmp_path / "file.txt"
+    path.write_bytes(b"one\n")
+    source = FileSource(path)
+
+    source.prefix(1)
+    source.release()
+    source.release()
+    path.write_bytes(b"two\n")
+
+    assert source.text_lines() == ["two\n"]
+    assert source.stats.opens == 2
+
+
+def test_load_errors_are_not_cached(tmp_path: Path) -> None:
+    """A missing file raises on every access until it appears."""
+    path: Path = tmp_path / "late.txt"
+    source = FileSource(path)
+
+    with pytest.raises(FileNotFoundError):
+        source.data()
+    path.write_bytes(b"now\n")
+
+    assert source.prefix(3) == b"now"
+
+
+def test_read_path_prefix_serves_active_source_without_reopening(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Content matchers read the active source; other paths fall back to disk."""
+    path: Path = tmp_path / "probe.json"
+    path.write_bytes(b'{"a": 1}\n')
+    other: Path = tmp_path / "other.json"
+    other.write_bytes(b"[]\n")
+    source = FileSource(path)
+    source.prefix(1)
+
+    def _fail_load(source: FileSource) -> NoReturn:
+        del source
+        raise AssertionError("active source must not be reloaded")
+
+    monkeypatch.setattr(FileSource, "_load", _fail_load)
+    with source.activate():
+        assert read_path_prefix(path, 4) == b'{"a"'
+        assert read_path_prefix(other, 100) == b"[]\n"
+    assert source.stats.opens == 1
+
+
+def test_in_memory_source_never_opens_the_logical_path(tmp_path: Path) -> None:
+    """`from_bytes()` serves its content even if the logical path is missing or released."""
+    path: Path = tmp_path / "missing" / "stdin.py"
+    source: FileSource = FileSource.from_bytes(path, _TRICKY_BYTES)
+
+    assert source.in_memory is True
+    with source.activate():
+        assert read_path_prefix(path, 4) == _TRICKY_BYTES[:4]
+    source.release()
+    assert source.data() == _TRICKY_BYTES
+    assert source.stat is None
+    assert (source.stats.opens, source.stats.reads) == (0, 0)
@@ -0,0 +1,322 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : cli_import_time_benchmark.py
+#   file_relpath : tools/perf/cli_import_time_benchmark.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Measure and budget the import cost of dispatching each TopMark subcommand.
+
+For every command path (e.g. ``version`` or ``config dump``) the tool starts a
+fresh interpreter with ``python -X importtime``, imports the root CLI group and
+resolves the command path through Click exactly as dispatch would, without
+running the command. The total import time is the sum of the per-module
+``self`` times reported by the interpreter; each path is measured several times
+and the median is reported.
+
+Two kinds of budget are checked:
+
+* a wall-clock budget in milliseconds per command path (machine dependent;
+  override with ``--budget PATH=MS``), and
+* a list of modules that must *not* be imported for that path (machine
+  independent; e.g. `topmark version` must not load the pipeline runner).
+
+The report is JSON on stdout. With ``--enforce`` the tool exits non-zero when
+any budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+SRC_ROOT: Final[Path] = REPO_ROOT / "src"
+
+# Command paths as typed on the command line; `()` measures `topmark` itself.
+COMMAND_PATHS: Final[tuple[tuple[str, ...], ...]] = (
+    (),
+    ("version",),
+    ("check",),
+    ("strip",),
+    ("probe",),
+    ("serve",),
+    ("config", "check"),
+    ("config", "dump"),
+    ("config", "defaults"),
+    ("config", "init"),
+    ("registry", "filetypes"),
+    ("registry", "processors"),
+    ("registry", "bindings"),
+)
+
+# Generous wall-clock budgets (ms); calibrate per machine with `--budget`.
+DEFAULT_BUDGETS_MS: Final[dict[str, float]] = {
+    "topmark": 400.0,
+    "version": 600.0,
+    "check": 1500.0,
+    "strip": 1500.0,
+    "probe": 1500.0,
+    "serve": 1500.0,
+    "config check": 1500.0,
+    "config dump": 1500.0,
+    "config defaults": 1200.0,
+    "config init": 1200.0,
+    "registry filetypes": 1200.0,
+    "registry processors": 1200.0,
+    "registry bindings": 1200.0,
+}
+
+# Modules that only pipeline commands need.
+_PIPELINE_MODULES: Final[tuple[str, ...]] = (
+    "topmark.cli.cmd_common",
+    "topmark.cli.emitters.machine",
+    "topmark.pipeline.runner",
+)
+
+# Modules that must not be imported when resolving a command path.
+FORBIDDEN_MODULES: Final[dict[str, tuple[str, ...]]] = {
+    "topmark": (
+        *_PIPELINE_MODULES,
+        "topmark.cli.commands.check",
+        "topmark.cli.commands.version",
+    ),
+    "version": _PIPELINE_MODULES,
+}
+
+_CHILD_SCRIPT: Final[str] = """
+import sys
+
+import click
+
+from topmark.cli.main import cli
+
+command: click.Command = cli
+ctx = click.Context(cli, info_name="topmark")
+for name in sys.argv[1:]:
+    assert isinstance(command, click.Group), name
+    sub = command.get_command(ctx, name)
+    assert sub is not None, name
+    ctx = click.Context(sub, parent=ctx, info_name=name)
+    command = sub
+"""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ImportTimeMeasurement:
+    """Import cost of resolving one command path.
+
+    Attributes:
+        command: Command path label (``"topmark"`` for the root group).
+        repeats: Number of fresh-interpreter runs.
+        median_ms: Median total import time across runs.
+        min_ms: Fastest run.
+        max_ms: Slowest run.
+        topmark_modules: Number of `topmark.*` modules imported.
+        budget_ms: Wall-clock budget for this path, if any.
+        forbidden_imported: Forbidden modules that were imported.
+        over_budget: Whether the median exceeds the budget.
+    """
+
+    command: str
+    repeats: int
+    median_ms: float
+    min_ms: float
+    max_ms: float
+    topmark_modules: int
+    budget_ms: float | None
+    forbidden_imported: list[str] = field(default_factory=list[str])
+    over_budget: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Whether this measurement respects all of its budgets."""
+        return not self.over_budget and not self.forbidden_imported
+
+
+def _label(path: Sequence[str]) -> str:
+    """Return the report label of a command path."""
+    return " ".join(path) if path else "topmark"
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse ``-X importtime`` output into a module -> self-time (µs) mapping.
+
+    Args:
+        stderr: Captured standard error of a ``python -X importtime`` run.
+
+    Returns:
+        Self time in microseconds for every module imported during the run.
+    """
+    self_us: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts: list[str] = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            value = int(parts[0].strip())
+        except ValueError:
+            # Column header line.
+            continue
+        self_us[parts[2].strip()] = value
+    return self_us
+
+
+def _run_once(path: Sequence[str]) -> dict[str, int]:
+    """Resolve `path` in a fresh interpreter and return its import profile."""
+    env: dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC_ROOT), env.get("PYTHONPATH", "")) if p)
+    completed = subprocess.run(  # noqa: S603 - fixed argv, current interpreter
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT, *path],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Resolving {_label(path)!r} failed with exit code {completed.returncode}:\n"
+            f"{completed.stderr[-2000:]}"
+        )
+    return parse_importtime(completed.stderr)
+
+
+def measure(
+    path: Sequence[str],
+    *,
+    repeats: int,
+    budgets: dict[str, float],
+) -> ImportTimeMeasurement:
+    """Measure the import cost of resolving one command path.
+
+    Args:
+        path: Command path as typed on the command line.
+        repeats: Number of fresh-interpreter runs; the median is reported.
+        budgets: Wall-clock budgets in milliseconds keyed by command label.
+
+    Returns:
+        The aggregated measurement.
+    """
+    label: str = _label(path)
+    totals_ms: list[float] = []
+    modules: set[str] = set()
+    for _ in range(repeats):
+        profile: dict[str, int] = _run_once(path)
+        totals_ms.append(sum(profile.values()) / 1000.0)
+        modules.update(profile)
+
+    median_ms: float = statistics.median(totals_ms)
+    budget_ms: float | None = budgets.get(label)
+    forbidden: list[str] = [m for m in FORBIDDEN_MODULES.get(label, ()) if m in modules]
+    return ImportTimeMeasurement(
+        command=label,
+        repeats=repeats,
+        median_ms=round(median_ms, 1),
+        min_ms=round(min(totals_ms), 1),
+        max_ms=round(max(totals_ms), 1),
+        topmark_modules=sum(1 for m in modules if m == "topmark" or m.startswith("topmark.")),
+        budget_ms=budget_ms,
+        forbidden_imported=forbidden,
+        over_budget=budget_ms is not None and median_ms > budget_ms,
+    )
+
+
+def _parse_budget(value: str) -> tuple[str, float]:
+    """Parse a ``PATH=MS`` budget override."""
+    label, sep, ms = value.rpartition("=")
+    if not sep or not label:
+        raise argparse.ArgumentTypeError(f"Expected PATH=MS, got {value!r}")
+    try:
+        return label.strip(), float(ms)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid budget in {value!r}") from exc
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure and budget the import cost of TopMark subcommands.",
+    )
+    parser.add_argument(
+        "--command",
+        action="append",
+        help=(
+            'Command path to measure, e.g. "version" or "config dump". May be repeated. '
+            "Defaults to every public command path."
+        ),
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Fresh-interpreter runs per command path (default: 5).",
+    )
+    parser.add_argument(
+        "--budget",
+        type=_parse_budget,
+        action="append",
+        default=[],
+        metavar="PATH=MS",
+        help='Override the wall-clock budget of one command path, e.g. "version=250".',
+    )
+    parser.add_argument(
+        "--enforce",
+        action="store_true",
+        help="Exit with status 1 if any budget is exceeded.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and emit a JSON report."""
+    args: argparse.Namespace = _parse_args(sys.argv[1:] if argv is None else argv)
+    budgets: dict[str, float] = {**DEFAULT_BUDGETS_MS, **dict(args.budget)}
+    paths: list[tuple[str, ...]] = (
+        [tuple(c.split()) for c in args.command] if args.command else list(COMMAND_PATHS)
+    )
+
+    measurements: list[ImportTimeMeasurement] = [
+        measure(path, repeats=max(1, int(args.repeats)), budgets=budgets) for path in paths
+    ]
+
+    report: dict[str, object] = {
+        "schema_version": 1,
+        "tool": "tools/perf/cli_import_time_benchmark.py",
+        "python": sys.version,
+        "platform": sys.platform,
+        "measurements": [asdict(measurement) for measurement in measurements],
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+    if args.enforce and not all(m.ok for m in measurements):
+        for m in measurements:
+            if m.over_budget:
+                sys.stderr.write(
+                    f"{m.command}: median {m.median_ms} ms exceeds budget {m.budget_ms} ms\n"
+                )
+            for module in m.forbidden_imported:
+                sys.stderr.write(f"{m.command}: imports forbidden module {module}\n")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
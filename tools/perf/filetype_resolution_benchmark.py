@@ -0,0 +1,242 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : filetype_resolution_benchmark.py
+#   file_relpath : tools/perf/filetype_resolution_benchmark.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Measure per-path file type resolution cost against registry size.
+
+The tool pads the effective file type registry with deterministic synthetic
+file types (each declaring an extension, an exact filename, and a basename
+pattern), then times `get_file_type_candidates_for_path()` over a fixed set of
+realistic paths. Each registry size is measured twice: once through the
+compiled match index and once with the index pre-filter disabled so every
+registered file type is scanned, which reproduces the historical resolver cost.
+
+With the match index, per-path cost should stay roughly flat as the registry
+grows; the full-scan column grows linearly. The report is JSON on stdout.
+"""
+
+from __future__ import annotations
+
+# The source-checkout bootstrap below intentionally precedes TopMark imports.
+# ruff: noqa: E402
+import argparse
+import json
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+
+# Allow running this tool directly from a source checkout without requiring an
+# editable install. The bootstrap must occur before any TopMark imports.
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+SRC_ROOT: Final[Path] = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from topmark.filetypes.model import FileType
+from topmark.registry.filetypes import FileTypeRegistry
+from topmark.resolution import filetypes as resolution_filetypes
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from collections.abc import Sequence
+
+DEFAULT_REGISTRY_PADDING: Final[tuple[int, ...]] = (0, 100, 1000)
+SYNTHETIC_NAMESPACE: Final[str] = "perf-synthetic"
+SAMPLE_PATHS: Final[tuple[str, ...]] = (
+    "src/pkg/module.py",
+    "web/types/index.d.ts",
+    "docs/guide.md",
+    "Dockerfile",
+    "requirements-dev.txt",
+    ".vscode/settings.json",
+    "config/app.toml",
+    "scripts/run.sh",
+    "LICENSE",
+    "data/blob.unknown",
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ResolutionMeasurement:
+    """Per-path resolution timing for one registry size.
+
+    Attributes:
+        registered_file_types: Number of file types in the effective registry.
+        synthetic_file_types: Number of synthetic file types added as padding.
+        paths_per_round: Number of paths resolved per timing round.
+        rounds: Number of timing rounds.
+        indexed_ns_per_path: Mean per-path cost with the match index.
+        full_scan_ns_per_path: Mean per-path cost scanning every file type.
+    """
+
+    registered_file_types: int
+    synthetic_file_types: int
+    paths_per_round: int
+    rounds: int
+    indexed_ns_per_path: float
+    full_scan_ns_per_path: float
+
+
+def _synthetic_file_type(index: int) -> FileType:
+    """Return a deterministic synthetic file type with one rule of each kind."""
+    token: str = f"synth{index:05d}"
+    return FileType(
+        local_key=token,
+        namespace=SYNTHETIC_NAMESPACE,
+        extensions=[f".{token}"],
+        filenames=[f"{token}.conf"],
+        patterns=[rf"{token}-.*\.cfg"],
+        description=f"Synthetic benchmark file type {index}",
+    )
+
+
+@contextmanager
+def _padded_registry(count: int) -> Generator[None]:
+    """Register `count` synthetic file types for the duration of the context."""
+    registered: list[FileType] = [_synthetic_file_type(index) for index in range(count)]
+    for ft in registered:
+        FileTypeRegistry.register(ft)
+    try:
+        yield
+    finally:
+        for ft in registered:
+            FileTypeRegistry.unregister(ft.qualified_key)
+
+
+def _full_scan_positions(
+    self: resolution_filetypes._FileTypeMatchIndex,  # pyright: ignore[reportPrivateUsage]
+    base_name: str,
+    path_str: str,
+) -> list[int]:
+    """Return every registry position, reproducing the historical full scan."""
+    del base_name, path_str
+    return list(range(len(self.file_types)))
+
+
+@contextmanager
+def _full_scan() -> Generator[None]:
+    """Temporarily disable the match-index pre-filter."""
+    index_cls = resolution_filetypes._FileTypeMatchIndex  # pyright: ignore[reportPrivateUsage]
+    original = index_cls.candidate_positions
+    index_cls.candidate_positions = _full_scan_positions
+    try:
+        yield
+    finally:
+        index_cls.candidate_positions = original
+
+
+def _time_per_path(paths: Sequence[Path], *, rounds: int) -> float:
+    """Return the mean resolution cost per path in nanoseconds."""
+    # Warm-up builds the match index and the registry caches.
+    for path in paths:
+        resolution_filetypes.get_file_type_candidates_for_path(path)
+    start: int = time.perf_counter_ns()
+    for _ in range(rounds):
+        for path in paths:
+            resolution_filetypes.get_file_type_candidates_for_path(path)
+    elapsed: int = time.perf_counter_ns() - start
+    return elapsed / (rounds * len(paths))
+
+
+def measure(
+    root: Path,
+    *,
+    padding: Sequence[int],
+    rounds: int,
+) -> list[ResolutionMeasurement]:
+    """Measure indexed and full-scan resolution for each registry size.
+
+    Args:
+        root: Directory in which the sample paths are created.
+        padding: Numbers of synthetic file types to register.
+        rounds: Number of timing rounds per measurement.
+
+    Returns:
+        One measurement per padding value.
+    """
+    paths: list[Path] = []
+    for relpath in SAMPLE_PATHS:
+        path: Path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("content\n", encoding="utf-8")
+        paths.append(path)
+
+    measurements: list[ResolutionMeasurement] = []
+    for count in padding:
+        with _padded_registry(count):
+            indexed: float = _time_per_path(paths, rounds=rounds)
+            with _full_scan():
+                scanned: float = _time_per_path(paths, rounds=rounds)
+            measurements.append(
+                ResolutionMeasurement(
+                    registered_file_types=len(FileTypeRegistry.as_mapping()),
+                    synthetic_file_types=count,
+                    paths_per_round=len(paths),
+                    rounds=rounds,
+                    indexed_ns_per_path=round(indexed, 1),
+                    full_scan_ns_per_path=round(scanned, 1),
+                )
+            )
+    return measurements
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Measure TopMark file type resolution cost against registry size.",
+    )
+    parser.add_argument(
+        "--padding",
+        type=int,
+        action="append",
+        help=(
+            "Number of synthetic file types to register. May be repeated. "
+            f"Defaults to {', '.join(str(n) for n in DEFAULT_REGISTRY_PADDING)}."
+        ),
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=200,
+        help="Timing rounds per measurement (default: 200).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and emit a JSON report."""
+    args: argparse.Namespace = _parse_args(sys.argv[1:] if argv is None else argv)
+    padding: Sequence[int] = args.padding or DEFAULT_REGISTRY_PADDING
+
+    with tempfile.TemporaryDirectory(prefix="topmark-perf-resolution-") as tmp:
+        measurements: list[ResolutionMeasurement] = measure(
+            Path(tmp),
+            padding=padding,
+            rounds=max(1, int(args.rounds)),
+        )
+
+    report: dict[str, object] = {
+        "schema_version": 1,
+        "tool": "tools/perf/filetype_resolution_benchmark.py",
+        "python": sys.version,
+        "platform": sys.platform,
+        "measurements": [asdict(measurement) for measurement in measurements],
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,441 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : monorepo_generator.py
+#   file_relpath : tools/perf/monorepo_generator.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Generate deterministic synthetic monorepos for repository-scale benchmarks.
+
+The generated tree mixes file types drawn from the effective
+[`FileTypeRegistry`][topmark.registry.filetypes.FileTypeRegistry], spreads
+files over a configurable directory depth and fan-out, and gives each file a
+current, outdated, or missing TopMark header. The repository root carries a
+`topmark.toml` (with `root = true`) that excludes everything listed in the
+generated `.gitignore`, as well as the generated config files themselves, so
+discovery selects exactly the content files.
+
+Directories down to `layer_depth` carry nested `topmark.toml` layers. Project
+configs are discovered upward from the run anchor (the first input path), so a
+run over the repository root loads only the root config. A run anchored inside
+a package (for example `topmark check d00/d01`) also loads every layer on the
+way. Layers restate root values (`project`, the header field list) and a policy
+default, so the rendered header is the same whichever anchor a run uses.
+
+Headers are not hand-written. For every selected file type, a template is
+rendered by running TopMark itself once over a small scratch tree. Header
+fields are therefore limited to values that do not depend on the file path
+(`project`, `license`, `copyright`), so each header can be reused for many
+files.
+
+Generation uses a seeded `random.Random`, so a given spec always produces the
+same tree. The tree can be several orders of magnitude larger than the scratch
+tree (up to millions of files); generation streams files to disk and keeps only
+the templates and directory bookkeeping in memory.
+
+Run the module directly to write a tree for use with the CLI:
+
+    python tools/perf/monorepo_generator.py /tmp/monorepo --files 100000
+"""
+
+from __future__ import annotations
+
+# The source-checkout bootstrap below intentionally precedes TopMark imports.
+# ruff: noqa: E402
+import argparse
+import json
+import random
+import sys
+import tempfile
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import Literal
+
+# Allow running this tool directly from a source checkout without requiring an
+# editable install. The bootstrap must occur before any TopMark imports.
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+SRC_ROOT: Final[Path] = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from topmark.api import check
+from topmark.registry.bindings import BindingRegistry
+from topmark.registry.filetypes import FileTypeRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from topmark.filetypes.model import FileType
+
+
+HeaderState = Literal["current", "outdated", "missing"]
+
+PROJECT_FIELD: Final[str] = "TopMarkPerf"
+LICENSE_FIELD: Final[str] = "MIT"
+COPYRIGHT_FIELD: Final[str] = "(c) 2025 TopMarkPerf"
+OUTDATED_COPYRIGHT_FIELD: Final[str] = "(c) 2019 TopMarkPerf Legacy"
+
+# Files placed in these directories are listed in the generated `.gitignore`
+# and must not be selected by discovery.
+EXCLUDED_DIR_NAME: Final[str] = "vendor"
+
+# Body used for template rendering; real files substitute their own body.
+_TEMPLATE_BODY: Final[str] = "value_0000 = 0\n"
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class MonorepoSpec:
+    """Shape of a synthetic monorepo.
+
+    Attributes:
+        files: Number of content files to generate, excluded files included.
+        depth: Number of directory levels above each file (at least 1).
+        fanout: Number of subdirectories per directory level.
+        files_per_dir: Target number of files per leaf directory. It grows when
+            `fanout ** depth` leaves cannot hold `files`.
+        file_types: Number of file types drawn from the registry.
+        current_fraction: Fraction of files with an up-to-date header.
+        outdated_fraction: Fraction of files with an outdated header; the rest
+            have no header.
+        excluded_fraction: Fraction of files placed in directories excluded by
+            the generated `.gitignore`.
+        layer_depth: Deepest directory level that receives a `topmark.toml`
+            layer (`0` disables nested layers).
+        min_body_lines: Minimum number of body lines per file.
+        max_body_lines: Maximum number of body lines per file.
+        seed: Seed of the deterministic random generator.
+    """
+
+    files: int = 10_000
+    depth: int = 3
+    fanout: int = 8
+    files_per_dir: int = 40
+    file_types: int = 12
+    current_fraction: float = 0.4
+    outdated_fraction: float = 0.2
+    excluded_fraction: float = 0.05
+    layer_depth: int = 2
+    min_body_lines: int = 20
+    max_body_lines: int = 200
+    seed: int = 0
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class MonorepoStats:
+    """Summary of a generated monorepo.
+
+    Attributes:
+        root: Repository root.
+        files: Number of generated content files, excluded files included.
+        selected_files: Content files that discovery is expected to select.
+        selected_bytes: Total size of the selected files.
+        excluded_files: Content files in excluded directories.
+        config_layers: Number of nested `topmark.toml` files below the root.
+        file_types: Qualified keys of the file types used.
+        headers: Number of selected files per header state.
+    """
+
+    root: Path
+    files: int
+    selected_files: int
+    selected_bytes: int
+    excluded_files: int
+    config_layers: int
+    file_types: tuple[str, ...]
+    headers: dict[str, int] = field(default_factory=lambda: {})
+
+
+def eligible_file_types() -> list[FileType]:
+    """Return registered file types suitable for generated content.
+
+    A file type is eligible when it is processed, bound to a header processor,
+    recognized by extension alone (no content matcher or pre-insert checker),
+    and owns at least one extension that no other file type claims.
+
+    Returns:
+        Eligible file types sorted by qualified key.
+    """
+    all_types: list[FileType] = sorted(
+        FileTypeRegistry.as_mapping().values(), key=lambda ft: ft.qualified_key
+    )
+    claims: dict[str, int] = {}
+    for ft in all_types:
+        for ext in ft.extensions:
+            claims[ext] = claims.get(ext, 0) + 1
+    return [
+        ft
+        for ft in all_types
+        if not ft.skip_processing
+        and ft.content_matcher is None
+        and ft.pre_insert_checker is None
+        and BindingRegistry.is_bound(ft.qualified_key)
+        and any(claims[ext] == 1 for ext in ft.extensions)
+    ]
+
+
+def _unique_extension(ft: FileType) -> str:
+    """Return the first extension of `ft` that no other file type claims."""
+    claims: set[str] = {
+        ext
+        for other in FileTypeRegistry.as_mapping().values()
+        if other.qualified_key != ft.qualified_key
+        for ext in other.extensions
+    }
+    return next(ext for ext in ft.extensions if ext not in claims)
+
+
+def _root_config(*, copyright_field: str) -> str:
+    """Return the repository-root `topmark.toml` text."""
+    return (
+        "[config]\n"
+        "root = true\n"
+        "\n"
+        "[fields]\n"
+        f'project = "{PROJECT_FIELD}"\n'
+        f'license = "{LICENSE_FIELD}"\n'
+        f'copyright = "{copyright_field}"\n'
+        "\n"
+        "[files]\n"
+        'exclude_from = [".gitignore"]\n'
+        'exclude_patterns = ["topmark.toml", ".gitignore"]\n'
+        "\n"
+        "[header]\n"
+        'fields = ["project", "license", "copyright"]\n'
+    )
+
+
+def _layer_config() -> str:
+    """Return the text of a nested `topmark.toml` layer.
+
+    The layer restates values the root already sets, so it adds discovery and
+    merge work without changing the rendered header.
+    """
+    return (
+        "[fields]\n"
+        f'project = "{PROJECT_FIELD}"\n'
+        "\n"
+        "[header]\n"
+        'fields = ["project", "license", "copyright"]\n'
+        "\n"
+        "[policy]\n"
+        "allow_header_in_empty_files = false\n"
+    )
+
+
+def _leaf_parts(leaf: int, *, depth: int, fanout: int) -> tuple[str, ...]:
+    """Return the directory names of leaf slot `leaf`, top level first."""
+    return tuple(f"d{(leaf // fanout**level) % fanout:02d}" for level in reversed(range(depth)))
+
+
+def _render_templates(file_types: Sequence[FileType]) -> dict[tuple[str, HeaderState], str]:
+    """Render header prefixes per file type and header state.
+
+    Args:
+        file_types: File types to render headers for.
+
+    Returns:
+        Text that precedes a file body for every `(file type key, state)`;
+        `missing` maps to the empty string. File types for which TopMark did
+        not insert a header are absent.
+    """
+    states: tuple[tuple[HeaderState, str], ...] = (
+        ("current", COPYRIGHT_FIELD),
+        ("outdated", OUTDATED_COPYRIGHT_FIELD),
+    )
+    templates: dict[tuple[str, HeaderState], str] = {}
+    for state, copyright_field in states:
+        with tempfile.TemporaryDirectory(prefix="topmark-monorepo-templates-") as tmp:
+            scratch = Path(tmp)
+            (scratch / "topmark.toml").write_text(
+                _root_config(copyright_field=copyright_field), encoding="utf-8"
+            )
+            (scratch / ".gitignore").write_text("", encoding="utf-8")
+            samples: dict[str, Path] = {}
+            for index, ft in enumerate(file_types):
+                sample: Path = scratch / f"template_{index:03d}{_unique_extension(ft)}"
+                sample.write_text(_TEMPLATE_BODY, encoding="utf-8", newline="\n")
+                samples[ft.qualified_key] = sample
+            check([scratch], apply=True)
+            for key, sample in samples.items():
+                rendered: str = sample.read_text(encoding="utf-8")
+                if rendered != _TEMPLATE_BODY and rendered.endswith(_TEMPLATE_BODY):
+                    templates[key, state] = rendered[: -len(_TEMPLATE_BODY)]
+    for key, state in list(templates):
+        if state == "current":
+            templates[key, "missing"] = ""
+    return templates
+
+
+def generate_monorepo(root: Path, spec: MonorepoSpec) -> MonorepoStats:
+    """Write a synthetic monorepo below `root`.
+
+    Args:
+        root: Empty or missing directory that becomes the repository root.
+        spec: Shape of the tree.
+
+    Returns:
+        Summary of the generated tree.
+
+    Raises:
+        ValueError: If the spec is inconsistent, or no usable file type is
+            registered.
+    """
+    if spec.depth < 1 or spec.fanout < 1 or spec.files < 0:
+        raise ValueError("depth and fanout must be at least 1 and files must not be negative")
+    if not 0 <= spec.layer_depth <= spec.depth:
+        raise ValueError("layer_depth must be between 0 and depth")
+    if spec.current_fraction + spec.outdated_fraction > 1:
+        raise ValueError("current_fraction + outdated_fraction must not exceed 1")
+
+    rng = random.Random(spec.seed)  # noqa: S311 - reproducible benchmark data, not security
+    candidates: list[FileType] = eligible_file_types()
+    if not candidates:
+        raise ValueError("no registered file type is usable for generated content")
+    chosen: list[FileType] = sorted(
+        rng.sample(candidates, min(spec.file_types, len(candidates))),
+        key=lambda ft: ft.qualified_key,
+    )
+
+    capacity: int = spec.fanout**spec.depth
+    leaves: int = min(capacity, max(1, -(-spec.files // max(1, spec.files_per_dir))))
+    # Spread used leaf slots evenly over the capacity so every top-level
+    # package receives files even for small trees.
+    leaf_slots: list[int] = [index * capacity // leaves for index in range(leaves)]
+    templates: dict[tuple[str, HeaderState], str] = _render_templates(chosen)
+    usable: list[FileType] = [ft for ft in chosen if (ft.qualified_key, "current") in templates]
+    if not usable:
+        raise ValueError("TopMark rendered no header for any selected file type")
+    extensions: dict[str, str] = {ft.qualified_key: _unique_extension(ft) for ft in usable}
+
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "topmark.toml").write_text(
+        _root_config(copyright_field=COPYRIGHT_FIELD), encoding="utf-8"
+    )
+    (root / ".gitignore").write_text(f"{EXCLUDED_DIR_NAME}/\n", encoding="utf-8")
+
+    created: set[Path] = set()
+    headers: dict[str, int] = {"current": 0, "outdated": 0, "missing": 0}
+    selected_files: int = 0
+    selected_bytes: int = 0
+    excluded_files: int = 0
+    for index in range(spec.files):
+        parts: tuple[str, ...] = _leaf_parts(
+            leaf_slots[index * leaves // max(1, spec.files)],
+            depth=spec.depth,
+            fanout=spec.fanout,
+        )
+        ft: FileType = rng.choice(usable)
+        roll: float = rng.random()
+        state: HeaderState = (
+            "current"
+            if roll < spec.current_fraction
+            else "outdated"
+            if roll < spec.current_fraction + spec.outdated_fraction
+            else "missing"
+        )
+        excluded: bool = rng.random() < spec.excluded_fraction
+        body_lines: int = rng.randint(spec.min_body_lines, spec.max_body_lines)
+
+        directory: Path = root.joinpath(*parts)
+        if excluded:
+            directory = directory / EXCLUDED_DIR_NAME
+        if directory not in created:
+            directory.mkdir(parents=True, exist_ok=True)
+            created.add(directory)
+
+        body: str = "".join(f"value_{line:04d} = {index}\n" for line in range(body_lines))
+        data: bytes = (templates[ft.qualified_key, state] + body).encode("utf-8")
+        (directory / f"m{index:07d}{extensions[ft.qualified_key]}").write_bytes(data)
+        if excluded:
+            excluded_files += 1
+        else:
+            selected_files += 1
+            selected_bytes += len(data)
+            headers[state] += 1
+
+    layer_dirs: set[tuple[str, ...]] = {
+        parts[:level]
+        for parts in (path.relative_to(root).parts for path in created)
+        for level in range(1, min(spec.layer_depth, spec.depth) + 1)
+        if len(parts) >= level
+    }
+    for parts in sorted(layer_dirs):
+        (root.joinpath(*parts) / "topmark.toml").write_text(_layer_config(), encoding="utf-8")
+
+    return MonorepoStats(
+        root=root,
+        files=spec.files,
+        selected_files=selected_files,
+        selected_bytes=selected_bytes,
+        excluded_files=excluded_files,
+        config_layers=len(layer_dirs),
+        file_types=tuple(ft.qualified_key for ft in usable),
+        headers=headers,
+    )
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    defaults = MonorepoSpec()
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic synthetic monorepo for TopMark benchmarks.",
+    )
+    parser.add_argument("root", type=Path, help="Directory to create the repository in.")
+    parser.add_argument("--files", type=int, default=defaults.files)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--fanout", type=int, default=defaults.fanout)
+    parser.add_argument("--files-per-dir", type=int, default=defaults.files_per_dir)
+    parser.add_argument("--file-types", type=int, default=defaults.file_types)
+    parser.add_argument("--current-fraction", type=float, default=defaults.current_fraction)
+    parser.add_argument("--outdated-fraction", type=float, default=defaults.outdated_fraction)
+    parser.add_argument("--excluded-fraction", type=float, default=defaults.excluded_fraction)
+    parser.add_argument("--layer-depth", type=int, default=defaults.layer_depth)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return parser.parse_args(argv)
+
+
+def spec_from_args(args: argparse.Namespace) -> MonorepoSpec:
+    """Build a spec from parsed generator arguments.
+
+    Args:
+        args: Namespace containing the generator options.
+
+    Returns:
+        The corresponding spec.
+    """
+    return MonorepoSpec(
+        files=int(args.files),
+        depth=int(args.depth),
+        fanout=int(args.fanout),
+        files_per_dir=int(args.files_per_dir),
+        file_types=int(args.file_types),
+        current_fraction=float(args.current_fraction),
+        outdated_fraction=float(args.outdated_fraction),
+        excluded_fraction=float(args.excluded_fraction),
+        layer_depth=int(args.layer_depth),
+        seed=int(args.seed),
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Generate a monorepo and print its summary as JSON."""
+    args: argparse.Namespace = _parse_args(sys.argv[1:] if argv is None else argv)
+    root: Path = args.root
+    if root.exists() and any(root.iterdir()):
+        sys.stderr.write(f"{root} is not empty\n")
+        return 1
+    stats: MonorepoStats = generate_monorepo(root, spec_from_args(args))
+    payload: dict[str, object] = {**asdict(stats), "root": stats.root.as_posix()}
+    sys.stdout.write(json.dumps(payload, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -71,6 +71,7 @@ from topmark.runtime.model import RunOptions
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Iterator
     from collections.abc import Sequence
 
     from topmark.config.model import FrozenConfig
@@ -84,7 +85,7 @@ if TYPE_CHECKING:
 
 
 PipelineKind = Literal["check", "strip"]
-SuiteName = Literal["smoke", "baseline", "pathological", "repository"]
+SuiteName = Literal["smoke", "baseline", "pathological", "repository", "sniff"]
 ScenarioName = Literal[
     "small_1kb_missing_header",
     "small_10kb_existing_header",
@@ -98,6 +99,7 @@ ScenarioName = Literal[
     "mixed_newlines",
     "bom_file",
     "repo_many_small_mixed",
+    "sniff_many_64kb",
 ]
 
 # ---- Benchmark scenario and suite definitions ----
@@ -120,6 +122,9 @@ LARGE_SCENARIOS: Final[tuple[ScenarioName, ...]] = ("large_10mb_missing_header",
 # the historical single-file baseline corpus.
 REPOSITORY_SCENARIOS: Final[tuple[ScenarioName, ...]] = ("repo_many_small_mixed",)
 
+# Sniff scenarios time only `SnifferStep` over many files and report MB/s.
+SNIFF_SCENARIOS: Final[tuple[ScenarioName, ...]] = ("sniff_many_64kb",)
+
 # ---- Pipeline mode definitions ----
 DEFAULT_MODES: Final[tuple[str, ...]] = (
     "check",
@@ -163,6 +168,7 @@ SUITE_SCENARIOS: Final[dict[SuiteName, tuple[ScenarioName, ...]]] = {
     ),
     "pathological": ("huge_header", "huge_diff", "strip_large_header"),
     "repository": REPOSITORY_SCENARIOS,
+    "sniff": SNIFF_SCENARIOS,
 }
 SUITE_MODES: Final[dict[SuiteName, tuple[str, ...]]] = {
     "smoke": ("check",),
@@ -179,8 +185,12 @@ SUITE_MODES: Final[dict[SuiteName, tuple[str, ...]]] = {
         "strip_pruned",
         "strip_diff_pruned",
     ),
+    "sniff": ("check_pruned",),
 }
 REPOSITORY_FILE_COUNT: Final[int] = 250
+SNIFF_FILE_COUNT: Final[int] = 100
+# Mirrors the bounded window inspected by `SnifferStep`.
+SNIFF_WINDOW_BYTES: Final[int] = 64 * 1024
 HEADER_LINES: Final[tuple[str, ...]] = (
     "# topmark:header:start\n",
     "#\n",
@@ -274,6 +284,56 @@ class RunMeasurement:
     views_before_prune: dict[str, int | bool]
     views_after_prune: dict[str, int | bool]
     steps: list[StepSample]
+    sniff_mb_per_s: float | None = None
+    source_opens_per_file: float | None = None
+    source_reads_per_file: float | None = None
+    write_bytes_encoded: int | None = None
+    write_bytes_copied: int | None = None
+    commit_elapsed_ns: int | None = None
+
+
+@dataclass(kw_only=True, slots=True)
+class SourceIoTally:
+    """Aggregate shared-source and writer I/O counters over processed contexts.
+
+    Reads count both `read(2)` and `mmap(2)` calls, i.e. every call that
+    transfers file content into the process. Written bytes are split into bytes
+    encoded from updated lines and bytes copied verbatim from the source file.
+    """
+
+    files: int = 0
+    opens: int = 0
+    reads: int = 0
+    writes: int = 0
+    bytes_encoded: int = 0
+    bytes_copied: int = 0
+
+    def add(self, ctx: ProcessingContext) -> None:
+        """Add the I/O counters of one processed context."""
+        self.files += 1
+        if ctx.source is not None:
+            self.opens += ctx.source.stats.opens
+            self.reads += ctx.source.stats.reads + ctx.source.stats.maps
+        if ctx.write_stats is not None:
+            self.writes += 1
+            self.bytes_encoded += ctx.write_stats.bytes_encoded
+            self.bytes_copied += ctx.write_stats.bytes_copied
+
+    def encoded_bytes(self) -> int | None:
+        """Return bytes encoded by writer sinks, or None when nothing was written."""
+        return self.bytes_encoded if self.writes else None
+
+    def copied_bytes(self) -> int | None:
+        """Return bytes copied from source files by writer sinks, or None without writes."""
+        return self.bytes_copied if self.writes else None
+
+    def opens_per_file(self) -> float | None:
+        """Return mean opens per processed file, or None when nothing was processed."""
+        return self.opens / self.files if self.files else None
+
+    def reads_per_file(self) -> float | None:
+        """Return mean content reads per processed file, or None when nothing was processed."""
+        return self.reads / self.files if self.files else None
 
 
 # ---- Lightweight measurement helpers ----
@@ -377,6 +437,16 @@ def _format_ms(elapsed_ns: int) -> str:
     return f"{elapsed_ns / 1_000_000:.2f}"
 
 
+def _format_optional_ms(elapsed_ns: int | None) -> str:
+    """Format optional nanoseconds as milliseconds."""
+    return "n/a" if elapsed_ns is None else _format_ms(elapsed_ns)
+
+
+def _format_rate(mb_per_s: float | None) -> str:
+    """Format an optional throughput value."""
+    return "n/a" if mb_per_s is None else f"{mb_per_s:.1f}"
+
+
 def _utc_run_id(suite: SuiteName | None) -> str:
     """Return a timestamp-based run identifier."""
     stamp: str = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
@@ -405,8 +475,10 @@ def _write_summary(path: Path, measurements: Sequence[RunMeasurement]) -> None:
         "# TopMark pipeline memory baseline",
         "",
         "| Scenario | Mode | Files | File size | Image lines | Updated lines | Diff size | "
-        "Result diff | Peak traced | Max RSS | Elapsed ms |",
-        "| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |",
+        "Result diff | Peak traced | Max RSS | Elapsed ms | Sniff MB/s | Opens/file | Reads/file | "
+        "Encoded | Copied | Commit ms |",
+        "| --- | --- | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: "
+        "| ---: | ---: | ---: | ---: |",
     ]
     for measurement in measurements:
         lines.append(
@@ -421,7 +493,13 @@ def _write_summary(path: Path, measurements: Sequence[RunMeasurement]) -> None:
             f"{_format_bytes(measurement.result_diff_bytes)} | "
             f"{_format_bytes(measurement.peak_tracemalloc_bytes)} | "
             f"{_format_bytes(measurement.max_observed_rss_bytes)} | "
-            f"{_format_ms(measurement.elapsed_ns)} |"
+            f"{_format_ms(measurement.elapsed_ns)} | "
+            f"{_format_rate(measurement.sniff_mb_per_s)} | "
+            f"{_format_rate(measurement.source_opens_per_file)} | "
+            f"{_format_rate(measurement.source_reads_per_file)} | "
+            f"{_format_bytes(measurement.write_bytes_encoded)} | "
+            f"{_format_bytes(measurement.write_bytes_copied)} | "
+            f"{_format_optional_ms(measurement.commit_elapsed_ns)} |"
         )
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
@@ -535,6 +613,25 @@ def _write_repository_workload(
             _write_repeated_body(path, target_bytes=8_000)
 
 
+def _write_sniff_workload(
+    root: Path,
+    *,
+    file_count: int = SNIFF_FILE_COUNT,
+) -> None:
+    """Write the deterministic many-file sniff throughput workload.
+
+    Every file is larger than the sniff window and uses CRLF line endings with
+    non-ASCII text, so each sniff validates a full window of multi-byte UTF-8
+    and counts paired newlines.
+    """
+    line: bytes = "print('sniff throughput: caf\u00e9 \u2014 na\u00efve')\r\n".encode()
+    body: bytes = line * (SNIFF_WINDOW_BYTES * 3 // 2 // len(line))
+    for index in range(file_count):
+        package_dir: Path = root / f"package_{index // 25:02d}"
+        package_dir.mkdir(parents=True, exist_ok=True)
+        (package_dir / f"module_{index:04d}.py").write_bytes(body)
+
+
 def _tree_size_bytes(root: Path) -> int:
     """Return the total size of files below `root`."""
     if root.is_file():
@@ -552,7 +649,10 @@ def _tree_file_count(root: Path) -> int:
 def build_scenarios(root: Path, *, include_large: bool) -> list[Scenario]:
     """Generate benchmark files and return their scenario descriptors."""
     names: tuple[ScenarioName, ...] = (
-        DEFAULT_SCENARIOS + REPOSITORY_SCENARIOS + (LARGE_SCENARIOS if include_large else ())
+        DEFAULT_SCENARIOS
+        + REPOSITORY_SCENARIOS
+        + SNIFF_SCENARIOS
+        + (LARGE_SCENARIOS if include_large else ())
     )
     scenarios: list[Scenario] = []
 
@@ -604,6 +704,14 @@ def build_scenarios(root: Path, *, include_large: bool) -> list[Scenario]:
                     "Repository-scale workload with many small Python files, mixing "
                     "missing, current, and outdated headers."
                 )
+            case "sniff_many_64kb":
+                path = root / name
+                path.mkdir(parents=True, exist_ok=True)
+                _write_sniff_workload(path)
+                description = (
+                    "Many CRLF, non-ASCII files larger than the sniff window; measures "
+                    "SnifferStep throughput in MB/s."
+                )
             case "mixed_newlines":
                 path.write_bytes(b"print('a')\nprint('b')\r\nprint('c')\n")
                 description = "Mixed newline file; should stop before expensive update paths."
@@ -823,6 +931,16 @@ def _run_steps_with_samples(
     return ctx, samples, stdout_capture.getvalue()
 
 
+def _tally_source_io(
+    contexts: Iterable[ProcessingContext],
+    tally: SourceIoTally,
+) -> Iterator[ProcessingContext]:
+    """Yield completed contexts unchanged while tallying their source I/O."""
+    for ctx in contexts:
+        tally.add(ctx)
+        yield ctx
+
+
 def _measure_repository_one(
     *,
     scenario: Scenario,
@@ -853,6 +971,7 @@ def _measure_repository_one(
     start_rss: int | None = _rss_bytes()
     start_ns: int = time.perf_counter_ns()
     state: PipelineExecutionState = PipelineExecutionState()
+    source_io: SourceIoTally = SourceIoTally()
     contexts: Iterable[ProcessingContext] = iter_steps_for_files(
         run_options=run_options,
         config=config,
@@ -865,7 +984,7 @@ def _measure_repository_one(
     # volatile context views as each file is consumed so this measures retained
     # result ownership rather than full ProcessingContext retention.
     results: tuple[ProcessingResult, ...] = tuple(
-        iter_processing_results(contexts, release_views=True)
+        iter_processing_results(_tally_source_io(contexts, source_io), release_views=True)
     )
     elapsed_ns: int = time.perf_counter_ns() - start_ns
     final_bytes, peak_bytes = tracemalloc.get_traced_memory()
@@ -918,6 +1037,109 @@ def _measure_repository_one(
             "has_build_view": False,
         },
         steps=[],
+        source_opens_per_file=source_io.opens_per_file(),
+        source_reads_per_file=source_io.reads_per_file(),
+        write_bytes_encoded=source_io.encoded_bytes(),
+        write_bytes_copied=source_io.copied_bytes(),
+        commit_elapsed_ns=state.commit.elapsed_ns if state.commit is not None else None,
+    )
+
+
+def _measure_sniff_one(
+    *,
+    scenario: Scenario,
+    mode: Mode,
+    config: FrozenConfig,
+    policy_registry: PolicyRegistry,
+) -> RunMeasurement:
+    """Measure `SnifferStep` throughput over a many-file sniff scenario.
+
+    Steps before the sniffer (resolution) run untimed for each file; only the
+    sniffer call itself is timed. Throughput is reported over the bytes the
+    sniffer inspects, i.e. at most one sniff window per file.
+    """
+    pipeline: PipelineSelection = select_pipeline(
+        mode.kind,
+        apply=mode.apply,
+        diff=mode.diff,
+    )
+    run_options: RunOptions = RunOptions.from_pipeline_selection(
+        selection=pipeline,
+        output_target=mode.output_target,
+        file_write_strategy=FileWriteStrategy.ATOMIC,
+        prune_views=mode.prune_views,
+    )
+    steps: tuple[Step[ProcessingContext], ...] = pipeline.steps
+    sniffer_index: int = next(
+        index for index, step in enumerate(steps) if step.name == "SnifferStep"
+    )
+    file_list: list[Path] = sorted(scenario.path.rglob("*.py"))
+
+    gc.collect()
+    tracemalloc.start()
+    start_rss: int | None = _rss_bytes()
+    start_ns: int = time.perf_counter_ns()
+    sniff_ns: int = 0
+    sniffed_bytes: int = 0
+    source_io: SourceIoTally = SourceIoTally()
+    status: dict[str, str] = {}
+    for path in file_list:
+        ctx: ProcessingContext = ProcessingContext.bootstrap(
+            path=path,
+            config=config,
+            run_options=run_options,
+            policy_registry_override=policy_registry,
+        )
+        for step in steps[:sniffer_index]:
+            ctx = step(ctx)
+        step_start: int = time.perf_counter_ns()
+        ctx = steps[sniffer_index](ctx)
+        sniff_ns += time.perf_counter_ns() - step_start
+        sniffed_bytes += min(path.stat().st_size, SNIFF_WINDOW_BYTES)
+        source_io.add(ctx)
+        ctx.release_source()
+        status = _status_dict(ctx)
+    elapsed_ns: int = time.perf_counter_ns() - start_ns
+    final_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    end_rss: int | None = _rss_bytes()
+    tracemalloc.stop()
+
+    empty_views: dict[str, int | bool] = {
+        "image_lines": 0,
+        "header_lines": 0,
+        "header_block_bytes": 0,
+        "render_lines": 0,
+        "render_block_bytes": 0,
+        "updated_lines": 0,
+        "diff_bytes": 0,
+        "has_build_view": False,
+    }
+    return RunMeasurement(
+        scenario=scenario.name,
+        mode=mode.name,
+        file_size_bytes=scenario.size_bytes,
+        elapsed_ns=elapsed_ns,
+        peak_tracemalloc_bytes=peak_bytes,
+        final_tracemalloc_bytes=final_bytes,
+        start_rss_bytes=start_rss,
+        end_rss_bytes=end_rss,
+        max_observed_rss_bytes=_max_optional_rss(start_rss, end_rss),
+        stdout_bytes=0,
+        input_file_count=len(file_list),
+        result_count=len(file_list),
+        result_diff_bytes=0,
+        exit_code=None,
+        status=status,
+        views_before_prune=dict(empty_views),
+        views_after_prune=dict(empty_views),
+        steps=[],
+        sniff_mb_per_s=(sniffed_bytes / 1_000_000) / (sniff_ns / 1_000_000_000)
+        if sniff_ns
+        else None,
+        source_opens_per_file=source_io.opens_per_file(),
+        source_reads_per_file=source_io.reads_per_file(),
+        write_bytes_encoded=source_io.encoded_bytes(),
+        write_bytes_copied=source_io.copied_bytes(),
     )
 
 
@@ -935,6 +1157,13 @@ def _measure_one(
             mode=mode,
             config=config,
         )
+    if scenario.name in SNIFF_SCENARIOS:
+        return _measure_sniff_one(
+            scenario=scenario,
+            mode=mode,
+            config=config,
+            policy_registry=policy_registry,
+        )
 
     gc.collect()
     tracemalloc.start()
@@ -962,6 +1191,8 @@ def _measure_one(
     max_sample_rss: int | None = _max_optional_rss(*(sample.rss_bytes for sample in samples))
     max_observed_rss: int | None = _max_optional_rss(start_rss, end_rss, max_sample_rss)
     tracemalloc.stop()
+    source_io: SourceIoTally = SourceIoTally()
+    source_io.add(ctx)
 
     return RunMeasurement(
         scenario=scenario.name,
@@ -982,6 +1213,10 @@ def _measure_one(
         views_before_prune=views_before_prune,
         views_after_prune=views_after_prune,
         steps=samples,
+        source_opens_per_file=source_io.opens_per_file(),
+        source_reads_per_file=source_io.reads_per_file(),
+        write_bytes_encoded=source_io.encoded_bytes(),
+        write_bytes_copied=source_io.copied_bytes(),
     )
 
 
@@ -1048,17 +1283,20 @@ def _required_int(payload: dict[str, object], key: str) -> int:
 def _optional_int(payload: dict[str, object], key: str) -> int | None:
     """Return an optional integer-compatible payload value.
 
+    Missing keys are treated as null so reports written before the field existed
+    still load.
+
     Args:
         payload: JSON object payload.
         key: Field name to read from `payload`.
 
     Returns:
-        The selected value converted to `int`, or `None` when the payload value is null.
+        The selected value converted to `int`, or `None` when absent or null.
 
     Raises:
         TypeError: If the non-null value cannot be converted to `int`.
     """
-    value: object = payload[key]
+    value: object = payload.get(key)
     if value is None:
         return None
     if isinstance(value, bool):
@@ -1068,6 +1306,30 @@ def _optional_int(payload: dict[str, object], key: str) -> int | None:
     raise TypeError(f"payload field {key!r} is not integer-compatible")
 
 
+def _optional_float(payload: dict[str, object], key: str) -> float | None:
+    """Return an optional float-compatible payload value.
+
+    Missing keys are treated as null so reports written before the field existed
+    still load.
+
+    Args:
+        payload: JSON object payload.
+        key: Field name to read from `payload`.
+
+    Returns:
+        The selected value converted to `float`, or `None` when absent or null.
+
+    Raises:
+        TypeError: If the non-null value cannot be converted to `float`.
+    """
+    value: object = payload.get(key)
+    if value is None:
+        return None
+    if isinstance(value, int | float | str) and not isinstance(value, bool):
+        return float(value)
+    raise TypeError(f"payload field {key!r} is not float-compatible")
+
+
 def _int_bool_mapping(value: object, *, message: str) -> dict[str, int | bool]:
     """Return a JSON object as an integer-or-boolean mapping.
 
@@ -1163,6 +1425,12 @@ def measurement_from_mapping(payload: dict[str, object]) -> RunMeasurement:
             message="measurement payload is missing a valid views_after_prune object",
         ),
         steps=steps,
+        sniff_mb_per_s=_optional_float(payload, "sniff_mb_per_s"),
+        source_opens_per_file=_optional_float(payload, "source_opens_per_file"),
+        source_reads_per_file=_optional_float(payload, "source_reads_per_file"),
+        write_bytes_encoded=_optional_int(payload, "write_bytes_encoded"),
+        write_bytes_copied=_optional_int(payload, "write_bytes_copied"),
+        commit_elapsed_ns=_optional_int(payload, "commit_elapsed_ns"),
     )
 
 
@@ -1215,19 +1483,26 @@ def _measure_all_subprocesses(
     modes: Sequence[Mode],
     include_large: bool,
     work_dir: Path,
+    repeat: int = 1,
 ) -> list[RunMeasurement]:
-    """Measure all scenario/mode pairs in subprocesses."""
+    """Measure all scenario/mode pairs in subprocesses.
+
+    With `repeat > 1` the whole scenario/mode matrix is measured once per round,
+    so slow drift on the host (thermal throttling, background load) spreads over
+    every pair instead of biasing the pairs measured last.
+    """
     measurements: list[RunMeasurement] = []
-    for scenario in scenarios:
-        for mode in modes:
-            measurements.append(
-                _measure_one_subprocess(
-                    scenario_name=scenario.name,
-                    mode_name=mode.name,
-                    include_large=include_large,
-                    work_dir=work_dir,
+    for _ in range(repeat):
+        for scenario in scenarios:
+            for mode in modes:
+                measurements.append(
+                    _measure_one_subprocess(
+                        scenario_name=scenario.name,
+                        mode_name=mode.name,
+                        include_large=include_large,
+                        work_dir=work_dir,
+                    )
                 )
-            )
     return measurements
 
 
@@ -1293,9 +1568,18 @@ def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser.add_argument(
         "--scenario",
         action="append",
-        choices=DEFAULT_SCENARIOS + REPOSITORY_SCENARIOS + LARGE_SCENARIOS,
+        choices=DEFAULT_SCENARIOS + REPOSITORY_SCENARIOS + SNIFF_SCENARIOS + LARGE_SCENARIOS,
         help="Scenario to run. May be repeated. Defaults to the standard scenario set.",
     )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help=(
+            "Measure every scenario/mode pair this many times, each in a fresh subprocess "
+            "(default: 1). Repeated measurements let pipeline_perf_compare.py use medians."
+        ),
+    )
     parser.add_argument(
         "--single-process",
         action="store_true",
@@ -1331,6 +1615,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         scenario_names = args.scenario if args.scenario is not None else DEFAULT_SCENARIOS
         mode_names = args.mode if args.mode is not None else DEFAULT_MODES
     modes: list[Mode] = [_mode_from_name(name) for name in mode_names]
+    repeat: int = 1 if bool(args.single_process) else max(1, int(args.repeat))
     destination: RunDestination = _resolve_destination(args, suite=suite)
 
     with tempfile.TemporaryDirectory(prefix="topmark-perf-") as tmp:
@@ -1375,6 +1660,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                 modes=modes,
                 include_large=bool(args.include_large),
                 work_dir=root,
+                repeat=repeat,
             )
 
         report: dict[str, object] = {
@@ -1390,6 +1676,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             "measurement_isolation": "single-process"
             if bool(args.single_process)
             else "subprocess",
+            "repeat": repeat,
             "scenarios": [asdict(scenario) for scenario in scenarios],
             "modes": [asdict(mode) for mode in modes],
             "measurements": measurements,
@@ -1411,6 +1698,7 @@ def main(argv: Sequence[str] | None = None) -> int:
             "git_commit": _read_git_commit(),
             "scenarios": [scenario.name for scenario in scenarios],
             "modes": [mode.name for mode in modes],
+            "repeat": repeat,
         }
         (destination.output_dir / "manifest.json").write_text(
             json.dumps(manifest, indent=2) + "\n",
@@ -0,0 +1,547 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : pipeline_perf_compare.py
+#   file_relpath : tools/perf/pipeline_perf_compare.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Compare preserved pipeline baseline runs and enforce regression budgets.
+
+The tool loads reports written by `tools/perf/pipeline_memory_baseline.py`
+(a preserved run directory below `artifacts/perf/`, a run id, or a
+`report.json` file), matches measurements by scenario and mode, and compares
+three metrics:
+
+* `elapsed`: wall-clock time of the measured run;
+* `peak_traced`: `tracemalloc` peak;
+* `max_rss`: maximum observed RSS (skipped when either side has no RSS data).
+
+Each side may consist of several runs and of repeated measurements within a run
+(`pipeline_memory_baseline.py --repeat N`). All samples of one scenario/mode
+pair are reduced to their median before comparing, and the allowed relative
+delta of a metric is its budget plus the observed noise: half the relative
+spread (max - min over median) of the noisier side. A change must also exceed
+a per-metric absolute floor, so sub-millisecond jitter on tiny scenarios never
+counts as a regression.
+
+The Markdown comparison (or JSON with `--format json`) is written to stdout.
+With `--enforce` the tool exits non-zero when any metric regresses beyond its
+allowance.
+"""
+
+from __future__ import annotations
+
+# The source-checkout bootstrap below intentionally precedes tool imports.
+# ruff: noqa: E402
+import argparse
+import json
+import statistics
+import sys
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import Literal
+
+# Allow running this tool directly from a source checkout: the measurement
+# loader lives next to this file in the `tools.perf` namespace package.
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.perf.pipeline_memory_baseline import RunMeasurement
+from tools.perf.pipeline_memory_baseline import measurement_from_mapping
+from topmark.core.typing_guards import as_object_dict
+from topmark.core.typing_guards import is_any_list
+from topmark.core.typing_guards import is_mapping
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+
+MetricName = Literal["elapsed", "peak_traced", "max_rss"]
+ComparisonStatus = Literal["ok", "regressed", "improved", "unavailable"]
+
+METRICS: Final[tuple[MetricName, ...]] = ("elapsed", "peak_traced", "max_rss")
+
+# Relative budgets (percent) on top of the measured noise. Timing is the
+# noisiest metric on shared CI hosts; traced allocations are nearly
+# deterministic for a given Python version.
+DEFAULT_BUDGETS_PCT: Final[dict[MetricName, float]] = {
+    "elapsed": 15.0,
+    "peak_traced": 5.0,
+    "max_rss": 10.0,
+}
+
+# Absolute changes below these floors never count as regressions or improvements.
+ABSOLUTE_FLOORS: Final[dict[MetricName, float]] = {
+    "elapsed": 2_000_000.0,  # 2 ms in nanoseconds
+    "peak_traced": 64.0 * 1024,
+    "max_rss": 1024.0 * 1024,
+}
+
+_METRIC_VALUES: Final[dict[MetricName, Callable[[RunMeasurement], int | None]]] = {
+    "elapsed": lambda measurement: measurement.elapsed_ns,
+    "peak_traced": lambda measurement: measurement.peak_tracemalloc_bytes,
+    "max_rss": lambda measurement: measurement.max_observed_rss_bytes,
+}
+
+DEFAULT_RUNS_DIR: Final[Path] = Path("artifacts/perf")
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PerfRun:
+    """Measurements loaded from one preserved benchmark report.
+
+    Attributes:
+        label: Run id or report path used to refer to the run.
+        platform: `sys.platform` recorded by the benchmark.
+        python: Python version string recorded by the benchmark.
+        measurement_isolation: `"subprocess"` or `"single-process"`.
+        measurements: Every measurement in the report, repeats included.
+    """
+
+    label: str
+    platform: str | None
+    python: str | None
+    measurement_isolation: str | None
+    measurements: list[RunMeasurement]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class MetricComparison:
+    """Comparison of one metric for one scenario/mode pair.
+
+    Attributes:
+        scenario: Benchmark scenario name.
+        mode: Pipeline mode name.
+        metric: Compared metric.
+        baseline_samples: Number of baseline samples with a value.
+        candidate_samples: Number of candidate samples with a value.
+        baseline_median: Median baseline value, or `None` when unavailable.
+        candidate_median: Median candidate value, or `None` when unavailable.
+        delta_pct: Relative change of the candidate median, in percent.
+        noise_pct: Noise allowance derived from the sample spread, in percent.
+        budget_pct: Configured budget for the metric, in percent.
+        status: Comparison verdict.
+    """
+
+    scenario: str
+    mode: str
+    metric: MetricName
+    baseline_samples: int
+    candidate_samples: int
+    baseline_median: float | None
+    candidate_median: float | None
+    delta_pct: float | None
+    noise_pct: float
+    budget_pct: float
+    status: ComparisonStatus
+
+    @property
+    def allowed_pct(self) -> float:
+        """Relative delta tolerated before the metric counts as regressed."""
+        return self.budget_pct + self.noise_pct
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PerfComparison:
+    """Result of comparing baseline runs with candidate runs.
+
+    Attributes:
+        comparisons: Metric comparisons for every matched scenario/mode pair.
+        only_in_baseline: Scenario/mode pairs without candidate measurements.
+        only_in_candidate: Scenario/mode pairs without baseline measurements.
+        warnings: Environment mismatches that make the comparison less reliable.
+    """
+
+    comparisons: list[MetricComparison]
+    only_in_baseline: list[str] = field(default_factory=lambda: [])
+    only_in_candidate: list[str] = field(default_factory=lambda: [])
+    warnings: list[str] = field(default_factory=lambda: [])
+
+    @property
+    def regressions(self) -> list[MetricComparison]:
+        """Metric comparisons that exceed their allowance."""
+        return [item for item in self.comparisons if item.status == "regressed"]
+
+
+# ---- Loading ----
+def resolve_run_path(run: str, *, runs_dir: Path = DEFAULT_RUNS_DIR) -> Path:
+    """Resolve a run argument to a `report.json` path.
+
+    Args:
+        run: Run id below `runs_dir`, a preserved run directory, or a report file.
+        runs_dir: Directory holding preserved runs.
+
+    Returns:
+        Path of the JSON report to load.
+
+    Raises:
+        FileNotFoundError: If no report can be found for `run`.
+    """
+    candidate: Path = Path(run)
+    if not candidate.exists():
+        candidate = runs_dir / run
+    if candidate.is_dir():
+        report_name: str = "report.json"
+        manifest_path: Path = candidate / "manifest.json"
+        if manifest_path.is_file():
+            manifest: object = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if is_mapping(manifest):
+                report_name = str(as_object_dict(manifest).get("report") or report_name)
+        candidate = candidate / report_name
+    if not candidate.is_file():
+        raise FileNotFoundError(f"No benchmark report found for {run!r} (looked for {candidate})")
+    return candidate
+
+
+def load_run(run: str, *, runs_dir: Path = DEFAULT_RUNS_DIR) -> PerfRun:
+    """Load one preserved benchmark run.
+
+    Args:
+        run: Run id below `runs_dir`, a preserved run directory, or a report file.
+        runs_dir: Directory holding preserved runs.
+
+    Returns:
+        The loaded run.
+
+    Raises:
+        TypeError: If the report does not have the expected shape.
+    """
+    report_path: Path = resolve_run_path(run, runs_dir=runs_dir)
+    raw: object = json.loads(report_path.read_text(encoding="utf-8"))
+    if not is_mapping(raw):
+        raise TypeError(f"{report_path}: report payload must be an object")
+    report: dict[str, object] = as_object_dict(raw)
+    measurements_payload: object = report.get("measurements")
+    if not is_any_list(measurements_payload):
+        raise TypeError(f"{report_path}: report measurements payload must be a list")
+
+    measurements: list[RunMeasurement] = []
+    for item in measurements_payload:
+        if not is_mapping(item):
+            raise TypeError(f"{report_path}: measurement payload must be an object")
+        measurements.append(measurement_from_mapping(as_object_dict(item)))
+
+    def _text(key: str) -> str | None:
+        value: object = report.get(key)
+        return None if value is None else str(value)
+
+    return PerfRun(
+        label=run,
+        platform=_text("platform"),
+        python=_text("python"),
+        measurement_isolation=_text("measurement_isolation"),
+        measurements=measurements,
+    )
+
+
+# ---- Comparison ----
+def _pair_label(scenario: str, mode: str) -> str:
+    """Return the report label of a scenario/mode pair."""
+    return f"{scenario}/{mode}"
+
+
+def _group_samples(runs: Sequence[PerfRun]) -> dict[tuple[str, str], list[RunMeasurement]]:
+    """Group measurements of all runs by scenario/mode pair, in first-seen order."""
+    grouped: dict[tuple[str, str], list[RunMeasurement]] = {}
+    for run in runs:
+        for measurement in run.measurements:
+            grouped.setdefault((measurement.scenario, measurement.mode), []).append(measurement)
+    return grouped
+
+
+def spread_pct(values: Sequence[float]) -> float:
+    """Return half the relative range of `values` around their median, in percent.
+
+    Args:
+        values: Samples of one metric.
+
+    Returns:
+        `0.0` for fewer than two samples or a zero median, else
+        `(max - min) / median / 2 * 100`.
+    """
+    if len(values) < 2:
+        return 0.0
+    median: float = statistics.median(values)
+    if median == 0:
+        return 0.0
+    return (max(values) - min(values)) / median / 2 * 100
+
+
+def compare_metric(
+    *,
+    scenario: str,
+    mode: str,
+    metric: MetricName,
+    baseline: Sequence[RunMeasurement],
+    candidate: Sequence[RunMeasurement],
+    budget_pct: float,
+) -> MetricComparison:
+    """Compare one metric of one scenario/mode pair.
+
+    Args:
+        scenario: Benchmark scenario name.
+        mode: Pipeline mode name.
+        metric: Metric to compare.
+        baseline: Baseline samples of the pair.
+        candidate: Candidate samples of the pair.
+        budget_pct: Relative budget in percent, before the noise allowance.
+
+    Returns:
+        The metric comparison.
+    """
+    value_of: Callable[[RunMeasurement], int | None] = _METRIC_VALUES[metric]
+    base_values: list[float] = [float(v) for v in map(value_of, baseline) if v is not None]
+    cand_values: list[float] = [float(v) for v in map(value_of, candidate) if v is not None]
+    noise_pct: float = max(spread_pct(base_values), spread_pct(cand_values))
+
+    base_median: float | None = statistics.median(base_values) if base_values else None
+    cand_median: float | None = statistics.median(cand_values) if cand_values else None
+    delta_pct: float | None = None
+    status: ComparisonStatus = "unavailable"
+    if base_median is not None and cand_median is not None and base_median > 0:
+        delta_pct = (cand_median - base_median) / base_median * 100
+        allowed_pct: float = budget_pct + noise_pct
+        significant: bool = abs(cand_median - base_median) >= ABSOLUTE_FLOORS[metric]
+        if significant and delta_pct > allowed_pct:
+            status = "regressed"
+        elif significant and delta_pct < -allowed_pct:
+            status = "improved"
+        else:
+            status = "ok"
+
+    return MetricComparison(
+        scenario=scenario,
+        mode=mode,
+        metric=metric,
+        baseline_samples=len(base_values),
+        candidate_samples=len(cand_values),
+        baseline_median=base_median,
+        candidate_median=cand_median,
+        delta_pct=delta_pct,
+        noise_pct=noise_pct,
+        budget_pct=budget_pct,
+        status=status,
+    )
+
+
+def _environment_warnings(baseline: Sequence[PerfRun], candidate: Sequence[PerfRun]) -> list[str]:
+    """Report platform, Python, or isolation differences between the runs."""
+    warnings: list[str] = []
+    runs: list[PerfRun] = [*baseline, *candidate]
+    for attribute in ("platform", "python", "measurement_isolation"):
+        values: set[str | None] = {getattr(run, attribute) for run in runs}
+        if len(values) > 1:
+            labels: str = ", ".join(f"{run.label}={getattr(run, attribute)}" for run in runs)
+            warnings.append(f"runs differ in {attribute}: {labels}")
+    return warnings
+
+
+def compare_runs(
+    baseline: Sequence[PerfRun],
+    candidate: Sequence[PerfRun],
+    *,
+    budgets: dict[MetricName, float] | None = None,
+) -> PerfComparison:
+    """Compare baseline runs with candidate runs.
+
+    Args:
+        baseline: Runs describing the reference state.
+        candidate: Runs describing the state under test.
+        budgets: Relative budgets in percent keyed by metric; defaults to
+            `DEFAULT_BUDGETS_PCT`.
+
+    Returns:
+        Metric comparisons for every scenario/mode pair present on both sides,
+        plus the pairs present on only one side.
+    """
+    effective: dict[MetricName, float] = {**DEFAULT_BUDGETS_PCT, **(budgets or {})}
+    base_groups: dict[tuple[str, str], list[RunMeasurement]] = _group_samples(baseline)
+    cand_groups: dict[tuple[str, str], list[RunMeasurement]] = _group_samples(candidate)
+
+    comparisons: list[MetricComparison] = [
+        compare_metric(
+            scenario=scenario,
+            mode=mode,
+            metric=metric,
+            baseline=samples,
+            candidate=cand_groups[scenario, mode],
+            budget_pct=effective[metric],
+        )
+        for (scenario, mode), samples in base_groups.items()
+        if (scenario, mode) in cand_groups
+        for metric in METRICS
+    ]
+    return PerfComparison(
+        comparisons=comparisons,
+        only_in_baseline=[_pair_label(*key) for key in base_groups if key not in cand_groups],
+        only_in_candidate=[_pair_label(*key) for key in cand_groups if key not in base_groups],
+        warnings=_environment_warnings(baseline, candidate),
+    )
+
+
+# ---- Rendering ----
+def _format_value(metric: MetricName, value: float | None) -> str:
+    """Format a metric median for the Markdown table."""
+    if value is None:
+        return "n/a"
+    if metric == "elapsed":
+        return f"{value / 1_000_000:.1f} ms"
+    if value >= 1024 * 1024:
+        return f"{value / (1024 * 1024):.1f} MiB"
+    if value >= 1024:
+        return f"{value / 1024:.1f} KiB"
+    return f"{value:.0f} B"
+
+
+def render_markdown(comparison: PerfComparison) -> str:
+    """Render a comparison as a Markdown report.
+
+    Args:
+        comparison: Comparison to render.
+
+    Returns:
+        Markdown text ending with a newline.
+    """
+    lines: list[str] = [
+        "# TopMark pipeline benchmark comparison",
+        "",
+        "| Scenario | Mode | Metric | Baseline | Candidate | Delta | Allowed | Samples | Status |",
+        "| --- | --- | --- | ---: | ---: | ---: | ---: | ---: | --- |",
+    ]
+    for item in comparison.comparisons:
+        delta: str = "n/a" if item.delta_pct is None else f"{item.delta_pct:+.1f}%"
+        lines.append(
+            f"| {item.scenario} | {item.mode} | {item.metric} | "
+            f"{_format_value(item.metric, item.baseline_median)} | "
+            f"{_format_value(item.metric, item.candidate_median)} | "
+            f"{delta} | {item.allowed_pct:.1f}% | "
+            f"{item.baseline_samples}/{item.candidate_samples} | {item.status} |"
+        )
+    for title, pairs in (
+        ("Only in baseline", comparison.only_in_baseline),
+        ("Only in candidate", comparison.only_in_candidate),
+        ("Warnings", comparison.warnings),
+    ):
+        if pairs:
+            lines.extend(["", f"{title}:", "", *(f"- {pair}" for pair in pairs)])
+    return "\n".join(lines) + "\n"
+
+
+def _comparison_payload(comparison: PerfComparison) -> dict[str, object]:
+    """Return the JSON report payload of a comparison."""
+    return {
+        "schema_version": 1,
+        "tool": "tools/perf/pipeline_perf_compare.py",
+        "comparisons": [
+            {**asdict(item), "allowed_pct": item.allowed_pct} for item in comparison.comparisons
+        ],
+        "only_in_baseline": comparison.only_in_baseline,
+        "only_in_candidate": comparison.only_in_candidate,
+        "warnings": comparison.warnings,
+        "regressions": len(comparison.regressions),
+    }
+
+
+# ---- CLI argument parsing and orchestration ----
+def _parse_budget(value: str) -> tuple[MetricName, float]:
+    """Parse a ``METRIC=PCT`` budget override."""
+    metric, sep, pct = value.partition("=")
+    metric = metric.strip()
+    if not sep or metric not in METRICS:
+        raise argparse.ArgumentTypeError(
+            f"Expected METRIC=PCT with METRIC in {', '.join(METRICS)}, got {value!r}"
+        )
+    try:
+        return next(name for name in METRICS if name == metric), float(pct)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Invalid budget in {value!r}") from exc
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare preserved TopMark pipeline baseline runs.",
+    )
+    parser.add_argument(
+        "--baseline",
+        action="append",
+        required=True,
+        metavar="RUN",
+        help=(
+            "Reference run: a run id below --runs-dir, a run directory, or a report.json file. "
+            "May be repeated; samples of all runs are pooled."
+        ),
+    )
+    parser.add_argument(
+        "--candidate",
+        action="append",
+        required=True,
+        metavar="RUN",
+        help="Run under test, in the same forms as --baseline. May be repeated.",
+    )
+    parser.add_argument(
+        "--runs-dir",
+        type=Path,
+        default=DEFAULT_RUNS_DIR,
+        help="Directory holding preserved runs (default: artifacts/perf).",
+    )
+    parser.add_argument(
+        "--budget",
+        type=_parse_budget,
+        action="append",
+        default=[],
+        metavar="METRIC=PCT",
+        help=(
+            'Override the relative budget of one metric, e.g. "elapsed=25". Defaults: '
+            + ", ".join(f"{name}={pct:g}" for name, pct in DEFAULT_BUDGETS_PCT.items())
+            + "."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("markdown", "json"),
+        default="markdown",
+        help="Report format written to stdout (default: markdown).",
+    )
+    parser.add_argument(
+        "--enforce",
+        action="store_true",
+        help="Exit with status 1 if any metric regresses beyond its budget.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Compare the selected runs and emit a report."""
+    args: argparse.Namespace = _parse_args(sys.argv[1:] if argv is None else argv)
+    runs_dir: Path = args.runs_dir
+    baseline: list[PerfRun] = [load_run(run, runs_dir=runs_dir) for run in args.baseline]
+    candidate: list[PerfRun] = [load_run(run, runs_dir=runs_dir) for run in args.candidate]
+    comparison: PerfComparison = compare_runs(baseline, candidate, budgets=dict(args.budget))
+
+    if args.format == "json":
+        sys.stdout.write(json.dumps(_comparison_payload(comparison), indent=2) + "\n")
+    else:
+        sys.stdout.write(render_markdown(comparison))
+
+    if args.enforce and comparison.regressions:
+        for item in comparison.regressions:
+            sys.stderr.write(
+                f"{_pair_label(item.scenario, item.mode)}: {item.metric} "
+                f"{item.delta_pct or 0.0:+.1f}% exceeds allowed {item.allowed_pct:.1f}%\n"
+            )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,422 @@
+# topmark:header:start
+#
+#   project      : TopMark
+#   file         : repository_throughput_benchmark.py
+#   file_relpath : tools/perf/repository_throughput_benchmark.py
+#   license      : MIT
+#   copyright    : (c) 2025 Olivier Biot
+#
+# topmark:header:end
+
+"""Measure repository-scale throughput on synthetic monorepos.
+
+For every requested tree size the tool generates a deterministic monorepo with
+`tools/perf/monorepo_generator.py` and times four phases separately:
+
+* `discovery`: layered `topmark.toml` resolution, file-list resolution
+  (include/exclude handling, `.gitignore` patterns), and per-path effective
+  config construction, performed with the same building blocks as the public
+  API;
+* `check`: the dry-run check pipeline over the discovered files;
+* `check_diff`: the dry-run check pipeline with unified diffs;
+* `check_apply`: the apply pipeline, which rewrites outdated and missing
+  headers.
+
+Discovery is single-threaded and measured once per round; pipeline phases are
+measured once per requested worker count (`--jobs`) and reuse the discovery
+result, so they measure pipeline execution only. `check_apply` changes the
+tree, so the tree is regenerated (untimed) before the next round or worker
+count. Unlike `pipeline_memory_baseline.py`, nothing runs under `tracemalloc`;
+the timings are plain wall-clock throughput.
+
+Throughput is reported in files/s and MB/s over the selected files. The report
+is JSON on stdout, or written to `--output`.
+"""
+
+from __future__ import annotations
+
+# The source-checkout bootstrap below intentionally precedes tool imports.
+# ruff: noqa: E402
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import Literal
+
+# Allow running this tool directly from a source checkout: the generator lives
+# next to this file in the `tools.perf` namespace package.
+REPO_ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.perf.monorepo_generator import MonorepoSpec
+from tools.perf.monorepo_generator import MonorepoStats
+from tools.perf.monorepo_generator import generate_monorepo
+from topmark.config.overrides import ConfigOverrides
+from topmark.config.overrides import apply_config_overrides
+from topmark.config.resolution.bridge import resolve_toml_sources_and_build_mutable_config
+from topmark.config.resolution.layers import build_config_layers_from_resolved_toml_sources
+from topmark.config.resolution.merge import EffectiveConfigInterner
+from topmark.config.resolution.synthetic import SyntheticConfigSource
+from topmark.pipeline.engine import PipelineExecutionState
+from topmark.pipeline.engine import iter_results_for_files
+from topmark.pipeline.pipelines import select_pipeline
+from topmark.pipeline.status import WriteStatus
+from topmark.resolution.files import resolve_file_list_with_diagnostics
+from topmark.runtime.model import RunOptions
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from topmark.config.model import FrozenConfig
+    from topmark.config.resolution.bridge import ResolvedConfigDraft
+    from topmark.config.resolution.layers import ConfigLayer
+    from topmark.pipeline.pipelines import PipelineSelection
+
+
+Phase = Literal["discovery", "check", "check_diff", "check_apply"]
+
+PHASES: Final[tuple[Phase, ...]] = ("discovery", "check", "check_diff", "check_apply")
+DEFAULT_TREE_SIZES: Final[tuple[int, ...]] = (1_000, 10_000)
+
+# Pipeline selection per pipeline phase: (apply, diff).
+_PIPELINE_PHASES: Final[dict[Phase, tuple[bool, bool]]] = {
+    "check": (False, False),
+    "check_diff": (False, True),
+    "check_apply": (True, False),
+}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DiscoveredRun:
+    """Discovery output shared by the pipeline phases of one round.
+
+    Attributes:
+        config: Run-level config after overrides.
+        file_list: Selected files in processing order.
+        path_configs: Effective layered config per selected file.
+        config_layers: Number of config layers discovered from the anchor,
+            defaults included.
+    """
+
+    config: FrozenConfig
+    file_list: list[Path]
+    path_configs: dict[Path, FrozenConfig]
+    config_layers: int
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ThroughputMeasurement:
+    """Throughput of one phase for one tree size, worker count, and round.
+
+    Attributes:
+        phase: Measured phase.
+        tree_files: Content files generated for the tree, excluded files included.
+        jobs: Worker processes used by pipeline phases (`1` for discovery).
+        round: Zero-based repetition index.
+        files: Files selected by discovery or processed by the pipeline.
+        bytes: Total size of those files before the phase ran.
+        elapsed_ns: Wall-clock time of the phase.
+        files_per_s: Files per second.
+        mb_per_s: Megabytes (10^6 bytes) per second.
+        written: Files rewritten by the phase (only non-zero for `check_apply`).
+    """
+
+    phase: Phase
+    tree_files: int
+    jobs: int
+    round: int
+    files: int
+    bytes: int
+    elapsed_ns: int
+    files_per_s: float
+    mb_per_s: float
+    written: int = 0
+
+
+def discover(root: Path) -> DiscoveredRun:
+    """Resolve configs and select files below `root` like an API run does.
+
+    Args:
+        root: Discovery anchor, usually the repository root. A directory inside
+            the tree also loads the nested layers above it.
+
+    Returns:
+        The run-level config, selected files, and per-path configs.
+    """
+    resolved: ResolvedConfigDraft = resolve_toml_sources_and_build_mutable_config(
+        input_paths=(root,),
+        extra_config_files=(),
+        strict=None,
+        no_config=False,
+    )
+    layers: list[ConfigLayer] = build_config_layers_from_resolved_toml_sources(
+        resolved.resolved.sources
+    )
+    config: FrozenConfig = apply_config_overrides(
+        resolved.draft,
+        overrides=ConfigOverrides(
+            config_origin=SyntheticConfigSource(label="<throughput benchmark>"),
+            config_base=root,
+            files=[str(root)],
+        ),
+    ).freeze()
+    file_list: list[Path] = list(resolve_file_list_with_diagnostics(config).selected)
+    interner = EffectiveConfigInterner(layers=layers)
+    path_configs: dict[Path, FrozenConfig] = {
+        path: interner.config_for_path(path) for path in file_list
+    }
+    return DiscoveredRun(
+        config=config,
+        file_list=file_list,
+        path_configs=path_configs,
+        config_layers=len(layers),
+    )
+
+
+def _measurement(
+    *,
+    phase: Phase,
+    tree_files: int,
+    jobs: int,
+    round_index: int,
+    files: int,
+    size_bytes: int,
+    elapsed_ns: int,
+    written: int = 0,
+) -> ThroughputMeasurement:
+    """Build a measurement and derive its rates."""
+    seconds: float = elapsed_ns / 1_000_000_000
+    return ThroughputMeasurement(
+        phase=phase,
+        tree_files=tree_files,
+        jobs=jobs,
+        round=round_index,
+        files=files,
+        bytes=size_bytes,
+        elapsed_ns=elapsed_ns,
+        files_per_s=round(files / seconds, 1) if seconds else 0.0,
+        mb_per_s=round(size_bytes / 1_000_000 / seconds, 2) if seconds else 0.0,
+        written=written,
+    )
+
+
+def run_pipeline_phase(
+    phase: Phase,
+    discovered: DiscoveredRun,
+    *,
+    jobs: int,
+) -> tuple[int, int, int]:
+    """Run one pipeline phase over discovered files.
+
+    Args:
+        phase: Pipeline phase (`check`, `check_diff`, or `check_apply`).
+        discovered: Discovery output to process.
+        jobs: Worker processes (`1` runs sequentially).
+
+    Returns:
+        Processed result count, rewritten file count, and elapsed nanoseconds.
+    """
+    apply, diff = _PIPELINE_PHASES[phase]
+    pipeline: PipelineSelection = select_pipeline("check", apply=apply, diff=diff)
+    run_options: RunOptions = RunOptions.from_pipeline_selection(pipeline, jobs=jobs)
+    results: int = 0
+    written: int = 0
+    start_ns: int = time.perf_counter_ns()
+    for result in iter_results_for_files(
+        run_options=run_options,
+        config=discovered.config,
+        path_configs=discovered.path_configs,
+        pipeline=pipeline,
+        file_list=discovered.file_list,
+        state=PipelineExecutionState(),
+    ):
+        results += 1
+        written += result.status.write is WriteStatus.WRITTEN
+    return results, written, time.perf_counter_ns() - start_ns
+
+
+def measure_tree(
+    spec: MonorepoSpec,
+    *,
+    work_dir: Path,
+    jobs: Sequence[int],
+    phases: Sequence[Phase],
+    repeat: int,
+) -> tuple[MonorepoStats, list[ThroughputMeasurement]]:
+    """Generate one tree and measure every phase for every worker count.
+
+    Args:
+        spec: Tree to generate.
+        work_dir: Directory below which the tree is generated.
+        jobs: Worker counts to measure pipeline phases with.
+        phases: Phases to measure, in order.
+        repeat: Number of rounds.
+
+    Returns:
+        Generator statistics and all measurements.
+    """
+    root: Path = work_dir / f"monorepo-{spec.files}"
+    stats: MonorepoStats = generate_monorepo(root, spec)
+    measurements: list[ThroughputMeasurement] = []
+    dirty: bool = False
+    for round_index in range(repeat):
+        for job_count in jobs:
+            if dirty:
+                shutil.rmtree(root)
+                generate_monorepo(root, spec)
+                dirty = False
+            start_ns: int = time.perf_counter_ns()
+            discovered: DiscoveredRun = discover(root)
+            discovery_ns: int = time.perf_counter_ns() - start_ns
+            size_bytes: int = sum(path.stat().st_size for path in discovered.file_list)
+            if "discovery" in phases and job_count == jobs[0]:
+                measurements.append(
+                    _measurement(
+                        phase="discovery",
+                        tree_files=spec.files,
+                        jobs=1,
+                        round_index=round_index,
+                        files=len(discovered.file_list),
+                        size_bytes=size_bytes,
+                        elapsed_ns=discovery_ns,
+                    )
+                )
+            for phase in phases:
+                if phase == "discovery":
+                    continue
+                results, written, elapsed_ns = run_pipeline_phase(phase, discovered, jobs=job_count)
+                dirty = dirty or written > 0
+                measurements.append(
+                    _measurement(
+                        phase=phase,
+                        tree_files=spec.files,
+                        jobs=job_count,
+                        round_index=round_index,
+                        files=results,
+                        size_bytes=size_bytes,
+                        elapsed_ns=elapsed_ns,
+                        written=written,
+                    )
+                )
+    shutil.rmtree(root)
+    return stats, measurements
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    defaults = MonorepoSpec()
+    parser = argparse.ArgumentParser(
+        description="Measure TopMark repository-scale throughput on synthetic monorepos.",
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        action="append",
+        help=(
+            "Content files per generated tree. May be repeated to measure scaling; "
+            "defaults to " + ", ".join(str(size) for size in DEFAULT_TREE_SIZES) + "."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        action="append",
+        help="Worker processes for pipeline phases. May be repeated (default: 1).",
+    )
+    parser.add_argument(
+        "--phase",
+        action="append",
+        choices=PHASES,
+        help="Phase to measure. May be repeated (default: all phases).",
+    )
+    parser.add_argument("--repeat", type=int, default=1, help="Rounds per tree (default: 1).")
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--fanout", type=int, default=defaults.fanout)
+    parser.add_argument("--files-per-dir", type=int, default=defaults.files_per_dir)
+    parser.add_argument("--file-types", type=int, default=defaults.file_types)
+    parser.add_argument("--current-fraction", type=float, default=defaults.current_fraction)
+    parser.add_argument("--outdated-fraction", type=float, default=defaults.outdated_fraction)
+    parser.add_argument("--excluded-fraction", type=float, default=defaults.excluded_fraction)
+    parser.add_argument("--layer-depth", type=int, default=defaults.layer_depth)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        default=None,
+        help="Generate trees below this directory instead of a temporary directory.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write the JSON report to this path instead of stdout.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and emit a JSON report."""
+    args: argparse.Namespace = _parse_args(sys.argv[1:] if argv is None else argv)
+    base_spec = MonorepoSpec(
+        depth=int(args.depth),
+        fanout=int(args.fanout),
+        files_per_dir=int(args.files_per_dir),
+        file_types=int(args.file_types),
+        current_fraction=float(args.current_fraction),
+        outdated_fraction=float(args.outdated_fraction),
+        excluded_fraction=float(args.excluded_fraction),
+        layer_depth=int(args.layer_depth),
+        seed=int(args.seed),
+    )
+    sizes: list[int] = list(args.files) if args.files else list(DEFAULT_TREE_SIZES)
+    jobs: list[int] = [max(1, int(count)) for count in args.jobs] if args.jobs else [1]
+    phases: list[Phase] = list(args.phase) if args.phase else list(PHASES)
+
+    trees: list[dict[str, object]] = []
+    measurements: list[ThroughputMeasurement] = []
+    if args.work_dir is not None:
+        Path(args.work_dir).mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="topmark-throughput-", dir=args.work_dir) as tmp:
+        for size in sizes:
+            stats, tree_measurements = measure_tree(
+                replace(base_spec, files=size),
+                work_dir=Path(tmp),
+                jobs=jobs,
+                phases=phases,
+                repeat=max(1, int(args.repeat)),
+            )
+            trees.append({**asdict(stats), "root": None})
+            measurements.extend(tree_measurements)
+
+    report: dict[str, object] = {
+        "schema_version": 1,
+        "tool": "tools/perf/repository_throughput_benchmark.py",
+        "python": sys.version,
+        "platform": sys.platform,
+        "cpu_count": os.cpu_count(),
+        "spec": asdict(base_spec),
+        "trees": trees,
+        "measurements": [asdict(measurement) for measurement in measurements],
+    }
+    payload: str = json.dumps(report, indent=2)
+    if args.output is not None:
+        output: Path = args.output
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(payload + "\n", encoding="utf-8")
+    else:
+        sys.stdout.write(payload + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())